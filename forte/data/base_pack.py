@@ -15,12 +15,14 @@
 import copy
 from abc import abstractmethod
 from typing import (
-    List, Optional, Set, Type, TypeVar, Union, Iterator, Dict, Tuple, Any)
+    List, Optional, Set, Type, TypeVar, Union, Iterator, Dict, Tuple, Any,
+    AbstractSet)
 import uuid
 
 import jsonpickle
 
 from forte.common import ProcessExecutionException, EntryNotFoundError
+from forte.data.binary_io import serialize_binary
 from forte.data.container import EntryContainer
 from forte.data.index import BaseIndex
 from forte.data.ontology.core import (Entry, EntryType, GroupType, LinkType)
@@ -28,9 +30,12 @@ from forte.data.ontology.core import (Entry, EntryType, GroupType, LinkType)
 __all__ = [
     "BasePack",
     "BaseMeta",
-    "PackType"
+    "PackType",
+    "SERIALIZE_METHODS",
 ]
 
+SERIALIZE_METHODS = ("jsonpickle", "binary")
+
 
 class BaseMeta:
     r"""Basic Meta information for both :class:`~forte.data.data_pack.DataPack`
@@ -202,13 +207,32 @@ class BasePack(EntryContainer[EntryType, LinkType, GroupType]):
             self.add_entry(entry, c_)
         self._pending_entries.clear()
 
-    def serialize(self, drop_record: Optional[bool] = False) -> str:
-        r"""Serializes a pack to a string."""
+    def serialize(self, drop_record: Optional[bool] = False,
+                  serialize_method: str = "jsonpickle") -> Union[str, bytes]:
+        r"""Serializes a pack.
+
+        Args:
+            drop_record: Whether to drop the creation and field records.
+            serialize_method: The format of the output, can be `jsonpickle`,
+              which produces a JSON string, or `binary`, which produces
+              the columnar binary format defined in
+              :mod:`~forte.data.binary_io`.
+
+        Returns:
+            A string when using `jsonpickle`, or bytes when using `binary`.
+        """
         if drop_record:
             self.creation_records.clear()
             self.field_records.clear()
 
-        return jsonpickle.encode(self, unpicklable=True)
+        if serialize_method == "jsonpickle":
+            return jsonpickle.encode(self, unpicklable=True)
+        elif serialize_method == "binary":
+            return serialize_binary(self)
+        else:
+            raise ValueError(
+                f"Unknown serialize method [{serialize_method}], should be "
+                f"one of {SERIALIZE_METHODS}.")
 
     def view(self):
         return copy.deepcopy(self)
@@ -367,11 +391,24 @@ class BasePack(EntryContainer[EntryType, LinkType, GroupType]):
              A set of entry tids. The entries are instances of entry_type (
              and also includes instances of the subclasses of entry_type).
         """
-        subclass_index: Set[int] = set()
-        for index_key, index_val in self.index.iter_type_index():
-            if issubclass(index_key, entry_type):
-                subclass_index.update(index_val)
-        return subclass_index
+        return set(self.index.ids_by_type(entry_type))
+
+    def view_ids_by_type(
+            self, entry_type: Type[EntryType]) -> AbstractSet[int]:
+        r"""Look up the type_index with key ``entry_type``, like
+        :meth:`get_ids_by_type`, but return a read-only view of the index
+        instead of a copy. The view should not be held while entries are
+        added to or removed from the pack.
+
+        Args:
+            entry_type: The type of the entry you are looking for.
+
+        Returns:
+             A read-only set of entry tids. The entries are instances of
+             entry_type (and also includes instances of the subclasses of
+             entry_type).
+        """
+        return self.index.ids_by_type(entry_type)
 
     def get_entries_by_type(
             self, entry_type: Type[EntryType]) -> List[EntryType]:
@@ -387,7 +424,7 @@ class BasePack(EntryContainer[EntryType, LinkType, GroupType]):
 
         """
         entries: List[EntryType] = []
-        for tid in self.get_ids_by_type(entry_type):
+        for tid in self.view_ids_by_type(entry_type):
             entry: EntryType = self.get_entry(tid)
             if isinstance(entry, entry_type):
                 entries.append(entry)
@@ -14,16 +14,21 @@
 
 # pylint: disable=attribute-defined-outside-init
 
+import itertools
+import time
 from abc import abstractmethod
+from collections import deque
 from typing import (
-    Dict, List, Iterable, Union, Optional, Tuple, Type, Generic, Iterator, Any)
+    Dict, List, Iterable, Union, Optional, Tuple, Type, Generic, Iterator, Any,
+    Deque)
 
 from forte.common.configuration import Config
 from forte.data.base_pack import PackType
 from forte.data.data_pack import DataPack
 from forte.data.multi_pack import MultiPack
 from forte.data.types import DataRequest
-from forte.data.data_utils_io import merge_batches, batch_instances
+from forte.data.data_utils_io import (
+    merge_batches, batch_instances, slice_batch)
 from forte.data.ontology.top import Annotation
 from forte.data.ontology.core import Entry
 
@@ -31,6 +36,7 @@ __all__ = [
     "ProcessingBatcher",
     "FixedSizeDataPackBatcher",
     "FixedSizeMultiPackProcessingBatcher",
+    "TokenBudgetDataPackBatcher",
 ]
 
 
@@ -41,6 +47,17 @@ class ProcessingBatcher(Generic[PackType]):
     the current packs so that the processors can pack prediction results into
     the data packs.
 
+    When batches go across packs, a pack stays in :attr:`data_pack_pool` until
+    all its instances are processed, which holds back the pack and the packs
+    after it in the pipeline. To bound this latency, the batcher configuration
+    may have the following keys, and the partial batch is processed once one
+    of them is reached:
+
+    - ``max_wait_packs``: The maximum number of packs in the partial batch.
+    - ``max_wait_time``: The maximum time in milliseconds since the first
+      instance of the partial batch was added. This is checked when a pack
+      arrives, so a pack may wait until the arrival of the next one.
+
     Args:
         cross_pack (bool, optional): whether to allow batches go across
         data packs when there is no enough data at the end.
@@ -48,12 +65,16 @@ class ProcessingBatcher(Generic[PackType]):
 
     def __init__(self, cross_pack: bool = True):
         self.current_batch: Dict = {}
-        self.data_pack_pool: List[PackType] = []
-        self.current_batch_sources: List[int] = []
+        self.data_pack_pool: Deque[PackType] = deque()
+        self.current_batch_sources: Deque[int] = deque()
 
         self.cross_pack: bool = cross_pack
 
-    def initialize(self, _):
+        self.max_wait_packs: Optional[int] = None
+        self.max_wait_time: Optional[float] = None
+        self._pending_since: float = 0.0
+
+    def initialize(self, config: Optional[Config]):
         r"""The implementation should initialize the batcher and setup the
         internal states of this batcher.
         This batcher will be called at the pipeline initialize stage.
@@ -64,6 +85,30 @@ class ProcessingBatcher(Generic[PackType]):
         self.current_batch.clear()
         self.data_pack_pool.clear()
         self.current_batch_sources.clear()
+        if config is not None:
+            self.max_wait_packs = config.get("max_wait_packs")
+            self.max_wait_time = config.get("max_wait_time")
+
+    def _add_to_batch(self, data_batch: Dict, instance_num: int):
+        r"""Add the instances of the last pack in the pool to the current
+        batch."""
+        if not self.current_batch:
+            self._pending_since = time.monotonic()
+        self.current_batch = merge_batches([self.current_batch, data_batch])
+        self.current_batch_sources.append(instance_num)
+
+    def should_flush(self) -> bool:
+        r"""Whether the current partial batch has waited long enough and
+        should be processed, according to ``max_wait_packs`` and
+        ``max_wait_time``."""
+        if not self.current_batch:
+            return False
+        if (self.max_wait_packs is not None
+                and len(self.data_pack_pool) >= self.max_wait_packs):
+            return True
+        return (self.max_wait_time is not None
+                and (time.monotonic() - self._pending_since) * 1000
+                >= self.max_wait_time)
 
     @abstractmethod
     def _should_yield(self) -> bool:
@@ -86,7 +131,7 @@ class ProcessingBatcher(Generic[PackType]):
         if self.current_batch:
             yield self.current_batch
             self.current_batch = {}
-            self.current_batch_sources = []
+            self.current_batch_sources.clear()
 
     def get_batch(
             self, input_pack: PackType, context_type: Type[Annotation],
@@ -95,11 +140,11 @@ class ProcessingBatcher(Generic[PackType]):
         # cache the new pack and generate batches
         self.data_pack_pool.append(input_pack)
 
+        has_instances = False
         for (data_batch, instance_num) in self._get_data_batch(
                 input_pack, context_type, requests):
-            self.current_batch = merge_batches(
-                [self.current_batch, data_batch])
-            self.current_batch_sources.append(instance_num)
+            has_instances = True
+            self._add_to_batch(data_batch, instance_num)
 
             # Yield a batch on two conditions.
             # 1. If we do not want to have batches from different pack, we
@@ -109,7 +154,12 @@ class ProcessingBatcher(Generic[PackType]):
             if not self.cross_pack or self._should_yield():
                 yield self.current_batch
                 self.current_batch = {}
-                self.current_batch_sources = []
+                self.current_batch_sources.clear()
+
+        if not has_instances and self.current_batch_sources:
+            # A pack without instance still takes a place in the pack pool,
+            # keep the sources aligned with the pool.
+            self.current_batch_sources.append(0)
 
     def _get_data_batch(
             self, data_pack: PackType, context_type: Type[Annotation],
@@ -128,6 +178,38 @@ class ProcessingBatcher(Generic[PackType]):
         """
         raise NotImplementedError
 
+    def _get_columnar_batch(
+            self, data_pack: DataPack, context_type: Type[Annotation],
+            requests: Optional[DataRequest] = None, offset: int = 0) \
+            -> Iterable[Tuple[Dict, int]]:
+        r"""Get batches of size ``batch_size`` from the columnar data of the
+        pack (see :meth:`~forte.data.data_pack.DataPack.get_columnar_data`).
+        The data of the pack is extracted once and each batch is a slice of
+        it, so the cost of batching does not grow with the number of
+        instances. The tail instances are yielded as a smaller batch.
+
+        Returns:
+            An iterator of tuples ``(batch, cnt)``, ``batch`` is a dict
+            containing the required columns, and ``cnt`` is the number of
+            instances in the batch.
+        """
+        data = data_pack.get_columnar_data(context_type, requests, offset)
+        num_instances = len(data["context"])
+
+        start = 0
+        batch_size = self.batch_size - sum(self.current_batch_sources)
+        while num_instances - start >= batch_size:
+            self.batch_is_full = True
+            yield (slice_batch(data, start, batch_size), batch_size)
+            self.batch_is_full = False
+            start += batch_size
+            batch_size = self.batch_size
+
+        # Flush the remaining data.
+        if start < num_instances:
+            yield (slice_batch(data, start, num_instances - start),
+                   num_instances - start)
+
     @classmethod
     @abstractmethod
     def default_configs(cls) -> Dict[str, Any]:
@@ -138,6 +220,7 @@ class FixedSizeDataPackBatcher(ProcessingBatcher[DataPack]):
     def initialize(self, config: Config):
         super().initialize(config)
         self.batch_size = config.batch_size
+        self.columnar = config.get("columnar", False)
         self.batch_is_full = False
 
     def _should_yield(self) -> bool:
@@ -155,6 +238,11 @@ class FixedSizeDataPackBatcher(ProcessingBatcher[DataPack]):
             containing the required annotations and context, and ``cnt`` is
             the number of instances in the batch.
         """
+        if self.columnar:
+            yield from self._get_columnar_batch(
+                data_pack, context_type, requests, offset)
+            return
+
         instances: List[Dict] = []
         current_size = sum(self.current_batch_sources)
 
@@ -165,6 +253,7 @@ class FixedSizeDataPackBatcher(ProcessingBatcher[DataPack]):
                 self.batch_is_full = True
                 yield (batch, len(instances))
                 instances = []
+                current_size = 0
                 self.batch_is_full = False
 
         # Flush the remaining data.
@@ -175,7 +264,10 @@ class FixedSizeDataPackBatcher(ProcessingBatcher[DataPack]):
     @classmethod
     def default_configs(cls) -> Dict:
         return {
-            'batch_size': 10
+            'batch_size': 10,
+            'columnar': False,
+            'max_wait_packs': None,
+            'max_wait_time': None,
         }
 
 
@@ -202,6 +294,7 @@ class FixedSizeMultiPackProcessingBatcher(ProcessingBatcher[MultiPack]):
         super().initialize(config)
         self.input_pack_name = config.input_pack_name
         self.batch_size = config.batch_size
+        self.columnar = config.get("columnar", False)
         self.batch_is_full = False
 
     def _should_yield(self) -> bool:
@@ -223,6 +316,11 @@ class FixedSizeMultiPackProcessingBatcher(ProcessingBatcher[MultiPack]):
         """
         input_pack = multi_pack.get_pack(self.input_pack_name)
 
+        if self.columnar:
+            yield from self._get_columnar_batch(
+                input_pack, context_type, requests, offset)
+            return
+
         instances: List[Dict] = []
         current_size = sum(self.current_batch_sources)
         for data in input_pack.get_data(context_type, requests, offset):
@@ -232,6 +330,7 @@ class FixedSizeMultiPackProcessingBatcher(ProcessingBatcher[MultiPack]):
                 self.batch_is_full = True
                 yield (batch, len(instances))
                 instances = []
+                current_size = 0
                 self.batch_is_full = False
 
         if len(instances):
@@ -242,5 +341,152 @@ class FixedSizeMultiPackProcessingBatcher(ProcessingBatcher[MultiPack]):
     def default_configs(cls) -> Dict:
         return {
             'batch_size': 10,
-            'input_pack_name': 'source'
+            'input_pack_name': 'source',
+            'columnar': False,
+            'max_wait_packs': None,
+            'max_wait_time': None,
+        }
+
+
+class TokenBudgetDataPackBatcher(ProcessingBatcher[DataPack]):
+    r"""A batcher that caps the batches by the number of tokens instead of the
+    number of instances, so that a batch of long sentences is as costly as a
+    batch of short ones.
+
+    The length of an instance is the number of entries of type
+    ``length_key`` in the instance (for example, ``"Token"``, which should be
+    in the request of the processor), or the number of characters of the
+    context if ``length_key`` is `None`. The budget is either the total length
+    of the instances of a batch (``"tokens"``), or the size of the batch once
+    padded to its longest instance (``"padded"``). An instance longer than the
+    budget is put in a batch alone.
+
+    With ``sort_buffer_size`` larger than 1, the instances of a pack are read
+    in chunks of this size, and each chunk is sorted by length before cutting
+    the batches, so the instances of a batch have similar lengths and little
+    padding. The results are still packed into the right packs, but the
+    instances of a pack are given to
+    :meth:`~forte.processors.base.batch_processor.BaseBatchProcessor.pack` in
+    the sorted order, so the predictions should identify their entries (such
+    as by the ``tid``) instead of relying on the order of the instances.
+
+    The configuration has the following keys:
+
+    - ``max_tokens``: The budget of a batch.
+    - ``budget_type``: ``"tokens"`` or ``"padded"``.
+    - ``length_key``: The entry type name giving the length of an instance.
+    - ``max_batch_size``: The maximum number of instances in a batch, or
+      `None` for no limit.
+    - ``sort_buffer_size``: The number of instances sorted by length together,
+      0 or 1 to keep the order of the instances.
+    """
+
+    def initialize(self, config: Config):
+        super().initialize(config)
+        if config.budget_type not in ("tokens", "padded"):
+            raise ValueError(
+                f"Unknown budget type {config.budget_type}, should be "
+                f"'tokens' or 'padded'.")
+        self.max_tokens: int = config.max_tokens
+        self.budget_type: str = config.budget_type
+        self.length_key: Optional[str] = config.length_key
+        self.max_batch_size: Optional[int] = config.max_batch_size
+        self.sort_buffer_size: int = config.sort_buffer_size
+        self._reset_budget()
+
+    def _reset_budget(self):
+        # The number of instances, total length and longest length of the
+        # current batch, including the instances of the previous packs.
+        self._num_instances = 0
+        self._num_tokens = 0
+        self._max_length = 0
+
+    def _should_yield(self) -> bool:
+        return False
+
+    def _length(self, instance: Dict) -> int:
+        if self.length_key is None:
+            return len(instance["context"])
+        return len(instance[self.length_key]["tid"])
+
+    def _fits(self, length: int) -> bool:
+        if (self.max_batch_size is not None
+                and self._num_instances >= self.max_batch_size):
+            return False
+        if self.budget_type == "tokens":
+            return self._num_tokens + length <= self.max_tokens
+        return ((self._num_instances + 1) * max(self._max_length, length)
+                <= self.max_tokens)
+
+    def _iter_instances(
+            self, data_pack: DataPack, context_type: Type[Annotation],
+            requests: Optional[DataRequest]) -> Iterator[Tuple[Dict, int]]:
+        r"""Iterate the instances of the pack with their lengths, sorted by
+        length in each chunk of ``sort_buffer_size`` instances."""
+        instances = (
+            (instance, self._length(instance))
+            for instance in data_pack.get_data(context_type, requests))
+        if self.sort_buffer_size <= 1:
+            yield from instances
+            return
+
+        while True:
+            chunk = list(itertools.islice(instances, self.sort_buffer_size))
+            if not chunk:
+                return
+            chunk.sort(key=lambda x: x[1])
+            yield from chunk
+
+    def _add_instances(self, instances: List[Dict]):
+        self._add_to_batch(batch_instances(instances), len(instances))
+
+    def get_batch(
+            self, input_pack: DataPack, context_type: Type[Annotation],
+            requests: DataRequest) -> Iterator[Dict]:
+        self.data_pack_pool.append(input_pack)
+
+        instances: List[Dict] = []
+        for instance, length in self._iter_instances(
+                input_pack, context_type, requests):
+            if self._num_instances > 0 and not self._fits(length):
+                # The current batch may only contain the instances of the
+                # previous packs, in which case this pack gets an empty slice.
+                self._add_instances(instances)
+                yield self.current_batch
+                self.current_batch = {}
+                self.current_batch_sources.clear()
+                self._reset_budget()
+                instances = []
+
+            instances.append(instance)
+            self._num_instances += 1
+            self._num_tokens += length
+            self._max_length = max(self._max_length, length)
+
+        if instances:
+            self._add_instances(instances)
+        elif self.current_batch_sources:
+            # Keep the sources aligned with the pack pool.
+            self.current_batch_sources.append(0)
+
+        if not self.cross_pack and self.current_batch:
+            yield self.current_batch
+            self.current_batch = {}
+            self.current_batch_sources.clear()
+            self._reset_budget()
+
+    def flush(self) -> Iterator[Dict]:
+        yield from super().flush()
+        self._reset_budget()
+
+    @classmethod
+    def default_configs(cls) -> Dict:
+        return {
+            'max_tokens': 1024,
+            'budget_type': 'tokens',
+            'length_key': None,
+            'max_batch_size': None,
+            'sort_buffer_size': 0,
+            'max_wait_packs': None,
+            'max_wait_time': None,
         }
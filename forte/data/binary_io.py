@@ -0,0 +1,316 @@
+# Copyright 2020 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A versioned, columnar binary serialization format for packs.
+
+Compared with the `jsonpickle` format, the binary format does not encode every
+entry as a separate JSON object. Instead, the text is stored as one UTF-8
+buffer and the entries are grouped by their concrete type, each type stores
+its `tid`, `begin`, `end` and creating component as fixed width integer
+columns, and each attribute as one column of values.
+
+The layout of a serialized pack is:
+
+    MAGIC (8 bytes) | VERSION (uint16) | block | block | ...
+
+where each block is a little endian `uint64` length followed by the payload.
+The first block is a JSON header describing the remaining blocks, the second
+block is the text of the pack, and the rest are the columns of each entry type
+in the order given by the header.
+"""
+import json
+import struct
+from typing import Any, Dict, List, Tuple, Union
+
+import jsonpickle
+import numpy as np
+
+from forte.common.exception import ProcessExecutionException
+from forte.data.ontology.core import Pointer
+from forte.data.span import Span
+from forte.utils.utils import get_class, get_full_module_name
+
+__all__ = [
+    "BINARY_MAGIC",
+    "BINARY_VERSION",
+    "is_binary_pack",
+    "serialize_binary",
+    "deserialize_binary",
+]
+
+BINARY_MAGIC = b"FORTEBIN"
+BINARY_VERSION = 1
+
+_VERSION_STRUCT = struct.Struct("<H")
+_LENGTH_STRUCT = struct.Struct("<Q")
+
+# The state fields of the packs that hold the entries.
+_ENTRY_FIELDS = ("annotations", "links", "groups", "generics")
+# Entry state keys that are stored in the fixed columns.
+_FIXED_KEYS = ("_tid", "_span")
+
+_INT64_MIN = -(2 ** 63)
+_INT64_MAX = 2 ** 63 - 1
+
+
+def is_binary_pack(data: Union[str, bytes]) -> bool:
+    r"""Check whether the data is a pack in the binary format.
+
+    Args:
+        data: The serialized pack.
+
+    Returns:
+        True if the data starts with the binary format header.
+    """
+    return isinstance(data, (bytes, bytearray, memoryview)) and bytes(
+        data[:len(BINARY_MAGIC)]) == BINARY_MAGIC
+
+
+def _is_json_native(value: Any) -> bool:
+    # Only accept values that survive a JSON round trip unchanged, tuples and
+    # non-string dict keys are silently converted by JSON.
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return True
+    if isinstance(value, list):
+        return all(_is_json_native(v) for v in value)
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _is_json_native(v)
+                   for k, v in value.items())
+    return False
+
+
+def _is_int64(value: Any) -> bool:
+    return (isinstance(value, int) and not isinstance(value, bool)
+            and _INT64_MIN <= value <= _INT64_MAX)
+
+
+def _encode_column(values: List[Any]) -> Tuple[str, bytes]:
+    r"""Encode one attribute column, choose the most compact codec that can
+    represent all the values losslessly.
+    """
+    if all(_is_int64(v) for v in values):
+        return "int", np.array(values, dtype=np.int64).tobytes()
+    if all(type(v) is Pointer for v in values):  # pylint: disable=C0123
+        return "pointer", np.array(
+            [v.tid for v in values], dtype=np.int64).tobytes()
+    if all(_is_json_native(v) for v in values):
+        return "json", json.dumps(
+            values, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return "jsonpickle", jsonpickle.encode(
+        values, unpicklable=True).encode('utf-8')
+
+
+def _decode_column(codec: str, payload: bytes) -> List[Any]:
+    if codec == "int":
+        return np.frombuffer(payload, dtype=np.int64).tolist()
+    if codec == "pointer":
+        return [Pointer(t) for t in
+                np.frombuffer(payload, dtype=np.int64).tolist()]
+    if codec == "json":
+        return json.loads(payload.decode('utf-8'))
+    if codec == "jsonpickle":
+        return jsonpickle.decode(payload.decode('utf-8'))
+    raise ProcessExecutionException(
+        f"Unknown column codec [{codec}] in the binary pack.")
+
+
+def _int_block(values: List[int], dtype) -> bytes:
+    return np.array(values, dtype=dtype).tobytes()
+
+
+def serialize_binary(pack) -> bytes:
+    r"""Serialize a pack (:class:`~forte.data.data_pack.DataPack` or
+    :class:`~forte.data.multi_pack.MultiPack`) into the binary format.
+
+    Args:
+        pack: The pack to be serialized.
+
+    Returns:
+        The serialized bytes.
+    """
+    state: Dict[str, Any] = pack.__getstate__()
+    has_text = "_text" in state
+    text: str = state.pop("_text", "")
+    creation_records: Dict[str, Any] = state.pop("creation_records")
+
+    entry_lists: Dict[str, List[Any]] = {}
+    for field in _ENTRY_FIELDS:
+        if field in state:
+            entry_lists[field] = list(state.pop(field))
+
+    # Assign each entry to the component that creates it, the records that
+    # cannot be represented in the component column are kept as is.
+    entry_tids = {e.tid for entries in entry_lists.values() for e in entries}
+    components: List[str] = list(creation_records.keys())
+    tid_component: Dict[int, int] = {}
+    extra_records: Dict[str, List[int]] = {}
+    for c_idx, (component, tids) in enumerate(creation_records.items()):
+        for tid in tids:
+            if tid in entry_tids and tid not in tid_component:
+                tid_component[tid] = c_idx
+            else:
+                extra_records.setdefault(component, []).append(tid)
+
+    blocks: List[bytes] = [text.encode('utf-8')]
+    entry_header: List[Dict[str, Any]] = []
+
+    for field, entries in entry_lists.items():
+        by_type: Dict[type, List[Any]] = {}
+        for entry in entries:
+            by_type.setdefault(type(entry), []).append(entry)
+
+        for entry_type, typed_entries in by_type.items():
+            states = [e.__getstate__() for e in typed_entries]
+            has_span = "_span" in states[0]
+
+            tids = [s["_tid"] for s in states]
+            blocks.append(_int_block(tids, np.int64))
+            if has_span:
+                blocks.append(_int_block(
+                    [s["_span"].begin for s in states], np.int64))
+                blocks.append(_int_block(
+                    [s["_span"].end for s in states], np.int64))
+            blocks.append(_int_block(
+                [tid_component.get(t, -1) for t in tids], np.int32))
+
+            attribute_names: Dict[str, None] = {}
+            for s in states:
+                for key in s:
+                    if key not in _FIXED_KEYS:
+                        attribute_names[key] = None
+
+            columns: List[Dict[str, Any]] = []
+            for name in attribute_names:
+                missing: List[int] = []
+                values: List[Any] = []
+                for i, s in enumerate(states):
+                    if name in s:
+                        values.append(s[name])
+                    else:
+                        missing.append(i)
+                codec, payload = _encode_column(values)
+                blocks.append(payload)
+                columns.append(
+                    {"name": name, "codec": codec, "missing": missing})
+
+            entry_header.append({
+                "field": field,
+                "type": get_full_module_name(entry_type),
+                "count": len(typed_entries),
+                "span": has_span,
+                "columns": columns,
+            })
+
+    header = {
+        "pack_type": get_full_module_name(pack),
+        "pack_state": jsonpickle.encode(state, unpicklable=True),
+        "has_text": has_text,
+        "entry_fields": list(entry_lists.keys()),
+        "components": components,
+        "extra_creation_records": extra_records,
+        "entries": entry_header,
+    }
+
+    out: List[bytes] = [BINARY_MAGIC, _VERSION_STRUCT.pack(BINARY_VERSION)]
+    for block in [json.dumps(header).encode('utf-8')] + blocks:
+        out.append(_LENGTH_STRUCT.pack(len(block)))
+        out.append(block)
+    return b"".join(out)
+
+
+def _iter_blocks(data: memoryview, offset: int):
+    while offset < len(data):
+        (length,) = _LENGTH_STRUCT.unpack_from(data, offset)
+        offset += _LENGTH_STRUCT.size
+        yield bytes(data[offset: offset + length])
+        offset += length
+
+
+def deserialize_binary(data: bytes):
+    r"""Deserialize a pack from the binary format.
+
+    Args:
+        data: The bytes produced by :func:`serialize_binary`.
+
+    Returns:
+        The recovered pack.
+    """
+    if not is_binary_pack(data):
+        raise ProcessExecutionException(
+            "The data is not a pack serialized in the binary format.")
+
+    view = memoryview(data)
+    (version,) = _VERSION_STRUCT.unpack_from(view, len(BINARY_MAGIC))
+    if version > BINARY_VERSION:
+        raise ProcessExecutionException(
+            f"The binary pack is of version {version}, which is newer than "
+            f"the supported version {BINARY_VERSION}.")
+
+    blocks = _iter_blocks(view, len(BINARY_MAGIC) + _VERSION_STRUCT.size)
+    header: Dict[str, Any] = json.loads(next(blocks).decode('utf-8'))
+    text: str = next(blocks).decode('utf-8')
+
+    state: Dict[str, Any] = jsonpickle.decode(header["pack_state"])
+    components: List[str] = header["components"]
+
+    creation_records: Dict[str, set] = {c: set() for c in components}
+    for component, tids in header["extra_creation_records"].items():
+        creation_records[component].update(tids)
+
+    entry_lists: Dict[str, List[Any]] = {
+        field: [] for field in header["entry_fields"]}
+
+    for type_header in header["entries"]:
+        entry_type = get_class(type_header["type"])
+        count: int = type_header["count"]
+
+        tids = np.frombuffer(next(blocks), dtype=np.int64).tolist()
+        if type_header["span"]:
+            begins = np.frombuffer(next(blocks), dtype=np.int64).tolist()
+            ends = np.frombuffer(next(blocks), dtype=np.int64).tolist()
+        comp_ids = np.frombuffer(next(blocks), dtype=np.int32).tolist()
+
+        states: List[Dict[str, Any]] = [{"_tid": tid} for tid in tids]
+        if type_header["span"]:
+            for s, begin, end in zip(states, begins, ends):
+                s["_span"] = Span(begin, end)
+
+        for tid, c_idx in zip(tids, comp_ids):
+            if c_idx >= 0:
+                creation_records[components[c_idx]].add(tid)
+
+        for column in type_header["columns"]:
+            name = column["name"]
+            values = _decode_column(column["codec"], next(blocks))
+            missing = set(column["missing"])
+            rows = (i for i in range(count) if i not in missing) \
+                if missing else range(count)
+            for i, value in zip(rows, values):
+                states[i][name] = value
+
+        entries = entry_lists[type_header["field"]]
+        for s in states:
+            entry = entry_type.__new__(entry_type)
+            entry.__setstate__(s)
+            entries.append(entry)
+
+    if header["has_text"]:
+        state["_text"] = text
+    state["creation_records"] = creation_records
+    state.update(entry_lists)
+
+    pack_type = get_class(header["pack_type"])
+    pack = pack_type.__new__(pack_type)
+    pack.__setstate__(state)
+    return pack
@@ -19,7 +19,7 @@ Forte Container module.
 # pylint: disable=function-redefined,multiple-statements
 
 from abc import abstractmethod
-from typing import Dict, Generic, Set, Tuple, TypeVar
+from typing import Dict, Generic, Set, Tuple, Type, TypeVar
 
 from forte.data.span import Span
 
@@ -28,8 +28,17 @@ __all__ = [
     "EntryContainer",
     "ContainerType",
     "BasePointer",
+    "VALIDATION_MODES",
 ]
 
+# The modes of validating the entry fields against their type hints:
+#   - strict: validate every assignment.
+#   - first_write: validate the first assignment of each (entry type, field,
+#     value type) combination in the container, later assignments of the same
+#     combination are trusted.
+#   - off: do not validate the assignments.
+VALIDATION_MODES = ("strict", "first_write", "off")
+
 E = TypeVar('E')
 L = TypeVar('L')
 G = TypeVar('G')
@@ -75,6 +84,10 @@ class EntryContainer(Generic[E, L, G]):
         # The Id manager controls the ID management in this container
         self._id_manager = EntryIdManager()
 
+        # Control the field validation of the entries in this container.
+        self._validation_mode: str = "strict"
+        self._validated_fields: Set[Tuple[Type, str, Type]] = set()
+
     def __getstate__(self):
         r"""In serialization:
             - We create a special field for serialization information.
@@ -86,6 +99,8 @@ class EntryContainer(Generic[E, L, G]):
         state['serialization']['next_id'] = \
             self._id_manager.current_id_counter()
         state.pop('_id_manager')
+        state.pop('_validation_mode', None)
+        state.pop('_validated_fields', None)
         return state
 
     def __setstate__(self, state):
@@ -95,6 +110,37 @@ class EntryContainer(Generic[E, L, G]):
         self.__dict__.update(state)
         self.__dict__.pop('serialization')
         self._id_manager = EntryIdManager(state['serialization']['next_id'])
+        self._validation_mode = "strict"
+        self._validated_fields = set()
+
+    @property
+    def validation_mode(self) -> str:
+        return self._validation_mode
+
+    def set_validation_mode(self, mode: str):
+        r"""Set how the entries in this container validate the assignments to
+        their fields. Readers that ingest trusted data in bulk can use
+        ``first_write`` or ``off`` to skip most of the validation.
+
+        Args:
+            mode: One of ``strict`` (default), ``first_write`` and ``off``.
+        """
+        if mode not in VALIDATION_MODES:
+            raise ValueError(
+                f"Unknown validation mode [{mode}], should be one of "
+                f"{VALIDATION_MODES}.")
+        self._validation_mode = mode
+        self._validated_fields.clear()
+
+    def is_field_validated(self, field_key: Tuple[Type, str, Type]) -> bool:
+        r"""Whether the field assignment identified by ``field_key`` (entry
+        type, field name, value type) needs no further validation, this is
+        only used in the ``first_write`` mode.
+        """
+        return field_key in self._validated_fields
+
+    def mark_field_validated(self, field_key: Tuple[Type, str, Type]):
+        self._validated_fields.add(field_key)
 
     @abstractmethod
     def on_entry_creation(self, entry: E):
@@ -12,15 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import heapq
 import logging
+import math
+from bisect import bisect_right
 from typing import (Dict, Iterable, Iterator, List, Optional, Type, Union, Any,
-                    Set, Callable, Tuple)
+                    Set, Callable, Tuple, AbstractSet, Sequence)
 
 import numpy as np
-from sortedcontainers import SortedList
+from sortedcontainers import SortedList, SortedKeyList
 
 from forte.common.exception import ProcessExecutionException
 from forte.data import data_utils_io
+from forte.data.data_utils_io import RaggedColumns, to_column
 from forte.data.base_pack import BaseMeta, BasePack
 from forte.data.index import BaseIndex
 from forte.data.ontology.core import Entry
@@ -80,6 +84,9 @@ class DataPack(BasePack[Entry, Link, Group]):
         self.replace_back_operations: ReplaceOperationsType = []
         self.processed_original_spans: List[Tuple[Span, Span]] = []
         self.orig_text_len: int = 0
+        # The offsets of the processed spans and their original spans as
+        # sorted lists, built from `processed_original_spans` when needed.
+        self._span_lookup: Optional[Tuple[List, ...]] = None
 
         self.index: DataIndex = DataIndex()
 
@@ -90,6 +97,7 @@ class DataPack(BasePack[Entry, Link, Group]):
             2) will not serialize the indices
         """
         state = super().__getstate__()
+        state.pop('_span_lookup', None)
         state['annotations'] = list(state['annotations'])
         state['links'] = list(state['links'])
         state['groups'] = list(state['groups'])
@@ -104,6 +112,7 @@ class DataPack(BasePack[Entry, Link, Group]):
             3) Obtain the pack ids.
         """
         super().__setstate__(state)
+        self._span_lookup = None
 
         self.annotations = SortedList(self.annotations)
         self.links = SortedList(self.links)
@@ -241,72 +250,157 @@ class DataPack(BasePack[Entry, Link, Group]):
         """
         assert align_mode in ["relaxed", "strict", "backward", "forward"]
 
-        req_begin = input_processed_span.begin
-        req_end = input_processed_span.end
-
-        def get_original_index(input_index: int, is_begin_index: bool,
-                               mode: str) -> int:
-            r"""
-            Args:
-                input_index: begin or end index of the input span
-                is_begin_index: if the index is the begin index of the input
-                span or the end index of the input span
-                mode: alignment mode
-            Returns:
-                Original index that aligns with input_index
-            """
-            if len(self.processed_original_spans) == 0:
-                return input_index
-
-            len_processed_text = len(self._text)
-            orig_index = None
-            prev_end = 0
-            for (inverse_span, original_span) in self.processed_original_spans:
-                # check if the input_index lies between one of the unprocessed
-                # spans
-                if prev_end <= input_index < inverse_span.begin:
-                    increment = original_span.begin - inverse_span.begin
-                    orig_index = input_index + increment
-                # check if the input_index lies between one of the processed
-                # spans
-                elif inverse_span.begin <= input_index < inverse_span.end:
-                    # look backward - backward shift of input_index
-                    if is_begin_index and mode in ["backward", "relaxed"]:
-                        orig_index = original_span.begin
-                    if not is_begin_index and mode == "backward":
-                        orig_index = original_span.begin - 1
-
-                    # look forward - forward shift of input_index
-                    if is_begin_index and mode == "forward":
-                        orig_index = original_span.end
-                    if not is_begin_index and mode in ["forward", "relaxed"]:
-                        orig_index = original_span.end - 1
-
-                # break if the original index is populated
-                if orig_index is not None:
-                    break
-                prev_end = inverse_span.end
-
-            if orig_index is None:
-                # check if the input_index lies between the last unprocessed
-                # span
-                inverse_span, original_span = self.processed_original_spans[-1]
-                if inverse_span.end <= input_index < len_processed_text:
-                    increment = original_span.end - inverse_span.end
-                    orig_index = input_index + increment
-                else:
-                    # check if there input_index is not valid given the
-                    # alignment mode or lies outside the processed string
-                    raise ValueError(f"The input span either does not adhere "
-                                     f"to the {align_mode} alignment mode or "
-                                     f"lies outside to the processed string.")
-            return orig_index
-
-        orig_begin = get_original_index(req_begin, True, align_mode)
-        orig_end = get_original_index(req_end - 1, False, align_mode) + 1
+        orig_begin = self._get_original_index(
+            input_processed_span.begin, True, align_mode)
+        orig_end = self._get_original_index(
+            input_processed_span.end - 1, False, align_mode) + 1
 
         return Span(orig_begin, orig_end)
 
+    def get_original_spans(self, input_processed_spans: Sequence[Span],
+                           align_mode: str = "relaxed") -> List[Span]:
+        r"""Get the spans of the original text that align with many spans of
+        the processed text at once, see :meth:`get_original_span`.
+
+        Args:
+            input_processed_spans: The spans of the processed text.
+            align_mode: The strictness criteria for alignment in the
+                ambiguous cases, see :meth:`get_original_span`.
+
+        Returns:
+            The spans of the original text, in the order of
+            ``input_processed_spans``.
+        """
+        assert align_mode in ["relaxed", "strict", "backward", "forward"]
+
+        if len(input_processed_spans) == 0:
+            return []
+        if len(self.processed_original_spans) == 0:
+            return [Span(span.begin, span.end)
+                    for span in input_processed_spans]
+
+        begins = self._get_original_indices(
+            np.fromiter((span.begin for span in input_processed_spans),
+                        dtype=np.int64, count=len(input_processed_spans)),
+            True, align_mode)
+        ends = self._get_original_indices(
+            np.fromiter((span.end - 1 for span in input_processed_spans),
+                        dtype=np.int64, count=len(input_processed_spans)),
+            False, align_mode) + 1
+        return [Span(begin, end)
+                for begin, end in zip(begins.tolist(), ends.tolist())]
+
+    def _get_span_lookup(self) -> Tuple[List, ...]:
+        r"""The begins and ends of the processed spans and of the original
+        spans, as sorted lists."""
+        spans = self.processed_original_spans
+        lookup = self._span_lookup
+        if lookup is None or lookup[0] is not spans or \
+                len(lookup[1]) != len(spans):
+            lookup = (
+                spans,
+                [processed.begin for processed, _ in spans],
+                [processed.end for processed, _ in spans],
+                [original.begin for _, original in spans],
+                [original.end for _, original in spans],
+            )
+            self._span_lookup = lookup
+        return lookup[1:]
+
+    def _alignment_error(self, align_mode: str) -> ValueError:
+        return ValueError(f"The input span either does not adhere "
+                          f"to the {align_mode} alignment mode or "
+                          f"lies outside to the processed string.")
+
+    def _get_original_index(self, input_index: int, is_begin_index: bool,
+                            mode: str) -> int:
+        r"""
+        Args:
+            input_index: begin or end index of the input span
+            is_begin_index: if the index is the begin index of the input
+            span or the end index of the input span
+            mode: alignment mode
+        Returns:
+            Original index that aligns with input_index
+        """
+        if len(self.processed_original_spans) == 0:
+            return input_index
+        if input_index < 0:
+            raise self._alignment_error(mode)
+
+        begins, ends, orig_begins, orig_ends = self._get_span_lookup()
+
+        # The first processed span ending after the index, the index is
+        # either in the unprocessed text before it, or in it.
+        i = bisect_right(ends, input_index)
+        if i == len(ends):
+            # The unprocessed text after the last processed span.
+            if input_index < len(self._text):
+                return input_index + orig_ends[-1] - ends[-1]
+            raise self._alignment_error(mode)
+
+        if input_index < begins[i]:
+            return input_index + orig_begins[i] - begins[i]
+
+        # The index is in the processed span.
+        if is_begin_index:
+            # look backward - backward shift of input_index
+            if mode in ["backward", "relaxed"]:
+                return orig_begins[i]
+            # look forward - forward shift of input_index
+            if mode == "forward":
+                return orig_ends[i]
+        else:
+            if mode == "backward":
+                return orig_begins[i] - 1
+            if mode in ["forward", "relaxed"]:
+                return orig_ends[i] - 1
+        raise self._alignment_error(mode)
+
+    def _get_original_indices(self, input_indices: np.ndarray,
+                              is_begin_index: bool, mode: str) -> np.ndarray:
+        r"""The vectorized version of :meth:`_get_original_index`."""
+        begins, ends, orig_begins, orig_ends = (
+            np.asarray(offsets, dtype=np.int64)
+            for offsets in self._get_span_lookup())
+
+        i = np.searchsorted(ends, input_indices, side='right')
+        after = i == len(ends)
+        # Any valid span for the indices after the last processed span.
+        j = np.minimum(i, len(ends) - 1)
+        before = ~after & (input_indices < begins[j])
+        inside = ~after & ~before
+
+        result = np.where(
+            after, input_indices + orig_ends[-1] - ends[-1],
+            input_indices + orig_begins[j] - begins[j])
+        valid = (input_indices >= 0) & (
+            ~after | (input_indices < len(self._text)))
+
+        if is_begin_index:
+            if mode in ["backward", "relaxed"]:
+                inside_result = orig_begins[j]
+            elif mode == "forward":
+                inside_result = orig_ends[j]
+            else:
+                inside_result = None
+        else:
+            if mode == "backward":
+                inside_result = orig_begins[j] - 1
+            elif mode in ["forward", "relaxed"]:
+                inside_result = orig_ends[j] - 1
+            else:
+                inside_result = None
+
+        if inside_result is None:
+            valid &= ~inside
+        else:
+            result = np.where(inside, inside_result, result)
+
+        if not valid.all():
+            raise self._alignment_error(mode)
+        return result
+
     def _add_entry(self, entry: EntryType) -> EntryType:
         r"""Force add an :class:`~forte.data.ontology.top.Entry` object to the
         :class:`DataPack` object. Allow duplicate entries in a pack.
@@ -382,7 +476,7 @@ class DataPack(BasePack[Entry, Link, Group]):
                 self.index.update_link_index([entry])
             if self.index.group_index_on and isinstance(entry, Group):
                 self.index.update_group_index([entry])
-            self.index.deactivate_coverage_index()
+            self.index.update_coverage_index([entry])
 
             self._pending_entries.pop(entry.tid)
 
@@ -436,11 +530,24 @@ class DataPack(BasePack[Entry, Link, Group]):
 
         # update basic index
         self.index.remove_entry(entry)
+        self.index.remove_from_coverage_index(entry)
 
         # set other index invalid
         self.index.turn_link_index_switch(on=False)
         self.index.turn_group_index_switch(on=False)
-        self.index.deactivate_coverage_index()
+
+    def view(self):
+        r"""Create a copy-on-write view of this pack, which shares the
+        entries of this pack and keeps the changes made on it separately, see
+        :class:`~forte.data.data_pack_view.DataPackView`. This pack should not
+        be modified while the view is in use.
+
+        Returns:
+            The view of this pack.
+        """
+        # pylint: disable=import-outside-toplevel
+        from forte.data.data_pack_view import DataPackView
+        return DataPackView(self)
 
     @classmethod
     def validate_link(cls, entry: EntryType) -> bool:
@@ -525,19 +632,11 @@ class DataPack(BasePack[Entry, Link, Group]):
         context_components, _, context_fields = self._parse_request_args(
             context_type, context_args)
 
-        valid_context_ids: Set[int] = self.get_ids_by_type(context_type)
-        if context_components:
-            valid_component_id: Set[int] = set()
-            for component in context_components:
-                valid_component_id |= self.get_ids_by_component(component)
-            valid_context_ids &= valid_component_id
-
         skipped = 0
-        # must iterate through a copy here because self.annotations is changing
-        for context in list(self.annotations):
-            if (context.tid not in valid_context_ids or
-                    not isinstance(context, context_type)):
-                continue
+        # Take a copy of the contexts, since the pack may change while
+        # yielding.
+        for context in list(self.get(
+                context_type, components=context_components or None)):
             if skipped < skip_k:
                 skipped += 1
                 continue
@@ -580,6 +679,216 @@ class DataPack(BasePack[Entry, Link, Group]):
 
             yield data
 
+    def get_columnar_data(
+            self, context_type: Type[Annotation],
+            request: Optional[DataRequest] = None,
+            skip_k: int = 0) -> Dict[str, Any]:
+        r"""Fetch the same data as :meth:`get_data`, but in a columnar form:
+        instead of one dict per context instance, all the instances are
+        returned at once with one array per field.
+
+        - ``"context"``, ``"offset"`` and the requested context fields are
+          arrays with one value per instance.
+        - Each requested entry type maps to a
+          :class:`~forte.data.data_utils_io.RaggedColumns`, holding flat
+          ``"begin"``, ``"end"``, ``"text"``, ``"tid"`` arrays and one flat
+          array per requested field of all instances, and the ``offsets``
+          that split them into instances. ``"unit_span"`` of annotations and
+          ``"parent"``, ``"child"`` of links are indices relative to the
+          instance, as in :meth:`get_data`.
+
+        The batchers can then concatenate and slice the batches with one
+        NumPy operation per column, see
+        :func:`~forte.data.data_utils_io.merge_batches`.
+
+        Args:
+            context_type (str): The granularity of the data context, which
+                could be any ``Annotation`` type.
+            request (dict): The entry types and fields required, in the same
+                format as :meth:`get_data`.
+            skip_k (int): Will skip the first `skip_k` instances.
+
+        Returns:
+            A dict of the columns.
+        """
+        annotation_types: Dict[Type[Annotation], Union[Dict, List]] = dict()
+        link_types: Dict[Type[Link], Union[Dict, List]] = dict()
+
+        if request is not None:
+            for key, value in request.items():
+                if issubclass(key, Annotation):
+                    annotation_types[key] = value
+                elif issubclass(key, Link):
+                    link_types[key] = value
+
+        context_components, _, context_fields = self._parse_request_args(
+            context_type, annotation_types.get(context_type))
+
+        contexts: List[Annotation] = list(
+            self.get(context_type, components=context_components))[skip_k:]
+
+        data: Dict[str, Any] = dict()
+        data["context"] = to_column(
+            [self.text[c.span.begin: c.span.end] for c in contexts])
+        data["offset"] = np.array(
+            [c.span.begin for c in contexts], dtype=np.int64)
+        for field in context_fields:
+            data[field] = to_column([getattr(c, field) for c in contexts])
+
+        # The tids of the entries of each type in each context, used to find
+        # the parents and children of links.
+        context_tids: Dict[str, List[Dict[int, int]]] = dict()
+
+        for a_type, a_args in annotation_types.items():
+            if issubclass(a_type, context_type):
+                continue
+            if a_type.__name__ in data.keys():
+                raise KeyError(
+                    f"Requesting two types of entries with the "
+                    f"same class name {a_type.__name__} at the "
+                    f"same time is not allowed")
+            data[a_type.__name__] = self._generate_annotation_columns(
+                a_type, a_args, data, contexts, context_tids)
+
+        for l_type, l_args in link_types.items():
+            if l_type.__name__ in data.keys():
+                raise KeyError(
+                    f"Requesting two types of entries with the "
+                    f"same class name {l_type.__name__} at the "
+                    f"same time is not allowed")
+            data[l_type.__name__] = self._generate_link_columns(
+                l_type, l_args, contexts, context_tids)
+
+        return data
+
+    def _generate_annotation_columns(
+            self,
+            a_type: Type[Annotation],
+            a_args: Union[Dict, Iterable],
+            data: Dict[str, Any],
+            contexts: List[Annotation],
+            context_tids: Dict[str, List[Dict[int, int]]]) -> RaggedColumns:
+        components, unit, fields = self._parse_request_args(a_type, a_args)
+        fields.discard("tid")
+
+        if unit is not None and unit not in data.keys():
+            raise KeyError(f"{unit} is missing in data. You need to "
+                           f"request {unit} before {a_type}.")
+
+        offsets: List[int] = [0]
+        begins: List[int] = []
+        ends: List[int] = []
+        tids: List[int] = []
+        field_values: Dict[str, List[Any]] = {f: [] for f in fields}
+        tid_positions: List[Dict[int, int]] = []
+
+        for context in contexts:
+            positions: Dict[int, int] = {}
+            for annotation in self.get(a_type, context, components):
+                positions[annotation.tid] = len(positions)
+                begins.append(annotation.span.begin)
+                ends.append(annotation.span.end)
+                tids.append(annotation.tid)
+                for field in fields:
+                    if field not in ("span", "text", "context_span"):
+                        field_values[field].append(
+                            getattr(annotation, field))
+            tid_positions.append(positions)
+            offsets.append(len(tids))
+        context_tids[a_type.__name__] = tid_positions
+
+        offset_array = np.array(offsets, dtype=np.int64)
+        begin_array = np.array(begins, dtype=np.int64)
+        end_array = np.array(ends, dtype=np.int64)
+
+        columns: Dict[str, np.ndarray] = {
+            "begin": begin_array,
+            "end": end_array,
+            "text": to_column(
+                [self.text[b:e] for b, e in zip(begins, ends)]),
+            "tid": np.array(tids, dtype=np.int64),
+        }
+        for field in fields:
+            if field == "context_span":
+                context_begins = np.repeat(
+                    data["offset"], np.diff(offset_array))
+                columns[field] = np.stack(
+                    [begin_array - context_begins,
+                     end_array - context_begins], axis=-1).reshape(-1, 2)
+            elif field not in ("span", "text"):
+                columns[field] = to_column(field_values[field])
+
+        if unit is not None:
+            unit_columns: RaggedColumns = data[unit]
+            unit_spans = np.zeros((len(tids), 2), dtype=np.int64)
+            for i in range(len(contexts)):
+                a_begin, a_end = offset_array[i], offset_array[i + 1]
+                u_begin, u_end = (unit_columns.offsets[i],
+                                  unit_columns.offsets[i + 1])
+                # The units within each annotation, as indices relative to the
+                # units of the instance.
+                unit_spans[a_begin:a_end, 0] = np.searchsorted(
+                    unit_columns["begin"][u_begin:u_end],
+                    begin_array[a_begin:a_end], side="left")
+                unit_spans[a_begin:a_end, 1] = np.searchsorted(
+                    unit_columns["end"][u_begin:u_end],
+                    end_array[a_begin:a_end], side="right")
+            columns["unit_span"] = unit_spans
+
+        return RaggedColumns(offset_array, columns)
+
+    def _generate_link_columns(
+            self,
+            a_type: Type[Link],
+            a_args: Union[Dict, Iterable],
+            contexts: List[Annotation],
+            context_tids: Dict[str, List[Dict[int, int]]]) -> RaggedColumns:
+        components, unit, fields = self._parse_request_args(a_type, a_args)
+        fields.discard("tid")
+
+        if unit is not None:
+            raise ValueError(f"Link entries cannot be indexed by {unit}.")
+
+        parent_type = a_type.ParentType.__name__
+        child_type = a_type.ChildType.__name__
+        if parent_type not in context_tids:
+            raise KeyError(f"The Parent entry of {a_type} is not requested."
+                           f" You should also request {parent_type} with "
+                           f"{a_type}")
+        if child_type not in context_tids:
+            raise KeyError(f"The child entry of {a_type} is not requested."
+                           f" You should also request {child_type} with "
+                           f"{a_type}")
+
+        offsets: List[int] = [0]
+        tids: List[int] = []
+        parents: List[int] = []
+        children: List[int] = []
+        field_values: Dict[str, List[Any]] = {
+            f: [] for f in fields if f not in ("parent", "child")}
+
+        link: Link
+        for i, context in enumerate(contexts):
+            parent_positions = context_tids[parent_type][i]
+            child_positions = context_tids[child_type][i]
+            for link in self.get(a_type, context, components):
+                tids.append(link.tid)
+                parents.append(parent_positions[link.parent])
+                children.append(child_positions[link.child])
+                for field, values in field_values.items():
+                    values.append(getattr(link, field))
+            offsets.append(len(tids))
+
+        columns: Dict[str, np.ndarray] = {
+            "tid": np.array(tids, dtype=np.int64),
+            "parent": np.array(parents, dtype=np.int64),
+            "child": np.array(children, dtype=np.int64),
+        }
+        for field, values in field_values.items():
+            columns[field] = to_column(values)
+
+        return RaggedColumns(np.array(offsets, dtype=np.int64), columns)
+
     def _parse_request_args(self, a_type, a_args):
         # request which fields generated by which component
         components = None
@@ -658,15 +967,19 @@ class DataPack(BasePack[Entry, Link, Group]):
                 a_dict[field].append(getattr(annotation, field))
 
             if unit is not None:
-                while not self.index.in_span(data[unit]["tid"][unit_begin],
-                                             annotation.span):
+                unit_tids = data[unit]["tid"]
+                while not self.index.in_span(
+                        self.get_entry(unit_tids[unit_begin]),
+                        annotation.span):
                     unit_begin += 1
 
                 unit_span_begin = unit_begin
                 unit_span_end = unit_span_begin + 1
 
-                while self.index.in_span(data[unit]["tid"][unit_span_end],
-                                         annotation.span):
+                while (unit_span_end < len(unit_tids)
+                       and self.index.in_span(
+                           self.get_entry(unit_tids[unit_span_end]),
+                           annotation.span)):
                     unit_span_end += 1
 
                 a_dict["unit_span"].append((unit_span_begin, unit_span_end))
@@ -752,22 +1065,26 @@ class DataPack(BasePack[Entry, Link, Group]):
                 generated by any component.
         """
         # If we don't have any annotations, then we yield an empty list.
-        # Note that generics do not work with annotations.
-        if len(self.annotations) == 0 and not issubclass(entry_type, Generics):
+        # Note that generics and links do not need annotations in this pack.
+        if len(self.annotations) == 0 and issubclass(entry_type, Annotation):
             yield from []
             return
 
-        # valid type
-        valid_id = self.get_ids_by_type(entry_type)
+        # valid type, a read-only view of the type index.
+        valid_id: AbstractSet[int] = self.view_ids_by_type(entry_type)
+        # Whether the ids are further filtered than the type.
+        filtered = False
         # valid component
         if components is not None:
             if isinstance(components, str):
                 components = [components]
-            valid_id &= self.get_ids_by_components(components)
+            valid_id = valid_id & self.get_ids_by_components(components)
+            filtered = True
 
         # Generics do not work with range_annotation.
         if issubclass(entry_type, Generics):
-            for entry_id in valid_id:
+            # Iterate over a copy, the index may change while yielding.
+            for entry_id in list(valid_id):
                 entry: EntryType = self.get_entry(entry_id)  # type: ignore
                 yield entry
             return
@@ -776,40 +1093,39 @@ class DataPack(BasePack[Entry, Link, Group]):
         if range_annotation is not None:
             coverage_index = self.index.coverage_index(type(range_annotation),
                                                        entry_type)
-            if coverage_index is not None:
-                valid_id &= coverage_index[range_annotation.tid]
-
-        range_begin = range_annotation.span.begin if range_annotation else 0
-        range_end = (range_annotation.span.end if range_annotation else
-                     self.annotations[-1].span.end)
+            if (coverage_index is not None
+                    and range_annotation.tid in coverage_index):
+                valid_id = valid_id & coverage_index[range_annotation.tid]
+                filtered = True
 
         if issubclass(entry_type, Annotation):
-            temp_begin = Annotation(self, range_begin, range_begin)
-            begin_index = self.annotations.bisect(temp_begin)
-
-            temp_end = Annotation(self, range_end, range_end)
-            end_index = self.annotations.bisect(temp_end)
-
-            # Make sure these temporary annotations are not part of the
-            # actual data.
-            temp_begin.regret_creation()
-            temp_end.regret_creation()
-
-            for annotation in self.annotations[begin_index: end_index]:
-                if annotation.tid not in valid_id:
+            # The span index only contains the entries of the requested types,
+            # so the ids need to be checked only if they are further filtered.
+            span = range_annotation.span if range_annotation else None
+            for annotation in self.index.annotations_in_span(
+                    entry_type, span):
+                if filtered and annotation.tid not in valid_id:
                     continue
-                if (range_annotation is None or
-                        self.index.in_span(annotation, range_annotation.span)):
-                    yield annotation
+                yield annotation
 
         elif issubclass(entry_type, (Link, Group)):
-            for entry_id in valid_id:
+            for entry_id in list(valid_id):
                 entry: EntryType = self.get_entry(entry_id)  # type: ignore
                 if (range_annotation is None or
                         self.index.in_span(entry, range_annotation.span)):
                     yield entry
 
 
+def _span_key(annotation: Annotation) -> Tuple[int, int, int]:
+    return annotation.span.begin, annotation.span.end, annotation.tid
+
+
+def _annotation_order(annotation: Annotation) -> Tuple[int, int, str, int]:
+    # Consistent with the ordering of the annotations, see `Annotation.__lt__`.
+    return (annotation.span.begin, annotation.span.end,
+            str(type(annotation)), annotation.tid)
+
+
 class DataIndex(BaseIndex):
     r"""A set of indexes used in :class:`DataPack`:
 
@@ -828,6 +1144,9 @@ class DataIndex(BaseIndex):
        The outer entry type should be an annotation type. The value is a dict,
        where the key is the tid of the outer entry, and the value is a set of
        tids that are covered by the outer entry.
+    #. :attr:`_span_index`, the index from each annotation type to the
+       annotations of that type sorted by span, used to find the annotations
+       within a range.
 
     """
 
@@ -837,6 +1156,70 @@ class DataIndex(BaseIndex):
                                    Dict[int, Set[int]]] = dict()
         self._coverage_index_valid = True
 
+        # Mapping from each annotation type to its annotations, sorted by the
+        # span and then the tid.
+        self._span_index: Dict[Type[Annotation], SortedKeyList] = dict()
+        # The longest span ever indexed of each annotation type.
+        self._max_span_length: Dict[Type[Annotation], int] = dict()
+
+    def update_basic_index(self, entries: List[EntryType]):
+        super().update_basic_index(entries)
+        for entry in entries:
+            if isinstance(entry, Annotation):
+                entry_type = type(entry)
+                length = entry.span.end - entry.span.begin
+                try:
+                    self._span_index[entry_type].add(entry)
+                    if length > self._max_span_length[entry_type]:
+                        self._max_span_length[entry_type] = length
+                except KeyError:
+                    self._span_index[entry_type] = SortedKeyList(
+                        [entry], key=_span_key)
+                    self._max_span_length[entry_type] = length
+
+    def remove_entry(self, entry: EntryType):
+        super().remove_entry(entry)
+        if isinstance(entry, Annotation):
+            annotations = self._span_index.get(type(entry))
+            if annotations is not None:
+                annotations.discard(entry)
+
+    def annotations_in_span(
+            self, entry_type: Type[Annotation],
+            span: Optional[Span] = None) -> Iterator[Annotation]:
+        r"""Get the annotations of ``entry_type`` (including its subclasses)
+        that are within ``span``, in the same order as
+        :attr:`DataPack.annotations`. Only the annotations of the requested
+        types are visited, each type takes a binary search on its span index.
+
+        Args:
+            entry_type (type): The annotation type to look up.
+            span (Span, optional): The span to search in. If `None`, all the
+                annotations of ``entry_type`` are returned.
+
+        Returns:
+            An iterator of the annotations.
+        """
+        results: List[List[Annotation]] = []
+        for t in self.indexed_subtypes(entry_type):
+            annotations = self._span_index.get(t)
+            if not annotations:
+                continue
+            if span is None:
+                # Take a copy since the index may change while iterating.
+                results.append(list(annotations))
+            else:
+                begin_index = annotations.bisect_key_left((span.begin,))
+                end_index = annotations.bisect_key_right(
+                    (span.end, span.end, math.inf))
+                results.append([
+                    a for a in annotations[begin_index: end_index]
+                    if a.span.end <= span.end])
+
+        if len(results) == 1:
+            return iter(results[0])
+        return heapq.merge(*results, key=_annotation_order)
+
     @property
     def coverage_index_is_valid(self):
         return self._coverage_index_valid
@@ -871,31 +1254,193 @@ class DataIndex(BaseIndex):
             outer_type: Type[Annotation],
             inner_type: Type[EntryType]):
         r"""Build the coverage index from ``outer_type`` to ``inner_type``.
+        The index is built with one sweep over the entries sorted by span, and
+        is then kept up to date by :meth:`update_coverage_index` and
+        :meth:`remove_from_coverage_index`.
 
         Args:
-            data_pack (DataPack): The data pack to build coverage for.
+            data_pack (DataPack): The data pack to build coverage for, which
+                should be the pack of this index.
             outer_type (type): an annotation type.
             inner_type (type): an entry type, can be Annotation, Link, Group.
         """
-        if not isinstance(inner_type, (Annotation, Link, Group)):
+        if not issubclass(inner_type, (Annotation, Link, Group)):
             raise ValueError(f"Do not support coverage index for {inner_type}.")
 
+        if data_pack.index is not self:
+            raise ValueError("The data pack is not the one of this index.")
+
         if not self.coverage_index_is_valid:
             self._coverage_index = dict()
 
         # prevent the index from being used during construction
         self.deactivate_coverage_index()
 
-        self._coverage_index[(outer_type, inner_type)] = dict()
-        for range_annotation in data_pack.get_entries_by_type(outer_type):
-            if isinstance(range_annotation, Annotation):
-                entries = data_pack.get(inner_type, range_annotation)
-                entry_ids = {e.tid for e in entries}
-                self._coverage_index[
-                    (outer_type, inner_type)][range_annotation.tid] = entry_ids
+        outers: List[Annotation] = list(self.annotations_in_span(outer_type))
+        coverage: Dict[int, Set[int]] = {o.tid: set() for o in outers}
+
+        inners: List[Tuple[int, int, int]]
+        if issubclass(inner_type, Annotation):
+            # The annotations from the span index are already sorted.
+            inners = [(a.span.begin, a.span.end, a.tid)
+                      for a in self.annotations_in_span(inner_type)]
+        else:
+            inners = []
+            for tid in self.ids_by_type(inner_type):
+                span = self._entry_span(self._entry_index[tid])
+                if span is not None:
+                    inners.append((span[0], span[1], tid))
+            inners.sort()
+
+        # Sweep over the inner entries by their begin, the active outer
+        # annotations are the ones that begin before the current inner entry
+        # and do not end before it begins, kept in a heap by their end.
+        active: List[Tuple[int, int]] = []
+        outer_index = 0
+        for begin, end, tid in inners:
+            while (outer_index < len(outers)
+                   and outers[outer_index].span.begin <= begin):
+                outer = outers[outer_index]
+                heapq.heappush(active, (outer.span.end, outer.tid))
+                outer_index += 1
+            while active and active[0][0] < begin:
+                heapq.heappop(active)
+            for outer_end, outer_tid in active:
+                if outer_end >= end:
+                    coverage[outer_tid].add(tid)
+
+        self._coverage_index[(outer_type, inner_type)] = coverage
 
         self.activate_coverage_index()
 
+    def update_coverage_index(self, entries: List[EntryType]):
+        r"""Update the built coverage indexes with the newly added
+        ``entries``. An index is dropped, to be built again when needed, if it
+        cannot be updated cheaply, i.e. when an outer annotation is added to an
+        index of links or groups.
+
+        Args:
+            entries (list): the entries added to the pack.
+        """
+        if not self.coverage_index_is_valid or not self._coverage_index:
+            return
+
+        for entry in entries:
+            for key in list(self._coverage_index.keys()):
+                outer_type, inner_type = key
+                coverage = self._coverage_index[key]
+
+                if isinstance(entry, outer_type):
+                    if issubclass(inner_type, Annotation):
+                        coverage[entry.tid] = {
+                            a.tid for a in self.annotations_in_span(
+                                inner_type, entry.span)}
+                    else:
+                        del self._coverage_index[key]
+                        continue
+
+                if isinstance(entry, inner_type):
+                    try:
+                        outers = list(
+                            self._covering_annotations(outer_type, entry))
+                    except KeyError:
+                        # The entries referred by a link or group may not be
+                        # indexed yet.
+                        del self._coverage_index[key]
+                        continue
+                    for outer in outers:
+                        coverage.setdefault(outer.tid, set()).add(entry.tid)
+
+    def remove_from_coverage_index(self, entry: EntryType):
+        r"""Remove ``entry`` from the built coverage indexes.
+
+        Args:
+            entry (Entry): the entry removed from the pack.
+        """
+        if not self.coverage_index_is_valid:
+            return
+
+        for key in list(self._coverage_index.keys()):
+            outer_type, inner_type = key
+            coverage = self._coverage_index[key]
+            if isinstance(entry, outer_type):
+                coverage.pop(entry.tid, None)
+            if isinstance(entry, inner_type):
+                try:
+                    outers = list(
+                        self._covering_annotations(outer_type, entry))
+                except KeyError:
+                    # The entries referred by a link or group may have been
+                    # removed already.
+                    del self._coverage_index[key]
+                    continue
+                for outer in outers:
+                    if outer.tid in coverage:
+                        coverage[outer.tid].discard(entry.tid)
+
+    def _covering_annotations(
+            self, outer_type: Type[Annotation],
+            entry: Entry) -> Iterator[Annotation]:
+        r"""Find the indexed annotations of ``outer_type`` that cover
+        ``entry``. Only the annotations beginning within the longest span of
+        each type before the entry are visited.
+        """
+        span = self._entry_span(entry)
+        if span is None:
+            return
+        begin, end = span
+        for t in self.indexed_subtypes(outer_type):
+            annotations = self._span_index.get(t)
+            if not annotations:
+                continue
+            lower = annotations.bisect_key_left(
+                (end - self._max_span_length[t],))
+            upper = annotations.bisect_key_right((begin, math.inf, math.inf))
+            for annotation in annotations[lower: upper]:
+                if annotation.span.end >= end:
+                    yield annotation
+
+    def _entry_span(self, entry: Entry) -> Optional[Tuple[int, int]]:
+        r"""Get the range of text taken by ``entry``, which is the span of an
+        annotation, or the range covering the parent and child of a link or
+        the members of a group. Return `None` if the range is not defined.
+        """
+        if isinstance(entry, Annotation):
+            return entry.span.begin, entry.span.end
+        elif isinstance(entry, Link):
+            child = entry.get_child()
+            parent = entry.get_parent()
+
+            if (not isinstance(child, Annotation)
+                    or not isinstance(parent, Annotation)):
+                # Cannot check in_span for non-annotations.
+                return None
+
+            child_: Annotation = child
+            parent_: Annotation = parent
+
+            return (min(child_.span.begin, parent_.span.begin),
+                    max(child_.span.end, parent_.span.end))
+        elif isinstance(entry, Group):
+            inner_begin = -1
+            inner_end = -1
+            for mem in entry.get_members():
+                if not isinstance(mem, Annotation):
+                    # Cannot check in_span for non-annotations.
+                    return None
+
+                mem_: Annotation = mem
+                if inner_begin == -1:
+                    inner_begin = mem_.span.begin
+                inner_begin = min(inner_begin, mem_.span.begin)
+                inner_end = max(inner_end, mem_.span.end)
+            return inner_begin, inner_end
+        else:
+            raise ValueError(
+                f"Invalid entry type {type(entry)}. A valid entry "
+                f"should be an instance of Annotation, Link, or Group."
+            )
+
     def have_overlap(self,
                      entry1: Union[Annotation, int],
                      entry2: Union[Annotation, int]) -> bool:
@@ -942,39 +1487,8 @@ class DataIndex(BaseIndex):
         if isinstance(inner_entry, (int, np.integer)):
             inner_entry = self._entry_index[inner_entry]
 
-        if isinstance(inner_entry, Annotation):
-            inner_begin = inner_entry.span.begin
-            inner_end = inner_entry.span.end
-        elif isinstance(inner_entry, Link):
-            child = inner_entry.get_child()
-            parent = inner_entry.get_parent()
-
-            if (not isinstance(child, Annotation)
-                    or not isinstance(parent, Annotation)):
-                # Cannot check in_span for non-annotations.
-                return False
-
-            child_: Annotation = child
-            parent_: Annotation = parent
-
-            inner_begin = min(child_.span.begin, parent_.span.begin)
-            inner_end = max(child_.span.end, parent_.span.end)
-        elif isinstance(inner_entry, Group):
-            inner_begin = -1
-            inner_end = -1
-            for mem in inner_entry.get_members():
-                if not isinstance(mem, Annotation):
-                    # Cannot check in_span for non-annotations.
-                    return False
-
-                mem_: Annotation = mem
-                if inner_begin == -1:
-                    inner_begin = mem_.span.begin
-                inner_begin = min(inner_begin, mem_.span.begin)
-                inner_end = max(inner_end, mem_.span.end)
-        else:
-            raise ValueError(
-                f"Invalid entry type {type(inner_entry)}. A valid entry "
-                f"should be an instance of Annotation, Link, or Group."
-            )
+        inner_span = self._entry_span(inner_entry)
+        if inner_span is None:
+            return False
+        inner_begin, inner_end = inner_span
         return inner_begin >= span.begin and inner_end <= span.end
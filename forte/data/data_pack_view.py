@@ -0,0 +1,327 @@
+# Copyright 2020 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A copy-on-write view of a :class:`~forte.data.data_pack.DataPack`.
+"""
+import copy
+import heapq
+from typing import (
+    Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type, Union)
+
+from forte.data.container import EntryIdManager
+from forte.data.data_pack import DataPack, DataIndex, _annotation_order
+from forte.data.ontology.core import Entry, EntryType
+from forte.data.ontology.top import (
+    Annotation, Link, Group, Generics)
+
+__all__ = [
+    "DataPackView",
+]
+
+# The attributes of a data pack holding the entries.
+_ENTRY_LISTS = ("annotations", "links", "groups", "generics")
+
+
+def _restore_pack(state: Dict[str, Any]) -> DataPack:
+    pack: DataPack = DataPack.__new__(DataPack)
+    pack.__setstate__(state)
+    return pack
+
+
+class DataPackView(DataPack):
+    r"""A copy-on-write view of a :class:`~forte.data.data_pack.DataPack`,
+    created by :meth:`DataPack.view() <forte.data.data_pack.DataPack.view>`.
+
+    The view shares the text, the entries and the indexes of the base pack,
+    and only stores what is done on top of it:
+
+    - The entries added to the view are stored and indexed in the view.
+    - The entries of the base pack are returned as shallow copies owned by
+      the view, created when they are first accessed, so the fields written
+      on them do not change the base pack.
+    - The entries of the base pack deleted from the view are hidden.
+
+    So creating a view takes constant time, and the cost of using it grows
+    with the entries accessed and added instead of the size of the pack. This
+    is used to let a predictor write to a pack during evaluation while
+    keeping the gold pack intact.
+
+    Call :meth:`materialize` to get the result as an independent
+    :class:`~forte.data.data_pack.DataPack`, or :meth:`discard` to drop
+    everything done on the view.
+
+    Note that the base pack should not be modified while the view is in use,
+    and the container fields (such as :class:`~forte.data.ontology.core.FList`)
+    of the base entries are shared, so they should be assigned instead of
+    modified in place.
+
+    Args:
+        base: The pack to be viewed.
+    """
+
+    def __init__(self, base: DataPack):
+        super().__init__()
+        self._base: DataPack = base
+        self.meta = copy.copy(base.meta)
+
+        self._text = base.text
+        self.replace_back_operations = base.replace_back_operations
+        self.processed_original_spans = base.processed_original_spans
+        self.orig_text_len = base.orig_text_len
+
+        # pylint: disable=protected-access
+        self._id_manager = EntryIdManager(
+            base._id_manager.current_id_counter())
+        self._validation_mode = base.validation_mode
+
+        # The copies of the base entries owned by this view, by tid.
+        self._shadows: Dict[int, Entry] = {}
+        # The tids of the base entries deleted from this view.
+        self._deleted: Set[int] = set()
+        # The fields written on the base entries through this view.
+        self._field_writes: Dict[int, Set[str]] = {}
+
+    def __reduce__(self):
+        # A view is copied or pickled as the data pack it represents.
+        return _restore_pack, (self._merged_state(),)
+
+    @property
+    def base(self) -> DataPack:
+        r"""The pack viewed by this view."""
+        return self._base
+
+    @property
+    def modified_fields(self) -> Dict[int, Set[str]]:
+        r"""The names of the fields written on the entries of the base pack
+        through this view, by the tid of the entry."""
+        return self._field_writes
+
+    def added_entries(self) -> Iterator[Entry]:
+        r"""The entries added to this view."""
+        yield from super().__iter__()
+
+    def __iter__(self):
+        yield from self.get(Annotation)
+        yield from self.get(Link)
+        yield from self.get(Group)
+        yield from self.get(Generics)
+
+    def _shadow_of(self, entry: EntryType) -> EntryType:
+        r"""Get the copy of the base entry owned by this view."""
+        shadow = self._shadows.get(entry.tid)
+        if shadow is None:
+            shadow = object.__new__(type(entry))
+            shadow.__dict__.update(entry.__dict__)
+            shadow.set_pack(self)
+            self._shadows[entry.tid] = shadow
+        return shadow  # type: ignore
+
+    def _is_own_entry(self, tid: int) -> bool:
+        try:
+            self.index.get_entry(tid)
+        except KeyError:
+            return False
+        return True
+
+    def get_entry(self, tid: int) -> EntryType:
+        try:
+            return self.index.get_entry(tid)
+        except KeyError:
+            pass
+        if tid in self._deleted:
+            raise KeyError(
+                f"There is no entry with tid '{tid}'' in this datapack")
+        return self._shadow_of(self._base.get_entry(tid))
+
+    def record_field(self, entry_id: int, field_name: str):
+        super().record_field(entry_id, field_name)
+        if entry_id in self._shadows:
+            try:
+                self._field_writes[entry_id].add(field_name)
+            except KeyError:
+                self._field_writes[entry_id] = {field_name}
+
+    def delete_entry(self, entry: EntryType):
+        if self._is_own_entry(entry.tid):
+            super().delete_entry(entry)
+            return
+
+        # Make sure the entry is in the base pack.
+        self._base.get_entry(entry.tid)
+        self._deleted.add(entry.tid)
+        self._shadows.pop(entry.tid, None)
+        self._field_writes.pop(entry.tid, None)
+
+    def get_ids_by_component(self, component: str) -> Set[int]:
+        found = False
+        ids: Set[int] = set()
+        try:
+            ids |= self._base.get_ids_by_component(component)
+            found = True
+        except KeyError:
+            pass
+        if component in self.creation_records:
+            ids |= self.creation_records[component]
+            found = True
+        if not found:
+            raise KeyError(component)
+        return ids - self._deleted
+
+    def get_ids_by_type(self, entry_type: Type[EntryType]) -> Set[int]:
+        ids = self._base.get_ids_by_type(entry_type) - self._deleted
+        return ids | set(self.view_ids_by_type(entry_type))
+
+    def get_entries_by_type(
+            self, entry_type: Type[EntryType]) -> List[EntryType]:
+        entries: List[EntryType] = []
+        for tid in self.get_ids_by_type(entry_type):
+            entry: EntryType = self.get_entry(tid)
+            if isinstance(entry, entry_type):
+                entries.append(entry)
+        return entries
+
+    def _base_components(self, components: List[str]) -> List[str]:
+        r"""The components that created some entries of the base pack."""
+        known = []
+        for component in components:
+            try:
+                self._base.get_ids_by_component(component)
+            except KeyError:
+                continue
+            known.append(component)
+        return known
+
+    def get(self, entry_type: Type[EntryType],  # type: ignore
+            range_annotation: Optional[Annotation] = None,
+            components: Optional[Union[str, List[str]]] = None
+            ) -> Iterable[EntryType]:
+        r"""Get the entries of the base pack and of this view, see
+        :meth:`DataPack.get() <forte.data.data_pack.DataPack.get>`. The
+        annotations are returned in the order of their spans.
+        """
+        base_components: Optional[List[str]] = None
+        if components is not None:
+            if isinstance(components, str):
+                components = [components]
+            base_components = self._base_components(components)
+
+        base_entries = (
+            self._shadow_of(entry) for entry in self._base.get(
+                entry_type, range_annotation, base_components)
+            if entry.tid not in self._deleted)
+        own_entries = super().get(entry_type, range_annotation, components)
+
+        if issubclass(entry_type, Annotation):
+            yield from heapq.merge(
+                base_entries, own_entries, key=_annotation_order)
+        else:
+            yield from base_entries
+            yield from own_entries
+
+    def get_links_from_node(
+            self, node: Union[int, EntryType], as_parent: bool) -> List[Link]:
+        tid = node.tid if isinstance(node, Entry) else node
+        links: List[Link] = [
+            self._shadow_of(link) for link in
+            self._base.get_links_from_node(tid, as_parent)
+            if link.tid not in self._deleted]
+        links.extend(super().get_links_from_node(node, as_parent))
+        return links
+
+    def get_groups_by_member(
+            self, member: Union[int, EntryType]) -> Set[Group]:
+        tid = member.tid if isinstance(member, Entry) else member
+        groups: Set[Group] = {
+            self._shadow_of(group) for group in
+            self._base.get_groups_by_member(tid)
+            if group.tid not in self._deleted}
+        groups |= super().get_groups_by_member(member)
+        return groups
+
+    def _merged_entries(self, name: str) -> List[Entry]:
+        r"""The entries of the pack represented by this view, in the entry
+        list ``name`` of a data pack. The base entries are not copied."""
+        if isinstance(self._base, DataPackView):
+            # pylint: disable=protected-access
+            base_entries = self._base._merged_entries(name)
+        else:
+            base_entries = list(getattr(self._base, name))
+
+        entries = [self._shadows.get(e.tid, e) for e in base_entries
+                   if e.tid not in self._deleted]
+        entries.extend(getattr(self, name))
+        return entries
+
+    def _merged_records(self) -> Tuple[Dict[str, Set[int]],
+                                       Dict[str, Set[Tuple[int, str]]]]:
+        if isinstance(self._base, DataPackView):
+            # pylint: disable=protected-access
+            base_creation, base_fields = self._base._merged_records()
+        else:
+            base_creation = self._base.creation_records
+            base_fields = self._base.field_records
+
+        creation_records = {c: set(ids) for c, ids in base_creation.items()}
+        for c, ids in self.creation_records.items():
+            creation_records.setdefault(c, set()).update(ids)
+        field_records = {c: set(f) for c, f in base_fields.items()}
+        for c, fields in self.field_records.items():
+            field_records.setdefault(c, set()).update(fields)
+        return creation_records, field_records
+
+    def _merged_state(self) -> Dict[str, Any]:
+        r"""The serialized state of the pack represented by this view, see
+        :meth:`DataPack.__getstate__`."""
+        state = super().__getstate__()
+        for key in ("_base", "_shadows", "_deleted", "_field_writes"):
+            state.pop(key)
+        for name in _ENTRY_LISTS:
+            state[name] = self._merged_entries(name)
+        state["creation_records"], state["field_records"] = \
+            self._merged_records()
+        return state
+
+    def materialize(self) -> DataPack:
+        r"""Create an independent :class:`~forte.data.data_pack.DataPack`
+        with the entries of the base pack and the changes made on this view.
+        Neither the base pack nor this view is changed.
+
+        Returns:
+            The new data pack.
+        """
+        return _restore_pack(copy.deepcopy(self._merged_state()))
+
+    def discard(self):
+        r"""Drop the entries added, the fields written and the entries
+        deleted on this view, so that it shows the base pack again. The
+        entries previously returned by the view should not be used anymore.
+        """
+        for name in _ENTRY_LISTS:
+            getattr(self, name).clear()
+        self.index = DataIndex()
+        self.creation_records.clear()
+        self.field_records.clear()
+        self._pending_entries.clear()
+        self._shadows.clear()
+        self._deleted.clear()
+        self._field_writes.clear()
+        # pylint: disable=protected-access
+        self._id_manager = EntryIdManager(
+            self._base._id_manager.current_id_counter())
+
+    def serialize(self, drop_record: Optional[bool] = False,
+                  serialize_method: str = "jsonpickle") -> Union[str, bytes]:
+        r"""Serialize the pack represented by this view, see
+        :meth:`~forte.data.base_pack.BasePack.serialize`."""
+        return self.materialize().serialize(drop_record, serialize_method)
@@ -20,10 +20,11 @@ import sys
 import tarfile
 import urllib.request
 import zipfile
-from typing import List, Optional, overload
+from typing import List, Optional, Union, overload
 
 import jsonpickle
 
+from forte.data.binary_io import is_binary_pack, deserialize_binary
 from forte.utils.types import PathLike
 from forte.utils.utils_io import maybe_create_dir
 
@@ -182,9 +183,16 @@ def _download_from_google_drive(url: str, filename: str, path: str) -> str:
     return filepath
 
 
-def deserialize(string: str):
-    r"""Deserialize a pack from a string.
+def deserialize(string: Union[str, bytes]):
+    r"""Deserialize a pack from a string. The format is detected from the
+    content: bytes starting with the binary header are read as the binary
+    format, anything else is read as a `jsonpickle` string.
     """
+    if is_binary_pack(string):
+        return deserialize_binary(string)
+
+    if isinstance(string, (bytes, bytearray)):
+        string = string.decode('utf-8')
     pack = jsonpickle.decode(string)
     # Need to assign the pack manager to the pack to control it after reading
     #  the raw data.
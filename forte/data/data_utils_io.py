@@ -15,12 +15,17 @@
 Utility functions related to data processing input/output.
 """
 import os
-from typing import Dict, List, Iterator, Any, Tuple
+from collections.abc import Mapping
+from typing import Dict, List, Iterator, Any, Tuple, Sequence
+
+import numpy as np
 
 from forte.data.types import ReplaceOperationsType
 from forte.data.span import Span
 
 __all__ = [
+    "RaggedColumns",
+    "to_column",
     "batch_instances",
     "merge_batches",
     "slice_batch",
@@ -28,6 +33,125 @@ __all__ = [
 ]
 
 
+def to_column(values: Sequence[Any]) -> np.ndarray:
+    r"""Convert a list of values into a one dimensional NumPy array. Values
+    that NumPy would turn into extra dimensions (such as lists of the same
+    length), and empty columns, are stored in an array of objects.
+
+    Args:
+        values: The values of a column.
+
+    Returns:
+        A one dimensional array of the values.
+    """
+    if len(values) > 0:
+        try:
+            column = np.array(values)
+            if column.ndim == 1:
+                return column
+        except ValueError:
+            pass
+    column = np.empty(len(values), dtype=object)
+    for i, v in enumerate(values):
+        column[i] = v
+    return column
+
+
+class RaggedColumns(Mapping):
+    r"""The columns of the entries of one type in a columnar batch. Each
+    column is a flat array holding the values of all the instances, and
+    :attr:`offsets` splits them into the instances: the entries of instance
+    ``i`` are at ``offsets[i]:offsets[i + 1]`` of every column.
+
+    It can be read like the dict of the row format, where
+    ``columns["text"]`` is the flat text array, and :meth:`split` returns the
+    per instance arrays.
+
+    Args:
+        offsets: An integer array of length ``number of instances + 1``.
+        columns: A mapping from the field name to its flat array.
+    """
+
+    def __init__(self, offsets: np.ndarray, columns: Dict[str, np.ndarray]):
+        self.offsets: np.ndarray = offsets
+        self.columns: Dict[str, np.ndarray] = columns
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        return self.columns[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.columns)
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def __repr__(self) -> str:
+        return (f"RaggedColumns(instances={self.num_instances}, "
+                f"columns={list(self.columns.keys())})")
+
+    @property
+    def num_instances(self) -> int:
+        return len(self.offsets) - 1
+
+    def lengths(self) -> np.ndarray:
+        r"""The number of entries of each instance."""
+        return np.diff(self.offsets)
+
+    def split(self, key: str) -> List[np.ndarray]:
+        r"""Split the column ``key`` into one array per instance, each array
+        is a view of the flat column.
+        """
+        column = self.columns[key]
+        return [column[self.offsets[i]: self.offsets[i + 1]]
+                for i in range(self.num_instances)]
+
+    def instance(self, index: int) -> Dict[str, np.ndarray]:
+        r"""Get the columns of the instance at ``index``, in the same form as
+        the row format returned by
+        :meth:`~forte.data.data_pack.DataPack.get_data`.
+        """
+        begin, end = self.offsets[index], self.offsets[index + 1]
+        return {k: v[begin:end] for k, v in self.columns.items()}
+
+    def slice(self, start: int, length: int) -> "RaggedColumns":
+        r"""Take ``length`` instances from ``start``. The columns of the
+        result are views of these columns.
+        """
+        offsets = self.offsets[start: start + length + 1]
+        if len(offsets) == 0:
+            return RaggedColumns(
+                np.zeros(1, dtype=np.int64),
+                {k: v[:0] for k, v in self.columns.items()})
+        begin, end = offsets[0], offsets[-1]
+        return RaggedColumns(
+            offsets - begin,
+            {k: v[begin:end] for k, v in self.columns.items()})
+
+    @classmethod
+    def concatenate(cls, items: List["RaggedColumns"]) -> "RaggedColumns":
+        r"""Concatenate the instances of several ``RaggedColumns``, with one
+        NumPy concatenation per column.
+        """
+        if len(items) == 1:
+            return items[0]
+
+        offsets = [np.zeros(1, dtype=np.int64)]
+        shift = 0
+        for item in items:
+            offsets.append(item.offsets[1:] + shift)
+            shift += item.offsets[-1]
+
+        keys: Dict[str, None] = {}
+        for item in items:
+            keys.update(dict.fromkeys(item.columns))
+
+        columns = {
+            k: np.concatenate([item.columns[k] for item in items])
+            for k in keys
+        }
+        return cls(np.concatenate(offsets), columns)
+
+
 def batch_instances(instances: List[Dict]):
     r"""Merge a list of ``instances``."""
     batch: Dict[str, Any] = {}
@@ -48,7 +172,15 @@ def batch_instances(instances: List[Dict]):
 
 
 def merge_batches(batches: List[Dict]):
-    r"""Merge a list of ``batches``."""
+    r"""Merge a list of ``batches``. The columnar batches (see
+    :meth:`~forte.data.data_pack.DataPack.get_columnar_data`) are merged by
+    concatenating their arrays.
+    """
+    batches = [batch for batch in batches if batch]
+    if batches and any(isinstance(v, (np.ndarray, RaggedColumns))
+                       for v in batches[0].values()):
+        return _merge_columnar_batches(batches)
+
     merged_batch: Dict = {}
     for batch in batches:
         for entry, fields in batch.items():
@@ -66,12 +198,29 @@ def merge_batches(batches: List[Dict]):
     return merged_batch
 
 
+def _merge_columnar_batches(batches: List[Dict]) -> Dict:
+    if len(batches) == 1:
+        return batches[0]
+
+    merged_batch: Dict = {}
+    for entry, fields in batches[0].items():
+        if isinstance(fields, RaggedColumns):
+            merged_batch[entry] = RaggedColumns.concatenate(
+                [batch[entry] for batch in batches])
+        else:
+            merged_batch[entry] = np.concatenate(
+                [batch[entry] for batch in batches])
+    return merged_batch
+
+
 def slice_batch(batch, start, length):
     r"""Return a sliced batch of size ``length`` from ``start`` in ``batch``."""
     sliced_batch: Dict = {}
 
     for entry, fields in batch.items():
-        if isinstance(fields, dict):
+        if isinstance(fields, RaggedColumns):
+            sliced_batch[entry] = fields.slice(start, length)
+        elif isinstance(fields, dict):
             if entry not in sliced_batch.keys():
                 sliced_batch[entry] = {}
             for k, value in fields.items():
@@ -86,9 +235,11 @@ def dataset_path_iterator_with_base(
         dir_path: str, file_extension: str) -> Iterator[Tuple[str, str]]:
     r"""An iterator returning file_paths in a directory containing files of the
     given datasets, including the original directory as the first element.
+    The files are listed in sorted order.
     """
-    for root, _, files in os.walk(dir_path):
-        for data_file in files:
+    for root, dirs, files in os.walk(dir_path):
+        dirs.sort()
+        for data_file in sorted(files):
             if len(file_extension) > 0:
                 if data_file.endswith(file_extension):
                     yield dir_path, os.path.join(root, data_file)
@@ -98,13 +249,15 @@ def dataset_path_iterator_with_base(
 
 def dataset_path_iterator(dir_path: str, file_extension: str) -> Iterator[str]:
     r"""An iterator returning the file paths in a directory containing files of
-    the given datasets.
+    the given datasets. The files are listed in sorted order, so that the
+    order does not depend on the file system.
     """
     if not os.path.exists(dir_path):
         raise FileNotFoundError('Cannot find the directory [%s].' % dir_path)
 
-    for root, _, files in os.walk(dir_path):
-        for data_file in files:
+    for root, dirs, files in os.walk(dir_path):
+        dirs.sort()
+        for data_file in sorted(files):
             if len(file_extension) > 0:
                 if data_file.endswith(file_extension):
                     yield os.path.join(root, data_file)
@@ -135,8 +288,10 @@ def modify_text_and_track_ops(original_text: str,
         orig_text_len: length of original text.
     """
     orig_text_len: int = len(original_text)
-    mod_text: str = original_text
-    increment: int = 0
+    # The pieces of the modified text, joined once at the end, so that the
+    # text is not copied for every operation.
+    pieces: List[str] = []
+    mod_length: int = 0
     prev_span_end: int = 0
     replace_back_operations: List[Tuple[Span, str]] = []
     processed_original_spans: List[Tuple[Span, Span]] = []
@@ -153,21 +308,25 @@ def modify_text_and_track_ops(original_text: str,
             raise ValueError(
                 "One of the span indices are outside the string length")
         if span.end < span.begin:
-            print(span.begin, span.end)
             raise ValueError(
                 "One of the end indices is lesser than start index")
         if span.begin < prev_span_end:
             raise ValueError(
                 "The replacement spans should be mutually exclusive")
-        span_begin = span.begin + increment
-        span_end = span.end + increment
-        original_span_text = mod_text[span_begin: span_end]
-        mod_text = mod_text[:span_begin] + replacement + mod_text[span_end:]
-        increment += len(replacement) - (span.end - span.begin)
-        replacement_span = Span(span_begin, span_begin + len(replacement))
-        replace_back_operations.append((replacement_span, original_span_text))
+        # The unchanged text since the previous operation.
+        pieces.append(original_text[prev_span_end:span.begin])
+        mod_length += span.begin - prev_span_end
+        pieces.append(replacement)
+
+        replacement_span = Span(mod_length, mod_length + len(replacement))
+        replace_back_operations.append(
+            (replacement_span, original_text[span.begin:span.end]))
         processed_original_spans.append((replacement_span, span))
+        mod_length += len(replacement)
         prev_span_end = span.end
 
+    pieces.append(original_text[prev_span_end:])
+    mod_text: str = "".join(pieces)
+
     return (mod_text, replace_back_operations, sorted(processed_original_spans),
             orig_text_len)
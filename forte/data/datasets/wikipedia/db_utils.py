@@ -15,19 +15,27 @@
 A set of utilities to support reading DBpedia datasets.
 """
 import bz2
+import hashlib
 import logging
 import os
+import queue
 import re
+import shutil
 import sys
+import threading
 from collections import OrderedDict
 from random import choice
-from typing import List, Dict, Tuple, Union, Any, Iterator
+from typing import (
+    List, Dict, Tuple, Union, Any, Iterator, Optional, BinaryIO)
 from urllib.parse import urlparse, parse_qs
 
+import numpy as np
 import rdflib
 
 dbpedia_prefix = "http://dbpedia.org/resource/"
 state_type = Tuple[rdflib.term.Node, rdflib.term.Node, rdflib.term.Node]
+quad_type = Tuple[rdflib.term.Node, rdflib.term.Node, rdflib.term.Node,
+                  Optional[rdflib.term.Node]]
 
 
 def load_redirects(redirect_path: str) -> Dict[str, str]:
@@ -35,9 +43,8 @@ def load_redirects(redirect_path: str) -> Dict[str, str]:
     redirect_rel = "http://dbpedia.org/ontology/wikiPageRedirects"
 
     count = 0
-    for statements in NIFParser(redirect_path):
-        for statement in statements:
-            s, v, o, _ = statement
+    with NIFParser(redirect_path) as parser:
+        for s, v, o, _ in parser.quads():
             if str(v) == redirect_rel:
                 count += 1
                 from_page = get_resource_name(s)
@@ -53,8 +60,11 @@ def get_resource_attribute(url, param_name) -> str:
     return parse_qs(parsed.query)[param_name][0]
 
 
-def context_base(c: rdflib.Graph) -> str:
-    return strip_url_params(c.identifier)
+def context_base(c: Union[rdflib.Graph, rdflib.term.Node]) -> str:
+    # The streaming parser gives the context as a node, rdflib as a graph.
+    if isinstance(c, rdflib.Graph):
+        c = c.identifier
+    return strip_url_params(c)
 
 
 def get_resource_fragment(url) -> str:
@@ -98,14 +108,190 @@ def print_notice(msg: str):
     print(f'\n -- {msg}')
 
 
+_IRI = r'<([^>]*)>'
+_BNODE = r'_:(\S+)'
+_LITERAL = (r'"((?:[^"\\]|\\.)*)"'
+            r'(?:@([a-zA-Z]+(?:-[a-zA-Z0-9]+)*)|\^\^<([^>]*)>)?')
+# A statement of N-Triples or N-Quads, the groups are: the subject (IRI or
+# blank node), the predicate, the object (IRI, blank node, or the value,
+# language and datatype of a literal) and the optional graph.
+_STATEMENT = re.compile(
+    rf'\s*(?:{_IRI}|{_BNODE})\s*{_IRI}'
+    rf'\s*(?:{_IRI}|{_BNODE}|{_LITERAL})'
+    rf'\s*(?:{_IRI}|{_BNODE})?\s*\.\s*$')
+_ESCAPE = re.compile(r'\\(?:u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8})|(.))')
+_ESCAPED_CHARS = {
+    't': '\t', 'b': '\b', 'n': '\n', 'r': '\r', 'f': '\f',
+    '"': '"', "'": "'", '\\': '\\',
+}
+
+
+def _unescape_char(match) -> str:
+    code = match.group(1) or match.group(2)
+    if code:
+        return chr(int(code, 16))
+    char = match.group(3)
+    if char not in _ESCAPED_CHARS:
+        raise ValueError(f"Invalid escape sequence: \\{char}")
+    return _ESCAPED_CHARS[char]
+
+
+def _unescape(value: str) -> str:
+    if '\\' not in value:
+        return value
+    return _ESCAPE.sub(_unescape_char, value)
+
+
+def _iri_or_bnode(iri: Optional[str], bnode: Optional[str]
+                  ) -> Optional[rdflib.term.Node]:
+    if iri is not None:
+        return rdflib.URIRef(_unescape(iri))
+    if bnode is not None:
+        return rdflib.BNode(bnode)
+    return None
+
+
+def parse_nquad(line: str) -> Optional[quad_type]:
+    """
+    Parse one N-Quads (or N-Triples) statement into rdflib terms, without
+    building a graph.
+
+    Args:
+        line: A line of the N-Quads file.
+
+    Returns:
+        The subject, predicate, object and graph of the statement, the graph
+        is `None` if the statement does not have one. `None` if the line is
+        empty or a comment.
+
+    Raises:
+        ValueError: If the line is not a statement this parser supports.
+    """
+    stripped = line.strip()
+    if not stripped or stripped.startswith('#'):
+        return None
+
+    match = _STATEMENT.match(stripped)
+    if match is None:
+        raise ValueError(f"Cannot parse the statement: {stripped}")
+
+    (s_iri, s_bnode, v_iri, o_iri, o_bnode, value, lang, datatype,
+     c_iri, c_bnode) = match.groups()
+
+    o: Optional[rdflib.term.Node]
+    if value is not None:
+        o = rdflib.Literal(
+            _unescape(value), lang=lang,
+            datatype=None if datatype is None else rdflib.URIRef(datatype))
+    else:
+        o = _iri_or_bnode(o_iri, o_bnode)
+
+    return (_iri_or_bnode(s_iri, s_bnode),  # type: ignore
+            rdflib.URIRef(_unescape(v_iri)), o,
+            _iri_or_bnode(c_iri, c_bnode))
+
+
+class BackgroundDecompressor:
+    """
+    Decompress a bz2 file in a background thread and iterate its lines, so
+    that the decompression overlaps with the parsing. The bz2 module releases
+    the GIL while decompressing, and multi-stream files (such as the ones
+    compressed by `pbzip2`) are supported.
+
+    Args:
+        path: The path of the bz2 file.
+        chunk_size: The number of decompressed bytes read at a time.
+        queue_size: The maximum number of chunks waiting to be parsed.
+    """
+
+    def __init__(self, path: str, chunk_size: int = 1 << 20,
+                 queue_size: int = 8):
+        self._file: BinaryIO = bz2.BZ2File(path)  # type: ignore
+        self._chunk_size: int = chunk_size
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._stop = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._lines: Iterator[bytes] = self._iter_lines()
+
+    def _put(self, item) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self):
+        try:
+            while True:
+                chunk = self._file.read(self._chunk_size)
+                if not chunk or not self._put(chunk):
+                    break
+        except Exception as e:  # pylint: disable=broad-except
+            self._error = e
+        self._put(None)
+
+    def _iter_lines(self) -> Iterator[bytes]:
+        remain = b''
+        while True:
+            chunk = self._queue.get()
+            if chunk is None:
+                break
+            lines = (remain + chunk).split(b'\n')
+            remain = lines.pop()
+            for line in lines:
+                yield line + b'\n'
+
+        if self._error is not None:
+            raise self._error
+        if remain:
+            yield remain
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> bytes:
+        return next(self._lines)
+
+    def close(self):
+        self._stop.set()
+        self._thread.join()
+        self._file.close()
+
+
 class NIFParser:
-    def __init__(self, nif_path, tuple_format='nquads'):
+    """
+    Read the statements of a NIF dataset in N-Quads (or N-Triples) format,
+    which can be compressed with bz2.
+
+    The lines are parsed directly into rdflib terms with :func:`parse_nquad`,
+    only the lines it cannot parse (and the other formats) go through an
+    rdflib graph. Iterating the parser gives the list of statements of each
+    line, :meth:`quads` gives the statements one by one.
+
+    Args:
+        nif_path: The path of the dataset.
+        tuple_format: The rdflib format name of the dataset.
+        background_decompress: Whether to decompress the bz2 files in a
+            background thread.
+    """
+
+    def __init__(self, nif_path: str, tuple_format: str = 'nquads',
+                 background_decompress: bool = True):
+        self.__nif: Union[BinaryIO, BackgroundDecompressor]
         if nif_path.endswith(".bz2"):
-            self.__nif = bz2.BZ2File(nif_path)
+            if background_decompress:
+                self.__nif = BackgroundDecompressor(nif_path)
+            else:
+                self.__nif = bz2.BZ2File(nif_path)  # type: ignore
         else:
-            self.__nif = open(nif_path)
+            self.__nif = open(nif_path, 'rb')
 
         self.format = tuple_format
+        self.__streaming = tuple_format in ('nquads', 'nt', 'ntriples')
 
     def __enter__(self):
         return self
@@ -128,20 +314,48 @@ class NIFParser:
         g_.parse(data=data, format=tuple_format)
 
         if self.format == 'nquads':
-            return list(g_.quads())
+            return [(s, v, o, c.identifier) for s, v, o, c in g_.quads()]
         else:
             return list(g_)
 
+    def parse_line(self, line: str) -> List:
+        """
+        Parse the statements of a line.
+
+        Args:
+            line: The line to parse.
+
+        Returns:
+            The statements, as `(s, v, o, c)` tuples for N-Quads and
+            `(s, v, o)` tuples otherwise.
+        """
+        if self.__streaming:
+            try:
+                statement = parse_nquad(line)
+            except ValueError:
+                # Leave the unusual statements to rdflib.
+                return self.parse_graph(line, tuple_format=self.format)
+            if statement is None:
+                return []
+            if self.format == 'nquads':
+                return [statement]
+            return [statement[:3]]
+        return self.parse_graph(line, tuple_format=self.format)
+
     def read(self):
         while True:
             line = next(self.__nif)
-            statements = list(self.parse_graph(
-                line.decode('utf-8'),
-                tuple_format=self.format
-            ))
+            statements = self.parse_line(line.decode('utf-8'))
 
             if len(statements) > 0:
-                return list(statements)
+                return statements
+
+    def quads(self) -> Iterator[Tuple]:
+        """
+        Iterate the statements of the remaining lines.
+        """
+        for line in self.__nif:
+            yield from self.parse_line(line.decode('utf-8'))
 
     def close(self):
         self.__nif.close()
@@ -150,6 +364,7 @@ class NIFParser:
 class ContextGroupedNIFReader:
     def __init__(self, nif_path: str):
         self.__parser = NIFParser(nif_path)
+        self.__quads: Iterator[Tuple] = self.__parser.quads()
         self.data_name = os.path.basename(nif_path)
 
         self.__last_c: str = ''
@@ -168,27 +383,26 @@ class ContextGroupedNIFReader:
         res_c: str = ''
         res_states: List = []
 
-        while True:
-            try:
-                for statements in self.__parser:
-                    for s, v, o, c in statements:
-                        c_ = context_base(c)
+        for s, v, o, c in self.__quads:
+            c_ = context_base(c)
 
-                        if c_ != self.__last_c and self.__last_c != '':
-                            res_c = self.__last_c
-                            res_states.extend(self.__statements)
-                            self.__statements.clear()
+            if c_ != self.__last_c and self.__last_c != '':
+                res_c = self.__last_c
+                res_states.extend(self.__statements)
+                self.__statements.clear()
 
-                        self.__statements.append((s, v, o))
-                        self.__last_c = c_
+            self.__statements.append((s, v, o))
+            self.__last_c = c_
 
-                        if not res_c == '':
-                            return res_c, res_states
-            except StopIteration:
-                break
+            if not res_c == '':
+                return res_c, res_states
 
         if len(self.__statements) > 0:
-            return self.__last_c, self.__statements
+            res_states.extend(self.__statements)
+            self.__statements.clear()
+            return self.__last_c, res_states
+
+        raise StopIteration
 
 
 class NIFBufferedContextReader:
@@ -200,7 +414,8 @@ class NIFBufferedContextReader:
             window_size=window_size
         )
 
-    def get(self, context: Union[rdflib.Graph, str]) -> List[state_type]:
+    def get(self, context: Union[rdflib.Graph, rdflib.term.Node, str]
+            ) -> List[state_type]:
         """
         We assume the order of querying keys is roughly the same as the order
         of keys in this data, that means we can find the key (context) within
@@ -216,10 +431,165 @@ class NIFBufferedContextReader:
 
         """
         context_ = context_base(context) if isinstance(
-            context, rdflib.Graph) else str(context)
+            context, (rdflib.Graph, rdflib.term.Node)) else str(context)
         return self.buf.get_key(context_)
 
 
+# The graph of an N-Quads statement, which ends the line.
+_GRAPH = re.compile(rb'<([^<>]*)>\s*\.\s*$')
+# A range of bytes holding consecutive statements of the same context.
+nif_index_dtype = np.dtype(
+    [('hash', '<u8'), ('offset', '<u8'), ('length', '<u8')])
+
+
+def _key_hash(key: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(),
+        'little')
+
+
+def build_nif_index(nif_path: str, index_path: str):
+    """
+    Record the byte ranges of the statements of each context in an
+    uncompressed N-Quads file. The index is an array of the hashes of the
+    contexts (see :func:`context_base`) with the offset and the length of the
+    ranges, sorted by hash, so that it can be searched while memory mapped.
+    A context appearing in several places of the file has several ranges.
+
+    Args:
+        nif_path: The path of the N-Quads file.
+        index_path: The path of the index, saved in the NumPy format.
+    """
+    runs: List[Tuple[int, int, int]] = []
+    last_graph = b''
+    last_key = ''
+    begin = offset = 0
+
+    with open(nif_path, 'rb') as nif:
+        for line in nif:
+            match = _GRAPH.search(line)
+            if match is not None:
+                graph = match.group(1)
+                if graph != last_graph:
+                    last_graph = graph
+                    key = context_base(graph.decode('utf-8'))
+                    if key != last_key:
+                        if offset > begin:
+                            runs.append(
+                                (_key_hash(last_key), begin, offset - begin))
+                        last_key = key
+                        begin = offset
+            offset += len(line)
+
+    if offset > begin and last_key:
+        runs.append((_key_hash(last_key), begin, offset - begin))
+
+    index = np.array(runs, dtype=nif_index_dtype)
+    index.sort(order=['hash', 'offset'])
+
+    temp_path = index_path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        np.save(f, index)
+    os.replace(temp_path, index_path)
+
+
+class NIFIndexedContextReader:
+    """
+    Get the statements of a context from a NIF dataset by seeking to the
+    byte ranges recorded by :func:`build_nif_index`, instead of scanning the
+    dataset in order like :class:`NIFBufferedContextReader`. The contexts
+    can then be queried in any order.
+
+    Since the bz2 files cannot be read at an offset, a bz2 dataset is
+    decompressed next to the original file (without the `.bz2` suffix) the
+    first time. The index is built the first time as well, both of them can
+    be prepared offline by creating the reader once.
+
+    Args:
+        nif_path: The path of the dataset.
+        index_path: The path of the index, by default the path of the
+            uncompressed dataset with a `.index.npy` suffix.
+    """
+
+    def __init__(self, nif_path: str, index_path: Optional[str] = None):
+        self.data_name = os.path.basename(nif_path)
+
+        data_path = nif_path
+        if nif_path.endswith('.bz2'):
+            data_path = nif_path[:-len('.bz2')]
+            if not os.path.exists(data_path):
+                logging.info("Decompressing %s.", nif_path)
+                with bz2.BZ2File(nif_path) as source, \
+                        open(data_path + '.tmp', 'wb') as target:
+                    shutil.copyfileobj(source, target, 1 << 20)
+                os.replace(data_path + '.tmp', data_path)
+
+        if index_path is None:
+            index_path = data_path + '.index.npy'
+        if not os.path.exists(index_path):
+            logging.info("Indexing %s.", data_path)
+            build_nif_index(data_path, index_path)
+
+        self.__index: np.ndarray = np.load(index_path, mmap_mode='r')
+        self.__hashes: np.ndarray = self.__index['hash']
+        self.__nif: BinaryIO = open(data_path, 'rb')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def get(self, context: Union[rdflib.Graph, rdflib.term.Node, str]
+            ) -> List[state_type]:
+        """
+        Read the statements of a context.
+
+        Args:
+            context: The context to find.
+
+        Returns:
+            The statements of the context in the order of the dataset, an
+            empty list if the context is not in the dataset.
+        """
+        context_ = context_base(context) if isinstance(
+            context, (rdflib.Graph, rdflib.term.Node)) else str(context)
+
+        key_hash = _key_hash(context_)
+        begin = np.searchsorted(self.__hashes, key_hash, side='left')
+        end = np.searchsorted(self.__hashes, key_hash, side='right')
+
+        statements: List[state_type] = []
+        last_c = None
+        matched = False
+        for offset, length in sorted(
+                (int(self.__index[i]['offset']), int(self.__index[i]['length']))
+                for i in range(begin, end)):
+            self.__nif.seek(offset)
+            for line in self.__nif.read(length).splitlines():
+                for s, v, o, c in _parse_quads(line.decode('utf-8')):
+                    # Check the context, in case two contexts share the hash.
+                    if c != last_c:
+                        last_c = c
+                        matched = context_base(c) == context_
+                    if matched:
+                        statements.append((s, v, o))
+        return statements
+
+    def close(self):
+        self.__nif.close()
+
+
+def _parse_quads(line: str) -> List[quad_type]:
+    try:
+        statement = parse_nquad(line)
+    except ValueError:
+        graph = rdflib.ConjunctiveGraph()
+        graph.parse(data=line, format='nquads')
+        return [(s, v, o, c.identifier) for s, v, o, c in graph.quads()]
+    return [] if statement is None else [statement]
+
+
 class AutoPopBuffer:
     def __init__(self, data_iter: Iterator, default_value,
                  window_size: int = 100):
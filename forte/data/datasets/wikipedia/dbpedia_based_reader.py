@@ -28,7 +28,8 @@ from forte.common import Resources
 from forte.common.configuration import Config
 from forte.data.data_pack import DataPack
 from forte.data.datasets.wikipedia.db_utils import (
-    NIFParser, NIFBufferedContextReader, get_resource_attribute,
+    NIFParser, NIFBufferedContextReader, NIFIndexedContextReader,
+    get_resource_attribute,
     get_resource_name, get_resource_fragment,
     print_progress)
 from forte.data.readers.base_reader import PackReader
@@ -128,9 +129,10 @@ class DBpediaWikiReader(PackReader):
         # These NIF readers organize the statements in the specific RDF context,
         # in this case each context correspond to one wiki page, this allows
         # us to read the information more systematically.
-        self.struct_reader = NIFBufferedContextReader(
-            configs.nif_page_structure)
-        self.link_reader = NIFBufferedContextReader(configs.nif_text_links)
+        context_reader = NIFIndexedContextReader if configs.use_nif_index \
+            else NIFBufferedContextReader
+        self.struct_reader = context_reader(configs.nif_page_structure)
+        self.link_reader = context_reader(configs.nif_text_links)
 
     def _collect(self, nif_context: str  # type: ignore
                  ) -> Iterator[Tuple[Dict[str, str],
@@ -138,17 +140,16 @@ class DBpediaWikiReader(PackReader):
         str_data: Dict[str, str] = {}
         node_data: Dict[str, List[state_type]] = {}
 
-        for context_statements in NIFParser(nif_context):
-            for s, v, o, c in context_statements:
+        with NIFParser(nif_context) as parser:
+            for s, v, o, c in parser.quads():
                 nif_type = get_resource_attribute(s, "nif")
-                print_progress(f'Collecting DBpedia context: [{c.identifier}]')
+                print_progress(f'Collecting DBpedia context: [{c}]')
 
                 if nif_type and nif_type == "context" and get_resource_fragment(
                         v) == 'isString':
                     str_data['text'] = o.toPython()
                     str_data['doc_name'] = get_resource_name(s)
-                    str_data['oldid'] = get_resource_attribute(
-                        c.identifier, 'oldid')
+                    str_data['oldid'] = get_resource_attribute(c, 'oldid')
 
                     node_data['struct'] = self.struct_reader.get(c)
                     node_data['links'] = self.link_reader.get(c)
@@ -191,10 +192,16 @@ class DBpediaWikiReader(PackReader):
     def default_configs(cls):
         """
         This defines a basic config structure
+
+        `use_nif_index`: whether to look up the page structures and the links
+        of each page in an index of the NIF files (see
+        :class:`NIFIndexedContextReader`) instead of scanning them in the
+        order of the pages.
         :return:
         """
         return {
             'redirect_path': None,
             'nif_page_structure': None,
             'nif_text_links': None,
+            'use_nif_index': False,
         }
@@ -32,8 +32,8 @@ from forte.common.configuration import Config
 from forte.data import data_utils
 from forte.data.data_pack import DataPack
 from forte.data.datasets.wikipedia.db_utils import (
-    get_resource_name, NIFBufferedContextReader, ContextGroupedNIFReader,
-    print_progress, print_notice)
+    get_resource_name, NIFBufferedContextReader, NIFIndexedContextReader,
+    ContextGroupedNIFReader, print_progress, print_notice)
 from forte.data.readers.base_reader import PackReader
 from ft.onto.wikipedia import WikiInfoBoxProperty, WikiInfoBoxMapped
 
@@ -82,10 +82,10 @@ class DBpediaInfoBoxReader(PackReader):
 
         self.redirects = resources.get('redirects')
 
-        self.literal_info_reader = NIFBufferedContextReader(
-            configs.mapping_literals)
-        self.object_info_reader = NIFBufferedContextReader(
-            configs.mapping_objects)
+        context_reader = NIFIndexedContextReader if configs.use_nif_index \
+            else NIFBufferedContextReader
+        self.literal_info_reader = context_reader(configs.mapping_literals)
+        self.object_info_reader = context_reader(configs.mapping_objects)
 
         # Set up logging.
         f_handler = logging.FileHandler(configs.reading_log)
@@ -136,6 +136,10 @@ class DBpediaInfoBoxReader(PackReader):
     def default_configs(cls):
         """
         This defines a basic config structure
+
+        `use_nif_index`: whether to look up the info boxes of each resource
+        in an index of the mapping files (see
+        :class:`NIFIndexedContextReader`) instead of scanning them in order.
         :return:
         """
         return {
@@ -144,4 +148,5 @@ class DBpediaInfoBoxReader(PackReader):
             'mapping_literals': None,
             'mapping_objects': None,
             'reading_log': 'infobox.log',
+            'use_nif_index': False,
         }
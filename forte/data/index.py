@@ -12,16 +12,52 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
 import logging
 from collections import defaultdict
 from typing import DefaultDict, Dict, List, Set, Type, Hashable, Generic, \
-    Iterable, Tuple
+    Iterable, Iterator, Tuple, AbstractSet, KeysView
 
 from forte.common.exception import PackIndexError
 from forte.data.ontology.core import GroupType, LinkType, EntryType
 
 logger = logging.getLogger(__name__)
 
+__all__ = [
+    "BaseIndex",
+    "IdsView",
+]
+
+
+class IdsView(AbstractSet[int]):
+    r"""A read-only set view over the entry ids of several entry types, which
+    does not copy the underlying ids. The set operations such as ``&`` and
+    ``|`` return a new ``set``.
+
+    Args:
+        views: The ids views of each type, these should not overlap.
+    """
+    __slots__ = ("_views",)
+
+    def __init__(self, views: List[AbstractSet[int]]):
+        self._views = views
+
+    @classmethod
+    def _from_iterable(cls, it: Iterable[int]) -> Set[int]:
+        return set(it)
+
+    def __contains__(self, tid: object) -> bool:
+        for view in self._views:
+            if tid in view:
+                return True
+        return False
+
+    def __iter__(self) -> Iterator[int]:
+        return itertools.chain.from_iterable(self._views)
+
+    def __len__(self) -> int:
+        return sum(len(v) for v in self._views)
+
 
 class BaseIndex(Generic[EntryType]):
     r"""A set of indexes used in :class:`BasePack`:
@@ -42,8 +78,14 @@ class BaseIndex(Generic[EntryType]):
         # Mapping from entry's tid to entry type.
         self._entry_index: Dict[int, EntryType] = dict()
 
-        # Mapping from entry's type to entries' id.
-        self._type_index: DefaultDict[Type, Set[int]] = defaultdict(set)
+        # Mapping from entry's type to entries' id, the ids are stored as the
+        # keys of a dict so that they can be exposed as a read-only view.
+        self._type_index: DefaultDict[Type, Dict[int, None]] = defaultdict(
+            dict)
+
+        # Mapping from a queried type to the indexed types that are its
+        # subclasses, reset when a new type is first indexed.
+        self._subtype_cache: Dict[Type, List[Type]] = dict()
 
         # List of other indexes (built when first looked up).
         self._group_index: DefaultDict[Hashable, Set[int, int]] = defaultdict(
@@ -71,18 +113,56 @@ class BaseIndex(Generic[EntryType]):
         """
         for entry in entries:
             self._entry_index[entry.tid] = entry
-            self._type_index[type(entry)].add(entry.tid)
+            entry_type = type(entry)
+            if entry_type not in self._type_index:
+                self._subtype_cache.clear()
+            self._type_index[entry_type][entry.tid] = None
 
     def get_entry(self, tid: int) -> EntryType:
         return self._entry_index[tid]
 
-    def iter_type_index(self) -> Iterable[Tuple[Type, Set[int]]]:
+    def iter_type_index(self) -> Iterable[Tuple[Type, KeysView[int]]]:
         for t, ids in self._type_index.items():
-            yield t, ids
+            yield t, ids.keys()
+
+    def indexed_subtypes(self, entry_type: Type) -> List[Type]:
+        r"""Get the indexed entry types that are ``entry_type`` or its
+        subclasses. The result is cached until a new type is indexed.
+
+        Args:
+            entry_type: The type to look up.
+
+        Returns:
+            A list of the concrete entry types in the type index.
+        """
+        try:
+            return self._subtype_cache[entry_type]
+        except KeyError:
+            subtypes = [t for t in self._type_index
+                        if issubclass(t, entry_type)]
+            self._subtype_cache[entry_type] = subtypes
+            return subtypes
+
+    def ids_by_type(self, entry_type: Type) -> AbstractSet[int]:
+        r"""Get a read-only view of the tids of the entries of ``entry_type``
+        (including the entries of its subclasses). The view reflects the
+        later changes to the index and should not be held while adding or
+        removing entries. Copy it into a ``set`` if it needs to be modified.
+
+        Args:
+            entry_type: The type of the entries.
+
+        Returns:
+            A read-only set of entry tids.
+        """
+        subtypes = self.indexed_subtypes(entry_type)
+        if len(subtypes) == 1:
+            return self._type_index[subtypes[0]].keys()
+        return IdsView([self._type_index[t].keys() for t in subtypes])
 
     def remove_entry(self, entry: EntryType):
         self._entry_index.pop(entry.tid)
-        self._type_index[type(entry)].remove(entry.tid)
+        del self._type_index[type(entry)][entry.tid]
 
     @property
     def link_index_on(self):
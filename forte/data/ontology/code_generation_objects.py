@@ -331,6 +331,21 @@ class NonCompositeProperty(Property):
         self.is_forte_type = import_manager.is_imported(type_str)
         self.self_ref = self_ref
 
+        # Attributes referring to other entries are declared with a
+        # descriptor, which resolves the stored pointers on access.
+        self.is_entry_ref = type_str not in SUPPORTED_PRIMITIVES
+        self.field_type = 'forte.data.ontology.core.EntryField'
+        if self.is_entry_ref:
+            import_manager.add_object_to_import(self.field_type)
+
+    def to_declaration(self, level: int):
+        if self.is_entry_ref:
+            field_type = self.import_manager.get_name_to_use(self.field_type)
+            return indent_line(
+                f"{self.field_name}: {self.internal_type_str()} = "
+                f"{field_type}()", level)
+        return super().to_declaration(level)
+
     def internal_type_str(self) -> str:
         option_type = self.import_manager.get_name_to_use(self.option_type)
         type_str = self.import_manager.get_name_to_use(self.type_str)
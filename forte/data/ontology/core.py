@@ -20,8 +20,8 @@ from abc import abstractmethod, ABC
 from collections.abc import MutableSequence, MutableMapping
 from dataclasses import dataclass
 from typing import (
-    Iterable, Optional, Type, Hashable, TypeVar, Generic,
-    Union, Dict, Iterator, get_type_hints, overload, List)
+    Any, Callable, Iterable, Optional, Type, Hashable, TypeVar, Generic,
+    Union, Dict, Iterator, get_type_hints, overload, List, Tuple, Set)
 
 import numpy as np
 
@@ -39,15 +39,125 @@ __all__ = [
     "MpPointer",
     "FDict",
     "FList",
-    "MultiEntry"
+    "MultiEntry",
+    "EntryField",
 ]
 
-from forte.utils.utils import check_type
+from forte.utils.utils import compile_type_check
 
-default_entry_fields = [
+default_entry_fields = frozenset([
     '_Entry__pack', '_tid', '_embedding', '_span', '_parent', '_child',
     '_members', '_Entry__field_modified', 'field_records', 'creation_records',
-    '_id_manager']
+    '_id_manager'])
+
+# A registry from each entry class to the compiled validators of its fields,
+# the type hints of a class are resolved only once, on its first assignment.
+_field_validators: Dict[
+    Type, Dict[str, Tuple[Any, Callable[[Any], bool]]]] = {}
+
+
+def get_field_validators(
+        entry_class: Type) -> Dict[str, Tuple[Any, Callable[[Any], bool]]]:
+    r"""Get the validators of the fields of ``entry_class``, which maps from
+    the field name to its type hint and the compiled check function.
+
+    Args:
+        entry_class: The entry class.
+
+    Returns:
+        The validators of each field.
+    """
+    try:
+        return _field_validators[entry_class]
+    except KeyError:
+        validators = {
+            name: (hint, compile_type_check(hint))
+            for name, hint in get_type_hints(entry_class).items()
+        }
+        _field_validators[entry_class] = validators
+        return validators
+
+
+_NO_DEFAULT = object()
+
+
+class EntryField:
+    r"""A descriptor for the entry attributes that refer to other entries.
+
+    An entry stores such an attribute as a pointer (see :class:`Pointer` and
+    :class:`MpPointer`), which is resolved back to the entry when the
+    attribute is read. The ontology code generator declares the entry typed
+    attributes with this descriptor, so that reading the other attributes does
+    not go through the pointer check at all. For the entry classes that are
+    not generated, the descriptor is installed on the class when a pointer is
+    first stored to the attribute.
+
+    Args:
+        default: The value to return if the attribute is not yet set on an
+            entry. By default, an `AttributeError` is raised.
+    """
+
+    def __init__(self, default: Any = _NO_DEFAULT):
+        self._name: str = ""
+        self._default = default
+
+    def __set_name__(self, owner, name: str):
+        self._name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            # Accessing from the class, this tells `dataclass` that this field
+            # has no default value.
+            if self._default is _NO_DEFAULT:
+                raise AttributeError(self._name)
+            return self._default
+
+        try:
+            value = instance.__dict__[self._name]
+        except KeyError:
+            if self._default is _NO_DEFAULT:
+                raise AttributeError(
+                    f"'{type(instance).__name__}' object has no attribute "
+                    f"'{self._name}'") from None
+            return self._default
+
+        if isinstance(value, BasePointer):
+            # Using the pointer to get the entry.
+            return instance.resolve_pointer(value)
+        return value
+
+    def __set__(self, instance, value):
+        instance.__dict__[self._name] = value
+
+
+# The (class, attribute) pairs that are known to be read via EntryField.
+_entry_field_classes: Set[Tuple[Type, str]] = set()
+
+
+def _ensure_entry_field(entry_class: Type, name: str):
+    r"""Make sure the attribute `name` of `entry_class` is read through a
+    :class:`EntryField`, so that the pointers stored in it are resolved.
+    """
+    if (entry_class, name) in _entry_field_classes:
+        return
+
+    for klass in entry_class.__mro__:
+        if name in klass.__dict__:
+            existing = klass.__dict__[name]
+            break
+    else:
+        existing = _NO_DEFAULT
+
+    if not isinstance(existing, EntryField):
+        if hasattr(existing, '__set__'):
+            raise AttributeError(
+                f"Cannot store an entry to [{name}] of [{entry_class}], "
+                f"which is managed by [{type(existing)}].")
+        field = EntryField(existing)
+        field.__set_name__(entry_class, name)
+        setattr(entry_class, name, field)
+
+    _entry_field_classes.add((entry_class, name))
 
 
 @dataclass
@@ -119,6 +229,10 @@ class Entry(Generic[ContainerType]):
             state["_embedding"] = np.empty(0)
         self.__dict__.update(state)
 
+        for key, value in state.items():
+            if isinstance(value, BasePointer):
+                _ensure_entry_field(self.__class__, key)
+
     # using property decorator
     # a getter function for self._embedding
     @property
@@ -203,6 +317,9 @@ class Entry(Generic[ContainerType]):
     def _check_attr_type(self, key, value):
         """
         Use the type hint to validate whether the provided value is as expected.
+        How often the validation happens is controlled by the validation mode
+        of the pack, see
+        :meth:`~forte.data.container.EntryContainer.set_validation_mode`.
 
         Args:
             key:  The field name.
@@ -211,21 +328,41 @@ class Entry(Generic[ContainerType]):
         Returns:
 
         """
-        if key not in default_entry_fields:
-            hints = get_type_hints(self.__class__)
-            is_valid = check_type(value, hints[key])
-            if not is_valid:
-                raise TypeError(
-                    f"The [{key}] attribute of [{type(self)}] "
-                    f"should be [{hints[key]}], but got [{type(value)}].")
+        if key in default_entry_fields:
+            return
+
+        pack = self.__pack
+        mode = pack.validation_mode
+        if mode == "off":
+            return
+
+        field_key = None
+        if mode == "first_write":
+            field_key = (self.__class__, key, value.__class__)
+            if pack.is_field_validated(field_key):
+                return
+
+        hint, validator = get_field_validators(self.__class__)[key]
+        if not validator(value):
+            raise TypeError(
+                f"The [{key}] attribute of [{type(self)}] "
+                f"should be [{hint}], but got [{type(value)}].")
+
+        if field_key is not None:
+            pack.mark_field_validated(field_key)
 
     def __setattr__(self, key, value):
+        if key in default_entry_fields:
+            super().__setattr__(key, value)
+            return
+
         self._check_attr_type(key, value)
 
         if isinstance(value, Entry):
             if value.pack == self.pack:
                 # Save a pointer to the value from this entry.
                 self.__dict__[key] = Pointer(value.tid)
+                _ensure_entry_field(self.__class__, key)
             else:
                 raise PackDataException(
                     "An entry cannot refer to entries in another data pack.")
@@ -233,16 +370,7 @@ class Entry(Generic[ContainerType]):
             super().__setattr__(key, value)
 
         # We add the record to the system.
-        if key not in default_entry_fields:
-            self.__pack.record_field(self.tid, key)
-
-    def __getattribute__(self, item):
-        v = super().__getattribute__(item)
-        if isinstance(v, BasePointer):
-            # Using the pointer to get the entry.
-            return self.resolve_pointer(v)
-        else:
-            return v
+        self.__pack.record_field(self.tid, key)
 
     def __eq__(self, other):
         r"""The eq function for :class:`Entry` objects.
@@ -287,6 +415,7 @@ class MultiEntry(Entry, ABC):
         if isinstance(value, Entry):
             # Save a pointer of the value.
             self.__dict__[key] = value.as_pointer(self)
+            _ensure_entry_field(self.__class__, key)
         else:
             super().__setattr__(key, value)
 
@@ -0,0 +1,335 @@
+# Copyright 2020 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A file of serialized packs with an index of their offsets, so that a pack can
+be read without reading the packs before it.
+
+The data file is a sequence of records, each one is a little endian `uint64`
+length followed by the serialized pack, compressed with zlib if the store is
+compressed. Without compression, a store of binary packs has the same layout
+as the binary cache files of the readers. The index file (the path of the
+data file with an `.index` suffix) has a JSON header line, then one JSON line
+per record with its offset, length, pack id and pack name.
+"""
+import json
+import os
+import struct
+import zlib
+from collections import OrderedDict
+from typing import (
+    BinaryIO, Dict, Hashable, Iterator, List, Optional, Union, overload)
+
+from forte.data.base_pack import BasePack, SERIALIZE_METHODS
+from forte.data.data_utils import deserialize
+
+__all__ = [
+    "PackMemoryCache",
+    "PackStore",
+]
+
+INDEX_SUFFIX = ".index"
+STORE_VERSION = 1
+
+_LENGTH_STRUCT = struct.Struct("<Q")
+
+
+class PackMemoryCache:
+    r"""An in-memory LRU cache of deserialized packs, holding at most
+    ``max_size`` packs. It can be shared by several :class:`PackStore`, so
+    that they are bounded together.
+
+    Args:
+        max_size (int): The maximum number of packs kept in memory.
+    """
+
+    def __init__(self, max_size: int):
+        if max_size < 0:
+            raise ValueError(
+                f"The size of the cache should not be negative, got "
+                f"{max_size}.")
+        self.max_size: int = max_size
+        self._packs: "OrderedDict[Hashable, BasePack]" = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self):
+        return len(self._packs)
+
+    def get(self, key: Hashable) -> Optional[BasePack]:
+        r"""Returns the pack of ``key``, or `None` if it is not cached."""
+        pack = self._packs.get(key)
+        if pack is None:
+            self.misses += 1
+        else:
+            self._packs.move_to_end(key)
+            self.hits += 1
+        return pack
+
+    def put(self, key: Hashable, pack: BasePack):
+        r"""Cache ``pack``, evicting the least recently used packs if the
+        cache is full."""
+        if self.max_size == 0:
+            return
+        self._packs[key] = pack
+        self._packs.move_to_end(key)
+        while len(self._packs) > self.max_size:
+            self._packs.popitem(last=False)
+
+    def clear(self):
+        self._packs.clear()
+
+
+class PackStore:
+    r"""A file of serialized packs with an offset index, see
+    :mod:`~forte.data.pack_store`. The packs can be read in order, by
+    position (including slices, so that several workers can each read a part
+    of the store), by pack id or by pack name.
+
+    .. code-block:: python
+
+        with PackStore("packs.bin", "w", compress=True) as store:
+            for pack in packs:
+                store.add(pack)
+
+        with PackStore("packs.bin") as store:
+            pack = store.get_by_name("doc_1")
+            first_half = store[:len(store) // 2]
+
+    Args:
+        path: The path of the data file.
+        mode: `r` to read the store, `w` to create a new store, or `a` to add
+            packs to the end of an existing store (or create it).
+        serialize_method: The format of the packs added to a new store,
+            `binary` or `jsonpickle`. An existing store keeps its format.
+        compress: Whether to compress the packs added to a new store.
+        memory: A cache of the deserialized packs. Without it, every read
+            deserializes the pack again.
+    """
+
+    def __init__(self, path: str, mode: str = "r",
+                 serialize_method: str = "binary", compress: bool = False,
+                 memory: Optional[PackMemoryCache] = None):
+        if mode not in ("r", "w", "a"):
+            raise ValueError(f"Unknown mode [{mode}], should be r, w or a.")
+        if serialize_method not in SERIALIZE_METHODS:
+            raise ValueError(
+                f"Unknown serialize method [{serialize_method}], should be "
+                f"one of {SERIALIZE_METHODS}.")
+
+        self.path: str = path
+        self._index_path: str = path + INDEX_SUFFIX
+        self._memory: Optional[PackMemoryCache] = memory
+        self.serialize_method: str = serialize_method
+        self.compress: bool = compress
+
+        self._offsets: List[int] = []
+        self._lengths: List[int] = []
+        self._pack_ids: List[Optional[int]] = []
+        self._pack_names: List[Optional[str]] = []
+        self._by_id: Optional[Dict[int, int]] = None
+        self._by_name: Optional[Dict[str, int]] = None
+
+        self._index_file = None
+        if mode == "w" or not os.path.exists(path):
+            if mode == "r":
+                raise FileNotFoundError(f"Cannot find the store [{path}].")
+            self._data: BinaryIO = open(path, "w+b")
+            self._write_index()
+        else:
+            self._data = open(path, "r+b" if mode == "a" else "rb")
+            has_index = os.path.exists(self._index_path)
+            self._load_index()
+            if mode == "a":
+                if has_index:
+                    self._index_file = open(self._index_path, "a")
+                else:
+                    self._write_index()
+
+    def _write_index(self):
+        self._index_file = open(self._index_path, "w")
+        self._index_file.write(json.dumps({
+            "version": STORE_VERSION,
+            "serialize_method": self.serialize_method,
+            "compress": self.compress}) + "\n")
+        for record in zip(self._offsets, self._lengths, self._pack_ids,
+                          self._pack_names):
+            self._index_file.write(json.dumps(record) + "\n")
+
+    def _load_index(self):
+        if not os.path.exists(self._index_path):
+            # A binary cache file written without an index.
+            self._scan_records()
+            return
+
+        with open(self._index_path) as index_file:
+            header = json.loads(index_file.readline())
+            if header["version"] > STORE_VERSION:
+                raise ValueError(
+                    f"The store [{self.path}] has version {header['version']}"
+                    f", this version of Forte reads up to {STORE_VERSION}.")
+            self.serialize_method = header["serialize_method"]
+            self.compress = header["compress"]
+            for line in index_file:
+                offset, length, pack_id, pack_name = json.loads(line)
+                self._offsets.append(offset)
+                self._lengths.append(length)
+                self._pack_ids.append(pack_id)
+                self._pack_names.append(pack_name)
+
+    def _scan_records(self):
+        self.serialize_method = "binary"
+        self.compress = False
+        self._data.seek(0, os.SEEK_END)
+        size = self._data.tell()
+        offset = 0
+        while offset < size:
+            self._data.seek(offset)
+            (length,) = _LENGTH_STRUCT.unpack(
+                self._data.read(_LENGTH_STRUCT.size))
+            self._offsets.append(offset + _LENGTH_STRUCT.size)
+            self._lengths.append(length)
+            # The ids and names are read when they are first looked up.
+            self._pack_ids.append(None)
+            self._pack_names.append(None)
+            offset += _LENGTH_STRUCT.size + length
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def add(self, pack: BasePack):
+        r"""Add a pack to the end of the store."""
+        if self._index_file is None:
+            raise ValueError(f"The store [{self.path}] is opened to read.")
+
+        data = pack.serialize(serialize_method=self.serialize_method)
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        if self.compress:
+            data = zlib.compress(data)
+
+        self._data.seek(0, os.SEEK_END)
+        offset = self._data.tell() + _LENGTH_STRUCT.size
+        self._data.write(_LENGTH_STRUCT.pack(len(data)))
+        self._data.write(data)
+
+        self._offsets.append(offset)
+        self._lengths.append(len(data))
+        self._pack_ids.append(pack.pack_id)
+        self._pack_names.append(pack.pack_name)
+        self._index_file.write(json.dumps(
+            [offset, len(data), pack.pack_id, pack.pack_name]) + "\n")
+        if self._by_id is not None:
+            self._by_id.setdefault(pack.pack_id, len(self) - 1)
+        if self._by_name is not None and pack.pack_name is not None:
+            self._by_name.setdefault(pack.pack_name, len(self) - 1)
+
+    def flush(self):
+        r"""Write the packs added to the store to the files."""
+        self._data.flush()
+        if self._index_file is not None:
+            self._index_file.flush()
+
+    def read_raw(self, index: int) -> bytes:
+        r"""Read the serialized pack at ``index``, decompressed."""
+        self._data.seek(self._offsets[index])
+        data = self._data.read(self._lengths[index])
+        if self.compress:
+            data = zlib.decompress(data)
+        return data
+
+    def get(self, index: int) -> BasePack:
+        r"""Read the pack at ``index``, from the memory cache if it is
+        there."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(
+                f"Pack {index} is out of the range of the store [{self.path}]"
+                f" with {len(self)} packs.")
+
+        key = (self.path, index)
+        if self._memory is not None:
+            pack = self._memory.get(key)
+            if pack is not None:
+                return pack
+
+        pack = deserialize(self.read_raw(index))
+        if self._memory is not None:
+            self._memory.put(key, pack)
+        return pack
+
+    @overload
+    def __getitem__(self, index: int) -> BasePack:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[BasePack]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]
+                    ) -> Union[BasePack, List[BasePack]]:
+        if isinstance(index, slice):
+            return [self.get(i) for i in range(*index.indices(len(self)))]
+        return self.get(index)
+
+    def __iter__(self) -> Iterator[BasePack]:
+        for index in range(len(self)):
+            yield self.get(index)
+
+    def _build_lookup(self):
+        by_id: Dict[int, int] = {}
+        by_name: Dict[str, int] = {}
+        for index in range(len(self)):
+            if self._pack_ids[index] is None:
+                pack = self.get(index)
+                self._pack_ids[index] = pack.pack_id
+                self._pack_names[index] = pack.pack_name
+            by_id.setdefault(self._pack_ids[index], index)  # type: ignore
+            name = self._pack_names[index]
+            if name is not None:
+                by_name.setdefault(name, index)
+        self._by_id = by_id
+        self._by_name = by_name
+
+    def index_of(self, pack_id: Optional[int] = None,
+                 pack_name: Optional[str] = None) -> Optional[int]:
+        r"""The position of the first pack with ``pack_id`` or
+        ``pack_name``, or `None` if there is no such pack."""
+        if self._by_id is None:
+            self._build_lookup()
+        if pack_id is not None:
+            return self._by_id.get(pack_id)  # type: ignore
+        return self._by_name.get(pack_name)  # type: ignore
+
+    def get_by_id(self, pack_id: int) -> Optional[BasePack]:
+        r"""Read the first pack with ``pack_id``, or return `None`."""
+        index = self.index_of(pack_id=pack_id)
+        return None if index is None else self.get(index)
+
+    def get_by_name(self, pack_name: str) -> Optional[BasePack]:
+        r"""Read the first pack named ``pack_name``, or return `None`."""
+        index = self.index_of(pack_name=pack_name)
+        return None if index is None else self.get(index)
+
+    def close(self):
+        self._data.close()
+        if self._index_file is not None:
+            self._index_file.close()
+            self._index_file = None
@@ -14,19 +14,21 @@
 """
 Base reader type to be inherited by all readers.
 """
+import itertools
 import logging
 import os
 from abc import abstractmethod, ABC
 from pathlib import Path
-from typing import Any, Iterator, Optional, Union, List
+from typing import Any, Dict, Iterator, Optional, Union, List
 
 from forte.common.configuration import Config
 from forte.common.exception import ProcessExecutionException
 from forte.common.resources import Resources
 from forte.data import data_utils
-from forte.data.base_pack import PackType
+from forte.data.base_pack import PackType, SERIALIZE_METHODS
 from forte.data.data_pack import DataPack
 from forte.data.multi_pack import MultiPack
+from forte.data.pack_store import PackMemoryCache, PackStore
 from forte.data.types import ReplaceOperationsType
 from forte.pipeline_component import PipelineComponent
 from forte.utils.utils import get_full_module_name
@@ -59,28 +61,75 @@ class BaseReader(PipelineComponent[PackType], ABC):
             if cache file already exists.  By default (``False``), we
             will overwrite the existing caching file. If ``True``, we will
             cache the datapack append to end of the caching file.
+        cache_in_memory (bool, optional): Whether to keep the packs in memory
+            after the first pass, so that later iterations do not parse the
+            dataset again.
+        serialize_method (str, optional): The format used in the cache files,
+            `jsonpickle` (default) stores one JSON string per line, `binary`
+            stores the packs in the columnar binary format in a
+            :class:`~forte.data.pack_store.PackStore`, with an index of the
+            packs next to each cache file.
+        compress_cache (bool, optional): Whether to compress the packs in the
+            cache files, only available with the `binary` method.
+        memory_cache_size (int, optional): Only used with
+            ``cache_in_memory``. If set, at most this number of packs are
+            kept in memory, in a least recently used cache, and the other
+            packs are read again from the cache files, which requires the
+            `binary` method and a ``cache_directory``. By default, all the
+            packs are kept in memory.
     """
 
     def __init__(self,
                  from_cache: bool = False,
                  cache_directory: Optional[str] = None,
                  append_to_cache: bool = False,
-                 cache_in_memory: bool = False):
+                 cache_in_memory: bool = False,
+                 serialize_method: str = "jsonpickle",
+                 compress_cache: bool = False,
+                 memory_cache_size: Optional[int] = None):
         super().__init__()
+        if serialize_method not in SERIALIZE_METHODS:
+            raise ValueError(
+                f"Unknown serialize method [{serialize_method}], should be "
+                f"one of {SERIALIZE_METHODS}.")
+        if compress_cache and serialize_method != "binary":
+            raise ValueError(
+                "The cache can only be compressed with the binary method.")
+        if memory_cache_size is not None and (
+                serialize_method != "binary" or cache_directory is None):
+            raise ValueError(
+                "A memory cache size requires the binary method and a cache "
+                "directory, to read the packs that are not in memory.")
         self.from_cache = from_cache
         self._cache_directory = cache_directory
         self.component_name = get_full_module_name(self)
         self.append_to_cache = append_to_cache
         self._cache_in_memory = cache_in_memory
+        self._serialize_method = serialize_method
+        self._compress_cache = compress_cache
         self._cache_ready: bool = False
         self._data_packs: List[PackType] = []
+        self._memory_cache: Optional[PackMemoryCache] = None
+        if memory_cache_size is not None:
+            self._memory_cache = PackMemoryCache(memory_cache_size)
+        # The cache files of the collections being read, by their paths, each
+        # kept open until its collection ends. Several collections are read
+        # at once by the threads of a prefetch reader.
+        self._cache_stores: Dict[str, PackStore] = {}
+        self._shard_index: int = 0
+        self._num_shards: int = 1
 
     def initialize(self, resources: Resources, configs: Config):
         super().initialize(resources, configs)
 
         # Clear memory cache
+        self._clear_memory_cache()
+
+    def _clear_memory_cache(self):
         self._cache_ready = False
         del self._data_packs[:]
+        if self._memory_cache is not None:
+            self._memory_cache.clear()
 
     @classmethod
     def default_configs(cls):
@@ -185,15 +234,60 @@ class BaseReader(PipelineComponent[PackType], ABC):
 
         return os.path.join(str(self._cache_directory), file_path)
 
+    def shard(self, index: int, num_shards: int):
+        r"""Only read one shard of the collections (see :meth:`_collect`),
+        so that several processes or machines can split a dataset without
+        coordination. The collections are assigned to the shards in turn, in
+        the order of :meth:`_collect`, so every shard reads a disjoint part
+        of the dataset as long as :meth:`_collect` gives the collections in
+        the same order (the file readers list the files in sorted order).
+
+        Args:
+            index: The index of the shard to read, from 0 to
+                ``num_shards - 1``.
+            num_shards: The number of shards. Use 1 to read all the
+                collections again.
+        """
+        if num_shards < 1 or not 0 <= index < num_shards:
+            raise ValueError(
+                f"Invalid shard {index} of {num_shards} shards, the number "
+                f"of shards should be positive and the index should be in "
+                f"[0, {num_shards}).")
+        self._shard_index = index
+        self._num_shards = num_shards
+        # The packs of the previous shard cannot be reused.
+        self._clear_memory_cache()
+
+    def _sharded_collect(self, *args, **kwargs) -> Iterator[Any]:
+        r"""The collections of the shard of this reader, see :meth:`shard`.
+        """
+        collections = self._collect(*args, **kwargs)
+        if self._num_shards == 1:
+            return collections
+        return itertools.islice(
+            collections, self._shard_index, None, self._num_shards)
+
     def _lazy_iter(self, *args, **kwargs):
-        for collection in self._collect(*args, **kwargs):
-            if self.from_cache:
-                for pack in self.read_from_cache(
-                        self._get_cache_location(collection)):
-                    pack.add_all_remaining_entries()
-                    yield pack
-            else:
-                not_first = False
+        for collection in self._sharded_collect(*args, **kwargs):
+            yield from self._iter_collection(collection)
+
+    def _iter_collection(self, collection: Any) -> Iterator[PackType]:
+        r"""Read the packs of one collection returned by :meth:`_collect`,
+        from the cache if ``from_cache`` is set, otherwise by parsing it.
+
+        Args:
+            collection: One collection from :meth:`_collect`.
+
+        Returns: Iterator of the packs of the collection.
+        """
+        if self.from_cache:
+            for pack in self.read_from_cache(
+                    self._get_cache_location(collection)):
+                pack.add_all_remaining_entries()
+                yield pack
+        else:
+            not_first = False
+            try:
                 for pack in self.parse_pack(collection):
                     # write to the cache if _cache_directory specified
                     if self._cache_directory is not None:
@@ -208,6 +302,15 @@ class BaseReader(PipelineComponent[PackType], ABC):
                     not_first = True
                     pack.add_all_remaining_entries()
                     yield pack
+            finally:
+                if self._cache_directory is not None:
+                    self._close_cache_store(
+                        self._get_cache_location(collection))
+
+    def _close_cache_store(self, cache_filename: str):
+        store = self._cache_stores.pop(cache_filename, None)
+        if store is not None:
+            store.close()
 
     def iter(self, *args, **kwargs) -> Iterator[PackType]:
         r"""An iterator over the entire dataset, giving all Packs processed
@@ -221,13 +324,18 @@ class BaseReader(PipelineComponent[PackType], ABC):
             kwargs: Iterator of DataPacks.
         """
         if self._cache_in_memory and self._cache_ready:
-            # Read from memory
-            for pack in self._data_packs:
-                yield pack
+            if self._memory_cache is None:
+                # Read from memory
+                yield from self._data_packs
+            else:
+                # Read from the memory cache, or from the cache files
+                for collection in self._sharded_collect(*args, **kwargs):
+                    yield from self.read_from_cache(
+                        self._get_cache_location(collection))
         else:
             # Read via parsing dataset
             for pack in self._lazy_iter(*args, **kwargs):
-                if self._cache_in_memory:
+                if self._cache_in_memory and self._memory_cache is None:
                     self._data_packs.append(pack)
                 yield pack
 
@@ -257,13 +365,25 @@ class BaseReader(PipelineComponent[PackType], ABC):
 
         os.makedirs(self._cache_directory, exist_ok=True)
 
-        cache_filename = os.path.join(
-            self._cache_directory,
-            self._get_cache_location(collection)
-        )
+        cache_filename = self._get_cache_location(collection)
 
         logger.info("Caching pack to %s", cache_filename)
-        if append:
+        if self._serialize_method == "binary":
+            # The store of the collection stays open while it is read, so that
+            # appending a pack does not load the index again.
+            store = self._cache_stores.get(cache_filename)
+            if not append or store is None:
+                self._close_cache_store(cache_filename)
+                store = PackStore(cache_filename, 'a' if append else 'w',
+                                  compress=self._compress_cache)
+                self._cache_stores[cache_filename] = store
+            store.add(pack)
+            store.flush()
+            if self._memory_cache is not None:
+                # The pack is read from the memory in the next passes.
+                self._memory_cache.put(
+                    (cache_filename, len(store) - 1), pack)
+        elif append:
             with open(cache_filename, 'a') as cache:
                 cache.write(pack.serialize() + "\n")
         else:
@@ -281,14 +401,23 @@ class BaseReader(PipelineComponent[PackType], ABC):
         Returns: List of cached data packs.
         """
         logger.info("reading from cache file %s", cache_filename)
-        with open(cache_filename, "r") as cache_file:
-            for line in cache_file:
-                pack = data_utils.deserialize(line.strip())
-                if not isinstance(pack, self.pack_type):
-                    raise TypeError(
-                        f"Pack deserialized from {cache_filename} "
-                        f"is {type(pack)}, but expect {self.pack_type}")
-                yield pack
+        for pack in self._iter_cache_file(cache_filename):
+            if not isinstance(pack, self.pack_type):
+                raise TypeError(
+                    f"Pack deserialized from {cache_filename} "
+                    f"is {type(pack)}, but expect {self.pack_type}")
+            yield pack
+
+    def _iter_cache_file(
+            self, cache_filename: Union[Path, str]) -> Iterator[PackType]:
+        if self._serialize_method == "binary":
+            with PackStore(str(cache_filename),
+                           memory=self._memory_cache) as store:
+                yield from store  # type: ignore
+        else:
+            with open(cache_filename, "r") as cache_file:
+                for line in cache_file:
+                    yield data_utils.deserialize(line.strip())
 
     def finish(self, resources: Resources):
         pass
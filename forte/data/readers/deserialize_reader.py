@@ -14,7 +14,7 @@
 import os
 from abc import ABC, abstractmethod
 
-from typing import Iterator, List, Any
+from typing import Iterator, List, Any, Union
 
 from forte.common.exception import ProcessExecutionException
 from forte.data.data_pack import DataPack
@@ -35,7 +35,8 @@ class BaseDeserializeReader(PackReader, ABC):
     def _cache_key_function(self, collection) -> str:
         return "cached_string_file"
 
-    def _parse_pack(self, data_source: str) -> Iterator[DataPack]:
+    def _parse_pack(
+            self, data_source: Union[str, bytes]) -> Iterator[DataPack]:
         if data_source is None:
             raise ProcessExecutionException(
                 "Data source is None, cannot deserialize.")
@@ -53,38 +54,49 @@ class BaseDeserializeReader(PackReader, ABC):
 
 class RawDataDeserializeReader(BaseDeserializeReader):
     """
-    This reader assumes the data passed in are raw DataPack strings.
+    This reader assumes the data passed in are raw DataPack strings, or bytes
+    in the binary format.
     """
 
-    def _collect(self, data_list: List[str]) -> Iterator[str]:  # type: ignore
+    def _collect(self,  # type: ignore
+                 data_list: List[Union[str, bytes]]
+                 ) -> Iterator[Union[str, bytes]]:
         yield from data_list
 
 
 class RecursiveDirectoryDeserializeReader(BaseDeserializeReader):
     """
     This reader find all the files under the directory and read each one as
-    a DataPack.
+    a DataPack. Both the `jsonpickle` and the binary formats can be read, set
+    the `suffix` to `.bin` to read the binary packs written by
+    :class:`~forte.processors.base.writers.JsonPackWriter`.
     """
 
     def _collect(self, data_dir: str) -> Iterator[str]:  # type: ignore
         """
-        This function will collect the files of the given directory. If the
-         'suffix' field in the config is set, it will only take files matching
-         that suffix. See :func:`~forte.data.readers.RecursiveDirectory
-         DeserializeReader.default_configs` for the default configs.
+        This function will collect the files of the given directory, in sorted
+        order. If the 'suffix' field in the config is set, it will only take
+        files matching that suffix. See :func:`~forte.data.readers.RecursiveD
+        irectoryDeserializeReader.default_configs` for the default configs.
 
         Args:
             data_dir: The root directory to search for the data packs.
 
-        Returns:
-
+        Returns: Iterator of the paths of the files, which are read when
+            parsing the packs, so that a shard or a worker process only reads
+            its own files.
         """
-        for root, _, files in os.walk(data_dir):
-            for file in files:
+        for root, dirs, files in os.walk(data_dir):
+            dirs.sort()
+            for file in sorted(files):
                 if not self.configs.suffix or file.endswith(
                         self.configs.suffix):
-                    with open(os.path.join(root, file)) as f:
-                        yield f.read()
+                    yield os.path.join(root, file)
+
+    def _parse_pack(  # type: ignore
+            self, data_source: str) -> Iterator[DataPack]:
+        with open(data_source, 'rb') as f:
+            yield from super()._parse_pack(f.read())
 
     @classmethod
     def default_configs(cls):
@@ -121,7 +133,8 @@ class MultiPackDeserializerBase(MultiPackReader):
         for s in self._get_multipack_content():
             yield s
 
-    def _parse_pack(self, multi_pack_str: str) -> Iterator[MultiPack]:
+    def _parse_pack(
+            self, multi_pack_str: Union[str, bytes]) -> Iterator[MultiPack]:
         # pylint: disable=protected-access
         m_pack: MultiPack = deserialize(multi_pack_str)
 
@@ -131,7 +144,7 @@ class MultiPackDeserializerBase(MultiPackReader):
         yield m_pack
 
     @abstractmethod
-    def _get_multipack_content(self) -> Iterator[str]:
+    def _get_multipack_content(self) -> Iterator[Union[str, bytes]]:
         """
         Implementation of this method should be responsible for yielding
          the raw content of the multi packs.
@@ -142,7 +155,7 @@ class MultiPackDeserializerBase(MultiPackReader):
         raise NotImplementedError
 
     @abstractmethod
-    def _get_pack_content(self, pack_id: int) -> str:
+    def _get_pack_content(self, pack_id: int) -> Union[str, bytes]:
         """
         Implementation of this method should be responsible for returning the
           raw string of the data pack from the pack id.
@@ -162,20 +175,23 @@ class MultiPackDirectoryReader(MultiPackDeserializerBase):
     can be used to read the output written by
     :class:`~forte.processors.base.writers.PackNameMultiPackWriter`. It assumes
     the multipack are stored in a directory, and the data packs are stored in
-    a directory too (they can be the same directory).
+    a directory too (they can be the same directory). The `pack_suffix` is
+    used for both the multi packs and the data packs, set it to `.bin` to read
+    packs written in the binary format.
     """
 
-    def _get_multipack_content(self) -> Iterator[str]:
+    def _get_multipack_content(self) -> Iterator[bytes]:  # type: ignore
         # pylint: disable=protected-access
         for f in os.listdir(self.configs.multi_pack_dir):
             if f.endswith(self.configs.pack_suffix):
                 with open(os.path.join(
-                        self.configs.multi_pack_dir, f)) as m_data:
+                        self.configs.multi_pack_dir, f), 'rb') as m_data:
                     yield m_data.read()
 
-    def _get_pack_content(self, pack_id: int) -> str:
+    def _get_pack_content(self, pack_id: int) -> bytes:
         with open(os.path.join(
-                self.configs.data_pack_dir, f'{pack_id}.json')) as pack_data:
+                self.configs.data_pack_dir,
+                f'{pack_id}{self.configs.pack_suffix}'), 'rb') as pack_data:
             return pack_data.read()
 
     @classmethod
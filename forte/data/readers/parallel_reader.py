@@ -0,0 +1,171 @@
+# Copyright 2020 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A reader wrapper that parses the collections in worker processes.
+"""
+import multiprocessing
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ProcessPoolExecutor, wait)
+from typing import (
+    Any, Deque, Dict, Iterator, List, Optional, Set, Union)
+
+from forte.common.configuration import Config
+from forte.common.resources import Resources
+from forte.data.base_pack import PackType
+from forte.data.readers.base_reader import BaseReader
+from forte.pipeline_workers import (
+    TransferredPack, serialize_for_transfer, deserialize_transfer)
+from forte.process_manager import ProcessManager
+
+__all__ = [
+    "ParallelReader",
+]
+
+# The wrapped reader of a worker process, inherited from the main process.
+_worker_reader: Optional[BaseReader] = None
+
+
+def _init_worker(reader: BaseReader):
+    global _worker_reader  # pylint: disable=global-statement
+    _worker_reader = reader
+
+
+def _read_collection(collection: Any) -> List[TransferredPack]:
+    assert _worker_reader is not None
+    # pylint: disable=protected-access
+    return [serialize_for_transfer(pack)
+            for pack in _worker_reader._iter_collection(collection)]
+
+
+class ParallelReader(BaseReader[PackType]):
+    r"""Wraps another reader, and parses the collections of the wrapped reader
+    (see :meth:`~forte.data.readers.base_reader.BaseReader._collect`) in
+    ``num_workers`` worker processes, so that the readers bound by the CPU,
+    such as the ones parsing large files, use several cores. The collections
+    are listed in the main process and sent to the workers, the packs are
+    sent back in the binary format of :mod:`~forte.data.binary_io`.
+
+    The wrapped reader is configured and used as usual, the wrapper takes the
+    configurations of the wrapped reader:
+
+    .. code-block:: python
+
+        pipeline.set_reader(ParallelReader(OntonotesReader(), 4), configs)
+
+    The workers are forked from the main process when the reading starts, so
+    they use the reader as initialized by the pipeline, but the changes made
+    to the reader in the workers (such as counters) are not seen by the main
+    process. The collections must be picklable.
+
+    Args:
+        reader: The reader to be wrapped.
+        num_workers (int): The number of worker processes.
+        preserve_order (bool): Whether to return the packs in the order of
+            the wrapped reader. Otherwise, the packs of each collection are
+            returned as soon as it is parsed.
+        max_in_flight (int, optional): The maximum number of collections
+            sent to the workers and not consumed yet, which bounds the
+            memory used by the parsed packs waiting to be returned. By
+            default, twice the number of workers.
+    """
+
+    def __init__(self, reader: BaseReader[PackType], num_workers: int = 2,
+                 preserve_order: bool = True,
+                 max_in_flight: Optional[int] = None):
+        # pylint: disable=protected-access
+        super().__init__(cache_in_memory=reader._cache_in_memory)
+        if max_in_flight is None:
+            max_in_flight = 2 * num_workers
+        if num_workers < 1 or max_in_flight < 1:
+            raise ValueError(
+                "The number of workers and the number of collections in "
+                "flight should be positive.")
+        self._reader: BaseReader[PackType] = reader
+        self._num_workers: int = num_workers
+        self._preserve_order: bool = preserve_order
+        self._max_in_flight: int = max_in_flight
+
+    @property
+    def reader(self) -> BaseReader[PackType]:
+        r"""The wrapped reader."""
+        return self._reader
+
+    @property
+    def pack_type(self):
+        return self._reader.pack_type
+
+    def make_configs(  # type: ignore # pylint: disable=arguments-differ
+            self, configs: Optional[Union[Config, Dict[str, Any]]]) -> Config:
+        return self._reader.make_configs(configs)
+
+    def assign_manager(self, process_manager: ProcessManager):
+        super().assign_manager(process_manager)
+        self._reader.assign_manager(process_manager)
+
+    def initialize(self, resources: Resources, configs: Config):
+        super().initialize(resources, configs)
+        self._reader.initialize(resources, configs)
+
+    def _collect(self, *args: Any, **kwargs: Any) -> Iterator[Any]:
+        # pylint: disable=protected-access
+        return self._reader._collect(*args, **kwargs)
+
+    def _parse_pack(self, collection: Any) -> Iterator[PackType]:
+        # pylint: disable=protected-access
+        return self._reader._parse_pack(collection)
+
+    def _lazy_iter(self, *args, **kwargs):
+        executor = ProcessPoolExecutor(
+            max_workers=self._num_workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_worker, initargs=(self._reader,))
+        # The collections sent to the workers, in the order of the reader.
+        in_order: Deque[Future] = deque()
+        pending: Set[Future] = set()
+
+        def _packs(future: Future) -> Iterator[PackType]:
+            for data in future.result():
+                yield deserialize_transfer(data)
+
+        try:
+            for collection in self._sharded_collect(*args, **kwargs):
+                future = executor.submit(_read_collection, collection)
+                if self._preserve_order:
+                    in_order.append(future)
+                    if len(in_order) >= self._max_in_flight:
+                        yield from _packs(in_order.popleft())
+                else:
+                    pending.add(future)
+                    if len(pending) >= self._max_in_flight:
+                        done, pending = wait(
+                            pending, return_when=FIRST_COMPLETED)
+                        for finished in done:
+                            yield from _packs(finished)
+
+            while in_order:
+                yield from _packs(in_order.popleft())
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for finished in done:
+                    yield from _packs(finished)
+        finally:
+            # Do not start the remaining collections if the iteration stops
+            # early.
+            for future in list(in_order) + list(pending):
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def finish(self, resources: Resources):
+        self._reader.finish(resources)
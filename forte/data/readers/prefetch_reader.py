@@ -0,0 +1,121 @@
+# Copyright 2020 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A reader wrapper that reads the next collections in background threads.
+"""
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, Iterator, List, Optional, Union
+
+from forte.common.configuration import Config
+from forte.common.resources import Resources
+from forte.data.base_pack import PackType
+from forte.data.readers.base_reader import BaseReader
+from forte.process_manager import ProcessManager
+
+__all__ = [
+    "PrefetchReader",
+]
+
+
+class PrefetchReader(BaseReader[PackType]):
+    r"""Wraps another reader, and reads the collections of the wrapped reader
+    (see :meth:`~forte.data.readers.base_reader.BaseReader._collect`) ahead in
+    background threads, so that reading the files overlaps with the
+    processors. The packs are returned in the same order as the wrapped
+    reader.
+
+    The wrapped reader is configured and used as usual, the wrapper takes the
+    configurations of the wrapped reader:
+
+    .. code-block:: python
+
+        pipeline.set_reader(PrefetchReader(OntonotesReader()), configs)
+
+    Since the parsing runs in Python threads, this helps most when reading is
+    bound by I/O, such as reading from a network file system.
+
+    Args:
+        reader: The reader to be wrapped.
+        prefetch_size (int): The number of collections read ahead of the
+            collection being consumed.
+        num_threads (int): The number of threads reading the collections.
+    """
+
+    def __init__(self, reader: BaseReader[PackType], prefetch_size: int = 4,
+                 num_threads: int = 1):
+        # pylint: disable=protected-access
+        super().__init__(cache_in_memory=reader._cache_in_memory)
+        if prefetch_size < 1 or num_threads < 1:
+            raise ValueError(
+                "The prefetch size and the number of threads should be "
+                "positive.")
+        self._reader: BaseReader[PackType] = reader
+        self._prefetch_size: int = prefetch_size
+        self._num_threads: int = num_threads
+
+    @property
+    def reader(self) -> BaseReader[PackType]:
+        r"""The wrapped reader."""
+        return self._reader
+
+    @property
+    def pack_type(self):
+        return self._reader.pack_type
+
+    def make_configs(  # type: ignore # pylint: disable=arguments-differ
+            self, configs: Optional[Union[Config, Dict[str, Any]]]) -> Config:
+        return self._reader.make_configs(configs)
+
+    def assign_manager(self, process_manager: ProcessManager):
+        super().assign_manager(process_manager)
+        self._reader.assign_manager(process_manager)
+
+    def initialize(self, resources: Resources, configs: Config):
+        super().initialize(resources, configs)
+        self._reader.initialize(resources, configs)
+
+    def _collect(self, *args: Any, **kwargs: Any) -> Iterator[Any]:
+        # pylint: disable=protected-access
+        return self._reader._collect(*args, **kwargs)
+
+    def _parse_pack(self, collection: Any) -> Iterator[PackType]:
+        # pylint: disable=protected-access
+        return self._reader._parse_pack(collection)
+
+    def _read_collection(self, collection: Any) -> List[PackType]:
+        # pylint: disable=protected-access
+        return list(self._reader._iter_collection(collection))
+
+    def _lazy_iter(self, *args, **kwargs):
+        futures: Deque[Future] = deque()
+        executor = ThreadPoolExecutor(max_workers=self._num_threads)
+        try:
+            for collection in self._sharded_collect(*args, **kwargs):
+                futures.append(
+                    executor.submit(self._read_collection, collection))
+                if len(futures) > self._prefetch_size:
+                    yield from futures.popleft().result()
+
+            while futures:
+                yield from futures.popleft().result()
+        finally:
+            # Do not start the remaining collections if the iteration stops
+            # early.
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def finish(self, resources: Resources):
+        self._reader.finish(resources)
@@ -18,6 +18,7 @@ Adapted from AllenNLP but removed the feature of external restriction
 from typing import Optional, List, Tuple, Dict, Union
 import logging
 
+import numpy as np
 import torch
 
 logger = logging.getLogger(__name__)
@@ -387,81 +388,183 @@ class ConditionalRandomField(torch.nn.Module):
 
         return torch.sum(log_numerator - log_denominator)
 
-    def viterbi_tags(self, logits: torch.Tensor,
-                     mask: torch.Tensor) -> List[Tuple[List[int], float]]:
+    def _viterbi_transitions(
+            self) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
         """
-        Uses viterbi algorithm to find most likely tags for the given inputs.
-        If constraints are applied, disallows all other transitions.
+        Get the transition scores used by the viterbi decoding, where the
+        disallowed transitions get a score of -10000. Returns the
+        (num_tags, num_tags) transitions between the tags, and the (num_tags,)
+        transitions from the start state and to the end state.
         """
-        _, max_seq_length, num_tags = logits.size()
-
-        # Get the tensors out of the variables
-        logits, mask = logits.data, mask.data
-
-        # Augment transitions matrix with start and end transitions
+        num_tags = self.num_tags
         start_tag = num_tags
         end_tag = num_tags + 1
-        transitions = torch.Tensor(num_tags + 2, num_tags + 2).fill_(-10000.0)
+        constraint_mask = self._constraint_mask.detach()
 
-        # Apply transition constraints
-        constrained_transitions = self.transitions * self._constraint_mask[
-                                                     :num_tags, :num_tags
-                                                     ] + -10000.0 * (
-                                          1 - self._constraint_mask[
-                                              :num_tags, :num_tags])
-        transitions[:num_tags, :num_tags] = constrained_transitions.data
+        tag_mask = constraint_mask[:num_tags, :num_tags]
+        transitions = (self.transitions.detach() * tag_mask
+                       + -10000.0 * (1 - tag_mask))
 
+        start_mask = constraint_mask[start_tag, :num_tags]
+        end_mask = constraint_mask[:num_tags, end_tag]
+        start_transitions = -10000.0 * (1 - start_mask)
+        end_transitions = -10000.0 * (1 - end_mask)
         if self.include_start_end_transitions:
-            transitions[
-            start_tag, :num_tags
-            ] = self.start_transitions.detach() * self._constraint_mask[
-                                                  start_tag, :num_tags
-                                                  ].data + -10000.0 * (
-                        1 - self._constraint_mask[start_tag, :num_tags].detach()
-                )
-            transitions[
-            :num_tags, end_tag
-            ] = self.end_transitions.detach() * self._constraint_mask[
-                                                :num_tags, end_tag
-                                                ].data + -10000.0 * (
-                        1 - self._constraint_mask[:num_tags, end_tag].detach()
-                )
+            start_transitions = (start_transitions
+                                 + self.start_transitions.detach() * start_mask)
+            end_transitions = (end_transitions
+                               + self.end_transitions.detach() * end_mask)
+
+        return transitions, start_transitions, end_transitions
+
+    def viterbi_tags(self, logits: torch.Tensor, mask: torch.Tensor,
+                     use_numpy: bool = False) -> List[Tuple[List[int], float]]:
+        """
+        Uses viterbi algorithm to find most likely tags for the given inputs.
+        If constraints are applied, disallows all other transitions.
+
+        All the sequences in the batch are decoded together, see
+        :func:`batch_viterbi_decode`.
+
+        Args:
+            logits (torch.Tensor): The (batch_size, sequence_length, num_tags)
+                tag scores.
+            mask (torch.Tensor): The (batch_size, sequence_length) mask of the
+                valid positions, each sequence should take the first positions
+                and have at least one position.
+            use_numpy (bool): Whether to decode with NumPy on CPU, see
+                :func:`numpy_batch_viterbi_decode`. This avoids the overhead of
+                the small tensor operations when decoding on CPU.
+
+        Returns:
+            The best tags of each sequence, and the score of the tags.
+        """
+        transitions, start_transitions, end_transitions = \
+            self._viterbi_transitions()
+        lengths = mask.detach().long().sum(-1).tolist()
+
+        if use_numpy:
+            best_tags, best_scores = numpy_batch_viterbi_decode(
+                logits.detach().cpu().numpy(), mask.detach().cpu().numpy(),
+                transitions.cpu().numpy(), start_transitions.cpu().numpy(),
+                end_transitions.cpu().numpy())
+            best_tags_list = best_tags.tolist()
+            best_scores_list = best_scores.tolist()
         else:
-            transitions[start_tag, :num_tags] = -10000.0 * (
-                    1 - self._constraint_mask[start_tag, :num_tags].detach()
-            )
-            transitions[:num_tags, end_tag] = -10000.0 * (
-                    1 - self._constraint_mask[:num_tags, end_tag].detach()
-            )
+            tags, scores = batch_viterbi_decode(
+                logits.detach(), mask.detach(), transitions,
+                start_transitions, end_transitions)
+            best_tags_list = tags.tolist()
+            best_scores_list = scores.tolist()
 
-        best_paths = []
-        # Pad the max sequence length by 2 to account for start_tag + end_tag.
-        tag_sequence = torch.Tensor(max_seq_length + 2, num_tags + 2)
-
-        for prediction, prediction_mask in zip(logits, mask):
-            sequence_length = torch.sum(prediction_mask)
-
-            # Start with everything totally unlikely
-            tag_sequence.fill_(-10000.0)
-            # At timestep 0 we must have the START_TAG
-            tag_sequence[0, start_tag] = 0.0
-            # At steps 1, ..., sequence_length we just use the
-            # incoming prediction
-            tag_sequence[1:(sequence_length + 1), :num_tags] = prediction[
-                                                               :sequence_length
-                                                               ]
-            # And at the last timestep we must have the END_TAG
-            tag_sequence[sequence_length + 1, end_tag] = 0.0
-
-            # We pass the tags and the transitions to ``viterbi_decode``.
-            viterbi_path, viterbi_score = viterbi_decode(
-                tag_sequence[: (sequence_length + 2)], transitions
-            )
-            # Get rid of START and END sentinels and append.
-            viterbi_path = viterbi_path[1:-1]
-            best_paths.append((viterbi_path, viterbi_score.item()))
+        return [(tags[:length], score) for tags, score, length in zip(
+            best_tags_list, best_scores_list, lengths)]
 
-        return best_paths
+
+def batch_viterbi_decode(
+        logits: torch.Tensor, mask: torch.Tensor, transitions: torch.Tensor,
+        start_transitions: torch.Tensor,
+        end_transitions: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Perform Viterbi decoding in log space over a batch of sequences at once.
+    Each time step is one tensor operation over the whole batch, the
+    positions beyond the length of a sequence keep its scores unchanged.
+
+    Parameters
+    ----------
+    logits : torch.Tensor, required.
+        A tensor of shape (batch_size, sequence_length, num_tags) representing
+        the scores of the tags over the sequences.
+    mask : torch.Tensor, required.
+        A tensor of shape (batch_size, sequence_length), the valid positions of
+        each sequence. Each sequence should take the first positions, and have
+        at least one position.
+    transitions : torch.Tensor, required.
+        A tensor of shape (num_tags, num_tags) representing the potentials for
+        transitioning between a given pair of tags.
+    start_transitions : torch.Tensor, required.
+        A tensor of shape (num_tags,), the potentials of the first tags.
+    end_transitions : torch.Tensor, required.
+        A tensor of shape (num_tags,), the potentials of the last tags.
+
+    Returns
+    -------
+    best_tags : torch.Tensor
+        A (batch_size, sequence_length) tensor of the tag indices of the
+        maximum likelihood tag sequences. The positions beyond the length of
+        a sequence repeat its last tag.
+    best_scores : torch.Tensor
+        The (batch_size,) scores of the best tag sequences.
+    """
+    batch_size, sequence_length, num_tags = logits.size()
+    mask = mask.bool()
+
+    # (batch_size, num_tags), the best score of the sequences ending with each
+    # tag at the current time step.
+    scores = start_transitions.view(1, num_tags) + logits[:, 0]
+    # Used for the positions beyond the length of the sequences.
+    identity = torch.arange(num_tags, device=logits.device).view(
+        1, num_tags).expand(batch_size, num_tags)
+    backpointers = []
+
+    for i in range(1, sequence_length):
+        # (batch_size, previous_tag, current_tag)
+        summed_potentials = scores.unsqueeze(2) + transitions.unsqueeze(0)
+        best_previous, paths = torch.max(summed_potentials, 1)
+        step_mask = mask[:, i].unsqueeze(1)
+        scores = torch.where(step_mask, best_previous + logits[:, i], scores)
+        backpointers.append(torch.where(step_mask, paths, identity))
+
+    best_scores, best_last = torch.max(
+        scores + end_transitions.view(1, num_tags), 1)
+
+    # Construct the most likely sequences backwards.
+    best_tags = [best_last]
+    for paths in reversed(backpointers):
+        best_last = paths.gather(1, best_last.unsqueeze(1)).squeeze(1)
+        best_tags.append(best_last)
+    best_tags.reverse()
+
+    return torch.stack(best_tags, 1), best_scores
+
+
+def numpy_batch_viterbi_decode(
+        logits: np.ndarray, mask: np.ndarray, transitions: np.ndarray,
+        start_transitions: np.ndarray,
+        end_transitions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    The same as :func:`batch_viterbi_decode`, with NumPy arrays in place of
+    the tensors.
+    """
+    batch_size, sequence_length, num_tags = logits.shape
+    mask = mask.astype(bool)
+
+    scores = start_transitions[np.newaxis, :] + logits[:, 0]
+    identity = np.broadcast_to(
+        np.arange(num_tags)[np.newaxis, :], (batch_size, num_tags))
+    batch_indices = np.arange(batch_size)
+    backpointers = []
+
+    for i in range(1, sequence_length):
+        summed_potentials = scores[:, :, np.newaxis] + transitions[np.newaxis]
+        paths = np.argmax(summed_potentials, 1)
+        best_previous = np.take_along_axis(
+            summed_potentials, paths[:, np.newaxis, :], 1)[:, 0]
+        step_mask = mask[:, i, np.newaxis]
+        scores = np.where(step_mask, best_previous + logits[:, i], scores)
+        backpointers.append(np.where(step_mask, paths, identity))
+
+    final_scores = scores + end_transitions[np.newaxis, :]
+    best_last = np.argmax(final_scores, 1)
+    best_scores = final_scores[batch_indices, best_last]
+
+    best_tags = [best_last]
+    for paths in reversed(backpointers):
+        best_last = paths[batch_indices, best_last]
+        best_tags.append(best_last)
+    best_tags.reverse()
+
+    return np.stack(best_tags, 1), best_scores
 
 
 def viterbi_decode(tag_sequence: torch.Tensor, transition_matrix: torch.Tensor,
@@ -0,0 +1,198 @@
+# Copyright 2020 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+The word and character features of the NER model, shared by
+:class:`~forte.processors.ner_predictor.CoNLLNERPredictor` and
+:class:`~forte.trainer.ner_trainer.CoNLLNERTrainer`.
+"""
+from collections import OrderedDict
+from typing import Callable, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+import torch
+
+from forte.models.ner.utils import (
+    MAX_CHAR_LENGTH, NUM_CHAR_PAD, normalize_digit_word)
+
+__all__ = [
+    "TokenFeatures",
+    "NERFeatureExtractor",
+    "pad_flat",
+]
+
+# The features of a sentence: the word ids, the char ids of all the words
+# concatenated, and the number of chars of each word.
+TokenFeatures = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def pad_flat(flat: np.ndarray, lengths: np.ndarray, pad_value: int,
+             max_length: Optional[int] = None) -> np.ndarray:
+    r"""Split ``flat`` into sequences of ``lengths``, and pad them into one
+    array of shape ``[len(lengths), max_length]`` in one step.
+
+    Args:
+        flat: The values of all the sequences concatenated.
+        lengths: The length of each sequence.
+        pad_value: The value of the padded positions.
+        max_length: The length to pad to, which should be at least the
+            longest sequence. By default, the length of the longest sequence.
+
+    Returns:
+        The padded array.
+    """
+    num_sequences = len(lengths)
+    if max_length is None:
+        max_length = int(lengths.max()) if num_sequences > 0 else 0
+
+    padded = np.full((num_sequences, max_length), pad_value, dtype=flat.dtype)
+    offsets = np.cumsum(lengths) - lengths
+    rows = np.repeat(np.arange(num_sequences), lengths)
+    columns = np.arange(len(flat)) - np.repeat(offsets, lengths)
+    padded[rows, columns] = flat
+    return padded
+
+
+class NERFeatureExtractor:
+    r"""Map the words of the sentences to the word ids and char ids used by
+    the NER model, and build the padded batches.
+
+    The ids of each distinct word are looked up in the alphabets once and
+    kept in a bounded LRU cache, and the sentences are stored as flat id
+    arrays, so that a batch is padded with a few NumPy operations instead of
+    one assignment per word.
+
+    Args:
+        word_alphabet: The alphabet of the words.
+        char_alphabet: The alphabet of the characters.
+        max_char_length (int): The maximum number of chars kept for a word.
+        num_char_pad (int): The number of padding chars added after the
+            longest word of a batch.
+        normalize_func: The function to normalize a word before looking it up
+            in ``word_alphabet``.
+        cache_size (int): The maximum number of words in the cache.
+    """
+
+    def __init__(self, word_alphabet, char_alphabet,
+                 max_char_length: int = MAX_CHAR_LENGTH,
+                 num_char_pad: int = NUM_CHAR_PAD,
+                 normalize_func: Callable[[str], str] = normalize_digit_word,
+                 cache_size: int = 100000):
+        self.word_alphabet = word_alphabet
+        self.char_alphabet = char_alphabet
+        self.max_char_length = max_char_length
+        self.num_char_pad = num_char_pad
+        self.normalize_func = normalize_func
+
+        self._cache_size = cache_size
+        self._cache: "OrderedDict[str, Tuple[int, np.ndarray]]" = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def _word_ids(self, word: str) -> Tuple[int, np.ndarray]:
+        try:
+            ids = self._cache[word]
+            self._cache.move_to_end(word)
+            self.hits += 1
+            return ids
+        except KeyError:
+            pass
+
+        self.misses += 1
+        char_ids = np.array(
+            [self.char_alphabet.get_index(char)
+             for char in word[:self.max_char_length]], dtype=np.int64)
+        ids = (self.word_alphabet.get_index(self.normalize_func(word)),
+               char_ids)
+        self._cache[word] = ids
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return ids
+
+    def extract(self, words: Iterable[str]) -> TokenFeatures:
+        r"""Get the features of a sentence.
+
+        Args:
+            words: The words of the sentence.
+
+        Returns:
+            The word ids, the char ids of all the words concatenated, and the
+            number of chars of each word.
+        """
+        word_ids = []
+        char_ids = []
+        for word in words:
+            word_id, chars = self._word_ids(word)
+            word_ids.append(word_id)
+            char_ids.append(chars)
+
+        return (np.array(word_ids, dtype=np.int64),
+                np.concatenate(char_ids) if char_ids
+                else np.empty(0, dtype=np.int64),
+                np.array([len(c) for c in char_ids], dtype=np.int64))
+
+    def get_batch_arrays(self, data: Sequence[TokenFeatures]) -> \
+            Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        r"""The NumPy version of :meth:`get_batch_tensor`."""
+        lengths = np.array([len(d[0]) for d in data], dtype=np.int64)
+        char_lengths = np.concatenate([d[2] for d in data])
+        char_length = min(
+            self.max_char_length,
+            int(char_lengths.max()) + self.num_char_pad)
+
+        words = pad_flat(np.concatenate([d[0] for d in data]), lengths,
+                         self.word_alphabet.pad_id)
+
+        # Pad the chars of each word, then place the words in the sentences.
+        word_chars = pad_flat(np.concatenate([d[1] for d in data]),
+                              char_lengths, self.char_alphabet.pad_id,
+                              char_length)
+        chars = np.full((len(data), words.shape[1], char_length),
+                        self.char_alphabet.pad_id, dtype=np.int64)
+        rows = np.repeat(np.arange(len(data)), lengths)
+        columns = np.arange(len(rows)) - np.repeat(
+            np.cumsum(lengths) - lengths, lengths)
+        chars[rows, columns] = word_chars
+
+        masks = np.zeros(words.shape, dtype=np.float32)
+        masks[rows, columns] = 1.0
+
+        return words, chars, masks, lengths
+
+    def get_batch_tensor(
+            self, data: Sequence[TokenFeatures],
+            device: Optional[torch.device] = None) -> \
+            Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
+        r"""Get the tensors to be fed into the model.
+
+        Args:
+            data: The features of the sentences, from :meth:`extract`.
+            device: The device for the tensors.
+
+        Returns:
+            A tuple where
+
+            - ``words``: A tensor of shape `[batch_size, batch_length]`
+              representing the word ids in the batch
+            - ``chars``: A tensor of shape
+              `[batch_size, batch_length, char_length]` representing the char
+              ids for each word in the batch
+            - ``masks``: A tensor of shape `[batch_size, batch_length]`
+              representing the indices to be masked in the batch. 1 indicates
+              no masking.
+            - ``lengths``: A tensor of shape `[batch_size]` representing the
+              length of each sentences in the batch
+        """
+        return tuple(  # type: ignore
+            torch.from_numpy(array).to(device)
+            for array in self.get_batch_arrays(data))
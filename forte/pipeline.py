@@ -15,8 +15,11 @@
 Base class for Pipeline module.
 """
 
-import itertools
+import copy
 import logging
+import multiprocessing
+import threading
+import time
 from typing import Any, Dict, Generic, Iterator, List, Optional, Union, Tuple
 
 import yaml
@@ -32,10 +35,11 @@ from forte.data.readers.base_reader import BaseReader
 from forte.data.selector import Selector, DummySelector
 from forte.evaluation.base.base_evaluator import Evaluator
 from forte.pipeline_component import PipelineComponent
+from forte.pipeline_stats import PipelineStats
+from forte.pipeline_workers import run_worker, feed_workers, collect_results
 from forte.process_job import ProcessJob
-from forte.process_manager import ProcessManager, ProcessJobStatus
+from forte.process_manager import ProcessManager
 from forte.processors.base.base_processor import BaseProcessor
-from forte.processors.base.batch_processor import BaseBatchProcessor
 from forte.utils import create_class_with_kwargs
 
 logger = logging.getLogger(__name__)
@@ -45,57 +49,30 @@ __all__ = [
 ]
 
 
-class ProcessBuffer:
-    def __init__(self,
-                 pipeline: "Pipeline",
-                 data_iter: Iterator[PackType],
-                 ):
-        self.__data_iter: Iterator[PackType] = data_iter
-        self.__data_exhausted = False
-        self.__pipeline = pipeline
-        self.__process_manager: ProcessManager = pipeline._proc_mgr
-
-    def __iter__(self):
-        return self
-
-    def __next__(self) -> ProcessJob:
-        if self.__process_manager.current_queue_index == -1:
-            if self.__data_exhausted:
-                # Both the buffer is empty and the data input is exhausted.
-                raise StopIteration
-            try:
-                job_pack = next(self.__data_iter)
-                job = ProcessJob(job_pack, False)
-
-                if len(self.__pipeline.evaluator_indices) > 0:
-                    gold_copy = job_pack.view()
-                    self.__pipeline.add_gold_packs({job.id: gold_copy})
-
-                self.__process_manager.add_to_queue(queue_index=0, job=job)
-                self.__process_manager.current_queue_index = 0
-                self.__process_manager.current_processor_index = 0
-                return job
-            except StopIteration:
-                self.__data_exhausted = True
-                job = ProcessJob(None, True)
-                self.__process_manager.add_to_queue(queue_index=0, job=job)
-                self.__process_manager.current_queue_index = 0
-                self.__process_manager.current_processor_index = 0
-                return job
-        else:
-            q_index = self.__process_manager.current_queue_index
-            u_index = self.__process_manager.unprocessed_queue_indices[q_index]
-            return self.__process_manager.current_queue[u_index]
-
-
 class Pipeline(Generic[PackType]):
     r"""This controls the main inference flow of the system. A pipeline is
     consisted of a set of Components (readers and processors). The data flows
     in the pipeline as data packs, and each component will use or add
     information to the data packs.
+
+    Args:
+        resource: The resources shared by the components.
+        num_workers: The number of worker processes used by
+            :meth:`process_dataset`. With the default ``0``, all the
+            components run in the current process. Otherwise the packs from
+            the reader are distributed to ``num_workers`` processes, each
+            running a copy of all the components. The packs returned are then
+            copies of the packs from the reader, sent across the processes in
+            the binary format. The worker processes are forked after
+            :meth:`initialize`, so this is only supported on platforms with
+            the `fork` start method, and evaluators are not supported.
+        preserve_order: Only used when ``num_workers > 0``. Whether to return
+            the packs in the order of the reader, otherwise the packs are
+            returned as soon as they are processed.
     """
 
-    def __init__(self, resource: Optional[Resources] = None):
+    def __init__(self, resource: Optional[Resources] = None,
+                 num_workers: int = 0, preserve_order: bool = True):
         self._reader: BaseReader
         self._reader_config: Optional[Config]
 
@@ -119,6 +96,17 @@ class Pipeline(Generic[PackType]):
         else:
             self.resource = resource
 
+        # The statistics are only collected when profiling is enabled.
+        self._stats: Optional[PipelineStats] = None
+        self._profiling_configs: Optional[Dict[str, Any]] = None
+
+        if num_workers < 0:
+            raise ValueError(
+                f"The number of workers should not be negative, "
+                f"got {num_workers}.")
+        self._num_workers: int = num_workers
+        self._preserve_order: bool = preserve_order
+
         self.initialized: bool = False
 
     def init_from_config_path(self, config_path):
@@ -167,6 +155,19 @@ class Pipeline(Generic[PackType]):
         self._reader.initialize(self.resource, self._reader_config)
         self.initialize_processors()
 
+        if self._profiling_configs is not None:
+            self._reset_stats()
+
+        if self._num_workers > 0:
+            if len(self.evaluator_indices) > 0:
+                raise ProcessFlowException(
+                    "Evaluators cannot be used with multiple workers, since "
+                    "each worker would only evaluate a part of the packs.")
+            if "fork" not in multiprocessing.get_all_start_methods():
+                raise ProcessFlowException(
+                    "Multiple workers require the 'fork' start method, which "
+                    "is not available on this platform.")
+
         self.initialized = True
 
     def initialize_processors(self):
@@ -179,6 +180,66 @@ class Pipeline(Generic[PackType]):
                               "processor %s", processor.name)
                 raise e
 
+    def enable_profiling(self, log_interval: Optional[float] = None,
+                         dump_path: Optional[str] = None,
+                         history_size: int = 1000):
+        r"""Collect the statistics of the pipeline while it runs, which can
+        be read with :meth:`stats`. The statistics include the wall time,
+        number of calls and packs per second of the reader and each
+        component, the depth of the queue of each component, and the batch
+        fill ratio and latency of the batch processors. When the profiling is
+        not enabled, the pipeline does not measure anything.
+
+        With multiple workers (``num_workers > 0``), the statistics of the
+        components are collected in each worker, and added to the statistics
+        of the pipeline when the worker finishes the data.
+
+        Args:
+            log_interval (float, optional): If set, log the statistics every
+                ``log_interval`` seconds while processing.
+            dump_path (str, optional): If set, also write the statistics as
+                JSON to this path when they are logged and when the data is
+                exhausted.
+            history_size (int): The number of the latest queue depth samples
+                kept for each queue.
+        """
+        self._profiling_configs = {
+            "log_interval": log_interval,
+            "dump_path": dump_path,
+            "history_size": history_size,
+        }
+        if self.initialized:
+            self._reset_stats()
+
+    def disable_profiling(self):
+        r"""Stop collecting the statistics, see :meth:`enable_profiling`."""
+        self._profiling_configs = None
+        self._stats = None
+        for component in self.components:
+            component.assign_stats(None)
+
+    def stats(self) -> Dict[str, Any]:
+        r"""Get the statistics collected since the profiling is enabled (or
+        since :meth:`initialize`), see :meth:`enable_profiling`.
+
+        Returns:
+            A dict with the ``reader`` statistics, and a list of the
+            statistics of the ``components`` in the pipeline order.
+        """
+        if self._stats is None:
+            raise ProcessFlowException(
+                "Profiling is not enabled, call enable_profiling first.")
+        return self._stats.to_dict()
+
+    def _reset_stats(self):
+        assert self._profiling_configs is not None
+        self._stats = PipelineStats(
+            self._reader.name, [c.name for c in self.components],
+            **self._profiling_configs)
+        for component, component_stats in zip(
+                self.components, self._stats.components):
+            component.assign_stats(component_stats)
+
     def set_reader(self, reader: BaseReader,
                    config: Optional[Union[Config, Dict[str, Any]]] = None):
         self._reader = reader
@@ -293,6 +354,8 @@ class Pipeline(Generic[PackType]):
                 "Please call initialize before running the pipeline")
 
         data_iter = self._reader.iter(*args, **kwargs)
+        if self._num_workers > 0 and len(self.components) > 0:
+            return self._process_packs_in_workers(data_iter)
         return self._process_packs(data_iter)
 
     def finish(self):
@@ -318,298 +381,185 @@ class Pipeline(Generic[PackType]):
         Returns:
             Yields packs that are processed by the pipeline.
         """
-
-        # pylint: disable=line-too-long
-
         # Here is the logic for the execution of the pipeline.
-
-        # The basic idea is to yield a pack as soon as it gets processed by all
-        # the processors instead of waiting for later jobs to get processed.
-
-        # 1) A job can be in three status
-        #  - UNPROCESSED
-        #  - QUEUED
-        #  - PROCESSED
-        #
-        # 2) Each processor maintains a queue to hold the jobs to be executed
-        # next.
-        #
-        # 3) In case of a BatchProcessor, a job enters into QUEUED status if the
-        # job does not satisfy the `batch_size` requirement of that processor.
-        # In that case, the pipeline requests for additional jobs from the
-        # reader and starts the execution loop from the beginning.
-        #
-        # 4) At any point, while moving to the next processor, the pipeline
-        # ensures that all jobs are either in QUEUED or PROCESSED status. If
-        # they are PROCESSED, they will be moved to the next queue. This design
-        # ensures that at any point, while processing the job at processor `i`,
-        # all the jobs in the previous queues are in QUEUED status. So whenever
-        # a new job is needed, the pipeline can directly request it from the
-        # reader instead of looking at previous queues for UNPROCESSED jobs.
-        #
-        # 5) When a processor receives a poison pack, it flushes all the
-        # remaining batches in its memory (this actually has no effect in
-        # PackProcessors) and moves the jobs including the poison pack to the
-        # next queue. If there is no next processor, the packs are yield.
-        #
-        # 6) The loop terminates when the last queue contains only a poison pack
-        #
-        # Here is the sample pipeline and its execution
-        #
-        # Assume 1 pack corresponds to a batch of size 1
-        #
-        # After 1st step (iteration), reading from the reader,
-        #
-        #            batch_size = 2                               batch_size = 2
-        #  Reader -> B1 (BatchProcessor) -> P1 (PackProcessor) -> B2(BatchProcessor)
         #
-        #          |___________|
-        #          |___________|
-        #          |___________|
-        #          |___________|
-        #          |_J1:QUEUED_|
+        # Each pack read from the reader becomes a job, which goes through
+        # the components (stages) one by one. Each stage has a queue of the
+        # jobs ready to be processed (see ``ProcessManager``).
         #
-        # B1 needs another pack to process job J1
+        # 1) At each step, the pipeline processes the next ready job of the
+        # last stage having one, so that the packs leave the pipeline as soon
+        # as possible. A job processed by a pack processor, a caster or an
+        # evaluator moves to the next stage right away.
         #
-        # After 2nd step (iteration),
+        # 2) A batch processor may keep the packs of a job in its batcher
+        # until a batch is filled. The job then waits (status QUEUED) in the
+        # stage, and moves to the next stage when the batch processor
+        # releases its packs.
         #
-        #           batch_size = 2                               batch_size = 2
-        # Reader -> B1 (BatchProcessor) -> P1 (PackProcessor) -> B2(BatchProcessor)
+        # 3) When no job is ready, the pipeline reads the next pack from the
+        # reader. Once the reader is exhausted, the components are flushed in
+        # order, each one after all the jobs before it are done, which
+        # releases the waiting jobs.
         #
-        #          |___________|       |_______________|
-        #          |___________|       |_______________|
-        #          |___________|       |_______________|
-        #          |___________|       |_J2:UNPROCESSED_|
-        #          |___________|       |_J1:UNPROCESSED_|
-        #
-        # B1 processes both the packs, the jobs are moved to the next queue.
-        #
-        # After 3rd step (iteration),
-        #
-        #           batch_size = 2                               batch_size = 2
-        # Reader -> B1 (BatchProcessor) -> P1 (PackProcessor) -> B2(BatchProcessor)
-        #
-        #          |___________|       |_______________|     |_______________|
-        #          |___________|       |_______________|     |_______________|
-        #          |___________|       |_______________|     |_______________|
-        #          |___________|       |_______________|     |_______________|
-        #          |___________|       |_J2:UNPROCESSED_|     |_J1:UNPROCESSED_|
-        #
-        # P1 processes the first job. However, there exists one UNPROCESSED job
-        # J2 in the queue. Pipeline first processes this job before moving to the
-        # next processor
-        #
-        # After 4th step (iteration),
-        #
-        #           batch_size = 2                               batch_size = 2
-        # Reader -> B1 (BatchProcessor) -> P1 (PackProcessor) -> B2(BatchProcessor)
-        #
-        #        |___________|       |_______________|     |_______________|
-        #        |___________|       |_______________|     |_______________|
-        #        |___________|       |_______________|     |_______________|
-        #        |___________|       |_______________|     |_J2:UNPROCESSED_|
-        #        |___________|       |_______________|     |_J1:UNPROCESSED_|
-        #
-        #
-        # After 5th step (iteration),
-        #
-        #           batch_size = 2                               batch_size = 2
-        # Reader -> B1 (BatchProcessor) -> P1 (PackProcessor) -> B2(BatchProcessor)
-        #
-        #        |___________|       |_______________|     |_______________|
-        #        |___________|       |_______________|     |_______________|
-        #        |___________|       |_______________|     |_______________|    --> Yield J1.pack and J2.pack
-        #        |___________|       |_______________|     |_______________|
-        #        |___________|       |_______________|     |_______________|
-
+        # 4) The jobs done with all the stages are yielded in the order they
+        # were read.
         if not self.initialized:
             raise ProcessFlowException(
                 "Please call initialize before running the pipeline")
 
-        buffer = ProcessBuffer(self, data_iter)
-
         if len(self.components) == 0:
             yield from data_iter
             # Write return here instead of using if..else to reduce indent.
             return
 
-        while not self._proc_mgr.exhausted():
-            # job has to be the first UNPROCESSED element
-            # the status of the job now is UNPROCESSED
-            unprocessed_job: ProcessJob = next(buffer)
-
-            processor_index = self._proc_mgr.current_processor_index
-            processor = self.components[processor_index]
-            selector = self._selectors[processor_index]
-            current_queue_index = self._proc_mgr.current_queue_index
-            current_queue = self._proc_mgr.current_queue
-            pipeline_length = self._proc_mgr.pipeline_length
-            unprocessed_queue_indices = \
-                self._proc_mgr.unprocessed_queue_indices
-            processed_queue_indices = \
-                self._proc_mgr.processed_queue_indices
-            next_queue_index = current_queue_index + 1
-            should_yield = next_queue_index >= pipeline_length
-
-            if not unprocessed_job.is_poison:
-                for pack in selector.select(unprocessed_job.pack):
-                    # First, perform the component action on the pack
-                    try:
-                        if isinstance(processor, Caster):
-                            # Replacing the job pack with the casted version.
-                            unprocessed_job.alter_pack(processor.cast(pack))
-                        elif isinstance(processor, BaseProcessor):
-                            processor.process(pack)
-                        elif isinstance(processor, Evaluator):
-                            processor.consume_next(
-                                pack, self._predict_to_gold[unprocessed_job.id]
-                            )
-
-                        # After the component action, make sure the entry is
-                        # added into the index.
-                        pack.add_all_remaining_entries()
-                    except ValueError as e:
-                        raise ProcessExecutionException(
-                            f'Exception occurred when running '
-                            f'{processor.name}') from e
-
-                    # Then, based on component type, handle the queue.
-                    if isinstance(processor, BaseBatchProcessor):
-                        index = unprocessed_queue_indices[current_queue_index]
-
-                        # check status of all the jobs up to "index"
-                        for i, job_i in enumerate(
-                                itertools.islice(current_queue, 0,
-                                                 index + 1)):
-
-                            if job_i.status == ProcessJobStatus.PROCESSED:
-                                processed_queue_indices[
-                                    current_queue_index] = i
-
-                        # there are UNPROCESSED jobs in the queue
-                        if index < len(current_queue) - 1:
-                            unprocessed_queue_indices[current_queue_index] \
-                                += 1
-
-                        # Fetch more data from the reader to process the
-                        # first job
-                        elif (processed_queue_indices[current_queue_index]
-                              == -1):
-
-                            unprocessed_queue_indices[current_queue_index] \
-                                = len(current_queue)
-
-                            self._proc_mgr.current_processor_index = 0
-
-                            self._proc_mgr.current_queue_index = -1
-
-                        else:
-                            processed_queue_index = \
-                                processed_queue_indices[current_queue_index]
-
-                            # move or yield the pack
-                            c_queue = list(current_queue)
-                            for job_i in \
-                                    c_queue[:processed_queue_index + 1]:
-
-                                if should_yield:
-                                    if job_i.id in self._predict_to_gold:
-                                        self._predict_to_gold.pop(job_i.id)
-                                    yield job_i.pack
-                                else:
-                                    self._proc_mgr.add_to_queue(
-                                        queue_index=next_queue_index,
-                                        job=job_i)
-                                current_queue.popleft()
-
-                            # set the UNPROCESSED and PROCESSED indices
-                            unprocessed_queue_indices[current_queue_index] \
-                                = len(current_queue)
-
-                            processed_queue_indices[current_queue_index] \
-                                = -1
-
-                            if should_yield:
-                                self._proc_mgr.current_processor_index = 0
-                                self._proc_mgr.current_queue_index = -1
-                            else:
-                                self._proc_mgr.current_processor_index \
-                                    = next_queue_index
-                                self._proc_mgr.current_queue_index \
-                                    = next_queue_index
-
-                    # Besides Batch Processors, the other component type only
-                    # deal with one pack at a time, these include: PackProcessor
-                    # Evaluator, Caster.
-                    # - Move them to the next queue
+        manager = self._proc_mgr
+        manager.reset()
+        stats: Optional[PipelineStats] = self._stats
+        data_exhausted = False
+        num_flushed = 0
+
+        while True:
+            job: Optional[ProcessJob] = manager.next_job()
+            if job is not None:
+                self._process_job(job)
+            elif not data_exhausted:
+                try:
+                    if stats is None:
+                        job_pack = next(data_iter)
                     else:
-                        index = unprocessed_queue_indices[current_queue_index]
-
-                        # there are UNPROCESSED jobs in the queue
-                        if index < len(current_queue) - 1:
-                            unprocessed_queue_indices[current_queue_index] \
-                                += 1
-                        else:
-                            # current_queue is modified in this array
-                            for job_i in list(current_queue):
-                                if should_yield:
-                                    if job_i.id in self._predict_to_gold:
-                                        self._predict_to_gold.pop(job_i.id)
-                                    yield job_i.pack
-                                else:
-                                    self._proc_mgr.add_to_queue(
-                                        queue_index=next_queue_index,
-                                        job=job_i)
-                                current_queue.popleft()
-
-                            # set the UNPROCESSED index
-                            # we do not use "processed_queue_indices" as the
-                            # jobs get PROCESSED whenever they are passed
-                            # into a PackProcessor
-                            unprocessed_queue_indices[current_queue_index] \
-                                = len(current_queue)
-
-                            # update the current queue and processor only
-                            # when all the jobs are processed in the current
-                            # queue
-                            if should_yield:
-                                self._proc_mgr.current_processor_index = 0
-                                self._proc_mgr.current_queue_index = -1
-
-                            else:
-                                self._proc_mgr.current_processor_index \
-                                    = next_queue_index
-                                self._proc_mgr.current_queue_index \
-                                    = next_queue_index
+                        start_time = time.perf_counter()
+                        job_pack = next(data_iter)
+                        stats.reader.record_call(
+                            time.perf_counter() - start_time)
+                except StopIteration:
+                    data_exhausted = True
+                    continue
+
+                job = ProcessJob(job_pack, False)
+                if len(self.evaluator_indices) > 0:
+                    # The pack will be changed by the processors, so the
+                    # evaluators need a full copy instead of a view.
+                    self.add_gold_packs({job.id: copy.deepcopy(job_pack)})
+                manager.add_job(job)
+            elif num_flushed < len(self.components):
+                self._flush_component(num_flushed)
+                num_flushed += 1
             else:
-                processor.flush()
-
-                # current queue is modified in the loop
-                for job in list(current_queue):
-                    if job.status != ProcessJobStatus.PROCESSED and \
-                            not job.is_poison:
-                        raise ValueError("Job is neither PROCESSED nor is "
-                                         "a poison. Something went wrong "
-                                         "during execution.")
-
-                    if not job.is_poison and should_yield:
-                        if job.id in self._predict_to_gold:
-                            self._predict_to_gold.pop(job.id)
-                        yield job.pack
-
-                    elif not should_yield:
-                        self._proc_mgr.add_to_queue(
-                            queue_index=next_queue_index, job=job)
-
-                    if not job.is_poison:
-                        current_queue.popleft()
-
-                if not should_yield:
-                    # set next processor and queue as current
-                    self._proc_mgr.current_processor_index = next_queue_index
-                    self._proc_mgr.current_queue_index = next_queue_index
-
-        self._proc_mgr.reset()
+                break
+
+            for finished_job in manager.finished_jobs():
+                self._predict_to_gold.pop(finished_job.id, None)
+                yield finished_job.pack
+
+        manager.reset()
+
+        if stats is not None:
+            stats.finish()
+
+    def _process_job(self, job: ProcessJob):
+        r"""Run the component of the stage of ``job`` on its packs."""
+        stage = job.stage
+        processor = self.components[stage]
+        stats: Optional[PipelineStats] = self._stats
+
+        if stats is not None:
+            stats.record_queue_depth(stage, self._proc_mgr.stage_size(stage))
+            stats.maybe_report()
+
+        self._proc_mgr.start(job)
+        for pack in self._selectors[stage].select(job.pack):
+            if stats is not None:
+                start_time = time.perf_counter()
+
+            # First, perform the component action on the pack
+            try:
+                if isinstance(processor, Caster):
+                    # Replacing the job pack with the casted version.
+                    job.alter_pack(processor.cast(pack))
+                elif isinstance(processor, BaseProcessor):
+                    processor.process(pack)
+                elif isinstance(processor, Evaluator):
+                    processor.consume_next(
+                        pack, self._predict_to_gold[job.id])
+
+                # After the component action, make sure the entry is added
+                # into the index.
+                pack.add_all_remaining_entries()
+            except ValueError as e:
+                raise ProcessExecutionException(
+                    f'Exception occurred when running '
+                    f'{processor.name}') from e
+
+            if stats is not None:
+                stats.components[stage].record_call(
+                    time.perf_counter() - start_time)
+        self._proc_mgr.finish(job)
+
+    def _flush_component(self, stage: int):
+        r"""Flush the component of ``stage`` after all the jobs before it are
+        done, which releases the jobs waiting in it."""
+        processor = self.components[stage]
+        if self._stats is None:
+            processor.flush()
+        else:
+            start_time = time.perf_counter()
+            processor.flush()
+            self._stats.components[stage].record_call(
+                time.perf_counter() - start_time, num_packs=0)
+
+    def _process_packs_in_workers(
+            self, data_iter: Iterator[PackType]) -> Iterator[PackType]:
+        r"""Process the packs received from the reader in the worker
+        processes, see :mod:`~forte.pipeline_workers`.
+
+        Args:
+             data_iter (iterator): Iterator yielding the packs to process.
+
+        Returns:
+            Yields packs that are processed by the pipeline.
+        """
+        context = multiprocessing.get_context("fork")
+        # Bound the packs waiting for the workers, so that the reader does
+        # not run too far ahead of them.
+        input_queue = context.Queue(maxsize=2 * self._num_workers)
+        output_queue = context.Queue()
+
+        # The workers are forked before the feeder thread is started, so they
+        # do not inherit the thread.
+        workers = [
+            context.Process(target=run_worker,
+                            args=(self, input_queue, output_queue),
+                            daemon=True)
+            for _ in range(self._num_workers)
+        ]
+        for worker in workers:
+            worker.start()
+
+        stop = threading.Event()
+        reader_errors: List[BaseException] = []
+        feeder = threading.Thread(
+            target=feed_workers,
+            args=(data_iter, input_queue, self._num_workers, stop,
+                  reader_errors, self._stats),
+            daemon=True)
+        feeder.start()
+
+        try:
+            yield from collect_results(
+                output_queue, workers, self._preserve_order, self._stats)
+            feeder.join()
+            if reader_errors:
+                raise reader_errors[0]
+
+            if self._stats is not None:
+                self._stats.finish()
+        finally:
+            stop.set()
+            for worker in workers:
+                if worker.is_alive():
+                    worker.terminate()
+                worker.join()
 
     def evaluate(self) -> Iterator[Tuple[str, Any]]:
         for i in self.evaluator_indices:
@@ -24,6 +24,7 @@ from forte.common.configuration import Config
 from forte.common.resources import Resources
 from forte.data.base_pack import PackType, BasePack
 from forte.data.ontology.core import Entry
+from forte.pipeline_stats import ComponentStats
 from forte.process_manager import ProcessManager
 from forte.utils import get_full_module_name
 
@@ -33,10 +34,17 @@ class PipelineComponent(Generic[PackType]):
         self._process_manager: ProcessManager = None
         self.resources: Optional[Resources] = None
         self.configs: Config = Config({}, {})
+        self._stats: Optional[ComponentStats] = None
 
     def assign_manager(self, process_manager: ProcessManager):
         self._process_manager = process_manager
 
+    def assign_stats(self, stats: Optional[ComponentStats]):
+        r"""Assign the statistics to be recorded by this component, this is
+        called by the pipeline when the profiling is enabled or disabled.
+        """
+        self._stats = stats
+
     def initialize(self, resources: Resources, configs: Config):
         r"""The pipeline will call the initialize method at the start of a
         processing. The processor and reader will be initialized with
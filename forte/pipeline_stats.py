@@ -0,0 +1,238 @@
+# Copyright 2020 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+The statistics collected by :class:`~forte.pipeline.Pipeline` when the
+profiling is enabled with :meth:`~forte.pipeline.Pipeline.enable_profiling`.
+"""
+import json
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "ComponentStats",
+    "QueueStats",
+    "PipelineStats",
+]
+
+
+class ComponentStats:
+    r"""The time spent in one pipeline component (or the reader). For the
+    batch processors, the batches are also recorded.
+
+    Args:
+        name (str): The name of the component.
+    """
+
+    def __init__(self, name: str):
+        self.name: str = name
+        self.calls: int = 0
+        self.packs: int = 0
+        self.total_time: float = 0.
+
+        self.batches: int = 0
+        self.batch_instances: int = 0
+        self.batch_capacity: int = 0
+        self.batch_time: float = 0.
+        self.max_batch_time: float = 0.
+
+    def record_call(self, elapsed: float, num_packs: int = 1):
+        r"""Record one call of the component.
+
+        Args:
+            elapsed (float): The wall time of the call, in seconds.
+            num_packs (int): The number of packs handled by the call, ``0``
+                for calls such as ``flush``.
+        """
+        self.calls += 1
+        self.packs += num_packs
+        self.total_time += elapsed
+
+    def record_batch(self, num_instances: int, batch_size: Optional[int],
+                     elapsed: float):
+        r"""Record one batch of a batch processor.
+
+        Args:
+            num_instances (int): The number of instances in the batch.
+            batch_size (int, optional): The capacity of the batch, if the
+                batcher has a fixed batch size.
+            elapsed (float): The time to predict and pack the batch, in
+                seconds.
+        """
+        self.batches += 1
+        self.batch_instances += num_instances
+        self.batch_capacity += batch_size or num_instances
+        self.batch_time += elapsed
+        self.max_batch_time = max(self.max_batch_time, elapsed)
+
+    def merge(self, other: "ComponentStats"):
+        r"""Add the statistics of the same component in another process."""
+        self.calls += other.calls
+        self.packs += other.packs
+        self.total_time += other.total_time
+        self.batches += other.batches
+        self.batch_instances += other.batch_instances
+        self.batch_capacity += other.batch_capacity
+        self.batch_time += other.batch_time
+        self.max_batch_time = max(self.max_batch_time, other.max_batch_time)
+
+    def to_dict(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {
+            "calls": self.calls,
+            "packs": self.packs,
+            "total_time": self.total_time,
+            "packs_per_second": (self.packs / self.total_time
+                                 if self.total_time > 0 else 0.),
+        }
+        if self.batches > 0:
+            stats["batches"] = self.batches
+            stats["batch_fill_ratio"] = (
+                self.batch_instances / self.batch_capacity
+                if self.batch_capacity > 0 else 0.)
+            stats["mean_batch_latency"] = self.batch_time / self.batches
+            stats["max_batch_latency"] = self.max_batch_time
+        return stats
+
+
+class QueueStats:
+    r"""The depth of the job queue of one component, sampled every time the
+    pipeline takes a job from the queue.
+
+    Args:
+        history_size (int): The number of the latest samples kept as
+            ``(time, depth)`` in :attr:`history`.
+    """
+
+    def __init__(self, history_size: int):
+        self.samples: int = 0
+        self.total_depth: int = 0
+        self.max_depth: int = 0
+        self.history: Deque[Tuple[float, int]] = deque(maxlen=history_size)
+
+    def record(self, timestamp: float, depth: int):
+        self.samples += 1
+        self.total_depth += depth
+        self.max_depth = max(self.max_depth, depth)
+        self.history.append((timestamp, depth))
+
+    def merge(self, other: "QueueStats"):
+        r"""Add the samples of the same queue in another process."""
+        self.samples += other.samples
+        self.total_depth += other.total_depth
+        self.max_depth = max(self.max_depth, other.max_depth)
+        self.history.extend(other.history)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "mean_depth": (self.total_depth / self.samples
+                           if self.samples > 0 else 0.),
+            "max_depth": self.max_depth,
+            "history": list(self.history),
+        }
+
+
+class PipelineStats:
+    r"""The statistics of a pipeline: a :class:`ComponentStats` for the
+    reader and each component, and a :class:`QueueStats` for the queue of
+    each component.
+
+    Args:
+        reader_name (str): The name of the reader.
+        component_names (list): The names of the components, in the order of
+            the pipeline.
+        log_interval (float, optional): If set, the statistics are logged
+            every ``log_interval`` seconds while the pipeline runs.
+        dump_path (str, optional): If set, the statistics are also written to
+            this path as JSON when they are logged, and when the pipeline
+            finishes the data.
+        history_size (int): The number of queue depth samples kept for each
+            queue.
+    """
+
+    def __init__(self, reader_name: str, component_names: List[str],
+                 log_interval: Optional[float] = None,
+                 dump_path: Optional[str] = None,
+                 history_size: int = 1000):
+        self.reader: ComponentStats = ComponentStats(reader_name)
+        self.components: List[ComponentStats] = [
+            ComponentStats(name) for name in component_names]
+        self.queues: List[QueueStats] = [
+            QueueStats(history_size) for _ in component_names]
+
+        self.log_interval: Optional[float] = log_interval
+        self.dump_path: Optional[str] = dump_path
+
+        self._start_time: float = time.time()
+        self._last_report: float = time.perf_counter()
+
+    def record_queue_depth(self, queue_index: int, depth: int):
+        self.queues[queue_index].record(time.time(), depth)
+
+    def merge(self, other: "PipelineStats"):
+        r"""Add the statistics of the components of the same pipeline in
+        another process, such as the pipeline workers. The reader is not
+        added, since the workers receive the packs from the main process."""
+        for component, other_component in zip(
+                self.components, other.components):
+            component.merge(other_component)
+        for queue, other_queue in zip(self.queues, other.queues):
+            queue.merge(other_queue)
+
+    def maybe_report(self):
+        r"""Log (and dump) the statistics if ``log_interval`` seconds have
+        passed since the last report."""
+        if self.log_interval is None:
+            return
+        now = time.perf_counter()
+        if now - self._last_report >= self.log_interval:
+            self._last_report = now
+            self.report()
+
+    def report(self):
+        r"""Log the statistics, and write them to ``dump_path`` if set."""
+        stats = self.to_dict()
+        for component in [stats["reader"]] + stats["components"]:
+            logger.info(
+                "%s: %d packs in %.3fs (%.1f packs/s)", component["name"],
+                component["packs"], component["total_time"],
+                component["packs_per_second"])
+        if self.dump_path is not None:
+            with open(self.dump_path, "w", encoding="utf-8") as f:
+                json.dump(stats, f, indent=2)
+
+    def finish(self):
+        r"""Called when the pipeline finishes the data, report the final
+        statistics if they are logged or dumped."""
+        if self.log_interval is not None or self.dump_path is not None:
+            self.report()
+
+    def to_dict(self) -> Dict[str, Any]:
+        components = []
+        for component, queue in zip(self.components, self.queues):
+            component_stats = component.to_dict()
+            component_stats["name"] = component.name
+            component_stats["queue"] = queue.to_dict()
+            components.append(component_stats)
+
+        reader_stats = self.reader.to_dict()
+        reader_stats["name"] = self.reader.name
+        return {
+            "start_time": self._start_time,
+            "elapsed": time.time() - self._start_time,
+            "reader": reader_stats,
+            "components": components,
+        }
@@ -0,0 +1,233 @@
+# Copyright 2020 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+The worker processes used by :class:`~forte.pipeline.Pipeline` when it is
+created with ``num_workers > 0``.
+
+The reader runs in the main process, which sends the packs to the workers
+through a bounded queue. Each worker runs the component chain of the pipeline
+on the packs it receives and sends the processed packs back. The packs cross
+the process boundaries in the binary format of :mod:`~forte.data.binary_io`.
+"""
+import queue
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Any, Deque, Iterator, List, Optional, Tuple
+
+from forte.common.exception import ProcessExecutionException
+from forte.data.base_pack import PackType
+from forte.data.data_utils import deserialize
+from forte.data.multi_pack import MultiPack
+from forte.pipeline_stats import PipelineStats
+
+__all__ = [
+    "TransferredPack",
+    "serialize_for_transfer",
+    "deserialize_transfer",
+    "run_worker",
+    "feed_workers",
+    "collect_results",
+]
+
+# A pack serialized in the binary format, and the packs of a multi pack.
+TransferredPack = Tuple[bytes, List[bytes]]
+
+# The kinds of the messages sent back by the workers.
+RESULT = "result"
+DONE = "done"
+ERROR = "error"
+
+# How long to wait on a queue before checking the other processes, in seconds.
+_POLL_INTERVAL = 0.5
+
+
+def serialize_for_transfer(pack: PackType) -> TransferredPack:
+    r"""Serialize a pack to be sent to another process. The packs of a
+    :class:`~forte.data.multi_pack.MultiPack` are serialized with it.
+
+    Args:
+        pack: The pack to be sent.
+
+    Returns:
+        The serialized pack, and the serialized packs of the multi pack.
+    """
+    sub_packs: List[bytes] = []
+    if isinstance(pack, MultiPack):
+        sub_packs = [p.serialize(serialize_method="binary")
+                     for p in pack.packs]
+    return pack.serialize(serialize_method="binary"), sub_packs
+
+
+def deserialize_transfer(data: TransferredPack) -> PackType:
+    r"""Recover a pack serialized by :func:`serialize_for_transfer`.
+
+    Args:
+        data: The serialized pack.
+
+    Returns:
+        The recovered pack.
+    """
+    pack_data, sub_packs = data
+    pack = deserialize(pack_data)
+    if isinstance(pack, MultiPack):
+        for p in sub_packs:
+            # pylint: disable=protected-access
+            pack._packs.append(deserialize(p))
+    return pack
+
+
+def run_worker(pipeline, input_queue, output_queue):
+    r"""The main loop of a worker process. The packs are read from
+    ``input_queue`` as ``(index, data)`` tuples until a ``None`` is received,
+    processed by the components of ``pipeline``, and sent to ``output_queue``
+    as ``(RESULT, index, data)``. A ``(DONE, -1, stats)`` message is sent when
+    all the packs are processed, where ``stats`` is the
+    :class:`~forte.pipeline_stats.PipelineStats` of the worker if the
+    profiling is enabled, or a ``(ERROR, -1, message)`` message if the
+    processing fails.
+
+    Args:
+        pipeline: The initialized pipeline, inherited from the main process.
+        input_queue: The queue of the packs to be processed.
+        output_queue: The queue of the processed packs.
+    """
+    # The pipeline returns the packs in the order they are read, so the index
+    # of each returned pack is the oldest one not returned yet.
+    indices: Deque[int] = deque()
+
+    def _receive_packs() -> Iterator[PackType]:
+        while True:
+            item: Optional[Tuple[int, TransferredPack]] = input_queue.get()
+            if item is None:
+                return
+            index, data = item
+            indices.append(index)
+            yield deserialize_transfer(data)
+
+    # pylint: disable=protected-access
+    if pipeline._stats is not None:
+        # Start from empty statistics, and leave the reporting to the main
+        # process.
+        pipeline._reset_stats()
+        pipeline._stats.log_interval = None
+        pipeline._stats.dump_path = None
+
+    try:
+        for pack in pipeline._process_packs(_receive_packs()):
+            output_queue.put(
+                (RESULT, indices.popleft(), serialize_for_transfer(pack)))
+        # The components of this process will not be used anymore.
+        for component in pipeline.components:
+            component.finish(pipeline.resource)
+        output_queue.put((DONE, -1, pipeline._stats))
+    except Exception:  # pylint: disable=broad-except
+        output_queue.put((ERROR, -1, traceback.format_exc()))
+
+
+def feed_workers(data_iter: Iterator[PackType], input_queue,
+                 num_workers: int, stop: threading.Event,
+                 errors: List[BaseException],
+                 stats: Optional[PipelineStats] = None):
+    r"""Send the packs from the reader to the workers, then one ``None`` to
+    each worker to mark the end of the data. This runs in a thread of the main
+    process, so that the reader is not blocked by the consumer of the
+    pipeline.
+
+    Args:
+        data_iter: The packs from the reader.
+        input_queue: The queue shared by the workers.
+        num_workers: The number of workers.
+        stop: Set by the main process to stop feeding early.
+        errors: The exception raised by the reader, if any, is appended here.
+        stats: If given, the time spent in the reader is recorded here.
+    """
+
+    def _put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                input_queue.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    index = 0
+    try:
+        while True:
+            start_time = time.perf_counter()
+            pack = next(data_iter, None)
+            if pack is None:
+                break
+            if stats is not None:
+                stats.reader.record_call(time.perf_counter() - start_time)
+            if not _put((index, serialize_for_transfer(pack))):
+                return
+            index += 1
+    except Exception as e:  # pylint: disable=broad-except
+        errors.append(e)
+
+    for _ in range(num_workers):
+        if not _put(None):
+            return
+
+
+def collect_results(output_queue, workers, preserve_order: bool,
+                    stats: Optional[PipelineStats] = None) \
+        -> Iterator[PackType]:
+    r"""Receive the processed packs from the workers until all of them are
+    done.
+
+    Args:
+        output_queue: The queue the workers send the packs to.
+        workers: The worker processes.
+        preserve_order: Whether to return the packs in the order they are
+            read. Otherwise the packs are returned as soon as they are
+            received.
+        stats: If given, the statistics of the workers are added here when
+            they are done.
+
+    Returns:
+        An iterator of the processed packs.
+    """
+    pending = {}
+    next_index = 0
+    running = len(workers)
+
+    while running > 0:
+        try:
+            kind, index, data = output_queue.get(timeout=_POLL_INTERVAL)
+        except queue.Empty:
+            for worker in workers:
+                if worker.exitcode not in (None, 0):
+                    raise ProcessExecutionException(
+                        f"Pipeline worker {worker.pid} exited unexpectedly "
+                        f"with code {worker.exitcode}.") from None
+            continue
+
+        if kind == DONE:
+            running -= 1
+            if stats is not None and data is not None:
+                stats.merge(data)
+        elif kind == ERROR:
+            raise ProcessExecutionException(
+                f"Exception occurred in a pipeline worker:\n{data}")
+        elif not preserve_order:
+            yield deserialize_transfer(data)
+        else:
+            pending[index] = data
+            while next_index in pending:
+                yield deserialize_transfer(pending.pop(next_index))
+                next_index += 1
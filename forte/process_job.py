@@ -20,10 +20,23 @@ class ProcessJob:
         self.__is_poison: bool = is_poison
         self.__status = ProcessJobStatus.UNPROCESSED
         self.__id = next(ProcessJob.counter)
+        # The index of the pipeline component the job is at, the status is
+        # the status of the job in this component.
+        self.__stage: int = 0
+        # The position of the job in the output order of the pipeline.
+        self.sequence: int = 0
 
     def set_status(self, status):
         self.__status = status
 
+    @property
+    def stage(self) -> int:
+        return self.__stage
+
+    def set_stage(self, stage: int):
+        self.__stage = stage
+        self.__status = ProcessJobStatus.UNPROCESSED
+
     @property
     def id(self):
         return self.__id
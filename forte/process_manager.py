@@ -13,59 +13,34 @@
 # limitations under the License.
 
 from collections import deque
-from typing import List
+from typing import Deque, Dict, Iterator, List, Optional
 
 from forte.process_job import ProcessJob, ProcessJobStatus
 
 
 class ProcessManager:
-    r"""A pipeline level manager that manages global processing information,
-    such as the current running components. This is an internal class and
-    should only be initialized by the system.
-
-    Attributes:
+    r"""A pipeline level manager that schedules the jobs through the pipeline
+    components. This is an internal class and should only be initialized by
+    the system.
+
+    Each job carries the index of the component it is at (its stage) and its
+    status in this component:
+
+    - ``UNPROCESSED``: The job is ready to be processed by the component.
+    - ``QUEUED``: The packs of the job wait in the batcher of a batch
+      processor for a batch to be filled.
+    - ``PROCESSED``: The job is done with the component.
+
+    Each stage keeps a queue of ready jobs. A job done with a component is
+    moved to the ready queue of the next stage when it is finished by the
+    pipeline (:meth:`finish`), or when its packs leave the batcher
+    (:meth:`release_job`), so every transition takes constant time. The jobs
+    done with all the components are returned in the order they entered the
+    pipeline through a reorder buffer (:meth:`finished_jobs`).
+
+    Args:
         pipeline_length (int): The length of the current pipeline being
             executed
-
-        _queues (List[Deque[int]]): A list of queues which hold the jobs for
-            each processors. The size of this list is equal to pipeline
-            length
-
-        _current_queue_index (int): An index indicating which queue to
-            read the data from. A value of -1 indicates read from the reader.
-
-        _current_processor_index (int): An index indicating the
-            processor that executes the job
-
-        _unprocessed_queue_indices (List[int]): Each element of this list is
-            the index of the first UNPROCESSED element in the corresponding
-            queue. Length of this list equals the "pipeline_length".
-
-            If unprocessed_queue_indices = [0, 2]
-
-                - This means for the 1st queue, the first UNPROCESSED job is at
-                  index-0. All elements from indices [0, len(queue[0]) ) are
-                  UNPROCESSED.
-
-                - Similarly, for the 2nd queue, the first UNPROCESSED job is at
-                  index-2. All elements from indices [2, len(queue[1])) are
-                  UNPROCESSED
-
-        _processed_queue_indices (List [int]):  Each element of this list is
-            the index of the last PROCESSED element in the corresponding queue.
-            Length of this list equals the "pipeline_length".
-
-            If processed_queue_indices = [0, 2]
-
-                - This means for the 1st queue, the last PROCESSED job is at
-                  index-0. Only the first element in queue[0] is PROCESSED
-
-                - Similarly, for the 2nd queue, the last PROCESSED job is at
-                  index-2. All elements from indices [0, 2] are PROCESSED
-
-        Args:
-            pipeline_length (int): The length of the current pipeline being
-                executed
     """
 
     def __init__(self, pipeline_length):
@@ -73,62 +48,96 @@ class ProcessManager:
         self.reset()
 
     def reset(self):
-        self._queues = [deque() for _ in range(self._pipeline_length)]
-        self._current_queue_index: int = -1
-        self._current_processor_index: int = 0
-        self._unprocessed_queue_indices: List[int] = [0] * self._pipeline_length
-        self._processed_queue_indices: List[int] = [-1] * self._pipeline_length
+        # The ready jobs of each stage, the last queue holds the jobs done
+        # with all the stages.
+        self._queues: List[Deque[ProcessJob]] = [
+            deque() for _ in range(self._pipeline_length + 1)]
+        # The number of jobs (ready or waiting) at each stage.
+        self._stage_sizes: List[int] = [0] * self._pipeline_length
+        self._current_job: Optional[ProcessJob] = None
+
+        self._next_sequence: int = 0
+        self._next_output: int = 0
+        self._reorder_buffer: Dict[int, ProcessJob] = {}
 
     @property
-    def current_processor_index(self):
-        return self._current_processor_index
-
-    @current_processor_index.setter
-    def current_processor_index(self, processor_index: int):
-        if processor_index >= len(self._queues):
-            raise ValueError(f"{processor_index} exceeds the pipeline "
-                             f"range [0, {self.pipeline_length - 1}]")
-        self._current_processor_index = processor_index
-
-    @property
-    def current_queue_index(self):
-        return self._current_queue_index
-
-    @current_queue_index.setter
-    def current_queue_index(self, queue_index: int):
-        if queue_index >= len(self._queues):
-            raise ValueError(f"{queue_index} exceeds the pipeline range "
-                             f"[0, {self.pipeline_length - 1}]")
-        self._current_queue_index = queue_index
-
-    @property
-    def unprocessed_queue_indices(self):
-        return self._unprocessed_queue_indices
+    def pipeline_length(self):
+        return self._pipeline_length
 
     @property
-    def processed_queue_indices(self):
-        return self._processed_queue_indices
+    def current_job(self) -> Optional[ProcessJob]:
+        r"""The job being processed by the current component."""
+        return self._current_job
 
-    @property
-    def current_queue(self):
-        return self._queues[self.current_queue_index]
+    def stage_size(self, stage: int) -> int:
+        r"""The number of jobs ready or waiting at ``stage``."""
+        return self._stage_sizes[stage]
 
-    @property
-    def pipeline_length(self):
-        return self._pipeline_length
+    def add_job(self, job: ProcessJob):
+        r"""Add a new job read from the reader to the first stage."""
+        job.sequence = self._next_sequence
+        self._next_sequence += 1
+        self.add_to_queue(0, job)
 
     def add_to_queue(self, queue_index: int, job: ProcessJob):
-        if queue_index > len(self._queues):
+        if queue_index > self._pipeline_length:
             raise ValueError(f"Queue number {queue_index} exceeds queue "
-                             f"size {len(self._queues)}")
-        else:
-            # change the job status
-            job.set_status(ProcessJobStatus.UNPROCESSED)
-            self._queues[queue_index].append(job)
-
-    def exhausted(self):
-        r"""Returns True only if the last element remaining in the last queue is
-         a poison pack."""
-
-        return (len(self._queues[self.pipeline_length - 1]) == 1
-                and self._queues[self.pipeline_length - 1][0].is_poison)
+                             f"size {self._pipeline_length}")
+        job.set_stage(queue_index)
+        self._queues[queue_index].append(job)
+        if queue_index < self._pipeline_length:
+            self._stage_sizes[queue_index] += 1
+
+    def next_job(self) -> Optional[ProcessJob]:
+        r"""Take the next ready job of the last stage having one, so that the
+        jobs leave the pipeline as early as possible. Returns `None` if no job
+        is ready."""
+        for stage in range(self._pipeline_length - 1, -1, -1):
+            if self._queues[stage]:
+                return self._queues[stage].popleft()
+        return None
+
+    def start(self, job: ProcessJob):
+        r"""Called before the component of the stage processes ``job``."""
+        self._current_job = job
+
+    def finish(self, job: ProcessJob):
+        r"""Called after the component of the stage processed ``job``. The
+        job moves to the next stage unless its packs wait in a batcher."""
+        self._current_job = None
+        if job.status != ProcessJobStatus.QUEUED:
+            job.set_status(ProcessJobStatus.PROCESSED)
+            self._advance(job)
+
+    def queue_job(self, job: ProcessJob):
+        r"""Called by the batch processors when the packs of ``job`` wait in
+        the batcher."""
+        job.set_status(ProcessJobStatus.QUEUED)
+
+    def release_job(self, job: ProcessJob):
+        r"""Called by the batch processors when all the packs of ``job`` left
+        the batcher."""
+        job.set_status(ProcessJobStatus.PROCESSED)
+        # The current job moves on in ``finish``, since the component may
+        # still have other packs of the job to process.
+        if job is not self._current_job:
+            self._advance(job)
+
+    def _advance(self, job: ProcessJob):
+        self._stage_sizes[job.stage] -= 1
+        self.add_to_queue(job.stage + 1, job)
+
+    def finished_jobs(self) -> Iterator[ProcessJob]:
+        r"""Yield the jobs done with all the stages, in the order they were
+        added."""
+        done = self._queues[self._pipeline_length]
+        while done:
+            job = done.popleft()
+            self._reorder_buffer[job.sequence] = job
+        while self._next_output in self._reorder_buffer:
+            yield self._reorder_buffer.pop(self._next_output)
+            self._next_output += 1
+
+    def exhausted(self) -> bool:
+        r"""Returns True if no job remains in the pipeline."""
+        return not any(self._stage_sizes) and not self._reorder_buffer
@@ -14,20 +14,22 @@
 """
 The processors that process data in batch.
 """
-import itertools
+import time
 from abc import abstractmethod, ABC
-from typing import Dict, Optional, Type, Any
+from collections import deque
+from typing import Deque, Dict, Optional, Type, Any
 
 from forte.common import Resources, ProcessorConfigError
 from forte.common.configuration import Config
 from forte.data import slice_batch
 from forte.data.base_pack import PackType
-from forte.data.batchers import ProcessingBatcher, FixedSizeDataPackBatcher
+from forte.data.batchers import (
+    ProcessingBatcher, FixedSizeDataPackBatcher, TokenBudgetDataPackBatcher)
 from forte.data.data_pack import DataPack
 from forte.data.multi_pack import MultiPack
 from forte.data.ontology.top import Annotation
 from forte.data.types import DataRequest
-from forte.process_manager import ProcessJobStatus
+from forte.process_job import ProcessJob
 from forte.processors.base.base_processor import BaseProcessor
 
 __all__ = [
@@ -35,7 +37,8 @@ __all__ = [
     "BatchProcessor",
     "MultiPackBatchProcessor",
     "FixedSizeBatchProcessor",
-    "FixedSizeMultiPackBatchProcessor"
+    "FixedSizeMultiPackBatchProcessor",
+    "TokenBudgetBatchProcessor",
 ]
 
 
@@ -55,10 +58,16 @@ class BaseBatchProcessor(BaseProcessor[PackType], ABC):
         self.batcher: ProcessingBatcher = self.define_batcher()
         self.use_coverage_index = False
 
+        # The jobs of the packs in the pool of the batcher, in the same order.
+        self._pool_jobs: Deque[Optional[ProcessJob]] = deque()
+        self._num_pending_jobs: int = 0
+
     def initialize(self, resources: Resources, configs: Optional[Config]):
         super().initialize(resources, configs)
 
         assert configs is not None
+        self._pool_jobs.clear()
+        self._num_pending_jobs = 0
         try:
             self.batcher.initialize(configs.batcher)
         except AttributeError as e:
@@ -118,39 +127,52 @@ class BaseBatchProcessor(BaseProcessor[PackType], ABC):
         if self.use_coverage_index:
             self.prepare_coverage_index(input_pack)
 
+        # The job is queued while its packs are in the pool of the batcher,
+        # and released when they are removed from it.
+        job: Optional[ProcessJob] = self._process_manager.current_job
+        if job is not None:
+            self._process_manager.queue_job(job)
+            if not self._pool_jobs or self._pool_jobs[-1] is not job:
+                self._num_pending_jobs += 1
+        self._pool_jobs.append(job)
+
         for batch in self.batcher.get_batch(
                 input_pack, self.context_type, self.input_info):
-            pred = self.predict(batch)
-            self.pack_all(pred)
-            self.update_batcher_pool(-1)
+            self._process_batch(batch)
+
+        # Do not hold the packs of the partial batch for too long.
+        if self.batcher.should_flush():
+            for batch in self.batcher.flush():
+                self._process_batch(batch)
 
         if len(self.batcher.current_batch_sources) == 0:
             self.update_batcher_pool()
 
-        # update the status of the jobs. The jobs which were removed from
-        # data_pack_pool will have status "PROCESSED" else they are "QUEUED"
-        q_index = self._process_manager.current_queue_index
-        u_index = self._process_manager.unprocessed_queue_indices[q_index]
-        data_pool_length = len(self.batcher.data_pack_pool)
-        current_queue = self._process_manager.current_queue
-
-        for i, job_i in enumerate(
-                itertools.islice(current_queue, 0, u_index + 1)):
-            if i <= u_index - data_pool_length:
-                job_i.set_status(ProcessJobStatus.PROCESSED)
-            else:
-                job_i.set_status(ProcessJobStatus.QUEUED)
+    @property
+    def num_pending_jobs(self) -> int:
+        r"""The number of jobs whose packs are waiting in the pool of the
+        batcher for their instances to be processed."""
+        return self._num_pending_jobs
+
+    def _process_batch(self, batch: Dict):
+        r"""Predict one batch and pack the results into the packs of the
+        batch, and record the batch if the pipeline is profiled."""
+        if self._stats is None:
+            self.pack_all(self.predict(batch))
+        else:
+            start_time = time.perf_counter()
+            self.pack_all(self.predict(batch))
+            self._stats.record_batch(
+                sum(self.batcher.current_batch_sources),
+                getattr(self.batcher, "batch_size", None),
+                time.perf_counter() - start_time)
+        self.update_batcher_pool(-1)
 
     def flush(self):
         for batch in self.batcher.flush():
-            pred = self.predict(batch)
-            self.pack_all(pred)
-            self.update_batcher_pool(-1)
-
-        current_queue = self._process_manager.current_queue
-
-        for job in current_queue:
-            job.set_status(ProcessJobStatus.PROCESSED)
+            self._process_batch(batch)
+        # All the packs are processed, do not keep them for the next run.
+        self.update_batcher_pool()
 
     @abstractmethod
     def predict(self, data_batch: Dict) -> Dict:
@@ -170,12 +192,14 @@ class BaseBatchProcessor(BaseProcessor[PackType], ABC):
         corresponding packs.
         """
         start = 0
-        for i in range(len(self.batcher.data_pack_pool)):
-            pack_i = self.batcher.data_pack_pool[i]
-            output_dict_i = slice_batch(output_dict, start,
-                                        self.batcher.current_batch_sources[i])
+        for pack_i, num_instances in zip(self.batcher.data_pack_pool,
+                                         self.batcher.current_batch_sources):
+            if num_instances == 0:
+                # The pack has no instance in this batch.
+                continue
+            output_dict_i = slice_batch(output_dict, start, num_instances)
             self.pack(pack_i, output_dict_i)
-            start += self.batcher.current_batch_sources[i]
+            start += num_instances
             pack_i.add_all_remaining_entries()
 
     @classmethod
@@ -213,11 +237,24 @@ class BaseBatchProcessor(BaseProcessor[PackType], ABC):
         """
         # TODO: the purpose of this function is confusing, especially the -1
         #  argument value.
-        if end is None:
-            end = len(self.batcher.data_pack_pool)
-        self.batcher.data_pack_pool = self.batcher.data_pack_pool[end:]
-        self.batcher.current_batch_sources = \
-            self.batcher.current_batch_sources[end:]
+        pool = self.batcher.data_pack_pool
+        sources = self.batcher.current_batch_sources
+        num_packs = len(pool)
+        if end is not None:
+            num_packs = max(0, min(num_packs, end if end >= 0
+                                   else num_packs + end))
+
+        for _ in range(num_packs):
+            pool.popleft()
+            if sources:
+                sources.popleft()
+            if self._pool_jobs:
+                job = self._pool_jobs.popleft()
+                # A job may have several packs in the pool.
+                if job is not None and (not self._pool_jobs
+                                        or self._pool_jobs[0] is not job):
+                    self._num_pending_jobs -= 1
+                    self._process_manager.release_job(job)
 
     @abstractmethod
     def prepare_coverage_index(self, input_pack: PackType):
@@ -248,6 +285,16 @@ class FixedSizeBatchProcessor(BatchProcessor, ABC):
         return FixedSizeDataPackBatcher()
 
 
+class TokenBudgetBatchProcessor(BatchProcessor, ABC):
+    r"""The batch processors whose batches are capped by the number of tokens,
+    see :class:`~forte.data.batchers.TokenBudgetDataPackBatcher`.
+    """
+
+    @staticmethod
+    def define_batcher() -> ProcessingBatcher:
+        return TokenBudgetDataPackBatcher()
+
+
 class MultiPackBatchProcessor(BaseBatchProcessor[MultiPack], ABC):
     r"""This just defines the generic type to :class:`MultiPack`.
     The implemented batch processors will process :class:`MultiPacks`.
@@ -16,10 +16,17 @@ Processors that augment the data. The processor will call
 replacement ops to generate texts similar to those in the input pack
 and create a new pack with them.
 """
-from typing import List, Tuple
+import copy
+from typing import Dict, Iterable, List, Tuple, Type
+
+import numpy as np
+
 from ft.onto.base_ontology import Annotation
-from forte.data.ontology.core import Entry
+from forte.data.container import EntryIdManager
+from forte.data.ontology.core import BasePointer, Entry, FDict, FList
+from forte.data.ontology.top import Group, Link
 from forte.data.data_pack import DataPack
+from forte.utils import get_class
 from forte.processors.base.base_processor import BaseProcessor
 from forte.processors.data_augment.algorithms.text_replacement_op \
     import TextReplacementOp
@@ -30,6 +37,53 @@ __all__ = [
 ]
 
 
+def _align_spans(
+        begins: np.ndarray, ends: np.ndarray, replaced_begins: np.ndarray,
+        replaced_ends: np.ndarray, shifts: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    r"""Map the spans of the original text to the text after replacing the
+    sorted and disjoint spans ``[replaced_begins, replaced_ends)``, where
+    ``shifts`` is the total change of length after each replaced span.
+
+    A begin (or end) at the boundary of a replaced span is moved to the
+    boundary of its replacement, so a span containing replaced spans
+    contains their replacements, and a begin or end strictly inside a
+    replaced span cannot be aligned.
+
+    Returns:
+        The new begins and ends, and whether each span is aligned.
+    """
+    num_replaced = len(replaced_begins)
+    # Count the replaced spans starting before the begin, the last one of them
+    # should end before the begin.
+    before_begin = np.searchsorted(replaced_begins, begins, side="left")
+    last = np.maximum(before_begin - 1, 0)
+    valid = (before_begin == 0) | (replaced_ends[last] <= begins)
+    new_begins = begins + np.where(before_begin > 0, shifts[last], 0)
+
+    # Count the replaced spans ending before the end, the next one of them
+    # should start after the end.
+    before_end = np.searchsorted(replaced_ends, ends, side="right")
+    last = np.maximum(before_end - 1, 0)
+    following = np.minimum(before_end, num_replaced - 1)
+    valid &= (before_end == num_replaced) | (
+        replaced_begins[following] >= ends)
+    new_ends = ends + np.where(before_end > 0, shifts[last], 0)
+    return new_begins, new_ends, valid
+
+
+# The types of the attribute values shared by the copies of the entries.
+_IMMUTABLE_TYPES = (str, int, float, bool, type(None))
+
+
+def _referred_tids(entry: Entry) -> List[int]:
+    if isinstance(entry, Link):
+        return [entry.get_parent().tid, entry.get_child().tid]
+    if isinstance(entry, Group):
+        return [member.tid for member in entry.get_members()]
+    return []
+
+
 class BaseDataAugmentProcessor(BaseProcessor):
     r"""The base class of processors that augment data.
     This processor instantiates replacement ops where specific
@@ -66,6 +120,29 @@ class ReplacementDataAugmentProcessor(BaseDataAugmentProcessor):
         if is_replace:
             self.replaced_spans.append((input, replaced_text))
 
+    def replace_batch(self, replacement_op: TextReplacementOp,
+                      inputs: Iterable[Annotation]):
+        """
+        This function collects the inputs, and replaces them together with
+        the `replace_batch` of the replacement op, so that the op can
+        batch the work, such as translating the texts. The replaced inputs
+        are registered like in :func: replace.
+        """
+        inputs = list(inputs)
+        for input, (is_replace, replaced_text) in zip(
+                inputs, replacement_op.replace_batch(inputs)):
+            if is_replace:
+                self.replaced_spans.append((input, replaced_text))
+
+    def replace_pack(self, replacement_op: TextReplacementOp,
+                     data_pack: DataPack):
+        """
+        This function replaces all the entries of the `augment_entry` type
+        in the data pack with one call to :func: replace_batch.
+        """
+        self.replace_batch(replacement_op, data_pack.get(
+            get_class(self.configs.augment_entry)))
+
     def auto_align_annotations(
         self,
         data_pack: DataPack,
@@ -74,6 +151,17 @@ class ReplacementDataAugmentProcessor(BaseDataAugmentProcessor):
         r"""
         Function to replace some annotations with new strings.
         It will update the text and auto-align the annotation spans.
+
+        The new text is built once from the sorted replacements, and the
+        spans of the annotations of the types to "auto_align" are mapped to
+        the new text with one search over the offsets of the replacements.
+        The annotations partially overlapping a replaced annotation, or
+        inside it, are not copied. The links and groups of the types to
+        "auto_align" are copied if the entries they refer to are copied.
+        The copies keep the ids of the original entries, so the links,
+        groups and the entry attributes refer to the copies in the new pack,
+        and the references to the entries not copied are dropped.
+
         Args:
             data_pack: Datapack holding the annotations to be replaced.
             replaced_annotations: A list of tuples(annotation, new string).
@@ -83,7 +171,137 @@ class ReplacementDataAugmentProcessor(BaseDataAugmentProcessor):
             in the original data pack will be copied and auto-aligned as
             instructed by the "other_entry_policy".
         """
-        pass
+        replacements = sorted(
+            ((annotation.begin, annotation.end, text)
+             for annotation, text in replaced_annotations),
+            key=lambda replacement: replacement[:2])
+
+        pieces: List[str] = []
+        replaced_begins: List[int] = []
+        replaced_ends: List[int] = []
+        shifts: List[int] = []
+        prev_end = 0
+        shift = 0
+        for begin, end, text in replacements:
+            if begin < prev_end:
+                raise ValueError(
+                    f"The replaced annotation at [{begin}:{end}] overlaps "
+                    f"with another replaced annotation.")
+            pieces.append(data_pack.text[prev_end:begin])
+            pieces.append(text)
+            shift += len(text) - (end - begin)
+            replaced_begins.append(begin)
+            replaced_ends.append(end)
+            shifts.append(shift)
+            prev_end = end
+        pieces.append(data_pack.text[prev_end:])
+
+        new_pack = DataPack()
+        new_pack.set_text("".join(pieces))
+        # The copies keep their ids, the new entries are numbered after them.
+        # pylint: disable=protected-access
+        new_pack._id_manager = EntryIdManager(
+            data_pack._id_manager.current_id_counter())
+
+        # The entries to copy, by tid, in the order of the pack.
+        annotations: Dict[int, Annotation] = {}
+        others: Dict[int, Entry] = {}
+        for entry_type in self._auto_align_types():
+            for entry in data_pack.get(entry_type):
+                if isinstance(entry, Annotation):
+                    annotations[entry.tid] = entry
+                else:
+                    others[entry.tid] = entry
+
+        copied: Dict[int, Entry] = {}
+        spans: Dict[int, Tuple[int, int]] = {}
+        if annotations:
+            entries = list(annotations.values())
+            begins = np.fromiter((a.begin for a in entries), dtype=np.int64,
+                                 count=len(entries))
+            ends = np.fromiter((a.end for a in entries), dtype=np.int64,
+                               count=len(entries))
+            if replacements:
+                new_begins, new_ends, valid = _align_spans(
+                    begins, ends, np.array(replaced_begins, dtype=np.int64),
+                    np.array(replaced_ends, dtype=np.int64),
+                    np.array(shifts, dtype=np.int64))
+            else:
+                new_begins, new_ends = begins, ends
+                valid = np.ones(len(entries), dtype=bool)
+            for entry, begin, end, is_valid in zip(
+                    entries, new_begins.tolist(), new_ends.tolist(),
+                    valid.tolist()):
+                if is_valid:
+                    copied[entry.tid] = entry
+                    spans[entry.tid] = (begin, end)
+
+        # A link or group is copied after the entries it refers to, which
+        # may be other links or groups.
+        pending = list(others.values())
+        while pending:
+            remaining = []
+            for entry in pending:
+                if all(tid in copied for tid in _referred_tids(entry)):
+                    copied[entry.tid] = entry
+                else:
+                    remaining.append(entry)
+            if len(remaining) == len(pending):
+                break
+            pending = remaining
+
+        copies: Dict[int, Entry] = {}
+        containers = []
+        for tid, entry in copied.items():
+            new_entry = object.__new__(type(entry))
+            for key, value in entry.__dict__.items():
+                if isinstance(value, BasePointer):
+                    if value.tid not in copied:
+                        value = None
+                elif isinstance(value, (FList, FDict)):
+                    # The containers are rebuilt once all entries are copied.
+                    containers.append((new_entry, key, value))
+                    continue
+                elif key == "_span":
+                    # Set below with the aligned span.
+                    continue
+                elif key != "_Entry__pack" and not isinstance(
+                        value, _IMMUTABLE_TYPES):
+                    value = copy.deepcopy(value)
+                new_entry.__dict__[key] = value
+            new_entry.set_pack(new_pack)
+            if tid in spans:
+                new_entry.set_span(*spans[tid])
+            copies[tid] = new_entry
+            new_pack.on_entry_creation(new_entry)
+
+        for new_entry, key, value in containers:
+            if isinstance(value, FList):
+                new_entry.__dict__[key] = FList(
+                    new_entry, [copies[e.tid] for e in value
+                                if e.tid in copies])
+            else:
+                new_entry.__dict__[key] = FDict(
+                    new_entry, {k: copies[e.tid] for k, e in value.items()
+                                if e.tid in copies})
+
+        new_pack.add_all_remaining_entries()
+        return new_pack
+
+    def _auto_align_types(self) -> List[Type[Entry]]:
+        policy = self.configs.get("other_entry_policy")
+        if policy is None:
+            return []
+        if not isinstance(policy, dict):
+            policy = policy.todict()
+        types = []
+        for type_name, entry_policy in policy.items():
+            if entry_policy != "auto_align":
+                raise ValueError(
+                    f"Unknown policy [{entry_policy}] for [{type_name}], "
+                    f"only 'auto_align' is supported.")
+            types.append(get_class(type_name))
+        return types
 
     @classmethod
     def default_configs(cls):
@@ -100,6 +318,7 @@ class ReplacementDataAugmentProcessor(BaseDataAugmentProcessor):
             spans might become invalid after the augmentation, for
             example, the tokens within a replaced sentence may disappear.
             Entries not in the dict will not be copied to the new data pack.
+            Defaults to None, which copies no entry.
             Example: {
                 "ft.onto.base_ontology.Document": "auto_align",
                 "ft.onto.base_ontology.Sentence": "auto_align"
@@ -108,6 +327,6 @@ class ReplacementDataAugmentProcessor(BaseDataAugmentProcessor):
         config = super().default_configs()
         config.update({
             'augment_entry': "ft.onto.base_ontology.Sentence",
-            'other_entry_policy': {}
+            'other_entry_policy': None
         })
         return config
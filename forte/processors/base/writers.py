@@ -19,11 +19,14 @@ import gzip
 import json
 import logging
 import os
+import queue
+import threading
 from abc import abstractmethod, ABC
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, Union
 import posixpath
 
 from forte.common.configuration import Config
+from forte.common.exception import ProcessExecutionException
 from forte.common.resources import Resources
 from forte.data.base_pack import BasePack
 from forte.data.data_pack import DataPack
@@ -35,14 +38,112 @@ from forte.utils.utils_io import maybe_create_dir, ensure_dir
 logger = logging.getLogger(__name__)
 
 __all__ = [
+    'BackgroundFileWriter',
     'JsonPackWriter',
     'MultiPackWriter',
 ]
 
 
+class BackgroundFileWriter:
+    r"""Writes the serialized packs to the files in a background thread, so
+    that the pipeline does not wait for the disk. At most ``queue_size``
+    packs wait to be written, after that :meth:`submit` blocks until the
+    thread catches up.
+
+    Args:
+        queue_size (int): The maximum number of packs waiting to be written.
+    """
+
+    def __init__(self, queue_size: int = 16):
+        self._queue_size: int = queue_size
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._error: Optional[BaseException] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: int = -1
+
+    def _ensure_thread(self):
+        # The thread is started on the first write of each process, since a
+        # forked process (such as a pipeline worker) does not inherit it.
+        if self._thread is None or self._pid != os.getpid():
+            self._queue = queue.Queue(maxsize=self._queue_size)
+            self._error = None
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            # Keep consuming after an error, so that submit does not block.
+            if self._error is None:
+                try:
+                    write_serialized(*item)
+                except Exception as e:  # pylint: disable=broad-except
+                    self._error = e
+
+    def _check_error(self):
+        if self._error is not None:
+            raise ProcessExecutionException(
+                "Failed to write a pack in the background.") from self._error
+
+    def submit(self, output_path: str, data: Union[str, bytes],
+               zip_pack: bool = False):
+        r"""Queue the serialized pack to be written to ``output_path``.
+
+        Args:
+            output_path: The path of the output file.
+            data: The serialized pack.
+            zip_pack: Whether to gzip the output.
+        """
+        self._ensure_thread()
+        self._check_error()
+        self._queue.put((output_path, data, zip_pack))
+
+    def close(self):
+        r"""Wait for all the queued packs to be written, and stop the thread.
+        Raise the error if any of the writes failed."""
+        if self._thread is None or self._pid != os.getpid():
+            # Nothing is written by this process.
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        self._check_error()
+
+
+def write_serialized(output_path: str, data: Union[str, bytes],
+                     zip_pack: bool = False):
+    r"""Write a serialized pack to a file.
+
+    Args:
+        output_path: The path of the output file.
+        data: The serialized pack, bytes are written in binary mode.
+        zip_pack: Whether to gzip the output.
+    """
+    ensure_dir(output_path)
+    if isinstance(data, bytes):
+        if zip_pack:
+            with gzip.open(output_path, 'wb') as out:
+                out.write(data)
+        else:
+            with open(output_path, 'wb') as out:
+                out.write(data)
+    else:
+        if zip_pack:
+            with gzip.open(output_path, 'wt') as out:
+                out.write(data)
+        else:
+            with open(output_path, 'w') as out:
+                out.write(data)
+
+
 def write_pack(input_pack: BasePack, output_dir: str, sub_path: str,
                indent: Optional[int] = None, zip_pack: bool = False,
-               overwrite: bool = False, drop_record: bool = False) -> str:
+               overwrite: bool = False, drop_record: bool = False,
+               serialize_method: str = "jsonpickle",
+               file_writer: Optional[BackgroundFileWriter] = None) -> str:
     """
     Write a pack to a path.
 
@@ -54,30 +155,31 @@ def write_pack(input_pack: BasePack, output_dir: str, sub_path: str,
         zip_pack: Whether to zip the output JSON.
         overwrite: Whether to overwrite the file if already exists.
         drop_record: Whether to drop the creation records in the serialization.
+        serialize_method: The serialization format, `jsonpickle` writes a
+          `.json` file, `binary` writes a `.bin` file using the columnar binary
+          format. `indent` is ignored for the binary format.
+        file_writer: If provided, the pack is serialized immediately but
+          written to the file by this background writer.
 
     Returns:
         If successfully written, will return the path of the output file.
         otherwise, will return None.
 
     """
-    output_path = os.path.join(output_dir, sub_path) + '.json'
+    suffix = '.bin' if serialize_method == 'binary' else '.json'
+    output_path = os.path.join(output_dir, sub_path) + suffix
     if overwrite or not os.path.exists(output_path):
         if zip_pack:
             output_path = output_path + '.gz'
 
-        ensure_dir(output_path)
-
-        out_str: str = input_pack.serialize(drop_record)
-
-        if indent:
-            out_str = json.dumps(json.loads(out_str), indent=indent)
+        out_data = input_pack.serialize(drop_record, serialize_method)
+        if indent and not isinstance(out_data, bytes):
+            out_data = json.dumps(json.loads(out_data), indent=indent)
 
-        if zip_pack:
-            with gzip.open(output_path, 'wt') as out:
-                out.write(out_str)
+        if file_writer is None:
+            write_serialized(output_path, out_data, zip_pack)
         else:
-            with open(output_path, 'w') as out:
-                out.write(out_str)
+            file_writer.submit(output_path, out_data, zip_pack)
     else:
         logging.info("Will not overwrite existing path %s", output_path)
 
@@ -90,6 +192,7 @@ class JsonPackWriter(PackProcessor, ABC):
         super().__init__()
         self.zip_pack: bool = False
         self.indent: Optional[int] = None
+        self._file_writer: Optional[BackgroundFileWriter] = None
 
     def initialize(self, resources: Resources, configs: Config):
         super().initialize(resources, configs)
@@ -104,6 +207,9 @@ class JsonPackWriter(PackProcessor, ABC):
         self.zip_pack = configs.zip_pack
         self.indent = configs.indent
 
+        if configs.async_write:
+            self._file_writer = BackgroundFileWriter(configs.async_queue_size)
+
     @abstractmethod
     def sub_output_path(self, pack: DataPack) -> str:
         r"""Allow defining output path using the information of the pack.
@@ -122,7 +228,10 @@ class JsonPackWriter(PackProcessor, ABC):
             'output_dir': None,
             'zip_pack': False,
             'indent': None,
-            'drop_record': False
+            'drop_record': False,
+            'serialize_method': 'jsonpickle',
+            'async_write': False,
+            'async_queue_size': 16,
         })
         return config
 
@@ -135,7 +244,12 @@ class JsonPackWriter(PackProcessor, ABC):
         maybe_create_dir(self.configs.output_dir)
         write_pack(input_pack, self.configs.output_dir, sub_path,
                    self.configs.indent, self.configs.zip_pack,
-                   self.configs.overwrite, self.configs.drop_record)
+                   self.configs.overwrite, self.configs.drop_record,
+                   self.configs.serialize_method, self._file_writer)
+
+    def finish(self, resource: Resources):
+        if self._file_writer is not None:
+            self._file_writer.close()
 
 
 class MultiPackWriter(MultiPackProcessor):
@@ -156,6 +270,11 @@ class MultiPackWriter(MultiPackProcessor):
         ensure_dir(multi_index)
         self.multi_idx_out = open(multi_index, 'w')
 
+        self._file_writer: Optional[BackgroundFileWriter] = None
+        if self.configs.async_write:
+            self._file_writer = BackgroundFileWriter(
+                self.configs.async_queue_size)
+
     def pack_name(self, pack: DataPack) -> str:
         r"""Allow defining output name using the information of the datapack.
 
@@ -180,7 +299,8 @@ class MultiPackWriter(MultiPackProcessor):
             pack_out = write_pack(
                 pack, pack_out_dir, self.pack_name(pack), self.configs.indent,
                 self.configs.zip_pack, self.configs.overwrite,
-                self.configs.drop_record)
+                self.configs.drop_record, self.configs.serialize_method,
+                self._file_writer)
 
             self.pack_idx_out.write(
                 f'{pack.meta.pack_id}\t'
@@ -190,7 +310,8 @@ class MultiPackWriter(MultiPackProcessor):
             input_pack, multi_out_dir,
             self.multipack_name(input_pack), self.configs.indent,
             self.configs.zip_pack, self.configs.overwrite,
-            self.configs.drop_record
+            self.configs.drop_record, self.configs.serialize_method,
+            self._file_writer
         )
 
         self.multi_idx_out.write(
@@ -198,6 +319,8 @@ class MultiPackWriter(MultiPackProcessor):
             f'{posixpath.relpath(multi_out, self.configs.output_dir)}\n')
 
     def finish(self, _):
+        if self._file_writer is not None:
+            self._file_writer.close()
         self.pack_idx_out.close()
         self.multi_idx_out.close()
 
@@ -208,6 +331,9 @@ class MultiPackWriter(MultiPackProcessor):
             'output_dir': None,
             'zip_pack': False,
             'indent': None,
-            'drop_record': False
+            'drop_record': False,
+            'serialize_method': 'jsonpickle',
+            'async_write': False,
+            'async_queue_size': 16,
         })
         return config
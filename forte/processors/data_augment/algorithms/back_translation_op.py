@@ -16,10 +16,12 @@ Class for back translation op. The input is translated
 to another language, then translated back to the original language.
 """
 import random
-from typing import Tuple
+from typing import List, Optional, Tuple
 from ft.onto.base_ontology import Annotation
 from forte.processors.data_augment.algorithms.text_replacement_op \
     import TextReplacementOp
+from forte.processors.data_augment.algorithms.translation_cache import (
+    TranslationCache, translate_with_cache)
 from forte.common.configuration import Config
 from forte.utils.utils import create_class_with_kwargs
 
@@ -52,6 +54,14 @@ class BackTranslationOp(TextReplacementOp):
         model_back (str): The full qualified name of the model from
             target language to source language.
         device (str): "cpu" for the CPU or "cuda" for GPU.
+        cache_translations (bool, optional): Whether to cache the
+            translations of the texts, so that the same texts are only
+            translated once. Defaults to True.
+        cache_path (str, optional): The file where the cached translations
+            are kept across runs, see :class:`TranslationCache`.
+
+    The inputs given to :func: replace_batch are translated together, with
+    one batch for each direction.
     """
     def __init__(self, configs: Config):
         super().__init__(configs)
@@ -72,6 +82,9 @@ class BackTranslationOp(TextReplacementOp):
                 "device": configs["device"]
             }
         )
+        self.cache: Optional[TranslationCache] = None
+        if configs.get("cache_translations", True):
+            self.cache = TranslationCache(configs.get("cache_path"))
 
     def _validate_configs(self, configs):
         prob = configs["prob"]
@@ -110,8 +123,30 @@ class BackTranslationOp(TextReplacementOp):
             whether the replacement happens, and the second element is the
             replaced string.
         """
-        # If the replacement does not happen, return False.
-        if random.random() > self.configs["prob"]:
-            return False, input.text
-        intermediate_text: str = self.model_to.translate(input.text)
-        return True, self.model_back.translate(intermediate_text)
+        return self.replace_batch([input])[0]
+
+    def replace_batch(self, inputs: List[Annotation]) -> List[Tuple[bool, str]]:
+        r"""
+        This function replaces many pieces of text with back translation,
+        translating them in one batch for each direction.
+
+        Args:
+            inputs: The annotations, could be words, sentences or documents.
+
+        Returns:
+            A tuple for each input, see :func: replace.
+        """
+        # Decide whether each replacement happens, in the order of inputs.
+        replaced: List[bool] = [
+            random.random() <= self.configs["prob"] for _ in inputs]
+        texts: List[str] = [
+            input.text for input, is_replace in zip(inputs, replaced)
+            if is_replace]
+
+        intermediate_texts: List[str] = translate_with_cache(
+            self.model_to, texts, self.cache)
+        back_texts = iter(translate_with_cache(
+            self.model_back, intermediate_texts, self.cache))
+        return [(True, next(back_texts)) if is_replace
+                else (False, input.text)
+                for input, is_replace in zip(inputs, replaced)]
@@ -12,9 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List
+import functools
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 import nltk
 from nltk.corpus import wordnet
+from nltk.corpus.reader.wordnet import ADJ, ADV, NOUN, VERB
+
+from forte.processors.data_augment.algorithms.lemma_table import (
+    LemmaKey, LemmaTable, write_lemma_table)
 
 
 __all__ = [
@@ -102,31 +107,63 @@ class WordnetDictionary(Dictionary):
     the input word with an synonym/antonym/hypernym/hyponym.
     Part-of-Speech(optional) can be provided to the wordnet
     for retrieving words with the same POS.
+
+    The lemmas are memoized by the word, the WordNet POS, the language and
+    the lemma type in a LRU cache of ``cache_size`` entries. They can also be
+    computed offline for a vocabulary with :meth:`build_lemma_table`, and
+    looked up from the table file given as ``lemma_table``. WordNet is then
+    only loaded for the words missing from the table, so the processes
+    augmenting the vocabulary of the table never load it.
+
+    Args:
+        lemma_table (str, optional): The path of a lemma table built by
+            :meth:`build_lemma_table`.
+        cache_size (int): The maximum number of lookups cached in memory.
     """
-    def __init__(self):
+    LEMMA_TYPES = ("SYNONYM", "ANTONYM", "HYPERNYM", "HYPONYM")
+
+    def __init__(self, lemma_table: Optional[str] = None,
+                 cache_size: int = 65536):
+        self._model = None
+        self.lemma_table: Optional[LemmaTable] = None
+        if lemma_table is None:
+            self._load_model()
+        else:
+            self.lemma_table = LemmaTable(lemma_table)
+        self._lookup = functools.lru_cache(maxsize=cache_size)(
+            self._lookup_lemmas)
+
+    def _load_model(self):
         try:
             # Check if the wordnet package and
             # pos_tag package are downloaded.
             wordnet.synsets('computer')
         except LookupError:
             nltk.download('wordnet')
-        self.model = wordnet
+        self._model = wordnet
+
+    @property
+    def model(self):
+        r"""The nltk WORDNET, loaded when it is first needed."""
+        if self._model is None:
+            self._load_model()
+        return self._model
 
     def _get_wordnet_pos(self, treebank_tag: str) -> str:
         """
         return WORDNET POS compliance to WORDNET lemmatization (a,n,r,v)
         """
         if treebank_tag.startswith('J'):
-            return self.model.ADJ
+            return ADJ
         elif treebank_tag.startswith('V'):
-            return self.model.VERB
+            return VERB
         elif treebank_tag.startswith('N'):
-            return self.model.NOUN
+            return NOUN
         elif treebank_tag.startswith('R'):
-            return self.model.ADV
+            return ADV
         else:
             # As default pos in lemmatization is Noun
-            return self.model.NOUN
+            return NOUN
 
     def get_lemmas(
             self,
@@ -151,15 +188,31 @@ class WordnetDictionary(Dictionary):
                 - ``'HYPERNYM'``
                 - ``'HYPONYM'``
         """
-        res: List[str] = []
-        pos_wordnet = None
+        if lemma_type not in self.LEMMA_TYPES:
+            raise KeyError(
+                'The type {} does not belong to '
+                '["SYNONYM", "ANTONYM", '
+                '"HYPERNYM", "HYPONYM"]]'.format(lemma_type)
+            )
         # The POS property is used for retrieving lemmas with the same POS.
+        pos_wordnet = ""
         if pos_tag and len(pos_tag) > 0:
             pos_wordnet = self._get_wordnet_pos(pos_tag)
+        return list(self._lookup((word, pos_wordnet, lang, lemma_type)))
+
+    def _lookup_lemmas(self, key: LemmaKey) -> Tuple[str, ...]:
+        if self.lemma_table is not None:
+            lemmas = self.lemma_table.get(key)
+            if lemmas is not None:
+                return tuple(lemmas)
+        return tuple(self._wordnet_lemmas(*key))
 
+    def _wordnet_lemmas(self, word: str, pos_wordnet: str, lang: str,
+                        lemma_type: str) -> List[str]:
+        res: List[str] = []
         for synonym in self.model.synsets(
             word,
-            pos=pos_wordnet,
+            pos=pos_wordnet or None,
             lang=lang
         ):
             for lemma in synonym.lemmas(lang=lang):
@@ -174,15 +227,37 @@ class WordnetDictionary(Dictionary):
                 elif lemma_type == "HYPONYM":
                     for hyponym in lemma.hyponyms():
                         res.append(hyponym.name())
-                else:
-                    raise KeyError(
-                        'The type {} does not belong to '
-                        '["SYNONYM", "ANTONYM", '
-                        '"HYPERNYM", "HYPONYM"]]'.format(type)
-                    )
         # The phrases are concatenated with "_" in wordnet.
         return [word.replace("_", " ") for word in res]
 
+    def build_lemma_table(
+            self,
+            path: str,
+            words: Iterable[str],
+            lang: str = "eng",
+            lemma_types: Sequence[str] = LEMMA_TYPES
+    ):
+        r"""
+        Look up the lemmas of ``words`` in WORDNET for all the POS, and save
+        them as a lemma table for the ``lemma_table`` argument. The words can
+        be the vocabulary of a corpus, or all the lemmas of WORDNET from
+        ``wordnet.all_lemma_names()``.
+
+        Args:
+            path (str): The path of the lemma table file.
+            words: The words to look up.
+            lang (str): The language of the words.
+            lemma_types: The types of lemmas to look up.
+        """
+        table: Dict[LemmaKey, List[str]] = {}
+        for word in words:
+            for pos_wordnet in ("", ADJ, ADV, NOUN, VERB):
+                for lemma_type in lemma_types:
+                    key = (word, pos_wordnet, lang, lemma_type)
+                    if key not in table:
+                        table[key] = self._wordnet_lemmas(*key)
+        write_lemma_table(path, table)
+
     def get_synonyms(
             self,
             word: str,
@@ -37,12 +37,15 @@ class DictionaryReplacementOp(TextReplacementOp):
         - `dictionary`: The full qualified name of the dictionary class.
         - `prob`: The probability of replacement, should fall in [0, 1].
         - `lang`: The language of the text.
+        - `dictionary_args` (optional): The keyword arguments of the
+          dictionary class, such as the `lemma_table` of the WORDNET
+          dictionary.
     """
     def __init__(self, configs: Config):
         super().__init__(configs)
         self.dictionary = create_class_with_kwargs(
             configs["dictionary_class"],
-            class_args={}
+            class_args=configs.get("dictionary_args") or {}
         )
 
     def replace(self, input: Annotation) -> Tuple[bool, str]:
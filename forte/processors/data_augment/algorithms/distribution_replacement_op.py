@@ -11,7 +11,6 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import random
 from typing import Tuple
 from ft.onto.base_ontology import Annotation
 from forte.common.configuration import Config
@@ -29,6 +28,8 @@ class DistributionReplacementOp(TextReplacementOp):
     r"""
     This class is a replacement op to replace the input word
     with a new word that is sampled by a sampler from a distribution.
+    Whether to replace a word is also drawn from the random generator of
+    the sampler, so a seeded sampler makes the replacements reproducible.
 
     Args:
         sampler: The sampler that samples a word from a distribution.
@@ -51,7 +52,7 @@ class DistributionReplacementOp(TextReplacementOp):
             indicating whether the replacement happens, and the second
             element is the replaced word.
         """
-        if random.random() > self.configs["prob"]:
+        if self.sampler.rng.random() > self.configs["prob"]:
             return False, input.text
         word: str = self.sampler.sample()
         return True, word
@@ -0,0 +1,196 @@
+# Copyright 2020 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A precomputed table of the lemmas related to words, saved in a file that is
+read with memory mapping, so that a dictionary can look the lemmas up without
+loading the resource they were computed from.
+
+The file starts with the magic bytes, the length of a JSON header and the
+header, which gives the number of keys and the offsets of the sections. The
+sections are the sorted 64 bits hashes of the keys, the offsets of the keys and
+of the lemmas in the order of the hashes, and the UTF-8 keys and lemmas.
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+__all__ = [
+    "LemmaKey",
+    "LemmaTable",
+    "write_lemma_table",
+]
+
+# The word, the WordNet POS (or an empty string), the language and the type
+# of the lemmas.
+LemmaKey = Tuple[str, str, str, str]
+
+_MAGIC = b"FLEMMAS\n"
+_HEADER_LENGTH = struct.Struct("<Q")
+_VERSION = 1
+_SECTIONS = ("hashes", "key_offsets", "lemma_offsets", "keys", "lemmas")
+# The fields of a key, and the lemmas of a key, are joined by these
+# characters, which do not appear in the words.
+_KEY_SEPARATOR = "\x1f"
+_LEMMA_SEPARATOR = "\n"
+
+
+def _encode_key(key: LemmaKey) -> bytes:
+    return _KEY_SEPARATOR.join(key).encode("utf-8")
+
+
+def _key_hash(key: bytes) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+def write_lemma_table(path: str, table: Mapping[LemmaKey, Iterable[str]]):
+    r"""Save the lemmas of each key, see :mod:`lemma_table`. The keys
+    without any lemma are saved as well, so that they are known to have
+    none.
+
+    Args:
+        path: The path of the table file, replaced atomically.
+        table: The lemmas of each key.
+    """
+    entries = []
+    for key, lemmas in table.items():
+        encoded = _encode_key(key)
+        entries.append((_key_hash(encoded), encoded,
+                        _LEMMA_SEPARATOR.join(lemmas).encode("utf-8")))
+    entries.sort()
+
+    hashes = np.array([entry[0] for entry in entries], dtype="<u8")
+    key_offsets = np.zeros(len(entries) + 1, dtype="<u8")
+    np.cumsum([len(entry[1]) for entry in entries], out=key_offsets[1:])
+    lemma_offsets = np.zeros(len(entries) + 1, dtype="<u8")
+    np.cumsum([len(entry[2]) for entry in entries], out=lemma_offsets[1:])
+    sections: Dict[str, bytes] = {
+        "hashes": hashes.tobytes(),
+        "key_offsets": key_offsets.tobytes(),
+        "lemma_offsets": lemma_offsets.tobytes(),
+        "keys": b"".join(entry[1] for entry in entries),
+        "lemmas": b"".join(entry[2] for entry in entries),
+    }
+
+    # The header is padded to a fixed size, so that it can give the offsets
+    # of the sections that follow it.
+    header_size = 512
+    offsets: Dict[str, int] = {}
+    offset = len(_MAGIC) + _HEADER_LENGTH.size + header_size
+    for name in _SECTIONS:
+        offsets[name] = offset
+        # Align the sections to 8 bytes for the arrays.
+        offset += (len(sections[name]) + 7) // 8 * 8
+    header = json.dumps({"version": _VERSION, "num_keys": len(entries),
+                         "sections": offsets}).encode("utf-8")
+    if len(header) > header_size:
+        raise ValueError("The header of the lemma table is too large.")
+
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(_MAGIC)
+        f.write(_HEADER_LENGTH.pack(len(header)))
+        f.write(header.ljust(header_size, b" "))
+        for name in _SECTIONS:
+            f.write(sections[name])
+            f.write(b"\0" * (-len(sections[name]) % 8))
+    os.replace(temp_path, path)
+
+
+class LemmaTable:
+    r"""A lemma table saved by :func:`write_lemma_table`, read with memory
+    mapping, so opening the table does not read it and the pages of the
+    file are shared by the processes reading it.
+
+    Args:
+        path: The path of the table file.
+    """
+
+    def __init__(self, path: str):
+        self.path: str = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mmap[:len(_MAGIC)] != _MAGIC:
+            self._mmap.close()
+            raise ValueError(f"[{path}] is not a lemma table.")
+        begin = len(_MAGIC) + _HEADER_LENGTH.size
+        (length,) = _HEADER_LENGTH.unpack(self._mmap[len(_MAGIC):begin])
+        header = json.loads(self._mmap[begin:begin + length])
+        if header["version"] > _VERSION:
+            self._mmap.close()
+            raise ValueError(
+                f"The lemma table [{path}] has version {header['version']}, "
+                f"this version of Forte reads up to {_VERSION}.")
+
+        num_keys: int = header["num_keys"]
+        offsets = header["sections"]
+        self._hashes = np.frombuffer(
+            self._mmap, dtype="<u8", count=num_keys,
+            offset=offsets["hashes"])
+        self._key_offsets = np.frombuffer(
+            self._mmap, dtype="<u8", count=num_keys + 1,
+            offset=offsets["key_offsets"])
+        self._lemma_offsets = np.frombuffer(
+            self._mmap, dtype="<u8", count=num_keys + 1,
+            offset=offsets["lemma_offsets"])
+        self._keys_begin: int = offsets["keys"]
+        self._lemmas_begin: int = offsets["lemmas"]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        return len(self._hashes)
+
+    def __contains__(self, key: LemmaKey) -> bool:
+        return self._find(_encode_key(key)) is not None
+
+    def _find(self, encoded: bytes) -> Optional[int]:
+        key_hash = np.uint64(_key_hash(encoded))
+        i = int(np.searchsorted(self._hashes, key_hash, side="left"))
+        # Check the keys, in case two keys share the hash.
+        while i < len(self._hashes) and self._hashes[i] == key_hash:
+            begin = self._keys_begin + int(self._key_offsets[i])
+            end = self._keys_begin + int(self._key_offsets[i + 1])
+            if self._mmap[begin:end] == encoded:
+                return i
+            i += 1
+        return None
+
+    def get(self, key: LemmaKey) -> Optional[List[str]]:
+        r"""The lemmas of ``key``, or `None` if the key is not in the
+        table."""
+        i = self._find(_encode_key(key))
+        if i is None:
+            return None
+        begin = self._lemmas_begin + int(self._lemma_offsets[i])
+        end = self._lemmas_begin + int(self._lemma_offsets[i + 1])
+        if begin == end:
+            return []
+        return self._mmap[begin:end].decode("utf-8").split(_LEMMA_SEPARATOR)
+
+    def close(self):
+        # The arrays refer to the memory map, which cannot be closed before
+        # they are released.
+        del self._hashes, self._key_offsets, self._lemma_offsets
+        self._mmap.close()
@@ -53,20 +53,39 @@ class MachineTranslator:
         """
         raise NotImplementedError
 
+    def translate_batch(self, src_texts: List[str]) -> List[str]:
+        r"""
+        This function translates a list of texts into target language. The
+        subclasses translate them in batches, this default implementation
+        translates them one by one.
+
+        Args:
+            src_texts (List[str]): The input texts in source language.
+        Returns:
+            The output texts in target language, in the same order.
+        """
+        return [self.translate(src_text) for src_text in src_texts]
+
 
 class MarianMachineTranslator(MachineTranslator):
     r"""
     This class is a wrapper for the Marian Machine Translator
     (https://huggingface.co/transformers/model_doc/marian.html).
     Please refer to their doc for supported languages.
+
+    The texts given to :meth:`translate_batch` are sorted by length and
+    translated ``batch_size`` at a time, so that the texts of a batch have
+    similar lengths and little padding.
     """
     def __init__(
             self,
             src_lang: str = 'en',
             tgt_lang: str = 'fr',
-            device: str = "cpu"
+            device: str = "cpu",
+            batch_size: int = 16
     ):
         super().__init__(src_lang, tgt_lang, device)
+        self.batch_size = batch_size
         self.model_name = 'Helsinki-NLP/opus-mt-{src}-{tgt}'.format(
             src=src_lang, tgt=tgt_lang
         )
@@ -75,11 +94,19 @@ class MarianMachineTranslator(MachineTranslator):
         self.model = self.model.to(self.device)
 
     def translate(self, src_text: str) -> str:
-        translated: List[str] = self.model.generate(
-            **self.tokenizer.prepare_seq2seq_batch([src_text]).to(self.device)
-        )
-        tgt_texts: List[str] = [
-            self.tokenizer.decode(t, skip_special_tokens=True)
-            for t in translated
-        ]
-        return tgt_texts[0]
+        return self.translate_batch([src_text])[0]
+
+    def translate_batch(self, src_texts: List[str]) -> List[str]:
+        order = sorted(range(len(src_texts)),
+                       key=lambda i: len(src_texts[i]))
+        tgt_texts: List[str] = [""] * len(src_texts)
+        for begin in range(0, len(order), self.batch_size):
+            indices = order[begin:begin + self.batch_size]
+            translated = self.model.generate(
+                **self.tokenizer.prepare_seq2seq_batch(
+                    [src_texts[i] for i in indices]).to(self.device)
+            )
+            for i, t in zip(indices, translated):
+                tgt_texts[i] = self.tokenizer.decode(
+                    t, skip_special_tokens=True)
+        return tgt_texts
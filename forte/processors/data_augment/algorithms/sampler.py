@@ -11,9 +11,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import random
 from abc import abstractmethod, ABC
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 
 __all__ = [
@@ -26,14 +27,47 @@ __all__ = [
 class Sampler(ABC):
     r"""
     An abstract sampler class.
+
+    Each sampler draws from its own random generator, so that a sampler
+    created with a ``seed`` samples the same words in every run, and does
+    not change the global random state.
+
+    Args:
+        seed: The seed of the random generator of this sampler. By default,
+            the generator is seeded from the system entropy.
+        buffer_size: The number of words drawn at once by :meth:`sample`,
+            which returns them one by one.
     """
-    def __init__(self):
-        random.seed()
+    def __init__(self, seed: Optional[int] = None, buffer_size: int = 1024):
+        if buffer_size < 1:
+            raise ValueError(
+                f"The buffer size should be positive, got {buffer_size}.")
+        self.buffer_size: int = buffer_size
+        self.rng: np.random.Generator = np.random.default_rng(seed)
+        self._buffer: List[str] = []
+
+    def seed(self, seed: Optional[int] = None):
+        r"""Reset the random generator of this sampler with ``seed``."""
+        self.rng = np.random.default_rng(seed)
+        self._buffer = []
 
     @abstractmethod
     def sample(self) -> str:
         raise NotImplementedError
 
+    def sample_n(self, n: int) -> List[str]:
+        r"""Sample ``n`` words. The subclasses draw them with one vectorized
+        operation."""
+        return [self.sample() for _ in range(n)]
+
+    def _sample_buffered(self) -> str:
+        # Draw the words in batches with `sample_n` and return them one by
+        # one, since a single draw costs about as much as a batch.
+        if not self._buffer:
+            self._buffer = self.sample_n(self.buffer_size)
+            self._buffer.reverse()
+        return self._buffer.pop()
+
 
 class UniformSampler(Sampler):
     r"""
@@ -41,32 +75,97 @@ class UniformSampler(Sampler):
 
     Args:
         word_list: A list of words that this sampler uniformly samples from.
+        seed: The seed of the random generator, see :class:`Sampler`.
+        buffer_size: The number of words drawn at once, see
+            :class:`Sampler`.
     """
 
-    def __init__(self, word_list: List[str]):
-        super().__init__()
+    def __init__(self, word_list: List[str], seed: Optional[int] = None,
+                 buffer_size: int = 1024):
+        super().__init__(seed, buffer_size)
+        if len(word_list) == 0:
+            raise ValueError("Cannot sample from an empty word list.")
         self.word_list: List[str] = word_list
 
     def sample(self) -> str:
-        word: str = random.choice(self.word_list)
-        return word
+        return self._sample_buffered()
+
+    def sample_n(self, n: int) -> List[str]:
+        indices = self.rng.integers(len(self.word_list), size=n)
+        return [self.word_list[i] for i in indices.tolist()]
+
+
+def _build_alias_table(weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    r"""Build the alias table of Walker's alias method for the distribution
+    proportional to ``weights``, so that an outcome is sampled in constant
+    time: draw a column ``i`` uniformly, then keep ``i`` with probability
+    ``prob[i]``, or take ``alias[i]`` otherwise.
+
+    Args:
+        weights: The non-negative weights of the outcomes, not all zero.
+
+    Returns:
+        The arrays ``prob`` and ``alias``.
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+    total = weights.sum()
+    if len(weights) == 0 or not np.isfinite(total) or total <= 0 \
+            or (weights < 0).any():
+        raise ValueError(
+            "The weights should be non-negative and finite, with a positive "
+            "sum.")
+
+    num_outcomes = len(weights)
+    # The probability of each outcome, scaled so that the average is 1.
+    scaled = (weights * (num_outcomes / total)).tolist()
+    prob = np.ones(num_outcomes, dtype=np.float64)
+    alias = np.arange(num_outcomes, dtype=np.int64)
+
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        less, more = small.pop(), large[-1]
+        # The column of `less` is filled up by `more`.
+        prob[less] = scaled[less]
+        alias[less] = more
+        scaled[more] -= 1.0 - scaled[less]
+        if scaled[more] < 1.0:
+            small.append(large.pop())
+    # The remaining columns are full, up to the rounding errors.
+    return prob, alias
 
 
 class UnigramSampler(Sampler):
     r"""
     A sampler that samples a word from a unigram distribution.
 
+    The alias table of the distribution is built once when the sampler is
+    created, so each word is sampled in constant time. The changes made to
+    ``unigram`` afterwards are not seen by the sampler.
+
     Args:
         unigram: A dictionary.
             The key is a word, the value is the word count or a probability.
             This sampler samples from this word distribution.
+        seed: The seed of the random generator, see :class:`Sampler`.
+        buffer_size: The number of words drawn at once, see
+            :class:`Sampler`.
     """
 
-    def __init__(self, unigram: Dict[str, float]):
-        super().__init__()
+    def __init__(self, unigram: Dict[str, float], seed: Optional[int] = None,
+                 buffer_size: int = 1024):
+        super().__init__(seed, buffer_size)
         self.unigram: Dict[str, float] = unigram
+        self._words: List[str] = list(unigram.keys())
+        self._prob, self._alias = _build_alias_table(
+            np.fromiter(unigram.values(), dtype=np.float64,
+                        count=len(unigram)))
 
     def sample(self) -> str:
-        word: str = random.choices(list(self.unigram.keys()),
-                                   list(self.unigram.values()))[0]
-        return word
+        return self._sample_buffered()
+
+    def sample_n(self, n: int) -> List[str]:
+        columns = self.rng.integers(len(self._words), size=n)
+        indices = np.where(self.rng.random(n) < self._prob[columns],
+                           columns, self._alias[columns])
+        return [self._words[i] for i in indices.tolist()]
@@ -15,7 +15,7 @@
 Class for data augmentation algorithm. The text replacement op will
 replace a piece of text with data augmentation algorithms.
 """
-from typing import Tuple
+from typing import List, Tuple
 from abc import abstractmethod, ABC
 from ft.onto.base_ontology import Annotation
 from forte.common.configuration import Config
@@ -52,3 +52,17 @@ class TextReplacementOp(ABC):
             The replaced string.
         """
         raise NotImplementedError
+
+    def replace_batch(self, inputs: List[Annotation]) -> List[Tuple[bool, str]]:
+        r"""
+        This function replaces many annotations at once, which lets the
+        subclasses share the work between them, such as running a model on
+        all the inputs together. By default, the inputs are replaced one by
+        one with :func: replace.
+
+        Args:
+            inputs: The annotations containing the input texts.
+        Returns:
+            The results of :func: replace for the inputs, in order.
+        """
+        return [self.replace(input) for input in inputs]
@@ -0,0 +1,143 @@
+# Copyright 2020 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A cache of the translations of machine translation models, addressed by the
+content of the source text, so that the same texts are not translated again.
+"""
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional, Sequence
+
+__all__ = [
+    "TranslationCache",
+    "translate_with_cache",
+]
+
+
+class TranslationCache:
+    r"""
+    The translations of source texts, keyed by a hash of the translator and
+    the text. With a ``path``, the cache is loaded from the file and the new
+    translations are appended to it as JSON lines by :meth:`flush`, so that
+    running the same augmentation again does not translate the texts again.
+    The file is only opened while it is written.
+
+    Args:
+        path (str, optional): The path of the cache file. Without it, the
+            cache is only kept in memory.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path: Optional[str] = path
+        self._translations: Dict[str, str] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+        # The lines of the new translations not yet written to the file.
+        self._unwritten: List[str] = []
+        if path is not None and os.path.exists(path):
+            with open(path, encoding="utf-8") as cache_file:
+                for line in cache_file:
+                    if line.strip():
+                        key, translation = json.loads(line)
+                        self._translations[key] = translation
+
+    def __len__(self):
+        return len(self._translations)
+
+    @staticmethod
+    def key(translator_id: str, text: str) -> str:
+        r"""The key of the translation of ``text`` by the translator
+        identified by ``translator_id``."""
+        return hashlib.sha256(
+            f"{translator_id}\0{text}".encode("utf-8")).hexdigest()
+
+    def get(self, translator_id: str, text: str) -> Optional[str]:
+        r"""The cached translation of ``text``, or `None`."""
+        translation = self._translations.get(self.key(translator_id, text))
+        if translation is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return translation
+
+    def put(self, translator_id: str, text: str, translation: str):
+        r"""Cache the translation of ``text``."""
+        key = self.key(translator_id, text)
+        if self._translations.get(key) == translation:
+            return
+        self._translations[key] = translation
+        if self.path is not None:
+            self._unwritten.append(json.dumps([key, translation]) + "\n")
+
+    def flush(self):
+        r"""Append the new translations to the cache file."""
+        if self._unwritten:
+            with open(self.path, "a", encoding="utf-8") as cache_file:
+                cache_file.writelines(self._unwritten)
+            self._unwritten = []
+
+    def close(self):
+        r"""Write the remaining translations to the cache file."""
+        self.flush()
+
+
+def _translator_id(translator) -> str:
+    return "/".join([
+        type(translator).__module__, type(translator).__qualname__,
+        str(getattr(translator, "model_name", "")),
+        str(getattr(translator, "src_lang", "")),
+        str(getattr(translator, "tgt_lang", ""))])
+
+
+def translate_with_cache(translator, src_texts: Sequence[str],
+                         cache: Optional[TranslationCache] = None
+                         ) -> List[str]:
+    r"""
+    Translate ``src_texts`` with one call to the ``translate_batch`` of the
+    translator (see :meth:`MachineTranslator.translate_batch`), which only
+    receives the distinct texts missing from the cache.
+
+    Args:
+        translator: The machine translator.
+        src_texts: The texts in the source language.
+        cache: The cache of the translations, updated with the new ones.
+
+    Returns:
+        The translations, in the order of ``src_texts``.
+    """
+    translator_id = _translator_id(translator)
+    translations: Dict[str, str] = {}
+    # The distinct missing texts, in order.
+    missing: Dict[str, None] = {}
+    for text in src_texts:
+        if text in translations or text in missing:
+            continue
+        translation = None if cache is None else cache.get(
+            translator_id, text)
+        if translation is None:
+            missing[text] = None
+        else:
+            translations[text] = translation
+
+    if missing:
+        for text, translation in zip(
+                missing, translator.translate_batch(list(missing))):
+            translations[text] = translation
+            if cache is not None:
+                cache.put(translator_id, text, translation)
+        if cache is not None:
+            cache.flush()
+    return [translations[text] for text in src_texts]
@@ -26,6 +26,8 @@ from forte.data.data_pack import DataPack
 from forte.data.ontology import Annotation
 from forte.data.types import DataRequest
 from forte.models.ner import utils
+from forte.models.ner.feature_extractor import (
+    NERFeatureExtractor, TokenFeatures)
 from forte.models.ner.model_factory import BiRecurrentConvCRF
 from forte.processors.base.batch_processor import FixedSizeBatchProcessor
 from ft.onto.base_ontology import Token, Sentence, EntityMention
@@ -53,6 +55,7 @@ class CoNLLNERPredictor(FixedSizeBatchProcessor):
         self.config_model = None
         self.config_data = None
         self.normalize_func = None
+        self.feature_extractor: Optional[NERFeatureExtractor] = None
         self.device = None
 
         self.train_instances_cache = []
@@ -99,6 +102,10 @@ class CoNLLNERPredictor(FixedSizeBatchProcessor):
                 else torch.device('cpu')
 
         self.normalize_func = utils.normalize_digit_word
+        self.feature_extractor = NERFeatureExtractor(
+            self.word_alphabet, self.char_alphabet,
+            self.config_data.max_char_length, self.config_data.num_char_pad,
+            self.normalize_func, self.config_data.feature_cache_size)
 
         if "model" not in self.resource.keys():
             def load_model(path):
@@ -125,22 +132,8 @@ class CoNLLNERPredictor(FixedSizeBatchProcessor):
             -> Dict[str, Dict[str, List[np.array]]]:
         tokens = data_batch["Token"]
 
-        instances = []
-        for words in tokens["text"]:
-            char_id_seqs = []
-            word_ids = []
-            for word in words:
-                char_ids = []
-                for char in word:
-                    char_ids.append(self.char_alphabet.get_index(char))
-                if len(char_ids) > self.config_data.max_char_length:
-                    char_ids = char_ids[: self.config_data.max_char_length]
-                char_id_seqs.append(char_ids)
-
-                word = self.normalize_func(word)
-                word_ids.append(self.word_alphabet.get_index(word))
-
-            instances.append((word_ids, char_id_seqs))
+        instances = [self.feature_extractor.extract(words)
+                     for words in tokens["text"]]
 
         self.model.eval()
         batch_data = self.get_batch_tensor(instances, device=self.device)
@@ -214,69 +207,22 @@ class CoNLLNERPredictor(FixedSizeBatchProcessor):
                     entity.ner_type = current_entity_mention[1]
 
     def get_batch_tensor(
-            self, data: List[Tuple[List[int], List[List[int]]]],
+            self, data: List[TokenFeatures],
             device: Optional[torch.device] = None) -> \
             Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
-        """Get the tensors to be fed into the model.
+        """Get the tensors to be fed into the model, see ``get_batch_tensor``
+        of :class:`~forte.models.ner.feature_extractor.NERFeatureExtractor`.
 
         Args:
-            data: A list of tuple (word_ids, char_id_sequences)
+            data: A list of tuple (word_ids, char_ids, char_lengths), from
+                the ``extract`` method of
+                :class:`~forte.models.ner.feature_extractor.NERFeatureExtractor`
             device: The device for the tensors.
 
         Returns:
-            A tuple where
-
-            - ``words``: A tensor of shape `[batch_size, batch_length]`
-              representing the word ids in the batch
-            - ``chars``: A tensor of shape
-              `[batch_size, batch_length, char_length]` representing the char
-              ids for each word in the batch
-            - ``masks``: A tensor of shape `[batch_size, batch_length]`
-              representing the indices to be masked in the batch. 1 indicates
-              no masking.
-            - ``lengths``: A tensor of shape `[batch_size]` representing the
-              length of each sentences in the batch
+            A tuple of ``words``, ``chars``, ``masks`` and ``lengths``.
         """
-        batch_size = len(data)
-        batch_length = max([len(d[0]) for d in data])
-        char_length = max(
-            [max([len(charseq) for charseq in d[1]]) for d in data]
-        )
-
-        char_length = min(
-            self.config_data.max_char_length,
-            char_length + self.config_data.num_char_pad,
-        )
-
-        wid_inputs = np.empty([batch_size, batch_length], dtype=np.int64)
-        cid_inputs = np.empty(
-            [batch_size, batch_length, char_length], dtype=np.int64
-        )
-
-        masks = np.zeros([batch_size, batch_length], dtype=np.float32)
-
-        lengths = np.empty(batch_size, dtype=np.int64)
-
-        for i, inst in enumerate(data):
-            wids, cid_seqs = inst
-
-            inst_size = len(wids)
-            lengths[i] = inst_size
-            # word ids
-            wid_inputs[i, :inst_size] = wids
-            wid_inputs[i, inst_size:] = self.word_alphabet.pad_id
-            for c, cids in enumerate(cid_seqs):
-                cid_inputs[i, c, : len(cids)] = cids
-                cid_inputs[i, c, len(cids):] = self.char_alphabet.pad_id
-            cid_inputs[i, inst_size:, :] = self.char_alphabet.pad_id
-            masks[i, :inst_size] = 1.0
-
-        words = torch.from_numpy(wid_inputs).to(device)
-        chars = torch.from_numpy(cid_inputs).to(device)
-        masks = torch.from_numpy(masks).to(device)
-        lengths = torch.from_numpy(lengths).to(device)
-
-        return words, chars, masks, lengths
+        return self.feature_extractor.get_batch_tensor(data, device)
 
     # TODO: change this to manageable size
     @classmethod
@@ -284,8 +230,6 @@ class CoNLLNERPredictor(FixedSizeBatchProcessor):
         r"""Default config for NER Predictor"""
 
         configs = super().default_configs()
-        # TODO: Batcher in NER need to be update to use the sytem one.
-        configs["batcher"] = {"batch_size": 10}
 
         more_configs = {
             "config_data": {
@@ -296,7 +240,8 @@ class CoNLLNERPredictor(FixedSizeBatchProcessor):
                 "batch_size_tokens": 512,
                 "test_batch_size": 16,
                 "max_char_length": 45,
-                "num_char_pad": 2
+                "num_char_pad": 2,
+                "feature_cache_size": 100000
             },
             "config_model": {
                 "output_hidden_size": 128,
@@ -340,11 +285,9 @@ class CoNLLNERPredictor(FixedSizeBatchProcessor):
                 },
                 "model_path": "",
                 "resource_dir": ""
-            },
-            "batcher": {
-                "batch_size": 16
             }
         }
 
         configs.update(more_configs)
+        configs["batcher"]["batch_size"] = 16
         return configs
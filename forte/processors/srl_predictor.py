@@ -151,8 +151,6 @@ class SRLPredictor(FixedSizeBatchProcessor):
         configs = super().default_configs()
         configs.update({
             'storage_path': None,
-            "batcher": {
-                "batch_size": 4
-            }
         })
+        configs["batcher"]["batch_size"] = 4
         return configs
@@ -32,6 +32,8 @@ from tqdm import tqdm
 from forte.common.configuration import Config
 from forte.common.resources import Resources
 from forte.models.ner import utils
+from forte.models.ner.feature_extractor import (
+    NERFeatureExtractor, TokenFeatures, pad_flat)
 from forte.models.ner.model_factory import BiRecurrentConvCRF
 from forte.trainer.base.base_trainer import BaseTrainer
 from ft.onto.base_ontology import Token, Sentence
@@ -55,6 +57,7 @@ class CoNLLNERTrainer(BaseTrainer):
         self.config_model = None
         self.config_data = None
         self.normalize_func = None
+        self.feature_extractor: Optional[NERFeatureExtractor] = None
 
         self.device = None
         self.optim, self.trained_epochs = None, None
@@ -92,6 +95,12 @@ class CoNLLNERTrainer(BaseTrainer):
         self.config_data = configs.config_data
 
         self.normalize_func = utils.normalize_digit_word
+        self.feature_extractor = NERFeatureExtractor(
+            self.word_alphabet, self.char_alphabet,
+            self.config_data.max_char_length, self.config_data.num_char_pad,
+            self.normalize_func,
+            # The same default as the configs of CoNLLNERPredictor.
+            self.config_data.get("feature_cache_size", 100000))
 
         self.device = torch.device("cuda") if torch.cuda.is_available() \
             else torch.device("cpu")
@@ -143,28 +152,17 @@ class CoNLLNERTrainer(BaseTrainer):
         """
 
         tokens = instance["Token"]
-        word_ids = []
-        char_id_seqs = []
-        ner_tags, ner_ids = tokens["ner"], []
+        word_ids, char_ids, char_lengths = self.feature_extractor.extract(
+            tokens["text"])
+        ner_ids = np.array(
+            [self.ner_alphabet.get_index(ner) for ner in tokens["ner"]],
+            dtype=np.int64)
 
-        for word in tokens["text"]:
-            char_ids = []
-            for char in word:
-                char_ids.append(self.char_alphabet.get_index(char))
-            if len(char_ids) > self.config_data.max_char_length:
-                char_ids = char_ids[: self.config_data.max_char_length]
-            char_id_seqs.append(char_ids)
+        self.max_char_length = max(
+            self.max_char_length, int(char_lengths.max()))
 
-            word = self.normalize_func(word)
-            word_ids.append(self.word_alphabet.get_index(word))
-
-        for ner in ner_tags:
-            ner_ids.append(self.ner_alphabet.get_index(ner))
-
-        max_len = max([len(char_seq) for char_seq in char_id_seqs])
-        self.max_char_length = max(self.max_char_length, max_len)
-
-        self.train_instances_cache.append((word_ids, char_id_seqs, ner_ids))
+        self.train_instances_cache.append(
+            (word_ids, char_ids, char_lengths, ner_ids))
 
     def epoch_finish_action(self, epoch):
         """
@@ -348,14 +346,18 @@ class CoNLLNERTrainer(BaseTrainer):
         self.optim.load_state_dict(ckpt["optimizer"])
 
     def get_batch_tensor(
-            self, data: List[Tuple[List[int], List[List[int]], List[int]]],
+            self, data: List[Tuple[np.ndarray, np.ndarray, np.ndarray,
+                                   np.ndarray]],
             device: Optional[torch.device] = None) -> \
             Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor,
                   torch.Tensor]:
         """Get the tensors to be fed into the model.
 
         Args:
-            data: A list of tuple (word_ids, char_id_sequences, ner_ids)
+            data: A list of tuple (word_ids, char_ids, char_lengths, ner_ids),
+                where the first three are the features from the ``extract``
+                method of
+                :class:`~forte.models.ner.feature_extractor.NERFeatureExtractor`
             device: The device for the tensors.
 
         Returns:
@@ -374,52 +376,15 @@ class CoNLLNERTrainer(BaseTrainer):
             - ``lengths``: A tensor of shape `[batch_size]` representing the
               length of each sentences in the batch
         """
-        batch_size = len(data)
-        batch_length = max([len(d[0]) for d in data])
-        char_length = max(
-            [max([len(charseq) for charseq in d[1]]) for d in data]
-        )
-
-        char_length = min(
-            self.config_data.max_char_length,
-            char_length + self.config_data.num_char_pad,
-        )
-
-        wid_inputs = np.empty([batch_size, batch_length], dtype=np.int64)
-        cid_inputs = np.empty(
-            [batch_size, batch_length, char_length], dtype=np.int64
-        )
-        nid_inputs = np.empty([batch_size, batch_length], dtype=np.int64)
-
-        masks = np.zeros([batch_size, batch_length], dtype=np.float32)
-
-        lengths = np.empty(batch_size, dtype=np.int64)
-
-        for i, inst in enumerate(data):
-            wids, cid_seqs, nids = inst
-
-            inst_size = len(wids)
-            lengths[i] = inst_size
-            # word ids
-            wid_inputs[i, :inst_size] = wids
-            wid_inputs[i, inst_size:] = self.word_alphabet.pad_id
-            for c, cids in enumerate(cid_seqs):
-                cid_inputs[i, c, : len(cids)] = cids
-                cid_inputs[i, c, len(cids):] = self.char_alphabet.pad_id
-            cid_inputs[i, inst_size:, :] = self.char_alphabet.pad_id
-            # ner ids
-            nid_inputs[i, :inst_size] = nids
-            nid_inputs[i, inst_size:] = self.ner_alphabet.pad_id
-            # masks
-            masks[i, :inst_size] = 1.0
-
-        words = torch.from_numpy(wid_inputs).to(device)
-        chars = torch.from_numpy(cid_inputs).to(device)
-        ners = torch.from_numpy(nid_inputs).to(device)
-        masks = torch.from_numpy(masks).to(device)
-        lengths = torch.from_numpy(lengths).to(device)
-
-        return words, chars, ners, masks, lengths
+        features: List[TokenFeatures] = [d[:3] for d in data]
+        words, chars, masks, lengths = \
+            self.feature_extractor.get_batch_arrays(features)
+        ners = pad_flat(np.concatenate([d[3] for d in data]), lengths,
+                        self.ner_alphabet.pad_id)
+
+        return tuple(  # type: ignore
+            torch.from_numpy(array).to(device)
+            for array in (words, chars, ners, masks, lengths))
 
 
 def _batch_size_fn(new: Tuple, count: int, _: int):
@@ -17,7 +17,8 @@ Utility functions
 from functools import wraps
 from inspect import getfullargspec
 from pydoc import locate
-from typing import Dict, List, Optional, get_type_hints
+from typing import (
+    Any, Callable, Dict, List, Optional, Tuple, get_type_hints)
 
 from typing_inspect import is_union_type, get_origin
 
@@ -28,6 +29,7 @@ __all__ = [
     "get_qual_name",
     "create_class_with_kwargs",
     "check_type",
+    "compile_type_check",
 ]
 
 
@@ -156,6 +158,39 @@ def check_type(obj, tp):
             return check_type(obj, origin)
 
 
+def _runtime_types(tp) -> Optional[Tuple[type, ...]]:
+    # Flatten the type hint into the classes that `check_type` would test with
+    # `isinstance`, return None if the hint cannot be flattened.
+    if is_union_type(tp):
+        types: Tuple[type, ...] = ()
+        for arg in tp.__args__:
+            arg_types = _runtime_types(arg)
+            if arg_types is None:
+                return None
+            types += arg_types
+        return types
+    origin = get_origin(tp)
+    target = tp if origin is None or origin == tp else origin
+    return (target,) if isinstance(target, type) else None
+
+
+def compile_type_check(tp) -> Callable[[Any], bool]:
+    r"""Compile a type hint into a function that checks a value against it,
+    the function gives the same result as :func:`check_type`, but the type
+    hint is only inspected once.
+
+    Args:
+        tp: The type hint.
+
+    Returns:
+        A function that takes a value and returns whether it matches ``tp``.
+    """
+    types = _runtime_types(tp)
+    if types is None:
+        return lambda obj: check_type(obj, tp)
+    return lambda obj: isinstance(obj, types)
+
+
 def validate_input(func, **kwargs):
     hints = get_type_hints(func)
 
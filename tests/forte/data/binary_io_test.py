@@ -0,0 +1,244 @@
+# Copyright 2020 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the binary pack serialization format.
+"""
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from typing import List
+
+import numpy as np
+from ddt import ddt, data
+
+from forte.data.binary_io import is_binary_pack
+from forte.data.data_pack import DataPack
+from forte.data.data_utils import deserialize
+from forte.data.multi_pack import MultiPack, MultiPackLink
+from forte.data.readers import (
+    OntonotesReader, CoNLL03Reader, RecursiveDirectoryDeserializeReader,
+    PlainTextReader)
+from forte.pipeline import Pipeline
+from forte.processors.writers import PackNameJsonPackWriter
+from ft.onto.base_ontology import (
+    Token, Sentence, PredicateLink, CoreferenceGroup, EntityMention)
+from tests.utils import performance_test
+
+ONTONOTES_PATH = "data_samples/ontonotes/00"
+CONLL_PATH = "data_samples/conll03"
+
+
+def _read_packs(reader, path: str) -> List[DataPack]:
+    pipeline = Pipeline[DataPack]()
+    pipeline.set_reader(reader)
+    pipeline.initialize()
+    return list(pipeline.process_dataset(path))
+
+
+def _sort_sets(value):
+    # The iteration order of sets is not part of the content.
+    if isinstance(value, dict):
+        if "py/set" in value:
+            return sorted(value["py/set"], key=str)
+        return {k: _sort_sets(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_sort_sets(v) for v in value]
+    return value
+
+
+def _normalized(pack) -> dict:
+    # Compare the packs through their jsonpickle form, which covers all the
+    # entries, attributes and records.
+    return _sort_sets(json.loads(pack.serialize()))
+
+
+@ddt
+class BinarySerializationTest(unittest.TestCase):
+
+    def setUp(self):
+        self.ontonotes_packs = _read_packs(OntonotesReader(), ONTONOTES_PATH)
+        self.conll_packs = _read_packs(CoNLL03Reader(), CONLL_PATH)
+
+    @data("ontonotes", "conll")
+    def test_round_trip(self, dataset):
+        packs = (self.ontonotes_packs if dataset == "ontonotes"
+                 else self.conll_packs)
+        self.assertGreater(len(packs), 0)
+
+        for pack in packs:
+            binary = pack.serialize(serialize_method="binary")
+            self.assertTrue(is_binary_pack(binary))
+
+            new_pack: DataPack = deserialize(binary)
+            self.assertEqual(pack.text, new_pack.text)
+            self.assertEqual(pack.pack_name, new_pack.pack_name)
+            self.assertEqual(pack.pack_id, new_pack.pack_id)
+            self.assertEqual(pack.creation_records, new_pack.creation_records)
+            self.assertEqual(pack.field_records, new_pack.field_records)
+            self.assertEqual(_normalized(pack), _normalized(new_pack))
+
+            for s1, s2 in zip(pack.get(Sentence), new_pack.get(Sentence)):
+                self.assertEqual(
+                    [(t.tid, t.text, t.pos, t.ner)
+                     for t in pack.get(Token, s1)],
+                    [(t.tid, t.text, t.pos, t.ner)
+                     for t in new_pack.get(Token, s2)])
+
+    def test_links_and_groups(self):
+        pack = self.ontonotes_packs[0]
+        new_pack: DataPack = deserialize(
+            pack.serialize(serialize_method="binary"))
+
+        for l1, l2 in zip(pack.get(PredicateLink), new_pack.get(PredicateLink)):
+            self.assertEqual(l1.get_parent().text, l2.get_parent().text)
+            self.assertEqual(l1.get_child().text, l2.get_child().text)
+            self.assertEqual(l1.arg_type, l2.arg_type)
+
+        for g1, g2 in zip(pack.get(CoreferenceGroup),
+                          new_pack.get(CoreferenceGroup)):
+            self.assertEqual(
+                sorted(m.text for m in g1.get_members()),
+                sorted(m.text for m in g2.get_members()))
+
+        # The deserialized pack can still be modified.
+        em = EntityMention(new_pack, 0, 3)
+        em.ner_type = "test"
+        new_pack.add_entry(em)
+        self.assertEqual(
+            len(list(new_pack.get(EntityMention))),
+            len(list(pack.get(EntityMention))) + 1)
+
+    def test_embedding_and_missing_fields(self):
+        pack = DataPack()
+        pack.set_text("Some text here.")
+        t1 = Token(pack, 0, 4)
+        # pylint: disable=protected-access
+        t1._embedding = np.array([0.5, 1.5])
+        t2 = Token(pack, 5, 9)
+        t2.ud_features = {"Number": "Sing"}
+        pack.add_all_remaining_entries()
+
+        new_pack: DataPack = deserialize(
+            pack.serialize(serialize_method="binary"))
+        tokens = list(new_pack.get(Token))
+        self.assertEqual(tokens[0].embedding.tolist(), [0.5, 1.5])
+        self.assertEqual(len(tokens[1].embedding), 0)
+        self.assertEqual(tokens[1].ud_features, {"Number": "Sing"})
+
+    def test_multi_pack(self):
+        m_pack = MultiPack()
+        left = m_pack.add_pack("left")
+        right = m_pack.add_pack("right")
+        left.set_text("left text")
+        right.set_text("right text")
+        lt = Token(left, 0, 4)
+        rt = Token(right, 0, 5)
+        left.add_all_remaining_entries()
+        right.add_all_remaining_entries()
+        m_pack.add_entry(MultiPackLink(m_pack, lt, rt))
+
+        new_m_pack: MultiPack = deserialize(
+            m_pack.serialize(serialize_method="binary"))
+        for p in m_pack.packs:
+            new_m_pack.packs.append(
+                deserialize(p.serialize(serialize_method="binary")))
+
+        self.assertEqual(new_m_pack.pack_names, {"left", "right"})
+        link: MultiPackLink = new_m_pack.get_single(MultiPackLink)
+        self.assertEqual(link.get_parent().text, "left")
+        self.assertEqual(link.get_child().text, "right")
+
+    def test_write_and_read(self):
+        output_path = tempfile.mkdtemp()
+        try:
+            pipeline = Pipeline[DataPack]()
+            pipeline.set_reader(OntonotesReader())
+            pipeline.add(PackNameJsonPackWriter(), {
+                'output_dir': output_path,
+                'serialize_method': 'binary',
+            })
+            pipeline.run(ONTONOTES_PATH)
+
+            written = [f for _, _, files in os.walk(output_path)
+                       for f in files]
+            self.assertTrue(all(f.endswith('.bin') for f in written))
+
+            read_back = _read_packs(
+                RecursiveDirectoryDeserializeReader(), output_path)
+            # The suffix defaults to .json, so nothing is read.
+            self.assertEqual(len(read_back), 0)
+
+            pipeline = Pipeline[DataPack]()
+            pipeline.set_reader(RecursiveDirectoryDeserializeReader(),
+                                {"suffix": ".bin"})
+            pipeline.initialize()
+            read_back = list(pipeline.process_dataset(output_path))
+
+            self.assertEqual(
+                sorted(p.pack_name for p in read_back),
+                sorted(p.pack_name for p in self.ontonotes_packs))
+        finally:
+            shutil.rmtree(output_path)
+
+    def test_binary_cache(self):
+        cache_dir = tempfile.mkdtemp()
+        try:
+            packs = _read_packs(
+                PlainTextReader(cache_directory=cache_dir,
+                                serialize_method="binary"),
+                "data_samples/base_reader_test")
+            cached = _read_packs(
+                PlainTextReader(from_cache=True, cache_directory=cache_dir,
+                                serialize_method="binary"),
+                "data_samples/base_reader_test")
+            self.assertEqual(sorted(p.text for p in packs),
+                             sorted(p.text for p in cached))
+        finally:
+            shutil.rmtree(cache_dir)
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            self.conll_packs[0].serialize(serialize_method="unknown")
+
+    @performance_test
+    @data("ontonotes", "conll")
+    def test_speed_and_size(self, dataset):
+        packs = (self.ontonotes_packs if dataset == "ontonotes"
+                 else self.conll_packs)
+        repeat = 20
+
+        def _bench(method):
+            start = time.time()
+            size = 0
+            for _ in range(repeat):
+                for pack in packs:
+                    serialized = pack.serialize(serialize_method=method)
+                    size += len(serialized)
+                    deserialize(serialized)
+            return time.time() - start, size // repeat
+
+        json_time, json_size = _bench("jsonpickle")
+        bin_time, bin_size = _bench("binary")
+
+        print(f"{dataset}: jsonpickle {json_size} bytes {json_time:.3f}s, "
+              f"binary {bin_size} bytes {bin_time:.3f}s")
+        self.assertLess(bin_size, json_size)
+        self.assertLess(bin_time, json_time)
+
+
+if __name__ == '__main__':
+    unittest.main()
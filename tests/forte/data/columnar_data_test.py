@@ -0,0 +1,240 @@
+# Copyright 2020 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the columnar data and batches.
+"""
+import time
+import unittest
+from typing import Dict, List, Optional, Type
+
+import numpy as np
+from ddt import ddt, data
+
+from forte.common.configuration import Config
+from forte.data.batchers import FixedSizeDataPackBatcher
+from forte.data.data_pack import DataPack
+from forte.data.data_utils_io import (
+    RaggedColumns, merge_batches, slice_batch, batch_instances)
+from forte.data.readers import OntonotesReader
+from forte.data.types import DataRequest
+from forte.pipeline import Pipeline
+from forte.processors.base import FixedSizeBatchProcessor
+from ft.onto.base_ontology import (
+    Token, Sentence, EntityMention, PredicateMention, PredicateArgument,
+    PredicateLink)
+from tests.utils import performance_test
+
+ONTONOTES_PATH = "data_samples/ontonotes/00"
+
+REQUEST: DataRequest = {
+    Token: ["pos"],
+    EntityMention: {"fields": ["ner_type", "context_span"], "unit": "Token"},
+    PredicateMention: [],
+    PredicateArgument: [],
+    PredicateLink: ["arg_type"],
+}
+
+
+def _read_packs() -> List[DataPack]:
+    pipeline = Pipeline[DataPack]()
+    pipeline.set_reader(OntonotesReader())
+    pipeline.initialize()
+    return list(pipeline.process_dataset(ONTONOTES_PATH))
+
+
+def _row_value(instance: Dict, field: str) -> np.ndarray:
+    # The row data stores the spans as one (n, 2) array.
+    if field == "span":
+        return np.stack(
+            [instance["begin"], instance["end"]], axis=-1).reshape(-1, 2)
+    return instance[field]
+
+
+class ColumnarEntityExtractor(FixedSizeBatchProcessor):
+    r"""Records the batches it receives, and the tids of the entity mentions
+    it is asked to pack."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches: List[Dict] = []
+        self.packed: Dict[str, List[int]] = {}
+
+    @staticmethod
+    def _define_context() -> Type[Sentence]:
+        return Sentence
+
+    @staticmethod
+    def _define_input_info() -> DataRequest:
+        return REQUEST
+
+    def predict(self, data_batch: Dict) -> Dict:
+        self.batches.append(data_batch)
+        return {"EntityMention": data_batch["EntityMention"]}
+
+    def pack(self, pack: DataPack, inputs: Optional[Dict] = None):
+        if inputs is None:
+            return
+        self.packed.setdefault(pack.pack_name, []).extend(
+            inputs["EntityMention"]["tid"].tolist())
+
+    @classmethod
+    def default_configs(cls):
+        configs = super().default_configs()
+        configs["batcher"] = {"batch_size": 7, "columnar": True}
+        return configs
+
+
+@ddt
+class ColumnarDataTest(unittest.TestCase):
+
+    def setUp(self):
+        self.packs = _read_packs()
+
+    def test_same_as_get_data(self):
+        for pack in self.packs:
+            rows = list(pack.get_data(Sentence, REQUEST, skip_k=1))
+            columns = pack.get_columnar_data(Sentence, REQUEST, skip_k=1)
+
+            self.assertEqual(len(rows), len(columns["context"]))
+            self.assertEqual(columns["offset"].dtype, np.int64)
+            for i, row in enumerate(rows):
+                self.assertEqual(row["context"], columns["context"][i])
+                self.assertEqual(row["offset"], columns["offset"][i])
+                self.assertEqual(row["tid"], columns["tid"][i])
+
+                for type_name in ("Token", "EntityMention", "PredicateMention",
+                                  "PredicateArgument", "PredicateLink"):
+                    instance = columns[type_name].instance(i)
+                    for field, value in row[type_name].items():
+                        self.assertEqual(
+                            np.asarray(value).tolist(),
+                            _row_value(instance, field).tolist(),
+                            f"{type_name}.{field} of instance {i}")
+
+    def test_missing_parent(self):
+        with self.assertRaises(KeyError):
+            self.packs[0].get_columnar_data(
+                Sentence, {PredicateLink: []})
+
+    def test_ragged_columns(self):
+        columns = self.packs[0].get_columnar_data(Sentence, REQUEST)
+        tokens: RaggedColumns = columns["Token"]
+        num = tokens.num_instances
+        self.assertEqual(tokens.lengths().sum(), len(tokens["tid"]))
+
+        head = tokens.slice(0, 3)
+        tail = tokens.slice(3, num - 3)
+        self.assertEqual(head.offsets[0], 0)
+        self.assertEqual(tail.offsets[0], 0)
+        self.assertEqual(head.num_instances + tail.num_instances, num)
+
+        merged = RaggedColumns.concatenate([head, tail])
+        self.assertEqual(merged.offsets.tolist(), tokens.offsets.tolist())
+        for key in tokens:
+            self.assertEqual(merged[key].tolist(), tokens[key].tolist())
+
+        for i, split in enumerate(tokens.split("text")):
+            self.assertEqual(split.tolist(), tokens.instance(i)["text"].tolist())
+
+    def test_merge_and_slice_batches(self):
+        columns = self.packs[0].get_columnar_data(Sentence, REQUEST)
+        num = len(columns["context"])
+
+        batch = merge_batches(
+            [{}, slice_batch(columns, 0, 5), slice_batch(columns, 5, num - 5)])
+        self.assertEqual(batch.keys(), columns.keys())
+        self.assertEqual(batch["context"].tolist(), columns["context"].tolist())
+        self.assertEqual(batch["EntityMention"]["unit_span"].tolist(),
+                         columns["EntityMention"]["unit_span"].tolist())
+
+        # The row batches are still supported.
+        rows = list(self.packs[0].get_data(Sentence, REQUEST))
+        row_batch = merge_batches(
+            [batch_instances(rows[:5]), batch_instances(rows[5:])])
+        self.assertEqual(len(row_batch["context"]), num)
+        self.assertEqual(len(slice_batch(row_batch, 2, 3)["context"]), 3)
+
+    @data(1, 7, 1000)
+    def test_batcher(self, batch_size):
+        row_batcher = FixedSizeDataPackBatcher()
+        row_batcher.initialize(Config(
+            {"batch_size": batch_size}, row_batcher.default_configs()))
+        col_batcher = FixedSizeDataPackBatcher()
+        col_batcher.initialize(Config(
+            {"batch_size": batch_size, "columnar": True},
+            col_batcher.default_configs()))
+
+        for pack in self.packs:
+            row_batches = list(row_batcher.get_batch(pack, Sentence, REQUEST))
+            col_batches = list(col_batcher.get_batch(pack, Sentence, REQUEST))
+            self.assertEqual(row_batcher.current_batch_sources,
+                             col_batcher.current_batch_sources)
+
+            self.assertEqual(len(row_batches), len(col_batches))
+            for row_batch, col_batch in zip(row_batches, col_batches):
+                self.assertEqual(list(row_batch["context"]),
+                                 col_batch["context"].tolist())
+                self.assertEqual(
+                    [t.tolist() for t in row_batch["Token"]["text"]],
+                    [t.tolist() for t in col_batch["Token"].split("text")])
+
+        row_rest = list(row_batcher.flush())
+        col_rest = list(col_batcher.flush())
+        self.assertEqual(len(row_rest), len(col_rest))
+
+    def test_pipeline(self):
+        processor = ColumnarEntityExtractor()
+        pipeline = Pipeline[DataPack]()
+        pipeline.set_reader(OntonotesReader())
+        pipeline.add(processor)
+        pipeline.initialize()
+
+        packs = list(pipeline.process_dataset(ONTONOTES_PATH))
+        self.assertTrue(all(len(b["context"]) <= 7 for b in processor.batches))
+        self.assertEqual(
+            sum(len(b["context"]) for b in processor.batches),
+            sum(len(list(p.get(Sentence))) for p in packs))
+
+        # The results are scattered back to the packs they come from.
+        for pack in packs:
+            expected = [e.tid for s in pack.get(Sentence)
+                        for e in pack.get(EntityMention, s)]
+            self.assertEqual(processor.packed.get(pack.pack_name, []),
+                             expected)
+
+    @performance_test
+    def test_batching_speed(self):
+        request: DataRequest = {Token: ["pos"]}
+        repeat = 20
+        timings = {}
+        for columnar in (False, True):
+            batcher = FixedSizeDataPackBatcher()
+            batcher.initialize(Config(
+                {"batch_size": 1000, "columnar": columnar},
+                batcher.default_configs()))
+            start = time.time()
+            for _ in range(repeat):
+                for pack in self.packs:
+                    for _ in batcher.get_batch(pack, Sentence, request):
+                        pass
+                list(batcher.flush())
+            timings["columnar" if columnar else "rows"] = time.time() - start
+
+        print("Batching of Token data: "
+              + ", ".join(f"{k} {v:.3f}s" for k, v in timings.items()))
+        self.assertLess(timings["columnar"], timings["rows"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,20 +16,39 @@ Unit tests for data pack related operations.
 """
 import os
 import logging
+import random
+import time
 import unittest
-from typing import List, Tuple
+from typing import List, Tuple, Optional, Type
+
+from ddt import ddt, data
 
 from forte.data.data_pack import DataPack
+from forte.data.ontology.core import Entry
+from forte.data.ontology.top import Annotation
+from forte.data.span import Span
 from forte.pipeline import Pipeline
 from forte.utils import utils
 from ft.onto.base_ontology import (
     Token, Sentence, Document, EntityMention, PredicateArgument, PredicateLink,
-    PredicateMention, CoreferenceGroup)
+    PredicateMention, CoreferenceGroup, Utterance, Phrase, Dependency)
 from forte.data.readers import OntonotesReader
+from tests.utils import performance_test
 
 logging.basicConfig(level=logging.DEBUG)
 
 
+def _scan_annotations(
+        pack: DataPack, entry_type: Type[Annotation],
+        range_annotation: Optional[Annotation] = None) -> List[Annotation]:
+    # A reference implementation that scans all the annotations.
+    return [a for a in pack.annotations
+            if isinstance(a, entry_type) and (
+                range_annotation is None or (
+                    a.begin >= range_annotation.begin
+                    and a.end <= range_annotation.end))]
+
+
 class DataPackTest(unittest.TestCase):
 
     def setUp(self) -> None:
@@ -178,6 +197,357 @@ class DataPackTest(unittest.TestCase):
         self.assertEqual(len(list(self.data_pack.get_data(Sentence))),
                          num_sent - 1)
 
+    def test_ids_by_type(self):
+        pack = self.data_pack
+        token_ids = {t.tid for t in pack.get(Token)}
+        annotation_ids = {a.tid for a in pack.annotations}
+
+        self.assertEqual(pack.get_ids_by_type(Token), token_ids)
+        self.assertEqual(set(pack.view_ids_by_type(Token)), token_ids)
+        self.assertEqual(pack.get_ids_by_type(Annotation), annotation_ids)
+
+        view = pack.view_ids_by_type(Annotation)
+        self.assertEqual(len(view), len(annotation_ids))
+        self.assertTrue(all(tid in view for tid in annotation_ids))
+        self.assertEqual(view & token_ids, token_ids)
+        self.assertFalse(hasattr(view, 'add'))
+
+        # The returned set is a copy that does not change the index.
+        ids = pack.get_ids_by_type(Token)
+        ids.clear()
+        self.assertEqual(pack.get_ids_by_type(Token), token_ids)
+
+        # The subclass cache is refreshed when a new type is indexed.
+        subtypes = pack.index.indexed_subtypes(Annotation)
+        self.assertIs(subtypes, pack.index.indexed_subtypes(Annotation))
+        self.assertNotIn(Utterance, subtypes)
+        utterance = Utterance(pack, 0, 3)
+        pack.add_entry(utterance)
+        self.assertIn(Utterance, pack.index.indexed_subtypes(Annotation))
+        self.assertIn(utterance.tid, pack.view_ids_by_type(Annotation))
+
+        pack.delete_entry(utterance)
+        self.assertNotIn(utterance.tid, pack.view_ids_by_type(Annotation))
+        self.assertEqual(len(list(pack.get(Utterance))), 0)
+
+    def test_get_in_span(self):
+        pack = self.data_pack
+        for range_type in (Sentence, EntityMention, Document):
+            for range_annotation in pack.get(range_type):
+                for entry_type in (Token, EntityMention, PredicateMention,
+                                   Phrase, Annotation):
+                    self.assertEqual(
+                        list(pack.get(entry_type, range_annotation)),
+                        _scan_annotations(pack, entry_type, range_annotation))
+
+        for entry_type in (Token, Phrase, Annotation):
+            self.assertEqual(list(pack.get(entry_type)),
+                             _scan_annotations(pack, entry_type))
+
+    def test_span_index_update(self):
+        pack = self.data_pack
+        sentence = pack.get_single(Sentence)
+        num_tokens = len(list(pack.get(Token, sentence)))
+
+        # Zero length and full sentence tokens are in the range.
+        empty = Token(pack, sentence.begin, sentence.begin)
+        full = Token(pack, sentence.begin, sentence.end)
+        outside = Token(pack, sentence.begin, sentence.end + 1)
+        pack.add_all_remaining_entries()
+
+        tokens = list(pack.get(Token, sentence))
+        self.assertEqual(len(tokens), num_tokens + 2)
+        self.assertIn(empty, tokens)
+        self.assertIn(full, tokens)
+        self.assertEqual(tokens, _scan_annotations(pack, Token, sentence))
+
+        for token in (empty, full, outside):
+            pack.delete_entry(token)
+        self.assertEqual(len(list(pack.get(Token, sentence))), num_tokens)
+        self.assertEqual(list(pack.get(Token, sentence)),
+                         _scan_annotations(pack, Token, sentence))
+
+    @performance_test
+    def test_get_in_span_speed(self):
+        pack = DataPack()
+        num_sentences = 5000
+        words = ["word"] * 20
+        pack.set_text(" ".join(words * num_sentences))
+        offset = 0
+        for _ in range(num_sentences):
+            begin = offset
+            for w in words:
+                Token(pack, offset, offset + len(w))
+                EntityMention(pack, offset, offset + len(w))
+                offset += len(w) + 1
+            Sentence(pack, begin, offset - 1)
+        pack.add_all_remaining_entries()
+
+        start = time.time()
+        count = 0
+        for sentence in pack.get(Sentence):
+            count += len(list(pack.get(Token, sentence)))
+        get_time = time.time() - start
+
+        start = time.time()
+        for sentence in list(pack.get(Sentence))[:100]:
+            _scan_annotations(pack, Token, sentence)
+        scan_time = (time.time() - start) * num_sentences / 100
+
+        print(f"Tokens in {num_sentences} sentences: get {get_time:.3f}s, "
+              f"full scan (estimated) {scan_time:.3f}s")
+        self.assertEqual(count, num_sentences * len(words))
+        self.assertLess(get_time, scan_time)
+
+    def _assert_coverage(self, outer_type, inner_type):
+        pack = self.data_pack
+        coverage = pack.index.coverage_index(outer_type, inner_type)
+        self.assertIsNotNone(coverage)
+        expected = {
+            outer.tid: {e.tid for e in pack.get_entries_by_type(inner_type)
+                        if pack.index.in_span(e, outer.span)}
+            for outer in pack.get(outer_type)}
+        self.assertEqual(
+            {k: v for k, v in coverage.items() if v},
+            {k: v for k, v in expected.items() if v})
+        self.assertTrue(set(coverage.keys()) >= set(expected.keys()))
+
+    def test_coverage_index(self):
+        pack = self.data_pack
+        pairs = [(Sentence, Token), (Sentence, EntityMention),
+                 (Sentence, PredicateLink), (Sentence, CoreferenceGroup),
+                 (EntityMention, Token), (Annotation, Annotation)]
+        for outer_type, inner_type in pairs:
+            self.assertIsNone(
+                pack.index.coverage_index(outer_type, inner_type))
+            pack.index.build_coverage_index(pack, outer_type, inner_type)
+            self._assert_coverage(outer_type, inner_type)
+
+        with self.assertRaises(ValueError):
+            pack.index.build_coverage_index(pack, Sentence, Entry)
+
+        # Inner entries are added to the existing indexes.
+        sentence = pack.get_single(Sentence)
+        token = Token(pack, sentence.begin, sentence.begin + 1)
+        mention = EntityMention(pack, sentence.begin, sentence.end)
+        pack.add_all_remaining_entries()
+        for outer_type, inner_type in pairs:
+            self._assert_coverage(outer_type, inner_type)
+        self.assertIn(
+            token.tid,
+            pack.index.coverage_index(Sentence, Token)[sentence.tid])
+        self.assertEqual(
+            list(pack.get(Token, mention)),
+            _scan_annotations(pack, Token, mention))
+
+        # A new outer annotation only drops the indexes of links and groups.
+        pack.add_entry(Sentence(pack, 0, len(pack.text)))
+        for outer_type, inner_type in pairs:
+            if issubclass(inner_type, Annotation):
+                self._assert_coverage(outer_type, inner_type)
+            else:
+                self.assertIsNone(
+                    pack.index.coverage_index(outer_type, inner_type))
+
+        for entry in (token, mention, sentence):
+            pack.delete_entry(entry)
+        for outer_type, inner_type in pairs:
+            if issubclass(inner_type, Annotation):
+                self._assert_coverage(outer_type, inner_type)
+        self.assertNotIn(
+            sentence.tid, pack.index.coverage_index(Sentence, Token))
+
+    @performance_test
+    def test_coverage_index_speed(self):
+        pack = DataPack()
+        num_sentences = 300
+        words = ["word"] * 20
+        pack.set_text(" ".join(words * num_sentences))
+        offset = 0
+        for _ in range(num_sentences):
+            begin = offset
+            prev_token = None
+            for w in words:
+                token = Token(pack, offset, offset + len(w))
+                if prev_token is not None:
+                    Dependency(pack, prev_token, token)
+                prev_token = token
+                offset += len(w) + 1
+            Sentence(pack, begin, offset - 1)
+        pack.add_all_remaining_entries()
+
+        for inner_type in (Token, Dependency):
+            start = time.time()
+            nested = {s.tid: {e.tid for e in pack.get(inner_type, s)}
+                      for s in pack.get(Sentence)}
+            nested_time = time.time() - start
+
+            start = time.time()
+            pack.index.build_coverage_index(pack, Sentence, inner_type)
+            sweep_time = time.time() - start
+            self.assertEqual(
+                pack.index.coverage_index(Sentence, inner_type), nested)
+            print(f"Coverage of {inner_type.__name__} in {num_sentences} "
+                  f"sentences: nested queries {nested_time:.3f}s, "
+                  f"sweep {sweep_time:.3f}s")
+
+        # Adding entries keeps the index instead of building it again.
+        start = time.time()
+        for s in list(pack.get(Sentence)):
+            pack.add_entry(Token(pack, s.begin, s.begin + 1))
+        print(f"Incremental update of {num_sentences} tokens "
+              f"{time.time() - start:.3f}s")
+        self.assertIsNotNone(pack.index.coverage_index(Sentence, Token))
+        self.assertLess(sweep_time, nested_time)
+
+
+def _reference_replace(text: str, operations) -> Tuple[str, List]:
+    # The replacement done by rebuilding the text for each operation.
+    increment = 0
+    mod_text = text
+    spans = []
+    for span, replacement in sorted(operations, key=lambda op: op[0]):
+        begin = span.begin + increment
+        mod_text = mod_text[:begin] + replacement + mod_text[
+            span.end + increment:]
+        increment += len(replacement) - (span.end - span.begin)
+        spans.append((Span(begin, begin + len(replacement)), span))
+    return mod_text, spans
+
+
+def _reference_original_index(pack: DataPack, index: int, is_begin: bool,
+                              mode: str) -> Optional[int]:
+    # Scans all the processed spans, returns None if the index cannot be
+    # aligned.
+    spans = pack.processed_original_spans
+    if len(spans) == 0:
+        return index
+    prev_end = 0
+    for processed, original in spans:
+        if prev_end <= index < processed.begin:
+            return index + original.begin - processed.begin
+        if processed.begin <= index < processed.end:
+            if is_begin and mode in ["backward", "relaxed"]:
+                return original.begin
+            if is_begin and mode == "forward":
+                return original.end
+            if not is_begin and mode == "backward":
+                return original.begin - 1
+            if not is_begin and mode in ["forward", "relaxed"]:
+                return original.end - 1
+            return None
+        prev_end = processed.end
+    processed, original = spans[-1]
+    if processed.end <= index < len(pack.text):
+        return index + original.end - processed.end
+    return None
+
+
+def _random_operations(rng: random.Random, text: str, num_operations: int):
+    positions = sorted(rng.randrange(len(text) + 1)
+                       for _ in range(2 * num_operations))
+    operations = []
+    for i in range(num_operations):
+        begin, end = positions[2 * i], positions[2 * i + 1]
+        if rng.random() < 0.2:
+            end = begin
+        operations.append(
+            (Span(begin, end), "x" * rng.choice([0, 0, 1, 3, 7])))
+    rng.shuffle(operations)
+    return operations
+
+
+@ddt
+class TextReplacementTest(unittest.TestCase):
+
+    @data(0, 1, 2, 3, 4)
+    def test_same_as_reference(self, seed):
+        rng = random.Random(seed)
+        text = "".join(rng.choice("abc <>") for _ in range(200))
+        operations = _random_operations(rng, text, rng.choice([0, 1, 30]))
+        expected_text, expected_spans = _reference_replace(text, operations)
+
+        pack = DataPack()
+        pack.set_text(text, lambda _: list(operations))
+        self.assertEqual(pack.text, expected_text)
+        self.assertEqual(pack.processed_original_spans,
+                         sorted(expected_spans))
+        self.assertEqual(pack.get_original_text(), text)
+
+        spans = [Span(begin, end) for begin in range(len(pack.text) + 1)
+                 for end in range(begin, min(begin + 4, len(pack.text) + 1))]
+        for mode in ["relaxed", "strict", "backward", "forward"]:
+            expected: List[Optional[Span]] = []
+            for span in spans:
+                begin = _reference_original_index(pack, span.begin, True, mode)
+                end = _reference_original_index(
+                    pack, span.end - 1, False, mode)
+                try:
+                    expected.append(Span(begin, end + 1))  # type: ignore
+                except (TypeError, ValueError):
+                    # Not aligned, or aligned to a reversed span.
+                    expected.append(None)
+                if expected[-1] is None:
+                    with self.assertRaises(ValueError):
+                        pack.get_original_span(span, mode)
+                else:
+                    self.assertEqual(
+                        pack.get_original_span(span, mode), expected[-1])
+
+            valid = [span for span, e in zip(spans, expected) if e]
+            self.assertEqual(pack.get_original_spans(valid, mode),
+                             [e for e in expected if e])
+            if len(valid) < len(spans):
+                with self.assertRaises(ValueError):
+                    pack.get_original_spans(spans, mode)
+
+    def test_set_text_again(self):
+        pack = DataPack()
+        pack.set_text("He plays", lambda _: [(Span(0, 2), "She")])
+        self.assertEqual(pack.get_original_span(Span(4, 9)), Span(3, 8))
+        pack.set_text("He plays in the park")
+        self.assertEqual(pack.get_original_span(Span(4, 9)), Span(4, 9))
+        self.assertEqual(pack.get_original_spans([]), [])
+
+    @performance_test
+    def test_replacement_speed(self):
+        rng = random.Random(0)
+        text = "".join(rng.choice("abc <>") for _ in range(200000))
+        operations = _random_operations(rng, text, 5000)
+        start = time.time()
+        expected_text, _ = _reference_replace(text, operations)
+        reference_time = time.time() - start
+
+        start = time.time()
+        pack = DataPack()
+        pack.set_text(text, lambda _: list(operations))
+        replace_time = time.time() - start
+        self.assertEqual(pack.text, expected_text)
+
+        spans = [Span(begin, begin + 1) for begin in range(
+            0, len(pack.text), len(pack.text) // 2000)]
+        start = time.time()
+        expected = [
+            Span(_reference_original_index(pack, s.begin, True, "relaxed"),
+                 _reference_original_index(pack, s.end - 1, False, "relaxed")
+                 + 1) for s in spans]
+        scan_time = time.time() - start
+
+        start = time.time()
+        self.assertEqual([pack.get_original_span(s) for s in spans], expected)
+        bisect_time = time.time() - start
+
+        start = time.time()
+        self.assertEqual(pack.get_original_spans(spans), expected)
+        batch_time = time.time() - start
+
+        print(f"Replace 5000 spans: rebuilding {reference_time:.3f}s, "
+              f"one pass {replace_time:.3f}s. Align {len(spans)} spans: "
+              f"scan {scan_time:.3f}s, bisect {bisect_time:.3f}s, "
+              f"batch {batch_time:.3f}s")
+        self.assertLess(replace_time, reference_time)
+        self.assertLess(bisect_time, scan_time)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,222 @@
+# Copyright 2020 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the copy-on-write data pack views.
+"""
+import copy
+import os
+import time
+import unittest
+from typing import List
+
+import numpy as np
+
+from forte.data.data_pack import DataPack
+from forte.data.data_pack_view import DataPackView
+from forte.data.data_utils import deserialize
+from forte.data.ontology.top import Annotation
+from forte.data.readers import OntonotesReader
+from forte.pipeline import Pipeline
+from ft.onto.base_ontology import (
+    Token, Sentence, EntityMention, PredicateArgument, PredicateLink,
+    PredicateMention, CoreferenceGroup)
+from tests.utils import performance_test
+
+REQUEST = {
+    Token: ["pos", "ner"],
+    EntityMention: {"fields": ["ner_type"], "unit": "Token"},
+    PredicateMention: [],
+    PredicateArgument: [],
+    PredicateLink: ["arg_type"],
+}
+
+
+def _tids(entries) -> List[int]:
+    return [e.tid for e in entries]
+
+
+class DataPackViewTest(unittest.TestCase):
+
+    def setUp(self):
+        data_path = os.path.join(
+            os.path.dirname(__file__), os.pardir, os.pardir,
+            'test_data', 'ontonotes')
+        pipeline: Pipeline = Pipeline()
+        pipeline.set_reader(OntonotesReader())
+        pipeline.initialize()
+        self.pack: DataPack = pipeline.process_one(data_path)
+        self.original = self.pack.serialize()
+
+    def tearDown(self):
+        # The base pack is never changed by the views.
+        self.assertEqual(self.pack.serialize(), self.original)
+
+    def assertSameData(self, pack1: DataPack, pack2: DataPack):
+        data1 = list(pack1.get_data(Sentence, REQUEST))
+        data2 = list(pack2.get_data(Sentence, REQUEST))
+        self.assertEqual(len(data1), len(data2))
+        for instance1, instance2 in zip(data1, data2):
+            self.assertEqual(instance1.keys(), instance2.keys())
+            for key, value in instance1.items():
+                if isinstance(value, dict):
+                    for field, array in value.items():
+                        np.testing.assert_array_equal(
+                            array, instance2[key][field])
+                else:
+                    self.assertEqual(value, instance2[key])
+
+    def test_same_as_base(self):
+        view = self.pack.view()
+        self.assertIsInstance(view, DataPackView)
+        self.assertIs(view.base, self.pack)
+        self.assertEqual(view.text, self.pack.text)
+        self.assertEqual(view.pack_name, self.pack.pack_name)
+
+        for entry_type in (Annotation, Token, Sentence, PredicateLink,
+                           CoreferenceGroup):
+            self.assertEqual(_tids(view.get(entry_type)),
+                             _tids(self.pack.get(entry_type)))
+            self.assertEqual(view.get_ids_by_type(entry_type),
+                             self.pack.get_ids_by_type(entry_type))
+        for sentence in view.get(Sentence):
+            self.assertEqual(
+                _tids(view.get(Token, sentence)),
+                _tids(self.pack.get(Token, self.pack.get_entry(sentence.tid))))
+        self.assertEqual(_tids(view), _tids(self.pack))
+        self.assertSameData(view, self.pack)
+
+        token = view.get_single(Token)
+        self.assertIs(token.pack, view)
+        self.assertIs(view.get_entry(token.tid), token)
+        self.assertEqual(token, self.pack.get_entry(token.tid))
+
+    def test_field_writes(self):
+        view = self.pack.view()
+        tokens = list(view.get(Token))
+        for token in tokens[:5]:
+            token.ner = "B-TEST"
+
+        self.assertEqual(view.modified_fields,
+                         {t.tid: {"ner"} for t in tokens[:5]})
+        for token in tokens[:5]:
+            self.assertEqual(view.get_entry(token.tid).ner, "B-TEST")
+            self.assertNotEqual(self.pack.get_entry(token.tid).ner, "B-TEST")
+        self.assertEqual(
+            list(view.get_data(Sentence, {Token: ["ner"]}))[0]["Token"]["ner"]
+            .tolist()[:5], ["B-TEST"] * 5)
+
+    def test_added_entries(self):
+        view = self.pack.view()
+        sentence = view.get_single(Sentence)
+        tokens = list(view.get(Token, sentence))
+
+        mention = EntityMention(view, tokens[1].begin, tokens[2].end)
+        mention.ner_type = "TEST"
+        view.add_entry(mention)
+        link = PredicateLink(view, PredicateMention(view, 0, 1),
+                             PredicateArgument(view, 2, 3))
+        view.add_all_remaining_entries()
+
+        self.assertEqual(list(view.added_entries())[-1], link)
+        self.assertNotIn(mention.tid, self.pack.get_ids_by_type(EntityMention))
+        self.assertIn(mention, list(view.get(EntityMention, sentence)))
+
+        # The annotations of the view and the base are returned in order.
+        annotations = list(view.get(Annotation))
+        self.assertEqual(annotations, sorted(annotations))
+        self.assertEqual(len(annotations),
+                         len(list(self.pack.get(Annotation))) + 3)
+
+        self.assertIn(link, list(view.get(PredicateLink)))
+        self.assertIn(link, view.get_links_by_parent(link.get_parent()))
+
+    def test_delete(self):
+        view = self.pack.view()
+        token = view.get_single(Token)
+        view.delete_entry(token)
+        self.assertNotIn(token.tid, _tids(view.get(Token)))
+        with self.assertRaises(KeyError):
+            view.get_entry(token.tid)
+        self.assertIn(token.tid, _tids(self.pack.get(Token)))
+
+    def test_materialize(self):
+        view = self.pack.view()
+        tokens = list(view.get(Token))
+        tokens[0].ner = "B-TEST"
+        deleted = view.get_single(EntityMention)
+        view.delete_entry(deleted)
+        mention = EntityMention(view, tokens[2].begin, tokens[2].end)
+        view.add_entry(mention)
+
+        expected = copy.deepcopy(self.pack)
+        expected.get_entry(tokens[0].tid).ner = "B-TEST"
+        expected.delete_entry(expected.get_entry(deleted.tid))
+        expected.add_entry(
+            EntityMention(expected, tokens[2].begin, tokens[2].end))
+
+        for pack in (view.materialize(), copy.deepcopy(view),
+                     deserialize(view.serialize()),
+                     deserialize(view.serialize(serialize_method="binary"))):
+            self.assertEqual(type(pack), DataPack)
+            self.assertEqual(_tids(pack), _tids(expected))
+            self.assertEqual(pack.get_entry(tokens[0].tid).ner, "B-TEST")
+            self.assertSameData(pack, expected)
+            self.assertSameData(pack, view)
+
+    def test_discard(self):
+        view = self.pack.view()
+        token = view.get_single(Token)
+        token.ner = "B-TEST"
+        view.delete_entry(list(view.get(Token))[1])
+        view.add_entry(EntityMention(view, 0, 1))
+
+        view.discard()
+        self.assertEqual(_tids(view), _tids(self.pack))
+        self.assertEqual(view.modified_fields, {})
+        self.assertEqual(view.get_single(Token).ner,
+                         self.pack.get_single(Token).ner)
+
+    def test_nested_view(self):
+        view = self.pack.view()
+        view.get_single(Token).ner = "B-OUTER"
+        inner = view.view()
+        inner.get_single(Token).ner = "B-INNER"
+        inner.add_entry(EntityMention(inner, 0, 1))
+
+        self.assertEqual(view.get_single(Token).ner, "B-OUTER")
+        self.assertEqual(inner.get_single(Token).ner, "B-INNER")
+        self.assertEqual(len(list(inner.get(EntityMention))),
+                         len(list(view.get(EntityMention))) + 1)
+        self.assertEqual(inner.materialize().get_single(Token).ner, "B-INNER")
+
+    @performance_test
+    def test_view_speed(self):
+        timings = {}
+        for name, make in (("deepcopy", copy.deepcopy),
+                           ("view", DataPack.view)):
+            start = time.time()
+            for _ in range(20):
+                pack = make(self.pack)
+                # Mimic a predictor writing to some tokens.
+                for token in list(pack.get(Token))[:10]:
+                    token.ner = "O"
+            timings[name] = time.time() - start
+
+        print("Copy a pack for evaluation: "
+              + ", ".join(f"{k} {v:.3f}s" for k, v in timings.items()))
+        self.assertLess(timings["view"], timings["deepcopy"])
+
+
+if __name__ == '__main__':
+    unittest.main()
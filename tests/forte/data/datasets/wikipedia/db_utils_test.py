@@ -0,0 +1,241 @@
+# Copyright 2020 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the NIF parsing utilities of the DBpedia readers.
+"""
+import bz2
+import os
+import random
+import tempfile
+import time
+import unittest
+from typing import List
+
+import numpy as np
+import rdflib
+from ddt import ddt, data
+
+from forte.data.datasets.wikipedia.db_utils import (
+    BackgroundDecompressor, ContextGroupedNIFReader, NIFBufferedContextReader,
+    NIFIndexedContextReader, NIFParser, build_nif_index, parse_nquad)
+from tests.utils import performance_test
+
+CONTEXT = "http://en.wikipedia.org/wiki/{}?dbpv=2016-10&nif=context"
+RESOURCE = "http://dbpedia.org/resource/{}"
+
+STATEMENTS = [
+    '<http://a.org/s> <http://a.org/p> <http://a.org/o> <http://a.org/g> .',
+    '<http://a.org/s> <http://a.org/p> "plain" <http://a.org/g> .',
+    '<http://a.org/s> <http://a.org/p> "chat"@fr <http://a.org/g> .',
+    '<http://a.org/s> <http://a.org/p> "12"^^'
+    '<http://www.w3.org/2001/XMLSchema#integer> <http://a.org/g> .',
+    '<http://a.org/s> <http://a.org/p> '
+    r'"tab\there \"quoted\" é\U0001F600 back\\slash" <http://a.org/g> .',
+    '_:b1 <http://a.org/p> _:b2 <http://a.org/g> .',
+    '<http://a.org/s>\t<http://a.org/p>  "en-GB"@en-GB <http://a.org/g>.',
+]
+
+
+def _nif_lines(num_pages: int, statements_per_page: int) -> List[str]:
+    lines = []
+    for page in range(num_pages):
+        context = CONTEXT.format(f"Page_{page}")
+        for i in range(statements_per_page):
+            lines.append(
+                f'<{context}&char={i},{i + 5}> '
+                f'<http://www.w3.org/2005/11/its/rdf#taIdentRef> '
+                f'<{RESOURCE.format(f"Target_{i}")}> <{context}> .\n')
+    return lines
+
+
+def _write_bz2(path: str, lines: List[str], num_streams: int = 1):
+    with open(path, 'wb') as f:
+        size = len(lines) // num_streams + 1
+        for begin in range(0, len(lines), size):
+            f.write(bz2.compress(
+                "".join(lines[begin:begin + size]).encode('utf-8')))
+
+
+@ddt
+class NIFParserTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    @data(*STATEMENTS)
+    def test_same_as_rdflib(self, statement):
+        graph = rdflib.ConjunctiveGraph()
+        graph.parse(data=statement, format='nquads')
+        expected = [(s, v, o, c.identifier) for s, v, o, c in graph.quads()]
+
+        actual = parse_nquad(statement)
+        self.assertEqual(len(expected), 1)
+        if isinstance(expected[0][0], rdflib.BNode):
+            # rdflib renames the blank nodes.
+            self.assertIsInstance(actual[0], rdflib.BNode)
+            self.assertIsInstance(actual[2], rdflib.BNode)
+            self.assertEqual(actual[1::2], expected[0][1::2])
+        else:
+            self.assertEqual(actual, expected[0])
+            self.assertEqual(actual[2].toPython(), expected[0][2].toPython())
+
+    def test_comments_and_triples(self):
+        self.assertIsNone(parse_nquad("# A comment.\n"))
+        self.assertIsNone(parse_nquad("   \n"))
+        self.assertIsNone(parse_nquad(
+            '<http://a.org/s> <http://a.org/p> "o" .')[3])
+        with self.assertRaises(ValueError):
+            parse_nquad('<http://a.org/s> <http://a.org/p> .')
+
+    @data(1, 3)
+    def test_decompress(self, num_streams):
+        lines = _nif_lines(20, 10)
+        path = os.path.join(self.temp_dir.name, 'links.ttl.bz2')
+        _write_bz2(path, lines, num_streams)
+
+        # A small chunk size splits the lines across the chunks.
+        decompressor = BackgroundDecompressor(path, chunk_size=100)
+        self.assertEqual(
+            [line.decode('utf-8') for line in decompressor], lines)
+        decompressor.close()
+
+        # Stop reading in the middle.
+        decompressor = BackgroundDecompressor(
+            path, chunk_size=100, queue_size=1)
+        next(decompressor)
+        decompressor.close()
+
+    @data(True, False)
+    def test_parser(self, background_decompress):
+        lines = _nif_lines(5, 4)
+        path = os.path.join(self.temp_dir.name, 'links.ttl.bz2')
+        _write_bz2(path, ['# Comment.\n'] + lines)
+
+        with NIFParser(path, background_decompress=background_decompress
+                       ) as parser:
+            quads = list(parser.quads())
+        self.assertEqual(quads, [parse_nquad(line) for line in lines])
+
+        with NIFParser(path, background_decompress=background_decompress
+                       ) as parser:
+            self.assertEqual(
+                [statements[0] for statements in parser], quads)
+
+    def test_context_grouped_reader(self):
+        lines = _nif_lines(6, 3)
+        path = os.path.join(self.temp_dir.name, 'links.ttl')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.writelines(lines)
+
+        groups = list(ContextGroupedNIFReader(path))
+        self.assertEqual(
+            [c for c, _ in groups],
+            [CONTEXT.format(f"Page_{page}").split('?')[0]
+             for page in range(6)])
+        for _, statements in groups:
+            self.assertEqual(len(statements), 3)
+
+        buffered = NIFBufferedContextReader(path)
+        context = parse_nquad(lines[-1])[3]
+        self.assertEqual(buffered.get(context), groups[-1][1])
+
+    def test_index(self):
+        lines = _nif_lines(30, 4)
+        # Move some statements out of the order of the contexts.
+        rng = random.Random(0)
+        for _ in range(10):
+            i = rng.randrange(len(lines))
+            lines.insert(rng.randrange(len(lines)), lines.pop(i))
+        path = os.path.join(self.temp_dir.name, 'links.ttl.bz2')
+        _write_bz2(path, lines)
+
+        expected = {}
+        for line in lines:
+            s, v, o, c = parse_nquad(line)
+            expected.setdefault(str(c).split('?')[0], []).append((s, v, o))
+
+        with NIFIndexedContextReader(path) as reader:
+            contexts = list(expected)
+            rng.shuffle(contexts)
+            for context in contexts:
+                self.assertEqual(reader.get(context), expected[context])
+            # A node is stripped of its parameters like the graphs.
+            self.assertEqual(
+                reader.get(rdflib.URIRef(CONTEXT.format("Page_3"))),
+                expected[CONTEXT.format("Page_3").split('?')[0]])
+            self.assertEqual(reader.get("http://en.wikipedia.org/x"), [])
+
+        # The decompressed file and the index are kept for the next time.
+        data_path = path[:-len('.bz2')]
+        index = np.load(data_path + '.index.npy')
+        self.assertGreater(len(index), 30)
+        self.assertTrue(np.all(np.diff(index['hash'].astype(float)) >= 0))
+        with NIFIndexedContextReader(path) as reader:
+            self.assertEqual(len(reader.get(contexts[0])), 4)
+
+        # The buffered reader misses the contexts out of its window.
+        buffered = NIFBufferedContextReader(path, window_size=2)
+        self.assertTrue(any(buffered.get(context) != expected[context]
+                            for context in contexts))
+
+    def test_index_path(self):
+        path = os.path.join(self.temp_dir.name, 'links.ttl')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.writelines(_nif_lines(3, 2))
+        index_path = os.path.join(self.temp_dir.name, 'links.npy')
+        build_nif_index(path, index_path)
+
+        with NIFIndexedContextReader(path, index_path) as reader:
+            self.assertEqual(
+                len(reader.get(CONTEXT.format("Page_1").split('?')[0])), 2)
+        self.assertFalse(os.path.exists(path + '.index.npy'))
+
+    @performance_test
+    def test_parsing_speed(self):
+        lines = _nif_lines(200, 25)
+        path = os.path.join(self.temp_dir.name, 'links.ttl.bz2')
+        _write_bz2(path, lines)
+
+        def parse_with_graphs():
+            parser = NIFParser(path, background_decompress=False)
+            count = 0
+            with bz2.BZ2File(path) as f:
+                for line in f:
+                    count += len(parser.parse_graph(
+                        line.decode('utf-8'), tuple_format='nquads'))
+            parser.close()
+            return count
+
+        def parse_streaming():
+            with NIFParser(path) as parser:
+                return sum(1 for _ in parser.quads())
+
+        timings = {}
+        for name, parse in (("rdflib graph per line", parse_with_graphs),
+                            ("streaming", parse_streaming)):
+            start = time.time()
+            self.assertEqual(parse(), len(lines))
+            timings[name] = time.time() - start
+
+        print(f"Parsing {len(lines)} NIF statements: "
+              + ", ".join(f"{k} {v:.3f}s" for k, v in timings.items()))
+        self.assertLess(timings["streaming"] * 5,
+                        timings["rdflib graph per line"])
+
+
+if __name__ == '__main__':
+    unittest.main()
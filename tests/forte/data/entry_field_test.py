@@ -0,0 +1,132 @@
+# Copyright 2020 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the entry typed attributes.
+"""
+import time
+import unittest
+from dataclasses import dataclass
+from typing import Optional
+
+from forte.data.container import BasePointer
+from forte.data.data_pack import DataPack
+from forte.data.data_utils import deserialize
+from forte.data.ontology.core import EntryField, Pointer
+from forte.data.ontology.top import Generics
+from ft.onto.base_ontology import (
+    Token, Sentence, Phrase, ConstituentNode)
+from tests.utils import performance_test
+
+
+@dataclass
+class HandWrittenEntry(Generics):
+    target: Optional[Token] = None
+
+    def __init__(self, pack: DataPack):
+        super().__init__(pack)
+
+
+class PointerCheckingToken(Token):
+    """A token that checks for pointers on every attribute access, used to
+    compare against the descriptor based resolution."""
+
+    def __getattribute__(self, item):
+        v = super().__getattribute__(item)
+        if isinstance(v, BasePointer):
+            return self.resolve_pointer(v)
+        return v
+
+
+def _build_pack(num_sentences: int, token_type=Token) -> DataPack:
+    pack = DataPack()
+    words = ["word"] * 20
+    pack.set_text(" ".join(words * num_sentences))
+
+    offset = 0
+    for _ in range(num_sentences):
+        sent_begin = offset
+        tokens = []
+        for w in words:
+            token = token_type(pack, offset, offset + len(w))
+            token.pos = "NN"
+            tokens.append(token)
+            offset += len(w) + 1
+        Sentence(pack, sent_begin, offset - 1)
+        phrase = Phrase(pack, tokens[0].begin, tokens[1].end)
+        phrase.headword = tokens[1]
+    pack.add_all_remaining_entries()
+    return pack
+
+
+class EntryFieldTest(unittest.TestCase):
+
+    def test_generated_field(self):
+        self.assertIsInstance(Phrase.__dict__['headword'], EntryField)
+        self.assertIsInstance(
+            ConstituentNode.__dict__['parent_node'], EntryField)
+        # The descriptor does not act as a default value.
+        self.assertFalse(hasattr(Phrase, 'headword'))
+
+        pack = _build_pack(3)
+        for phrase in pack.get(Phrase):
+            self.assertIsInstance(phrase.__dict__['headword'], Pointer)
+            self.assertIsInstance(phrase.headword, Token)
+            self.assertEqual(phrase.headword.begin, phrase.begin + 5)
+
+        phrase = Phrase(pack, 0, 4)
+        self.assertIsNone(phrase.headword)
+        pack.add_entry(phrase)
+
+    def test_deserialized_field(self):
+        pack = _build_pack(3)
+        new_pack: DataPack = deserialize(pack.serialize())
+        for p1, p2 in zip(pack.get(Phrase), new_pack.get(Phrase)):
+            self.assertEqual(p1.headword.tid, p2.headword.tid)
+            self.assertIs(p2.headword.pack, new_pack)
+
+    def test_hand_written_entry(self):
+        pack = _build_pack(1)
+        token = pack.get_single(Token)
+        entry = HandWrittenEntry(pack)
+        self.assertIsNone(entry.target)
+
+        entry.target = token
+        self.assertIsInstance(entry.__dict__['target'], Pointer)
+        self.assertEqual(entry.target, token)
+        self.assertIsInstance(HandWrittenEntry.__dict__['target'], EntryField)
+        # The class default is kept.
+        self.assertIsNone(HandWrittenEntry.target)
+
+        entry.target = None
+        self.assertIsNone(entry.target)
+
+    @performance_test
+    def test_get_speed(self):
+        num_sentences = 2000
+        timings = {}
+        for token_type in (Token, PointerCheckingToken):
+            pack = _build_pack(num_sentences, token_type)
+            start = time.time()
+            for sentence in pack.get(Sentence):
+                for token in pack.get(token_type, sentence):
+                    _ = (token.pos, token.ner, token.lemma, token.chunk)
+            timings[token_type.__name__] = time.time() - start
+
+        print("Token reading in sentences: "
+              + ", ".join(f"{k} {v:.3f}s" for k, v in timings.items()))
+        self.assertLess(timings["Token"], timings["PointerCheckingToken"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+# Copyright 2020 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the field validation of entries.
+"""
+import time
+import unittest
+from typing import get_type_hints
+
+from ddt import ddt, data
+
+from forte.data.data_pack import DataPack
+from forte.data.data_utils import deserialize
+from forte.data.ontology.core import get_field_validators
+from forte.utils.utils import check_type
+from ft.onto.base_ontology import Token, Sentence, Document
+from tests.utils import performance_test
+
+
+def _build_pack(num_sentences: int, mode: str = "strict") -> DataPack:
+    pack = DataPack()
+    pack.set_validation_mode(mode)
+    words = ["word"] * 20
+    pack.set_text(" ".join(words * num_sentences))
+
+    offset = 0
+    for _ in range(num_sentences):
+        sent_begin = offset
+        for w in words:
+            token = Token(pack, offset, offset + len(w))
+            token.pos = "NN"
+            token.ner = "O"
+            token.lemma = w
+            offset += len(w) + 1
+        sent = Sentence(pack, sent_begin, offset - 1)
+        sent.speaker = "someone"
+    pack.add_all_remaining_entries()
+    return pack
+
+
+@ddt
+class EntryValidationTest(unittest.TestCase):
+
+    def test_validators_match_check_type(self):
+        for entry_type in (Token, Sentence, Document):
+            hints = get_type_hints(entry_type)
+            validators = get_field_validators(entry_type)
+            self.assertEqual(set(hints.keys()), set(validators.keys()))
+            for name, (hint, validator) in validators.items():
+                self.assertEqual(hint, hints[name])
+                for value in (None, "a", 1, True, [], {}, 1.5):
+                    self.assertEqual(
+                        validator(value), check_type(value, hint),
+                        f"{entry_type}.{name} with {value!r}")
+
+        # The validators are only built once.
+        self.assertIs(get_field_validators(Token), get_field_validators(Token))
+
+    @data("strict", "first_write")
+    def test_invalid_value(self, mode):
+        pack = DataPack()
+        pack.set_validation_mode(mode)
+        pack.set_text("Some text.")
+        token = Token(pack, 0, 4)
+        with self.assertRaises(TypeError):
+            token.pos = 1
+        # A failed validation is not remembered as validated.
+        with self.assertRaises(TypeError):
+            token.pos = 1
+        token.pos = "NN"
+        pack.add_entry(token)
+        self.assertEqual(token.pos, "NN")
+
+    def test_first_write(self):
+        pack = DataPack()
+        pack.set_validation_mode("first_write")
+        pack.set_text("Some text.")
+        t1 = Token(pack, 0, 4)
+        t1.pos = "NN"
+        t2 = Token(pack, 5, 9)
+        t2.pos = "VB"
+        # Another value type of the same field is still validated.
+        with self.assertRaises(TypeError):
+            t2.pos = 1
+        pack.add_all_remaining_entries()
+
+    def test_off(self):
+        pack = DataPack()
+        pack.set_validation_mode("off")
+        pack.set_text("Some text.")
+        token = Token(pack, 0, 4)
+        token.pos = 1
+        pack.add_entry(token)
+        self.assertEqual(token.pos, 1)
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            DataPack().set_validation_mode("unknown")
+
+    def test_mode_not_serialized(self):
+        pack = _build_pack(2, "off")
+        new_pack = deserialize(pack.serialize())
+        self.assertEqual(new_pack.validation_mode, "strict")
+        self.assertEqual(len(list(new_pack.get(Token))), 40)
+
+    @performance_test
+    def test_construction_speed(self):
+        num_sentences = 2000
+        timings = {}
+        for mode in ("strict", "first_write", "off"):
+            start = time.time()
+            _build_pack(num_sentences, mode)
+            timings[mode] = time.time() - start
+        print(f"Token/Sentence construction of {num_sentences} sentences: "
+              + ", ".join(f"{k} {v:.3f}s" for k, v in timings.items()))
+        self.assertLess(timings["off"], timings["strict"])
+
+
+if __name__ == '__main__':
+    unittest.main()
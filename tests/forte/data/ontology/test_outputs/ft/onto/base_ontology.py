@@ -11,6 +11,7 @@ from dataclasses import dataclass
 from forte.data.data_pack import DataPack
 from forte.data.multi_pack import MultiPack
 from forte.data.ontology.core import Entry
+from forte.data.ontology.core import EntryField
 from forte.data.ontology.core import FList
 from forte.data.ontology.top import Annotation
 from forte.data.ontology.top import Group
@@ -382,7 +383,7 @@ class ConstituentNode(Annotation):
     sentiment: Dict[str, float]
     is_root: Optional[bool]
     is_leaf: Optional[bool]
-    parent_node: Optional['ConstituentNode']
+    parent_node: Optional['ConstituentNode'] = EntryField()
     children_nodes: FList['ConstituentNode']
 
     def __init__(self, pack: DataPack, begin: int, end: int):
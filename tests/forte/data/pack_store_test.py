@@ -0,0 +1,218 @@
+# Copyright 2020 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the indexed pack store and the reader caches using it.
+"""
+import os
+import struct
+import tempfile
+import time
+import unittest
+from typing import Iterator, List
+from unittest import mock
+
+from ddt import ddt, data, unpack
+
+from forte.data.data_pack import DataPack
+from forte.data.pack_store import PackMemoryCache, PackStore
+from forte.data.readers import OntonotesReader
+from forte.data.readers.base_reader import PackReader
+from forte.pipeline import Pipeline
+from ft.onto.base_ontology import Token
+from tests.utils import performance_test
+
+ONTONOTES_PATH = "data_samples/ontonotes/00"
+
+
+def _read_packs(reader, path=ONTONOTES_PATH) -> List[DataPack]:
+    pipeline = Pipeline[DataPack]()
+    pipeline.set_reader(reader)
+    pipeline.initialize()
+    return list(pipeline.process_dataset(path))
+
+
+def _summary(pack: DataPack):
+    return pack.pack_name, pack.text, [t.text for t in pack.get(Token)]
+
+
+class ManyPacksReader(PackReader):
+    r"""Reads a collection of `num_packs` packs."""
+
+    def _collect(self, num_packs: int) -> Iterator[int]:  # type: ignore
+        yield num_packs
+
+    def _cache_key_function(self, num_packs: int) -> str:
+        return f"packs_{num_packs}"
+
+    def _parse_pack(self, num_packs: int) -> Iterator[DataPack]:
+        for i in range(num_packs):
+            pack = DataPack(f"pack_{i}")
+            pack.set_text(f"text {i}")
+            yield pack
+
+
+@ddt
+class PackStoreTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.packs = _read_packs(OntonotesReader())
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "packs.bin")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    @data(("binary", False), ("binary", True), ("jsonpickle", True))
+    @unpack
+    def test_random_access(self, serialize_method, compress):
+        with PackStore(self.path, "w", serialize_method, compress) as store:
+            for pack in self.packs[:3]:
+                store.add(pack)
+        with PackStore(self.path, "a") as store:
+            for pack in self.packs[3:]:
+                store.add(pack)
+
+        expected = [_summary(p) for p in self.packs]
+        with PackStore(self.path) as store:
+            self.assertEqual(store.serialize_method, serialize_method)
+            self.assertEqual(store.compress, compress)
+            self.assertEqual(len(store), len(self.packs))
+            self.assertEqual([_summary(p) for p in store], expected)
+            self.assertEqual(_summary(store[-1]), expected[-1])
+            self.assertEqual([_summary(p) for p in store[1:4]], expected[1:4])
+
+            last = self.packs[-1]
+            self.assertEqual(_summary(store.get_by_id(last.pack_id)),
+                             expected[-1])
+            self.assertEqual(_summary(store.get_by_name(last.pack_name)),
+                             expected[-1])
+            self.assertIsNone(store.get_by_name("missing"))
+            with self.assertRaises(IndexError):
+                store.get(len(self.packs))
+            with self.assertRaises(ValueError):
+                store.add(last)
+
+    def test_without_index(self):
+        # A binary cache file written before the stores had an index.
+        with open(self.path, "wb") as f:
+            for pack in self.packs:
+                data = pack.serialize(serialize_method="binary")
+                f.write(struct.pack("<Q", len(data)))
+                f.write(data)
+
+        with PackStore(self.path, "a") as store:
+            self.assertEqual(_summary(store.get_by_id(self.packs[2].pack_id)),
+                             _summary(self.packs[2]))
+            store.add(self.packs[0])
+        with PackStore(self.path) as store:
+            self.assertEqual(len(store), len(self.packs) + 1)
+            self.assertEqual(_summary(store[-1]), _summary(self.packs[0]))
+
+    def test_memory_cache(self):
+        memory = PackMemoryCache(2)
+        with PackStore(self.path, "w") as store:
+            for pack in self.packs:
+                store.add(pack)
+        with PackStore(self.path, memory=memory) as store:
+            first = store[0]
+            self.assertIs(store[0], first)
+            store.get(1)
+            store.get(2)
+            # The first pack is evicted.
+            self.assertIsNot(store[0], first)
+            self.assertEqual(len(memory), 2)
+            self.assertEqual((memory.hits, memory.misses), (1, 4))
+
+    def test_reader_cache(self):
+        cache_dir = os.path.join(self.temp_dir.name, "cache")
+        expected = [_summary(p) for p in self.packs]
+        self.assertEqual(
+            [_summary(p) for p in _read_packs(OntonotesReader(
+                cache_directory=cache_dir, serialize_method="binary",
+                compress_cache=True))],
+            expected)
+        self.assertEqual(
+            [_summary(p) for p in _read_packs(OntonotesReader(
+                from_cache=True, cache_directory=cache_dir,
+                serialize_method="binary"))],
+            expected)
+
+    def test_reader_cache_one_store(self):
+        reader = ManyPacksReader(cache_directory=self.temp_dir.name,
+                                 serialize_method="binary")
+        with mock.patch("forte.data.readers.base_reader.PackStore",
+                        wraps=PackStore) as store_class:
+            names = [p.pack_name for p in _read_packs(reader, 50)]
+        # The cache file of the collection is opened once for all the packs.
+        self.assertEqual(store_class.call_count, 1)
+        # pylint: disable=protected-access
+        self.assertEqual(reader._cache_stores, {})
+        self.assertEqual(names, [f"pack_{i}" for i in range(50)])
+
+        cached = _read_packs(ManyPacksReader(
+            from_cache=True, cache_directory=self.temp_dir.name,
+            serialize_method="binary"), 50)
+        self.assertEqual([p.pack_name for p in cached], names)
+
+    def test_reader_memory_cache(self):
+        reader = OntonotesReader(
+            cache_in_memory=True, cache_directory=self.temp_dir.name,
+            serialize_method="binary", memory_cache_size=2)
+        pipeline = Pipeline[DataPack]()
+        pipeline.set_reader(reader)
+        pipeline.initialize()
+
+        expected = [_summary(p) for p in self.packs]
+        for _ in range(3):
+            self.assertEqual(
+                [_summary(p) for p in reader.iter(ONTONOTES_PATH)], expected)
+        # pylint: disable=protected-access
+        self.assertEqual(len(reader._data_packs), 0)
+        self.assertLessEqual(len(reader._memory_cache), 2)
+
+        with self.assertRaises(ValueError):
+            OntonotesReader(cache_in_memory=True, memory_cache_size=2)
+        with self.assertRaises(ValueError):
+            OntonotesReader(compress_cache=True)
+
+    @performance_test
+    def test_epochs(self):
+        num_epochs = 5
+        timings = {}
+        for name, kwargs in (
+                ("parse", {}),
+                ("memory bounded", {
+                    "cache_in_memory": True, "memory_cache_size": 4,
+                    "cache_directory": self.temp_dir.name,
+                    "serialize_method": "binary"})):
+            reader = OntonotesReader(**kwargs)
+            pipeline = Pipeline[DataPack]()
+            pipeline.set_reader(reader)
+            pipeline.initialize()
+            start = time.time()
+            for _ in range(num_epochs):
+                for _ in reader.iter(ONTONOTES_PATH):
+                    pass
+            timings[name] = time.time() - start
+
+        print(f"Reading {num_epochs} epochs: "
+              + ", ".join(f"{k} {v:.3f}s" for k, v in timings.items()))
+        self.assertLess(timings["memory bounded"], timings["parse"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -60,6 +60,29 @@ class BaseReaderTest(unittest.TestCase):
         self.assertFalse(self.reader._cache_ready)
         self.assertTrue(len(self.reader._data_packs) == 0)
 
+    def test_shard(self):
+        texts = [pack.text
+                 for pack in self.nlp.process_dataset(self.dataset_path)]
+
+        shards = []
+        for index in range(2):
+            self.reader.shard(index, 2)
+            shards.append([
+                pack.text
+                for pack in self.nlp.process_dataset(self.dataset_path)])
+        # The files are listed in sorted order, and taken in turn.
+        self.assertEqual(shards, [texts[0::2], texts[1::2]])
+
+        self.reader.shard(0, 1)
+        self.assertEqual(
+            [pack.text
+             for pack in self.nlp.process_dataset(self.dataset_path)],
+            texts)
+
+        for index, num_shards in ((2, 2), (-1, 2), (0, 0)):
+            with self.assertRaises(ValueError):
+                self.reader.shard(index, num_shards)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,164 @@
+# Copyright 2020 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for ParallelReader.
+"""
+import os
+import time
+import unittest
+from typing import Iterator, List, Tuple
+
+from ddt import ddt, data, unpack
+
+from forte.common import ProcessorConfigError
+from forte.data.data_pack import DataPack
+from forte.data.readers import OntonotesReader, ParallelReader
+from forte.data.readers.base_reader import PackReader
+from forte.pipeline import Pipeline
+from ft.onto.base_ontology import Token
+from tests.utils import performance_test
+
+ONTONOTES_PATH = "data_samples/ontonotes/00"
+
+
+class CPUBoundReader(PackReader):
+    """Spends some CPU time on each collection, the collection ``fail_on``
+    fails."""
+
+    def __init__(self, work: int = 1000, fail_on: int = -1):
+        super().__init__()
+        self.work = work
+        self.fail_on = fail_on
+
+    def _collect(self, num_packs: int) -> Iterator[int]:  # type: ignore
+        return iter(range(num_packs))
+
+    def _parse_pack(self, index: int) -> Iterator[DataPack]:
+        if index == self.fail_on:
+            raise ValueError("Failed on purpose.")
+        total = 0
+        # The later collections are faster, to shuffle the unordered packs.
+        for i in range(self.work * (20 - index % 20)):
+            total += i * i
+        for part in range(index % 3):
+            pack = DataPack(f"pack_{index}_{part}")
+            pack.set_text(f"pack {index} {part}")
+            Token(pack, 0, 4)
+            yield pack
+
+
+def _read(reader, *args, configs=None) -> List[Tuple[str, str, int]]:
+    pipeline = Pipeline[DataPack]()
+    pipeline.set_reader(reader, configs)
+    pipeline.initialize()
+    return [(pack.pack_name, pack.text, len(list(pack.get(Token))))
+            for pack in pipeline.process_dataset(*args)]
+
+
+@ddt
+class ParallelReaderTest(unittest.TestCase):
+
+    @data((1, None), (2, 1), (3, None))
+    @unpack
+    def test_same_packs(self, num_workers, max_in_flight):
+        expected = _read(OntonotesReader(), ONTONOTES_PATH)
+        self.assertGreater(len(expected), 1)
+        self.assertEqual(
+            _read(ParallelReader(OntonotesReader(), num_workers,
+                                 max_in_flight=max_in_flight),
+                  ONTONOTES_PATH),
+            expected)
+
+        expected = _read(CPUBoundReader(), 30)
+        self.assertEqual(
+            _read(ParallelReader(CPUBoundReader(), num_workers,
+                                 max_in_flight=max_in_flight), 30),
+            expected)
+
+    def test_unordered(self):
+        expected = _read(CPUBoundReader(), 30)
+        packs = _read(ParallelReader(
+            CPUBoundReader(), 3, preserve_order=False), 30)
+        self.assertEqual(sorted(packs), sorted(expected))
+
+        # The packs of a collection stay together.
+        names = [name for name, _, _ in packs]
+        for i in range(30):
+            if i % 3 == 2:
+                first = names.index(f"pack_{i}_0")
+                self.assertEqual(names[first + 1], f"pack_{i}_1")
+
+    def test_shard(self):
+        expected = _read(CPUBoundReader(), 30)
+        shards = []
+        for index in range(3):
+            reader = ParallelReader(CPUBoundReader(), 2)
+            reader.shard(index, 3)
+            shards.append(_read(reader, 30))
+        self.assertEqual(sorted(sum(shards, [])), sorted(expected))
+
+        # The same shard as the wrapped reader alone.
+        reader = CPUBoundReader()
+        reader.shard(1, 3)
+        self.assertEqual(shards[1], _read(reader, 30))
+
+    def test_configs(self):
+        reader = ParallelReader(OntonotesReader())
+        self.assertEqual(reader.pack_type, DataPack)
+        self.assertIsNotNone(reader.reader)
+
+        # The configs are passed to the wrapped reader.
+        with self.assertRaises(ProcessorConfigError):
+            _read(ParallelReader(OntonotesReader()), ONTONOTES_PATH,
+                  configs={"column_format": None})
+
+    def test_error(self):
+        with self.assertRaises(ValueError):
+            _read(ParallelReader(CPUBoundReader(fail_on=5), 2), 30)
+
+    def test_stop_early(self):
+        pipeline = Pipeline[DataPack]()
+        pipeline.set_reader(ParallelReader(CPUBoundReader(), 2))
+        pipeline.initialize()
+        for i, pack in enumerate(pipeline.process_dataset(100)):
+            if i == 3:
+                break
+        self.assertEqual(pack.pack_name, "pack_4_0")
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            ParallelReader(CPUBoundReader(), num_workers=0)
+        with self.assertRaises(ValueError):
+            ParallelReader(CPUBoundReader(), max_in_flight=0)
+
+    @performance_test
+    def test_scaling(self):
+        num_cpus = os.cpu_count() or 1
+        timings = {}
+        for num_workers in sorted({0, 2, num_cpus}):
+            reader = CPUBoundReader(work=20000)
+            if num_workers > 0:
+                reader = ParallelReader(reader, num_workers)
+            start = time.time()
+            _read(reader, 60)
+            timings[num_workers] = time.time() - start
+
+        print(f"Reading with a CPU bound reader on {num_cpus} CPUs: "
+              + ", ".join(f"{k} workers {v:.3f}s" for k, v in timings.items()))
+        if num_cpus >= 2:
+            self.assertLess(timings[2], timings[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+# Copyright 2020 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for PrefetchReader.
+"""
+import tempfile
+import time
+import unittest
+from typing import Iterator, List, Tuple
+
+from ddt import ddt, data, unpack
+
+from forte.common import ProcessorConfigError
+from forte.data.data_pack import DataPack
+from forte.data.readers import OntonotesReader, PrefetchReader
+from forte.data.readers.base_reader import PackReader
+from forte.pipeline import Pipeline
+from forte.processors.base import PackProcessor
+from ft.onto.base_ontology import Token
+from tests.utils import performance_test
+
+ONTONOTES_PATH = "data_samples/ontonotes/00"
+
+
+class SlowReader(PackReader):
+    """Simulates a slow file system, each collection takes some time to
+    read."""
+
+    def _collect(self, num_packs: int) -> Iterator[int]:  # type: ignore
+        return iter(range(num_packs))
+
+    def _parse_pack(self, index: int) -> Iterator[DataPack]:
+        time.sleep(0.02)
+        pack = DataPack(f"pack_{index}")
+        pack.set_text(f"pack {index}")
+        yield pack
+
+
+class SlowCollectionsReader(PackReader):
+    """Reads collections of several packs, each pack takes some time to
+    read."""
+
+    def _collect(  # type: ignore
+            self, num_collections: int, num_packs: int
+    ) -> Iterator[Tuple[int, int]]:
+        for index in range(num_collections):
+            yield index, num_packs
+
+    def _cache_key_function(self, collection: Tuple[int, int]) -> str:
+        return f"collection_{collection[0]}"
+
+    def _parse_pack(self, collection: Tuple[int, int]) -> Iterator[DataPack]:
+        index, num_packs = collection
+        for i in range(num_packs):
+            time.sleep(0.002)
+            pack = DataPack(f"pack_{index}_{i}")
+            pack.set_text(f"pack {index} {i}")
+            yield pack
+
+
+class SlowProcessor(PackProcessor):
+
+    def _process(self, input_pack: DataPack):
+        time.sleep(0.02)
+
+
+def _read(reader, *args, configs=None) -> List[Tuple[str, str, int]]:
+    pipeline = Pipeline[DataPack]()
+    pipeline.set_reader(reader, configs)
+    pipeline.initialize()
+    return [(pack.pack_name, pack.text, len(list(pack.get(Token))))
+            for pack in pipeline.process_dataset(*args)]
+
+
+@ddt
+class PrefetchReaderTest(unittest.TestCase):
+
+    @data((1, 1), (2, 1), (4, 3))
+    @unpack
+    def test_same_packs(self, prefetch_size, num_threads):
+        expected = _read(OntonotesReader(), ONTONOTES_PATH)
+        self.assertGreater(len(expected), 1)
+        self.assertEqual(
+            _read(PrefetchReader(OntonotesReader(), prefetch_size,
+                                 num_threads), ONTONOTES_PATH),
+            expected)
+
+        expected = [(f"pack_{i}", f"pack {i}", 0) for i in range(20)]
+        self.assertEqual(
+            _read(PrefetchReader(SlowReader(), prefetch_size, num_threads),
+                  20),
+            expected)
+
+    def test_configs(self):
+        reader = PrefetchReader(OntonotesReader())
+        self.assertEqual(reader.pack_type, DataPack)
+        self.assertEqual(_read(reader, ONTONOTES_PATH),
+                         _read(OntonotesReader(), ONTONOTES_PATH))
+        self.assertIsNotNone(reader.reader.configs.column_format)
+
+        # The configs are passed to the wrapped reader.
+        with self.assertRaises(ProcessorConfigError):
+            _read(PrefetchReader(OntonotesReader()), ONTONOTES_PATH,
+                  configs={"column_format": None})
+
+    def test_cache_in_memory(self):
+        reader = PrefetchReader(OntonotesReader(cache_in_memory=True))
+        pipeline = Pipeline[DataPack]()
+        pipeline.set_reader(reader)
+        pipeline.initialize()
+        first = list(pipeline.process_dataset(ONTONOTES_PATH))
+        second = list(pipeline.process_dataset(ONTONOTES_PATH))
+        self.assertEqual(len(first), len(second))
+        for p1, p2 in zip(first, second):
+            self.assertIs(p1, p2)
+
+    def test_binary_cache(self):
+        expected = [(f"pack_{c}_{i}", f"pack {c} {i}", 0)
+                    for c in range(20) for i in range(5)]
+        with tempfile.TemporaryDirectory() as cache_dir:
+            # The threads write the cache files of their collections at once.
+            reader = SlowCollectionsReader(
+                cache_directory=cache_dir, serialize_method="binary")
+            self.assertEqual(
+                _read(PrefetchReader(reader, prefetch_size=8, num_threads=4),
+                      20, 5),
+                expected)
+            # pylint: disable=protected-access
+            self.assertEqual(reader._cache_stores, {})
+
+            self.assertEqual(
+                _read(PrefetchReader(SlowCollectionsReader(
+                    from_cache=True, cache_directory=cache_dir,
+                    serialize_method="binary"), num_threads=4), 20, 5),
+                expected)
+
+    def test_stop_early(self):
+        reader = PrefetchReader(SlowReader(), prefetch_size=2)
+        pipeline = Pipeline[DataPack]()
+        pipeline.set_reader(reader)
+        pipeline.initialize()
+        for i, pack in enumerate(pipeline.process_dataset(100)):
+            self.assertEqual(pack.text, f"pack {i}")
+            if i == 3:
+                break
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            PrefetchReader(SlowReader(), prefetch_size=0)
+
+    @performance_test
+    def test_overlap(self):
+        timings = {}
+        for name, reader in (("sync", SlowReader()),
+                             ("prefetch", PrefetchReader(SlowReader()))):
+            pipeline = Pipeline[DataPack]()
+            pipeline.set_reader(reader)
+            pipeline.add(SlowProcessor())
+            pipeline.initialize()
+            start = time.time()
+            for _ in pipeline.process_dataset(50):
+                pass
+            timings[name] = time.time() - start
+
+        print("Reading with a slow reader and processor: "
+              + ", ".join(f"{k} {v:.3f}s" for k, v in timings.items()))
+        self.assertLess(timings["prefetch"], timings["sync"] * 0.75)
+
+
+if __name__ == '__main__':
+    unittest.main()
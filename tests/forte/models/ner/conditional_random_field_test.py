@@ -0,0 +1,141 @@
+# Copyright 2020 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the viterbi decoding of the conditional random field.
+"""
+import time
+import unittest
+from typing import List, Tuple
+
+import torch
+from ddt import ddt, data, unpack
+
+from forte.models.ner.conditional_random_field import (
+    ConditionalRandomField, allowed_transitions, viterbi_decode)
+from tests.utils import performance_test
+
+LABELS = {0: "O", 1: "B-PER", 2: "I-PER", 3: "B-LOC", 4: "I-LOC",
+          5: "B-ORG", 6: "I-ORG"}
+
+
+def _reference_viterbi_tags(
+        crf: ConditionalRandomField, logits: torch.Tensor,
+        mask: torch.Tensor) -> List[Tuple[List[int], float]]:
+    # Decode the sequences one by one with `viterbi_decode`, with the start and
+    # end states added as extra tags.
+    _, max_seq_length, num_tags = logits.size()
+    start_tag = num_tags
+    end_tag = num_tags + 1
+
+    # pylint: disable=protected-access
+    constraint_mask = crf._constraint_mask.detach()
+    transitions = torch.Tensor(num_tags + 2, num_tags + 2).fill_(-10000.0)
+    transitions[:num_tags, :num_tags] = (
+        crf.transitions.detach() * constraint_mask[:num_tags, :num_tags]
+        + -10000.0 * (1 - constraint_mask[:num_tags, :num_tags]))
+    transitions[start_tag, :num_tags] = \
+        -10000.0 * (1 - constraint_mask[start_tag, :num_tags])
+    transitions[:num_tags, end_tag] = \
+        -10000.0 * (1 - constraint_mask[:num_tags, end_tag])
+    if crf.include_start_end_transitions:
+        transitions[start_tag, :num_tags] += (
+            crf.start_transitions.detach()
+            * constraint_mask[start_tag, :num_tags])
+        transitions[:num_tags, end_tag] += (
+            crf.end_transitions.detach() * constraint_mask[:num_tags, end_tag])
+
+    best_paths = []
+    tag_sequence = torch.Tensor(max_seq_length + 2, num_tags + 2)
+    for prediction, prediction_mask in zip(logits, mask):
+        sequence_length = int(torch.sum(prediction_mask))
+        tag_sequence.fill_(-10000.0)
+        tag_sequence[0, start_tag] = 0.0
+        tag_sequence[1:(sequence_length + 1), :num_tags] = \
+            prediction[:sequence_length]
+        tag_sequence[sequence_length + 1, end_tag] = 0.0
+        viterbi_path, viterbi_score = viterbi_decode(
+            tag_sequence[: (sequence_length + 2)], transitions)
+        best_paths.append((viterbi_path[1:-1], viterbi_score.item()))
+    return best_paths
+
+
+def _random_batch(batch_size: int, max_length: int, num_tags: int):
+    logits = torch.randn(batch_size, max_length, num_tags) * 3
+    lengths = torch.randint(1, max_length + 1, (batch_size,))
+    lengths[0] = max_length
+    mask = (torch.arange(max_length).unsqueeze(0)
+            < lengths.unsqueeze(1)).long()
+    return logits, mask
+
+
+@ddt
+class ConditionalRandomFieldTest(unittest.TestCase):
+
+    def setUp(self):
+        torch.manual_seed(1)
+
+    @data((True, True), (True, False), (False, True), (False, False))
+    @unpack
+    def test_same_as_sequential(self, constrained, start_end):
+        constraints = (allowed_transitions("BIO", LABELS)
+                       if constrained else None)
+        crf = ConditionalRandomField(
+            len(LABELS), constraints, include_start_end_transitions=start_end)
+
+        for batch_size, max_length in ((1, 1), (1, 9), (16, 1), (16, 23)):
+            logits, mask = _random_batch(batch_size, max_length, len(LABELS))
+            expected = _reference_viterbi_tags(crf, logits, mask)
+            for use_numpy in (False, True):
+                results = crf.viterbi_tags(logits, mask, use_numpy=use_numpy)
+                self.assertEqual([tags for tags, _ in results],
+                                 [tags for tags, _ in expected])
+                for (_, score), (_, expected_score) in zip(results, expected):
+                    self.assertAlmostEqual(score, expected_score, places=3)
+
+    def test_constraints(self):
+        crf = ConditionalRandomField(
+            len(LABELS), allowed_transitions("BIO", LABELS))
+        logits, mask = _random_batch(8, 30, len(LABELS))
+        for tags, _ in crf.viterbi_tags(logits, mask):
+            labels = ["O"] + [LABELS[t] for t in tags]
+            for previous, current in zip(labels, labels[1:]):
+                if current.startswith("I-"):
+                    self.assertIn(previous, ("B" + current[1:], current))
+
+    @performance_test
+    def test_decoding_speed(self):
+        crf = ConditionalRandomField(
+            len(LABELS), allowed_transitions("BIO", LABELS))
+        logits, mask = _random_batch(64, 40, len(LABELS))
+
+        timings = {}
+        for name, decode in (
+                ("sequential", lambda: _reference_viterbi_tags(
+                    crf, logits, mask)),
+                ("batched", lambda: crf.viterbi_tags(logits, mask)),
+                ("numpy", lambda: crf.viterbi_tags(
+                    logits, mask, use_numpy=True))):
+            start = time.time()
+            for _ in range(5):
+                decode()
+            timings[name] = time.time() - start
+
+        print("Viterbi decoding of 64 sequences: "
+              + ", ".join(f"{k} {v:.3f}s" for k, v in timings.items()))
+        self.assertLess(timings["batched"], timings["sequential"])
+        self.assertLess(timings["numpy"], timings["sequential"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,23 +15,30 @@
 Unit tests for Pipeline.
 """
 
+import json
 import os
+import tempfile
+import time
 import unittest
 from dataclasses import dataclass
 from typing import Any, Dict, Iterator, Optional, Type
 
 from ddt import ddt, data, unpack
 
+from forte.common.exception import (
+    ProcessExecutionException, ProcessFlowException)
 from forte.data.caster import MultiPackBoxer
 from forte.data.data_pack import DataPack
 from forte.data.multi_pack import MultiPack
 from forte.data.ontology.top import Generics
 from forte.data.readers.base_reader import PackReader, MultiPackReader
-from forte.data.selector import FirstPackSelector, NameMatchSelector
+from forte.data.selector import (
+    FirstPackSelector, NameMatchSelector, RegexNameMatchSelector)
 from forte.pipeline import Pipeline
 from forte.processors.base import PackProcessor, FixedSizeBatchProcessor
 from ft.onto.base_ontology import Token, Sentence
 from tests.dummy_batch_processor import DummyRelationExtractor
+from tests.utils import performance_test
 
 data_samples_root = "data_samples"
 
@@ -160,6 +167,60 @@ class DummmyFixedSizeBatchProcessor(FixedSizeBatchProcessor):
         return config
 
 
+class FailingPackProcessor(PackProcessor):
+    """Fails on the pack with the given text."""
+
+    def __init__(self, fail_on: str):
+        super().__init__()
+        self.fail_on = fail_on
+
+    def _process(self, input_pack: DataPack):
+        if input_pack.text == self.fail_on:
+            raise ValueError("Failed on purpose.")
+
+
+class SlowPackProcessor(PackProcessor):
+    """Spends some CPU time on each pack, to benchmark the workers."""
+
+    def _process(self, input_pack: DataPack):
+        total = 0
+        for i in range(200000):
+            total += i * i
+        NewType(pack=input_pack, value=str(total))
+
+
+class WaitingBatchProcessor(DummmyFixedSizeBatchProcessor):
+    """Takes all the batcher configurations, including the wait bounds."""
+
+    @classmethod
+    def default_configs(cls):
+        return FixedSizeBatchProcessor.default_configs()
+
+
+class SlowSentenceReader(SentenceReader):
+    """Reads a sentence every 10 milliseconds."""
+
+    def _parse_pack(self, file_path: str) -> Iterator[DataPack]:
+        for pack in super()._parse_pack(file_path):
+            time.sleep(0.01)
+            yield pack
+
+
+class TinyMultiPackReader(MultiPackReader):
+    """Creates multi packs of one short sentence, the pack of every other
+    multi pack is named ``skip``."""
+
+    def _collect(self, num_packs: int) -> Iterator[int]:  # type: ignore
+        return iter(range(num_packs))
+
+    def _parse_pack(self, index: int) -> Iterator[MultiPack]:
+        m_pack = MultiPack()
+        pack = m_pack.add_pack('skip' if index % 2 else 'pack')
+        pack.set_text(f"sentence {index}")
+        Sentence(pack, 0, len(pack.text))
+        yield m_pack
+
+
 @ddt
 class PipelineTest(unittest.TestCase):
 
@@ -375,6 +436,294 @@ class PipelineTest(unittest.TestCase):
         self.assertEqual(num_packs, reader.count)
 
 
+@ddt
+class MultiProcessPipelineTest(unittest.TestCase):
+
+    def _build_pipeline(self, batch_size: int, **kwargs) -> Pipeline:
+        nlp = Pipeline[DataPack](**kwargs)
+        nlp.set_reader(SentenceReader())
+        nlp.add(DummmyFixedSizeBatchProcessor(),
+                config={"batcher": {"batch_size": batch_size}})
+        nlp.add(DummyPackProcessor())
+        nlp.add(DummmyFixedSizeBatchProcessor(),
+                config={"batcher": {"batch_size": batch_size}})
+        nlp.initialize()
+        return nlp
+
+    @data(1, 2, 3)
+    def test_same_as_single_process(self, num_workers):
+        data_path = data_samples_root + "/random_texts/0.txt"
+        expected = [
+            (pack.text, pack.get_single(NewType).value)
+            for pack in self._build_pipeline(4).process_dataset(data_path)]
+
+        nlp = self._build_pipeline(4, num_workers=num_workers)
+        results = [(pack.text, pack.get_single(NewType).value)
+                   for pack in nlp.process_dataset(data_path)]
+        self.assertEqual(results, expected)
+        self.assertEqual(expected[0][1], "[BATCH][PACK][BATCH]")
+
+        # The pipeline can be run again.
+        results = [pack.text for pack in nlp.process_dataset(data_path)]
+        self.assertEqual(results, [text for text, _ in expected])
+
+    def test_unordered(self):
+        data_path = data_samples_root + "/random_texts/0.txt"
+        nlp = self._build_pipeline(2, num_workers=3, preserve_order=False)
+        results = [pack.text for pack in nlp.process_dataset(data_path)]
+        expected = [pack.text for pack in
+                    self._build_pipeline(2).process_dataset(data_path)]
+        self.assertEqual(sorted(results), sorted(expected))
+
+    def test_multi_pack(self):
+        nlp = Pipeline[MultiPack](num_workers=2)
+        reader = MultiPackSentenceReader()
+        nlp.set_reader(reader)
+        nlp.add(DummmyFixedSizeBatchProcessor(),
+                config={"batcher": {"batch_size": 4}},
+                selector=FirstPackSelector())
+        nlp.initialize()
+
+        num_packs = 0
+        for m_pack in nlp.process_dataset(
+                data_samples_root + "/random_texts/0.txt"):
+            pack = m_pack.get_pack("pack")
+            self.assertEqual(pack.get_single(NewType).value, "[BATCH]")
+            self.assertEqual(pack.get_single(Sentence).text, pack.text)
+            num_packs += 1
+        self.assertEqual(num_packs, reader.count)
+
+    def test_worker_error(self):
+        data_path = data_samples_root + "/random_texts/0.txt"
+        with open(data_path, encoding="utf8") as f:
+            line = [t.strip() for t in f if t.strip()][3]
+
+        nlp = Pipeline[DataPack](num_workers=2)
+        nlp.set_reader(SentenceReader())
+        nlp.add(FailingPackProcessor(line))
+        nlp.initialize()
+        with self.assertRaises(ProcessExecutionException):
+            list(nlp.process_dataset(data_path))
+
+    def test_invalid_num_workers(self):
+        with self.assertRaises(ValueError):
+            Pipeline[DataPack](num_workers=-1)
+
+    @performance_test
+    def test_scaling(self):
+        data_path = data_samples_root + "/random_texts/0.txt"
+        num_cpus = os.cpu_count() or 1
+        timings = {}
+        for num_workers in sorted({0, 1, 2, 4, num_cpus}):
+            nlp = Pipeline[DataPack](num_workers=num_workers)
+            nlp.set_reader(SentenceReader())
+            nlp.add(SlowPackProcessor())
+            nlp.initialize()
+            start = time.time()
+            for _ in range(5):
+                for _ in nlp.process_dataset(data_path):
+                    pass
+            timings[num_workers] = time.time() - start
+
+        print(f"Pipeline with a CPU bound processor on {num_cpus} CPUs: "
+              + ", ".join(f"{k} workers {v:.3f}s" for k, v in timings.items()))
+        if num_cpus >= 2:
+            self.assertLess(timings[2], timings[0])
+
+
+@ddt
+class BatchWaitTest(unittest.TestCase):
+
+    def _read_counts(self, reader: SentenceReader, batcher_configs: Dict,
+                     chain: bool = False):
+        """Returns the number of packs read when each pack is yielded."""
+        nlp = Pipeline[DataPack]()
+        nlp.set_reader(reader)
+        nlp.add(WaitingBatchProcessor(), config={"batcher": batcher_configs})
+        nlp.add(DummyPackProcessor())
+        expected = "[BATCH][PACK]"
+        if chain:
+            nlp.add(WaitingBatchProcessor(),
+                    config={"batcher": batcher_configs})
+            expected += "[BATCH]"
+        nlp.initialize()
+
+        read_counts = []
+        for pack in nlp.process_dataset(
+                data_samples_root + "/random_texts/0.txt"):
+            types = list(pack.get_entries_by_type(NewType))
+            self.assertEqual(len(types), 1)
+            self.assertEqual(types[0].value, expected)
+            read_counts.append(reader.count)
+
+        self.assertEqual(len(read_counts), reader.count)
+        return read_counts
+
+    def test_no_wait_bound(self):
+        read_counts = self._read_counts(SentenceReader(), {"batch_size": 100})
+        # The packs wait for the batch until the reader is exhausted.
+        self.assertEqual(set(read_counts), {len(read_counts)})
+
+    @data((1, False), (2, False), (5, False), (3, True))
+    @unpack
+    def test_max_wait_packs(self, max_wait_packs, chain):
+        read_counts = self._read_counts(
+            SentenceReader(),
+            {"batch_size": 100, "max_wait_packs": max_wait_packs}, chain)
+        for i, count in enumerate(read_counts):
+            self.assertLessEqual(count, i + max_wait_packs)
+
+    def test_max_wait_time(self):
+        read_counts = self._read_counts(
+            SlowSentenceReader(), {"batch_size": 100, "max_wait_time": 30})
+        # The batch is flushed every 3 or 4 packs, leave some margin for a
+        # busy machine.
+        for i, count in enumerate(read_counts):
+            self.assertLessEqual(count, i + 10)
+        self.assertLess(read_counts[0], len(read_counts))
+
+
+class SchedulerTest(unittest.TestCase):
+
+    def test_order_with_skipped_jobs(self):
+        """The multi packs without the selected pack pass the batch processor
+        before the ones waiting in the batcher, and are yielded in order."""
+        nlp = Pipeline[MultiPack]()
+        nlp.set_reader(TinyMultiPackReader())
+        batch_processor = DummmyFixedSizeBatchProcessor()
+        nlp.add(batch_processor,
+                config={"batcher": {"batch_size": 7}},
+                selector=RegexNameMatchSelector(select_name='^pack$'))
+        nlp.add(DummyPackProcessor(), selector=FirstPackSelector())
+        nlp.initialize()
+
+        m_packs = list(nlp.process_dataset(50))
+        self.assertEqual(len(m_packs), 50)
+        for i, m_pack in enumerate(m_packs):
+            pack = m_pack.packs[0]
+            self.assertEqual(pack.text, f"sentence {i}")
+            expected = "[PACK]" if i % 2 else "[BATCH][PACK]"
+            types = list(pack.get_entries_by_type(NewType))
+            self.assertEqual(len(types), 1)
+            self.assertEqual(types[0].value, expected)
+        # All the jobs waiting in the batcher were released.
+        self.assertEqual(batch_processor.num_pending_jobs, 0)
+
+    def _run_mixed(self, num_packs: int) -> float:
+        nlp = Pipeline[MultiPack]()
+        nlp.set_reader(TinyMultiPackReader())
+        for batch_size in (3, 16, 5):
+            nlp.add(DummmyFixedSizeBatchProcessor(),
+                    config={"batcher": {"batch_size": batch_size}},
+                    selector=FirstPackSelector())
+            nlp.add(DummyPackProcessor(), selector=FirstPackSelector())
+        nlp.initialize()
+
+        start = time.time()
+        count = sum(1 for _ in nlp.process_dataset(num_packs))
+        self.assertEqual(count, num_packs)
+        return time.time() - start
+
+    @performance_test
+    def test_stress(self):
+        small = self._run_mixed(2500)
+        large = self._run_mixed(10000)
+        print(f"Mixed pack and batch processors: 2500 packs {small:.3f}s, "
+              f"10000 packs {large:.3f}s ({10000 / large:.0f} packs/s)")
+        # The scheduling cost of each pack does not grow with the number of
+        # packs in flight.
+        self.assertLess(large, small * 6)
+
+
+class PipelineProfilingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.data_path = data_samples_root + "/random_texts/0.txt"
+        self.reader = SentenceReader()
+        self.nlp = Pipeline[DataPack]()
+        self.nlp.set_reader(self.reader)
+        self.nlp.add(DummmyFixedSizeBatchProcessor(),
+                     config={"batcher": {"batch_size": 4}})
+        self.nlp.add(DummyPackProcessor())
+
+    def _check_stats(self, stats, num_packs: int):
+        self.assertEqual(stats["reader"]["packs"], num_packs)
+        batch_stats, pack_stats = stats["components"]
+
+        self.assertEqual(batch_stats["packs"], num_packs)
+        self.assertEqual(batch_stats["batches"], (num_packs + 3) // 4)
+        self.assertAlmostEqual(
+            batch_stats["batch_fill_ratio"],
+            num_packs / (4 * batch_stats["batches"]))
+        self.assertGreater(batch_stats["mean_batch_latency"], 0)
+        self.assertGreater(batch_stats["queue"]["max_depth"], 1)
+
+        self.assertEqual(pack_stats["packs"], num_packs)
+        self.assertNotIn("batches", pack_stats)
+        self.assertGreater(pack_stats["packs_per_second"], 0)
+
+    def test_stats(self):
+        self.nlp.initialize()
+        with self.assertRaises(ProcessFlowException):
+            self.nlp.stats()
+
+        self.nlp.enable_profiling()
+        packs = list(self.nlp.process_dataset(self.data_path))
+        stats = self.nlp.stats()
+        self._check_stats(stats, len(packs))
+        self.assertEqual(
+            [c["name"] for c in stats["components"]],
+            [c.name for c in self.nlp.components])
+
+        self.nlp.disable_profiling()
+        list(self.nlp.process_dataset(self.data_path))
+        with self.assertRaises(ProcessFlowException):
+            self.nlp.stats()
+
+    def test_dump(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            dump_path = os.path.join(tmp_dir, "stats.json")
+            self.nlp.enable_profiling(log_interval=0., dump_path=dump_path)
+            self.nlp.initialize()
+            packs = list(self.nlp.process_dataset(self.data_path))
+
+            with open(dump_path, encoding="utf-8") as f:
+                dumped = json.load(f)
+            self._check_stats(dumped, len(packs))
+
+    def test_workers(self):
+        self.nlp = Pipeline[DataPack](num_workers=2)
+        self.nlp.set_reader(SentenceReader())
+        self.nlp.add(DummmyFixedSizeBatchProcessor(),
+                     config={"batcher": {"batch_size": 4}})
+        self.nlp.add(DummyPackProcessor())
+        self.nlp.enable_profiling()
+        self.nlp.initialize()
+
+        packs = list(self.nlp.process_dataset(self.data_path))
+        stats = self.nlp.stats()
+        self.assertEqual(stats["reader"]["packs"], len(packs))
+        for component in stats["components"]:
+            self.assertEqual(component["packs"], len(packs))
+
+    @performance_test
+    def test_overhead(self):
+        self.nlp.initialize()
+        timings = {}
+        for enabled in (False, True):
+            if enabled:
+                self.nlp.enable_profiling()
+            start = time.time()
+            for _ in range(50):
+                list(self.nlp.process_dataset(self.data_path))
+            timings["enabled" if enabled else "disabled"] = \
+                time.time() - start
+
+        print("Pipeline profiling: "
+              + ", ".join(f"{k} {v:.3f}s" for k, v in timings.items()))
+        self.assertLess(timings["enabled"], timings["disabled"] * 1.5)
+
+
 @ddt
 class MultiPackPipelineTest(unittest.TestCase):
     def test_process_multi_next(self):
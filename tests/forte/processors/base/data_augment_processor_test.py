@@ -0,0 +1,305 @@
+# Copyright 2020 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the replacement data augmentation processor.
+"""
+import random
+import time
+import unittest
+from typing import Dict, List, Optional, Tuple
+
+from ddt import ddt, data
+
+from forte.common.resources import Resources
+from forte.data.data_pack import DataPack
+from forte.data.readers import StringReader
+from forte.pipeline import Pipeline
+from forte.processors.base.data_augment_processor import \
+    ReplacementDataAugmentProcessor
+from forte.processors.data_augment.algorithms.text_replacement_op import \
+    TextReplacementOp
+from forte.processors.nltk_processors import NLTKSentenceSegmenter
+from ft.onto.base_ontology import (
+    Annotation, ConstituentNode, CoreferenceGroup, Dependency, EntityMention,
+    Sentence, Token)
+from tests.utils import performance_test
+
+
+class UpperCaseOp(TextReplacementOp):
+    r"""Replaces the texts with their upper case, except the first one of
+    each batch, and records the batch sizes."""
+
+    def __init__(self):
+        super().__init__({})
+        self.batch_sizes: List[int] = []
+
+    def replace(self, input: Annotation) -> Tuple[bool, str]:
+        return self.replace_batch([input])[0]
+
+    def replace_batch(self, inputs: List[Annotation]) -> List[Tuple[bool, str]]:
+        self.batch_sizes.append(len(inputs))
+        return [(i > 0, input.text.upper()) for i, input in enumerate(inputs)]
+
+
+class UpperCaseProcessor(ReplacementDataAugmentProcessor):
+    def __init__(self):
+        super().__init__()
+        self.op = UpperCaseOp()
+
+    def _process(self, input_pack: DataPack):
+        self.replace_pack(self.op, input_pack)
+
+
+class ReplacementDataAugmentProcessorTest(unittest.TestCase):
+    def test_replace_pack(self):
+        processor = UpperCaseProcessor()
+        nlp = Pipeline[DataPack]()
+        nlp.set_reader(StringReader())
+        nlp.add(NLTKSentenceSegmenter())
+        nlp.add(processor)
+        nlp.initialize()
+
+        pack = nlp.process(["One sentence. Two sentences. Three sentences."])
+        sentences = list(pack.get(Sentence))
+        self.assertEqual(processor.op.batch_sizes, [3])
+        self.assertEqual(
+            [(entry, text) for entry, text in processor.replaced_spans],
+            [(sentences[1], "TWO SENTENCES."),
+             (sentences[2], "THREE SENTENCES.")])
+
+    def test_replace_batch(self):
+        processor = UpperCaseProcessor()
+        data_pack = DataPack()
+        data_pack.set_text("a b")
+        inputs = [Sentence(data_pack, 0, 1), Sentence(data_pack, 2, 3)]
+        processor.replace_batch(processor.op, iter(inputs))
+        self.assertEqual(processor.replaced_spans, [(inputs[1], "B")])
+
+
+def _aligning_processor(policy: Optional[Dict[str, str]]
+                        ) -> UpperCaseProcessor:
+    processor = UpperCaseProcessor()
+    processor.initialize(Resources(), UpperCaseProcessor.make_configs(
+        {"other_entry_policy": policy}))
+    return processor
+
+
+def _reference_align(pack: DataPack, replacements, begin: int, end: int
+                     ) -> Optional[Tuple[int, int]]:
+    # Checks the span against every replacement.
+    new_begin, new_end = begin, end
+    for annotation, text in replacements:
+        r_begin, r_end = annotation.begin, annotation.end
+        if r_begin < begin < r_end or r_begin < end < r_end:
+            return None
+        shift = len(text) - (r_end - r_begin)
+        if r_end <= begin and r_begin < begin:
+            new_begin += shift
+        if r_end <= end:
+            new_end += shift
+    return new_begin, new_end
+
+
+def _random_pack(rng: random.Random, num_tokens: int
+                 ) -> Tuple[DataPack, List[Tuple[Annotation, str]]]:
+    words = ["w" * rng.randint(1, 6) for _ in range(num_tokens)]
+    pack = DataPack()
+    pack.set_text(" ".join(words))
+    tokens = []
+    begin = 0
+    for word in words:
+        tokens.append(Token(pack, begin, begin + len(word)))
+        begin += len(word) + 1
+    for _ in range(num_tokens // 2):
+        first = rng.randrange(num_tokens)
+        last = min(num_tokens - 1, first + rng.randint(0, 3))
+        EntityMention(pack, tokens[first].begin, tokens[last].end)
+    for _ in range(num_tokens // 4):
+        Dependency(pack, rng.choice(tokens), rng.choice(tokens))
+    pack.add_all_remaining_entries()
+
+    replacements = []
+    for i in range(0, num_tokens, 5):
+        token = tokens[i]
+        if rng.random() < 0.2:
+            # An insertion before the token.
+            token = Annotation(pack, token.begin, token.begin)
+        replacements.append((token, "x" * rng.randint(0, 8)))
+    return pack, replacements
+
+
+@ddt
+class AutoAlignTest(unittest.TestCase):
+    def setUp(self):
+        self.pack = DataPack()
+        self.pack.set_text("Mary and Samantha arrived at the bus station.")
+        words = self.pack.text[:-1].split(" ")
+        self.tokens = []
+        begin = 0
+        for word in words:
+            self.tokens.append(Token(self.pack, begin, begin + len(word)))
+            begin += len(word) + 1
+        self.sentence = Sentence(self.pack, 0, len(self.pack.text))
+        self.mary = EntityMention(self.pack, 0, 4)
+        self.samantha = EntityMention(self.pack, 9, 17)
+        self.partial = EntityMention(self.pack, 13, 25)
+        CoreferenceGroup(self.pack, [self.mary, self.samantha])
+        CoreferenceGroup(self.pack, [self.mary, self.partial])
+        Dependency(self.pack, self.tokens[3], self.tokens[0]).dep_label = \
+            "nsubj"
+        Dependency(self.pack, self.tokens[3], self.tokens[2])
+        node = ConstituentNode(self.pack, 0, 17)
+        node.children_nodes.extend([
+            ConstituentNode(self.pack, 0, 4),
+            ConstituentNode(self.pack, 13, 17)])
+        self.pack.add_all_remaining_entries()
+
+        self.replacements = [
+            (self.tokens[2], "Sam"),
+            (self.tokens[0], "Jane"),
+            (self.tokens[6], "train"),
+        ]
+
+    def test_align(self):
+        processor = _aligning_processor({
+            "ft.onto.base_ontology.Token": "auto_align",
+            "ft.onto.base_ontology.Sentence": "auto_align",
+            "ft.onto.base_ontology.EntityMention": "auto_align",
+            "ft.onto.base_ontology.CoreferenceGroup": "auto_align",
+            "ft.onto.base_ontology.Dependency": "auto_align",
+            "ft.onto.base_ontology.ConstituentNode": "auto_align",
+        })
+        new_pack = processor.auto_align_annotations(
+            self.pack, self.replacements)
+
+        self.assertEqual(new_pack.text,
+                         "Jane and Sam arrived at the train station.")
+        self.assertEqual(
+            [token.text for token in new_pack.get(Token)],
+            ["Jane", "and", "Sam", "arrived", "at", "the", "train",
+             "station"])
+        self.assertEqual([s.text for s in new_pack.get(Sentence)],
+                         [new_pack.text])
+        # The mention partially overlapping "Samantha" is dropped.
+        self.assertEqual([m.text for m in new_pack.get(EntityMention)],
+                         ["Jane", "Sam"])
+        groups = list(new_pack.get(CoreferenceGroup))
+        self.assertEqual(len(groups), 1)
+        self.assertEqual(sorted(m.text for m in groups[0].get_members()),
+                         ["Jane", "Sam"])
+
+        dependencies = list(new_pack.get(Dependency))
+        self.assertEqual(
+            [(d.get_parent().text, d.get_child().text, d.dep_label)
+             for d in dependencies],
+            [("arrived", "Jane", "nsubj"), ("arrived", "Sam", None)])
+        for dependency in dependencies:
+            self.assertIs(dependency.get_parent().pack, new_pack)
+
+        # The node with a dropped child keeps the other child.
+        nodes = list(new_pack.get(ConstituentNode))
+        self.assertEqual([n.text for n in nodes], ["Jane", "Jane and Sam"])
+        self.assertEqual([n.text for n in nodes[1].children_nodes], ["Jane"])
+        self.assertIs(nodes[1].children_nodes[0], nodes[0])
+
+        # The original pack is not changed.
+        self.assertEqual(self.tokens[0].text, "Mary")
+        self.assertEqual(len(list(self.pack.get(EntityMention))), 3)
+        self.assertEqual(len(list(self.pack.get(ConstituentNode))[1]
+                             .children_nodes), 2)
+
+        # New entries do not reuse the ids of the copies.
+        token = Token(new_pack, 0, 4)
+        self.assertNotIn(token.tid, [t.tid for t in self.pack.get(Token)])
+
+    def test_policy(self):
+        new_pack = _aligning_processor(None).auto_align_annotations(
+            self.pack, self.replacements)
+        self.assertEqual(new_pack.text,
+                         "Jane and Sam arrived at the train station.")
+        self.assertEqual(len(list(new_pack.get(Annotation))), 0)
+
+        # Only the links whose ends are copied are kept.
+        new_pack = _aligning_processor({
+            "ft.onto.base_ontology.Dependency": "auto_align",
+        }).auto_align_annotations(self.pack, self.replacements)
+        self.assertEqual(len(list(new_pack.get(Dependency))), 0)
+
+        with self.assertRaises(ValueError):
+            _aligning_processor({
+                "ft.onto.base_ontology.Token": "drop",
+            }).auto_align_annotations(self.pack, self.replacements)
+
+    def test_overlapping_replacements(self):
+        processor = _aligning_processor(None)
+        with self.assertRaises(ValueError):
+            processor.auto_align_annotations(
+                self.pack, [(self.tokens[2], "Sam"), (self.partial, "x")])
+
+    @data(0, 1, 2)
+    def test_same_as_reference(self, seed):
+        rng = random.Random(seed)
+        pack, replacements = _random_pack(rng, 300)
+        processor = _aligning_processor({
+            "ft.onto.base_ontology.Token": "auto_align",
+            "ft.onto.base_ontology.EntityMention": "auto_align",
+            "ft.onto.base_ontology.Dependency": "auto_align",
+        })
+        new_pack = processor.auto_align_annotations(pack, replacements)
+
+        expected: Dict[int, Tuple[int, int]] = {}
+        for annotation in pack.get(Annotation):
+            if isinstance(annotation, (Token, EntityMention)):
+                span = _reference_align(
+                    pack, replacements, annotation.begin, annotation.end)
+                if span is not None:
+                    expected[annotation.tid] = span
+        self.assertEqual(
+            {a.tid: (a.begin, a.end) for a in new_pack.get(Annotation)},
+            expected)
+        self.assertEqual(
+            len(list(new_pack.get(Dependency))),
+            len([d for d in pack.get(Dependency)
+                 if d.get_parent().tid in expected
+                 and d.get_child().tid in expected]))
+
+    @performance_test
+    def test_large_pack(self):
+        pack, replacements = _random_pack(random.Random(0), 20000)
+        processor = _aligning_processor({
+            "ft.onto.base_ontology.Token": "auto_align",
+            "ft.onto.base_ontology.EntityMention": "auto_align",
+            "ft.onto.base_ontology.Dependency": "auto_align",
+        })
+        start = time.time()
+        new_pack = processor.auto_align_annotations(pack, replacements)
+        align_time = time.time() - start
+
+        annotations = list(pack.get(Annotation))[:500]
+        start = time.time()
+        for annotation in annotations:
+            _reference_align(
+                pack, replacements, annotation.begin, annotation.end)
+        scan_time = (time.time() - start) * len(list(pack.get(Annotation))) \
+            / len(annotations)
+
+        print(f"Aligning {len(list(pack.get(Annotation)))} annotations "
+              f"over {len(replacements)} replacements: {align_time:.3f}s, "
+              f"estimated {scan_time:.3f}s by checking each replacement")
+        self.assertGreater(len(list(new_pack.get(Token))), 0)
+        self.assertLess(align_time, scan_time)
+
+
+if __name__ == "__main__":
+    unittest.main()
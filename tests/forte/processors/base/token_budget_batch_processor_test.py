@@ -0,0 +1,254 @@
+# Copyright 2020 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the token budget batcher.
+"""
+import random
+import time
+import unittest
+from typing import Dict, Iterator, List, Optional, Type
+
+import numpy as np
+from ddt import ddt, data, unpack
+
+from forte.data.data_pack import DataPack
+from forte.data.readers.base_reader import PackReader
+from forte.data.types import DataRequest
+from forte.pipeline import Pipeline
+from forte.processors.base import (
+    BatchProcessor, FixedSizeBatchProcessor, TokenBudgetBatchProcessor)
+from ft.onto.base_ontology import Token, Sentence
+from tests.utils import performance_test
+
+
+class RandomSentenceReader(PackReader):
+    r"""Creates packs of sentences with random lengths."""
+
+    def __init__(self, max_sentences: int = 12):
+        super().__init__()
+        self.max_sentences = max_sentences
+
+    def _collect(self, num_packs: int) -> Iterator[int]:  # type: ignore
+        return iter(range(num_packs))
+
+    def _parse_pack(self, index: int) -> Iterator[DataPack]:
+        rng = random.Random(index)
+        pack = DataPack(f"pack_{index}")
+        words: List[str] = []
+        sentences = []
+        for _ in range(rng.randint(0, self.max_sentences)):
+            begin = len(words)
+            words.extend(f"w{index}_{len(words)}"
+                         for _ in range(rng.randint(1, 60)))
+            sentences.append((begin, len(words)))
+
+        text = " ".join(words)
+        pack.set_text(text)
+        offsets = []
+        begin = 0
+        for word in words:
+            offsets.append((begin, begin + len(word)))
+            Token(pack, begin, begin + len(word))
+            begin += len(word) + 1
+        for first, last in sentences:
+            Sentence(pack, offsets[first][0], offsets[last - 1][1])
+        yield pack
+
+
+class RecordingProcessor(BatchProcessor):
+    r"""Records the batches, and tags each token with the text of the
+    sentence it was batched with."""
+
+    def __init__(self):
+        super().__init__()
+        self.batch_lengths: List[List[int]] = []
+        self.padded_size = 0
+
+    @staticmethod
+    def _define_context() -> Type[Sentence]:
+        return Sentence
+
+    @staticmethod
+    def _define_input_info() -> DataRequest:
+        return {Token: []}
+
+    def predict(self, data_batch: Dict) -> Dict:
+        lengths = [len(tids) for tids in data_batch["Token"]["tid"]]
+        self.batch_lengths.append(lengths)
+        self.padded_size += len(lengths) * max(lengths)
+        return {"tid": data_batch["Token"]["tid"],
+                "context": data_batch["context"]}
+
+    def pack(self, pack: DataPack, inputs: Optional[Dict] = None):
+        assert inputs is not None
+        for tids, context in zip(inputs["tid"], inputs["context"]):
+            for tid in tids:
+                token: Token = pack.get_entry(tid)  # type: ignore
+                assert token.text in context.split(" ")
+                token.ner = context
+
+
+class FixedSizeRecordingProcessor(RecordingProcessor, FixedSizeBatchProcessor):
+    pass
+
+
+class TokenBudgetRecordingProcessor(RecordingProcessor,
+                                    TokenBudgetBatchProcessor):
+    pass
+
+
+class PaddedComputeProcessor(BatchProcessor):
+    r"""Spends time in proportion to the padded size of the batches, like a
+    neural model."""
+
+    def __init__(self):
+        super().__init__()
+        self.weights = np.random.rand(128, 128)
+
+    @staticmethod
+    def _define_context() -> Type[Sentence]:
+        return Sentence
+
+    @staticmethod
+    def _define_input_info() -> DataRequest:
+        return {Token: []}
+
+    def predict(self, data_batch: Dict) -> Dict:
+        tids = data_batch["Token"]["tid"]
+        padded = np.ones((len(tids), max(len(t) for t in tids), 128))
+        for _ in range(50):
+            padded = np.tanh(padded @ self.weights)
+        return {}
+
+    def pack(self, pack: DataPack, inputs: Optional[Dict] = None):
+        pass
+
+
+class FixedSizePaddedComputeProcessor(PaddedComputeProcessor,
+                                      FixedSizeBatchProcessor):
+    pass
+
+
+class TokenBudgetPaddedComputeProcessor(PaddedComputeProcessor,
+                                        TokenBudgetBatchProcessor):
+    pass
+
+
+def _check_packs(test: unittest.TestCase, packs: List[DataPack]):
+    for pack in packs:
+        for sentence in pack.get(Sentence):
+            for token in pack.get(Token, sentence):
+                test.assertEqual(token.ner, sentence.text)
+
+
+@ddt
+class TokenBudgetBatcherTest(unittest.TestCase):
+
+    def _run(self, processor, configs: Dict, num_packs: int = 30,
+             max_sentences: int = 12):
+        pipeline = Pipeline[DataPack]()
+        pipeline.set_reader(RandomSentenceReader(max_sentences))
+        pipeline.add(processor, {"batcher": configs})
+        pipeline.initialize()
+        return list(pipeline.process_dataset(num_packs))
+
+    @data(
+        ("tokens", 0, True),
+        ("tokens", 8, True),
+        ("padded", 0, True),
+        ("padded", 16, True),
+        ("tokens", 8, False),
+    )
+    @unpack
+    def test_budget(self, budget_type, sort_buffer_size, cross_pack):
+        processor = TokenBudgetRecordingProcessor()
+        processor.batcher.cross_pack = cross_pack
+        packs = self._run(processor, {
+            "max_tokens": 100,
+            "budget_type": budget_type,
+            "length_key": "Token",
+            "sort_buffer_size": sort_buffer_size,
+        })
+
+        self.assertEqual(len(packs), 30)
+        _check_packs(self, packs)
+        self.assertEqual(
+            sum(len(lengths) for lengths in processor.batch_lengths),
+            sum(len(list(pack.get(Sentence))) for pack in packs))
+
+        for lengths in processor.batch_lengths:
+            if len(lengths) == 1:
+                continue
+            if budget_type == "tokens":
+                self.assertLessEqual(sum(lengths), 100)
+            else:
+                self.assertLessEqual(len(lengths) * max(lengths), 100)
+
+    def test_long_instances(self):
+        processor = TokenBudgetRecordingProcessor()
+        packs = self._run(processor, {"max_tokens": 1, "length_key": "Token"})
+        _check_packs(self, packs)
+        for lengths in processor.batch_lengths:
+            self.assertEqual(len(lengths), 1)
+
+    def test_max_batch_size(self):
+        processor = TokenBudgetRecordingProcessor()
+        packs = self._run(processor, {
+            "max_tokens": 100000, "length_key": "Token",
+            "max_batch_size": 3})
+        _check_packs(self, packs)
+        self.assertTrue(all(len(lengths) == 3
+                            for lengths in processor.batch_lengths[:-1]))
+
+    def test_context_length(self):
+        processor = TokenBudgetRecordingProcessor()
+        packs = self._run(processor, {"max_tokens": 500})
+        _check_packs(self, packs)
+        self.assertGreater(len(processor.batch_lengths), 1)
+
+    def test_sorting_reduces_padding(self):
+        configs = {"max_tokens": 200, "budget_type": "padded",
+                   "length_key": "Token"}
+        unsorted = TokenBudgetRecordingProcessor()
+        self._run(unsorted, configs)
+        configs["sort_buffer_size"] = 32
+        sorted_processor = TokenBudgetRecordingProcessor()
+        self._run(sorted_processor, configs)
+        self.assertLess(sorted_processor.padded_size, unsorted.padded_size)
+
+    def test_invalid_budget_type(self):
+        with self.assertRaises(ValueError):
+            self._run(TokenBudgetRecordingProcessor(),
+                      {"budget_type": "sentences"})
+
+    @performance_test
+    def test_throughput(self):
+        timings = {}
+        for name, processor, configs in (
+                ("fixed size", FixedSizePaddedComputeProcessor(),
+                 {"batch_size": 10}),
+                ("token budget", TokenBudgetPaddedComputeProcessor(),
+                 {"max_tokens": 300, "budget_type": "padded",
+                  "length_key": "Token", "sort_buffer_size": 64})):
+            start = time.time()
+            self._run(processor, configs, num_packs=20, max_sentences=200)
+            timings[name] = time.time() - start
+
+        print("Batching sentences of random lengths: "
+              + ", ".join(f"{k} {v:.3f}s" for k, v in timings.items()))
+        self.assertLess(timings["token budget"], timings["fixed size"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,23 +15,28 @@
 Unit tests for dictionary word replacement op.
 """
 
+import os
+import tempfile
 import unittest
 from forte.processors.data_augment.algorithms.dictionary_replacement_op \
     import DictionaryReplacementOp
 
 from ft.onto.base_ontology import Token
 from forte.data.data_pack import DataPack
+from forte.processors.data_augment.algorithms.lemma_table import \
+    write_lemma_table
 
 
 class TestDictionaryReplacementOp(unittest.TestCase):
+    dict_name = (
+        "forte.processors.data_augment."
+        "algorithms.dictionary.WordnetDictionary"
+    )
+
     def setUp(self):
-        dict_name = (
-            "forte.processors.data_augment."
-            "algorithms.dictionary.WordnetDictionary"
-        )
         self.dra = DictionaryReplacementOp(
             configs={
-                "dictionary_class": dict_name,
+                "dictionary_class": self.dict_name,
                 "prob": 1.0,
                 "lang": "eng",
             }
@@ -64,6 +69,34 @@ class TestDictionaryReplacementOp(unittest.TestCase):
             ]
         )
 
+    def test_lemma_table(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "lemmas.bin")
+            write_lemma_table(path, {
+                ("eat", "v", "eng", "SYNONYM"): ["feed", "consume"],
+                ("phone", "", "eng", "SYNONYM"): [],
+            })
+            dra = DictionaryReplacementOp(
+                configs={
+                    "dictionary_class": self.dict_name,
+                    "dictionary_args": {"lemma_table": path},
+                    "prob": 1.0,
+                    "lang": "eng",
+                }
+            )
+            data_pack = DataPack()
+            data_pack.set_text("eat phone")
+            token_1 = Token(data_pack, 0, 3)
+            token_2 = Token(data_pack, 4, 9)
+            token_1.pos = "VB"
+            token_2.pos = None
+
+            replaced, word = dra.replace(token_1)
+            self.assertTrue(replaced)
+            self.assertIn(word, ["feed", "consume"])
+            self.assertEqual(dra.replace(token_2), (False, "phone"))
+            dra.dictionary.lemma_table.close()
+
 
 if __name__ == "__main__":
     unittest.main()
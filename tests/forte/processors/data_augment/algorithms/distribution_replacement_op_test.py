@@ -43,6 +43,18 @@ class TestDistributionReplacementOp(unittest.TestCase):
         word = replacement.replace(self.token)
         self.assertEqual(word[1], self.word)
 
+    def test_seeded_sampler(self):
+        configs = {"prob": 0.5}
+        replacement = DistributionReplacementOp(
+            UniformSampler(self.word_list, seed=1), configs)
+        words = [replacement.replace(self.token) for _ in range(50)]
+        self.assertIn((False, self.word), words)
+        self.assertIn(True, [replaced for replaced, _ in words])
+
+        replacement.sampler.seed(1)
+        self.assertEqual(
+            [replacement.replace(self.token) for _ in range(50)], words)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,149 @@
+# Copyright 2020 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the lemma table and the memoized WordNet dictionary.
+"""
+import os
+import tempfile
+import time
+import unittest
+
+from nltk.corpus import wordnet
+
+from forte.processors.data_augment.algorithms.dictionary import \
+    WordnetDictionary
+from forte.processors.data_augment.algorithms.lemma_table import \
+    LemmaTable, write_lemma_table
+from tests.utils import performance_test
+
+
+def _has_wordnet() -> bool:
+    try:
+        wordnet.synsets("computer")
+    except LookupError:
+        return False
+    return True
+
+
+class LemmaTableTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "lemmas.bin")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_round_trip(self):
+        table = {
+            (f"word_{i}", pos, "eng", "SYNONYM"):
+                [f"lemma {i} {j}" for j in range(i % 4)]
+            for i in range(500) for pos in ("", "n", "v")
+        }
+        table[("café", "n", "fra", "SYNONYM")] = ["bistro", "estaminet"]
+        write_lemma_table(self.path, table)
+
+        with LemmaTable(self.path) as lemma_table:
+            self.assertEqual(len(lemma_table), len(table))
+            for key, lemmas in table.items():
+                self.assertIn(key, lemma_table)
+                self.assertEqual(lemma_table.get(key), lemmas)
+            self.assertIsNone(lemma_table.get(("word_1", "a", "eng",
+                                               "SYNONYM")))
+            self.assertNotIn(("word_1", "n", "eng", "ANTONYM"), lemma_table)
+
+    def test_empty(self):
+        write_lemma_table(self.path, {})
+        with LemmaTable(self.path) as lemma_table:
+            self.assertEqual(len(lemma_table), 0)
+            self.assertIsNone(lemma_table.get(("eat", "", "eng", "SYNONYM")))
+
+    def test_invalid_file(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a lemma table")
+        with self.assertRaises(ValueError):
+            LemmaTable(self.path)
+
+
+class WordnetDictionaryTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "lemmas.bin")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_lemma_table(self):
+        write_lemma_table(self.path, {
+            ("eat", "v", "eng", "SYNONYM"): ["eat", "feed"],
+            ("eat", "", "eng", "SYNONYM"): ["eat", "feed", "consume"],
+            ("eat", "v", "eng", "ANTONYM"): [],
+        })
+        dictionary = WordnetDictionary(lemma_table=self.path, cache_size=2)
+        self.assertEqual(dictionary.get_synonyms("eat", "VB"),
+                         ["eat", "feed"])
+        self.assertEqual(dictionary.get_synonyms("eat", "VBD"),
+                         ["eat", "feed"])
+        self.assertEqual(dictionary.get_synonyms("eat"),
+                         ["eat", "feed", "consume"])
+        self.assertEqual(dictionary.get_antonyms("eat", "VB"), [])
+        # The words in the table are found without loading WordNet.
+        self.assertIsNone(dictionary._model)
+
+        cache_info = dictionary._lookup.cache_info()
+        self.assertEqual(cache_info.hits, 1)
+        self.assertEqual(cache_info.currsize, 2)
+
+        with self.assertRaises(KeyError):
+            dictionary.get_lemmas("eat", lemma_type="MERONYM")
+
+    @unittest.skipUnless(_has_wordnet(), "Requires the WordNet corpus.")
+    def test_build_lemma_table(self):
+        dictionary = WordnetDictionary()
+        words = ["eat", "phone", "good", "quickly"]
+        dictionary.build_lemma_table(self.path, words)
+
+        table_dictionary = WordnetDictionary(lemma_table=self.path)
+        for word in words:
+            for pos_tag in ("", "VB", "NN", "JJ", "RB"):
+                self.assertEqual(
+                    table_dictionary.get_synonyms(word, pos_tag),
+                    dictionary.get_synonyms(word, pos_tag))
+                self.assertEqual(
+                    table_dictionary.get_antonyms(word, pos_tag),
+                    dictionary.get_antonyms(word, pos_tag))
+        self.assertIsNone(table_dictionary._model)
+
+    @performance_test
+    @unittest.skipUnless(_has_wordnet(), "Requires the WordNet corpus.")
+    def test_lookup_speed(self):
+        dictionary = WordnetDictionary()
+        words = ["eat", "phone", "good", "run", "house"] * 400
+
+        start = time.time()
+        for word in words:
+            dictionary._wordnet_lemmas(word, "", "eng", "SYNONYM")
+        wordnet_time = time.time() - start
+
+        start = time.time()
+        for word in words:
+            dictionary.get_synonyms(word)
+        cached_time = time.time() - start
+
+        print(f"Looking up {len(words)} words: WordNet {wordnet_time:.3f}s, "
+              f"memoized {cached_time:.3f}s")
+        self.assertLess(cached_time, wordnet_time)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,12 +14,19 @@
 """
 Unit tests for distribution sampler.
 """
+import random
+import time
 import unittest
+from collections import Counter
+
+from ddt import ddt, data
 
 from forte.processors.data_augment.algorithms.sampler import \
     UniformSampler, UnigramSampler
+from tests.utils import performance_test
 
 
+@ddt
 class TestSampler(unittest.TestCase):
     def test_unigram_sampler(self):
         word_count = {"apple": 1,
@@ -41,6 +48,83 @@ class TestSampler(unittest.TestCase):
         word = sampler.sample()
         self.assertIn(word, word_list)
 
+    @data(
+        {"apple": 1, "banana": 2, "orange": 3},
+        {"apple": 0.7, "banana": 0.0, "orange": 0.3},
+        {"w%d" % i: (i % 7) + 0.5 for i in range(100)},
+    )
+    def test_unigram_distribution(self, unigram):
+        sampler = UnigramSampler(unigram, seed=0)
+        num_samples = 200000
+        counts = Counter(sampler.sample_n(num_samples))
+        total = sum(unigram.values())
+        for word, weight in unigram.items():
+            expected = weight / total
+            self.assertAlmostEqual(
+                counts[word] / num_samples, expected,
+                delta=5 * (expected / num_samples) ** 0.5 + 1e-9)
+
+    def test_uniform_distribution(self):
+        word_list = ["apple", "banana", "orange", "pear"]
+        counts = Counter(UniformSampler(word_list, seed=0).sample_n(40000))
+        for word in word_list:
+            self.assertAlmostEqual(counts[word] / 40000, 0.25, delta=0.015)
+
+    @data(UniformSampler(["apple", "banana", "orange"], buffer_size=7),
+          UnigramSampler({"apple": 1, "banana": 2, "orange": 3},
+                         buffer_size=7))
+    def test_seed(self, sampler):
+        sampler.seed(42)
+        words = [sampler.sample() for _ in range(20)]
+        batch = sampler.sample_n(20)
+        sampler.seed(42)
+        self.assertEqual([sampler.sample() for _ in range(20)], words)
+        self.assertEqual(sampler.sample_n(20), batch)
+        self.assertEqual(sampler.sample_n(0), [])
+
+        # The samplers do not use the global random state.
+        state = random.getstate()
+        sampler.sample_n(10)
+        self.assertEqual(random.getstate(), state)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            UnigramSampler({})
+        with self.assertRaises(ValueError):
+            UnigramSampler({"apple": 0, "banana": 0})
+        with self.assertRaises(ValueError):
+            UnigramSampler({"apple": -1, "banana": 2})
+        with self.assertRaises(ValueError):
+            UniformSampler([])
+        with self.assertRaises(ValueError):
+            UniformSampler(["apple"], buffer_size=0)
+
+    @performance_test
+    def test_sampling_speed(self):
+        unigram = {f"word_{i}": 1.0 / (i + 1) for i in range(50000)}
+        num_samples = 2000
+
+        start = time.time()
+        for _ in range(num_samples):
+            random.choices(list(unigram.keys()), list(unigram.values()))
+        choices_time = time.time() - start
+
+        sampler = UnigramSampler(unigram, seed=0)
+        start = time.time()
+        for _ in range(num_samples):
+            sampler.sample()
+        sample_time = time.time() - start
+
+        start = time.time()
+        sampler.sample_n(100 * num_samples)
+        batch_time = time.time() - start
+
+        print(f"Sampling {num_samples} words from {len(unigram)}: "
+              f"random.choices {choices_time:.3f}s, alias table "
+              f"{sample_time:.4f}s, {100 * num_samples} words with "
+              f"sample_n {batch_time:.3f}s")
+        self.assertLess(sample_time * 10, choices_time)
+
 
 if __name__ == "__main__":
     unittest.main()
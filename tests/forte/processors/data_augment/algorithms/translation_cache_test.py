@@ -0,0 +1,175 @@
+# Copyright 2020 The Forte Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the translation cache and the batched back translation.
+"""
+import os
+import random
+import tempfile
+import time
+import unittest
+from typing import List
+
+from forte.data.data_pack import DataPack
+from forte.processors.data_augment.algorithms.back_translation_op \
+    import BackTranslationOp
+from forte.processors.data_augment.algorithms.translation_cache import \
+    TranslationCache, translate_with_cache
+from ft.onto.base_ontology import Sentence
+from tests.utils import performance_test
+
+
+class ReverseTranslator:
+    r"""Translates by reversing the words, and records the batches. Each
+    call takes some time, like running a model."""
+
+    batches: List[List[str]] = []
+
+    def __init__(self, src_lang: str, tgt_lang: str, device: str):
+        self.src_lang = src_lang
+        self.tgt_lang = tgt_lang
+
+    def translate(self, src_text: str) -> str:
+        return self.translate_batch([src_text])[0]
+
+    def translate_batch(self, src_texts: List[str]) -> List[str]:
+        ReverseTranslator.batches.append(list(src_texts))
+        time.sleep(0.001)
+        return [f"{self.tgt_lang}:" + " ".join(reversed(text.split(" ")))
+                for text in src_texts]
+
+
+def _sentences(texts: List[str]) -> List[Sentence]:
+    data_pack = DataPack()
+    data_pack.set_text("\n".join(texts))
+    sentences = []
+    begin = 0
+    for text in texts:
+        sentences.append(Sentence(data_pack, begin, begin + len(text)))
+        begin += len(text) + 1
+    return sentences
+
+
+class TranslationCacheTest(unittest.TestCase):
+    def setUp(self):
+        ReverseTranslator.batches = []
+        self.translator = ReverseTranslator("en", "fr", "cpu")
+
+    def test_translate_with_cache(self):
+        cache = TranslationCache()
+        texts = ["a b", "c d", "a b", "e f"]
+        self.assertEqual(
+            translate_with_cache(self.translator, texts, cache),
+            ["fr:b a", "fr:d c", "fr:b a", "fr:f e"])
+        self.assertEqual(ReverseTranslator.batches, [["a b", "c d", "e f"]])
+
+        self.assertEqual(
+            translate_with_cache(self.translator, ["c d", "g h"], cache),
+            ["fr:d c", "fr:h g"])
+        self.assertEqual(ReverseTranslator.batches[-1], ["g h"])
+        self.assertEqual(len(cache), 4)
+
+        # Another translator does not use the translations of this one.
+        other = ReverseTranslator("en", "de", "cpu")
+        self.assertEqual(translate_with_cache(other, ["a b"], cache),
+                         ["de:b a"])
+        self.assertEqual(translate_with_cache(self.translator, [], cache), [])
+
+    def test_persistence(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "translations.jsonl")
+            cache = TranslationCache(path)
+            translate_with_cache(self.translator, ["a b", "c d"], cache)
+            cache.close()
+
+            cache = TranslationCache(path)
+            self.assertEqual(len(cache), 2)
+            self.assertEqual(
+                translate_with_cache(self.translator, ["c d", "a b"], cache),
+                ["fr:d c", "fr:b a"])
+            self.assertEqual(len(ReverseTranslator.batches), 1)
+            cache.close()
+
+
+class BatchedBackTranslationTest(unittest.TestCase):
+    def setUp(self):
+        ReverseTranslator.batches = []
+        self.configs = {
+            "prob": 0.5,
+            "model_to": f"{__name__}.ReverseTranslator",
+            "model_back": f"{__name__}.ReverseTranslator",
+            "src_language": "en",
+            "tgt_language": "fr",
+            "device": "cpu",
+        }
+
+    def test_replace_batch(self):
+        op = BackTranslationOp(self.configs)
+        sentences = _sentences([f"w{i % 7} x{i}" for i in range(20)])
+
+        random.seed(0)
+        expected = [op.replace(sentence) for sentence in sentences]
+        self.assertIn(True, [replaced for replaced, _ in expected])
+        self.assertIn(False, [replaced for replaced, _ in expected])
+        for (replaced, text), sentence in zip(expected, sentences):
+            self.assertEqual(
+                text, "en:" + sentence.text.replace(" ", " fr:", 1)
+                if replaced else sentence.text)
+
+        ReverseTranslator.batches = []
+        random.seed(0)
+        self.assertEqual(op.replace_batch(sentences), expected)
+        # The texts were translated by the single replacements.
+        self.assertEqual(ReverseTranslator.batches, [])
+
+        ReverseTranslator.batches = []
+        op = BackTranslationOp(dict(self.configs, cache_translations=False))
+        random.seed(0)
+        self.assertEqual(op.replace_batch(sentences), expected)
+        self.assertEqual(len(ReverseTranslator.batches), 2)
+
+    @performance_test
+    def test_batch_speed(self):
+        sentences = _sentences([f"w{i % 50} x{i % 400}" for i in range(2000)])
+        configs = dict(self.configs, prob=1.0)
+
+        op = BackTranslationOp(dict(configs, cache_translations=False))
+        start = time.time()
+        for sentence in sentences:
+            op.replace(sentence)
+        single_time = time.time() - start
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            configs["cache_path"] = os.path.join(temp_dir, "cache.jsonl")
+            op = BackTranslationOp(configs)
+            start = time.time()
+            op.replace_batch(sentences)
+            batch_time = time.time() - start
+            op.cache.close()
+
+            op = BackTranslationOp(configs)
+            start = time.time()
+            op.replace_batch(sentences)
+            rerun_time = time.time() - start
+            op.cache.close()
+
+        print(f"Back translating {len(sentences)} sentences: one by one "
+              f"{single_time:.3f}s, batched {batch_time:.3f}s, again with "
+              f"the cache file {rerun_time:.3f}s")
+        self.assertLess(batch_time, single_time)
+        self.assertLess(rerun_time, single_time)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -15,16 +15,23 @@
 """
 Unit tests for the writers.
 """
+import gzip
+import os
 import shutil
 import tempfile
 import unittest
 from typing import List, Dict
 
+from ddt import ddt, data
+
+from forte.common.exception import ProcessExecutionException
 from forte.data.data_pack import DataPack
+from forte.data.data_utils import deserialize
 from forte.data.readers import OntonotesReader, \
     RecursiveDirectoryDeserializeReader
 from forte.pipeline import Pipeline
 from forte.processors.annotation_remover import AnnotationRemover
+from forte.processors.base.writers import BackgroundFileWriter
 from forte.processors.nltk_processors import NLTKWordTokenizer, \
     NLTKPOSTagger, NLTKSentenceSegmenter
 from forte.processors.writers import PackNameJsonPackWriter
@@ -80,3 +87,61 @@ class TestLowerCaserProcessor(unittest.TestCase):
 
         assert token_counts == expected_count
         shutil.rmtree(output_path)
+
+
+def _write_and_read(output_path: str, configs: Dict) -> Dict[str, int]:
+    pipeline = Pipeline[DataPack]()
+    pipeline.set_reader(OntonotesReader())
+    pipeline.add(PackNameJsonPackWriter(),
+                 dict(configs, output_dir=output_path))
+    pipeline.run("data_samples/ontonotes/00")
+
+    token_counts: Dict[str, int] = {}
+    for root, _, files in os.walk(output_path):
+        for file in files:
+            with open(os.path.join(root, file), "rb") as f:
+                content = f.read()
+            if configs.get("zip_pack"):
+                content = gzip.decompress(content)
+            pack = deserialize(content)
+            token_counts[pack.pack_name] = len(list(pack.get(Token)))
+    return token_counts
+
+
+@ddt
+class AsyncWriterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.sync_path = tempfile.mkdtemp()
+        self.async_path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.sync_path)
+        shutil.rmtree(self.async_path)
+
+    @data({}, {"zip_pack": True}, {"serialize_method": "binary"},
+          {"indent": 2})
+    def test_same_output(self, configs):
+        expected = _write_and_read(self.sync_path, configs)
+        self.assertGreater(len(expected), 0)
+        written = _write_and_read(
+            self.async_path,
+            dict(configs, async_write=True, async_queue_size=2))
+        self.assertEqual(written, expected)
+
+    def test_write_error(self):
+        writer = BackgroundFileWriter(queue_size=1)
+        # The output path is a directory, which cannot be written as a file.
+        writer.submit(self.async_path, "{}")
+        with self.assertRaises(ProcessExecutionException):
+            writer.close()
+
+    def test_restart(self):
+        writer = BackgroundFileWriter()
+        for i in range(2):
+            path = os.path.join(self.async_path, f"{i}.json")
+            writer.submit(path, "{}")
+            writer.close()
+            self.assertTrue(os.path.exists(path))
+        # Closing without writing is allowed.
+        writer.close()